@@ -3,6 +3,8 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
 from backend.app.db.init_db import init_db
+from backend.app.routes.base_route import NEXT_CURSOR_HEADER
+from backend.app.routes.http_caching import compress_response
 from backend.app.utils.id import generate_ulid
 
 ########## Blueprints Import ##########
@@ -72,8 +74,13 @@ from backend.app.routes.r_ui_progression_flow import bp as ui_progression_flow_b
 from backend.app.routes.r_ui_scoped_gates import bp as ui_scoped_gates_bp
 from backend.app.routes.r_ui_consequences import bp as ui_consequences_bp
 from backend.app.routes.r_ui_creation_flow import bp as ui_creation_flow_bp
+from backend.app.routes.r_ui_catalogs import bp as ui_catalogs_bp
+from backend.app.routes.r_changes import bp as changes_bp
+from backend.app.routes.r_change_events import bp as change_events_bp
 from backend.app.routes.r_creation_flow_manifests import creation_flow_artifacts_bp, creation_flow_manifests_bp
 from backend.app.routes.r_recovery import bp as recovery_bp
+from backend.app.routes.r_search import bp as search_bp
+from backend.app.routes.r_tags import bp as tags_bp
 from backend.app.services.recovery import run_startup_recovery
 
 __all__ = ["create_app", "generate_ulid"]
@@ -81,7 +88,8 @@ __all__ = ["create_app", "generate_ulid"]
 
 def create_app(startup_recovery: bool = True) -> Flask:
     app = Flask(__name__)
-    CORS(app)
+    CORS(app, expose_headers=[NEXT_CURSOR_HEADER, "ETag"])
+    app.after_request(compress_response)
 
     # Global error handler for JSON errors
     @app.errorhandler(Exception)
@@ -165,9 +173,14 @@ def create_app(startup_recovery: bool = True) -> Flask:
         ui_scoped_gates_bp,
         ui_consequences_bp,
         ui_creation_flow_bp,
+        ui_catalogs_bp,
+        changes_bp,
+        change_events_bp,
         creation_flow_manifests_bp,
         creation_flow_artifacts_bp,
-        recovery_bp
+        recovery_bp,
+        search_bp,
+        tags_bp
     ]
     
     for blueprint in blueprints:
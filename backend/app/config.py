@@ -17,3 +17,13 @@ RECOVERY_STARTUP_IMPORT_MODE = os.getenv(
     "RECOVERY_STARTUP_IMPORT_MODE",
     os.getenv("SOA_STARTUP_CSV_IMPORT_MODE", "newer"),
 ).strip().lower()
+# Named PRAGMA profile for the live SQLite engine (see init_db.SQLITE_PRAGMA_PROFILES).
+# Use "compat" for filesystems where WAL is unsupported (e.g. network shares).
+SQLITE_PRAGMA_PROFILE = os.getenv("SQLITE_PRAGMA_PROFILE", "live").strip().lower()
+# Worker processes for table CSV exports (recovery export and ZIP downloads).
+# "1" exports tables one after another in-process; "auto" uses one per CPU.
+EXPORT_WORKERS = os.getenv("EXPORT_WORKERS", "1").strip().lower()
+# JSON responses at least this large are gzip/Brotli-encoded for clients that accept it.
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+# Entries kept in the in-process change log behind `/api/changes`; older cursors get `reset`.
+CHANGE_LOG_LIMIT = int(os.getenv("CHANGE_LOG_LIMIT", "10000"))
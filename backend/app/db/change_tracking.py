@@ -0,0 +1,435 @@
+"""Committed-row change feed for in-process derived caches.
+
+ORM flushes and bulk ORM statements are recorded per session; on commit the
+accumulated `ChangeSet` is handed to every registered listener together with
+the engine it was written through, and on rollback it is discarded. Writes made
+with raw SQL bypass the feed; callers doing those should fire
+`init_db.notify_database_change()` instead.
+
+Each commit takes the next value of a process-wide change version and stamps
+it on every table it touched, so per-table versions only ever increase;
+`content_version()` folds them into a cache key for anything derived from a set
+of tables. The commit's rows are also appended to a bounded per-engine change
+log as `(version, table, id, op)` entries, which `changes_since()` replays as
+compact deltas for clients patching their own caches. Versions start from the
+process start time in microseconds, so a restarted process never reuses a
+version an earlier one handed out.
+
+`EngineStates` holds the per-engine state of one derived cache: it drops every
+state when the active database changes and, given a stale-entry mapper,
+accumulates the committed rows each state has yet to apply.
+"""
+
+import time
+from collections import defaultdict, deque
+from threading import Lock, RLock
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from backend.app.config import CHANGE_LOG_LIMIT
+from backend.app.db import init_db as db_runtime
+from backend.app.models.base import Base
+
+_PENDING_KEY = "committed_changes_pending"
+_commit_listeners: List[Callable[..., None]] = []
+_versions_lock = Lock()
+_table_versions: "WeakKeyDictionary[object, Dict[str, int]]" = WeakKeyDictionary()
+# Bumped whenever the active database is switched, replaced or reset, so keys
+# taken before the change never match content read after it.
+_epoch = 0
+_change_version = time.time_ns() // 1000
+# Oldest cursor an engine without a change log can serve.
+_process_floor = _change_version
+_change_logs: "WeakKeyDictionary[object, _ChangeLog]" = WeakKeyDictionary()
+# A commit writing more rows than this to one table is logged as one table entry.
+TABLE_ENTRY_THRESHOLD = 200
+
+INSERT, UPDATE, DELETE, TABLE = "insert", "update", "delete", "table"
+
+
+class ChangeSet:
+    """Tables/rows touched by a unit of work.
+
+    `rows` maps a table to primary keys written through the ORM and `ops` to the
+    net operation on each of them; `parents` maps a referenced table to the ids
+    its changed child rows pointed at (before and after the change); `tables`
+    lists tables changed wholesale by bulk statements or database-side ON DELETE
+    CASCADE.
+    """
+
+    __slots__ = ("rows", "ops", "parents", "tables")
+
+    def __init__(self):
+        self.rows: Dict[str, Set[str]] = defaultdict(set)
+        self.ops: Dict[str, Dict[str, str]] = defaultdict(dict)
+        self.parents: Dict[str, Set[str]] = defaultdict(set)
+        self.tables: Set[str] = set()
+
+    def __bool__(self):
+        return bool(self.rows or self.tables)
+
+    def record(self, table: str, row_id: str, op: str) -> None:
+        self.rows[table].add(row_id)
+        self.ops[table][row_id] = merge_op(self.ops[table].get(row_id), op)
+
+    def update(self, other: "ChangeSet") -> None:
+        for table, row_ids in other.rows.items():
+            self.rows[table].update(row_ids)
+        for table, ops in other.ops.items():
+            for row_id, op in ops.items():
+                self.ops[table][row_id] = merge_op(self.ops[table].get(row_id), op)
+        for table, row_ids in other.parents.items():
+            self.parents[table].update(row_ids)
+        self.tables.update(other.tables)
+
+    def touched_tables(self) -> Set[str]:
+        return set(self.rows) | self.tables
+
+
+def merge_op(previous: Optional[str], op: str) -> str:
+    """Net operation of `op` following `previous` on one row; an insert then update stays an insert."""
+    return INSERT if previous == INSERT and op == UPDATE else op
+
+
+def _cascade_children():
+    children = defaultdict(set)
+    for table in Base.metadata.tables.values():
+        for foreign_key in table.foreign_keys:
+            if (foreign_key.ondelete or "").upper() == "CASCADE":
+                children[foreign_key.column.table.name].add(table.name)
+    return children
+
+
+# Parent table -> tables whose rows the database deletes along with it.
+CASCADE_CHILDREN = _cascade_children()
+
+
+def on_commit(listener: Callable[..., None]) -> Callable[..., None]:
+    """Register `listener(engine, changes)` to run after every commit that changed rows."""
+    if listener not in _commit_listeners:
+        _commit_listeners.append(listener)
+    return listener
+
+
+def table_versions(engine) -> Dict[str, int]:
+    """Snapshot of the change version of the last commit that touched each table on `engine`."""
+    with _versions_lock:
+        return dict(_table_versions.get(engine, {}))
+
+
+def content_version(engine, tables: Optional[Iterable[str]] = None) -> Tuple[Hashable, ...]:
+    """Cache key for data derived from `tables` (all tables when None).
+
+    Take the key before reading: content read afterwards is at least as new, and
+    any later commit to those tables changes the key.
+    """
+    with _versions_lock:
+        versions = _table_versions.get(engine, {})
+        if tables is None:
+            return (_epoch, tuple(sorted(versions.items())))
+        return (_epoch, tuple(versions.get(table, 0) for table in tables))
+
+
+def current_version() -> int:
+    """The change version of the most recent commit (or reset) in this process."""
+    with _versions_lock:
+        return _change_version
+
+
+class _EngineEntry:
+    __slots__ = ("state", "stale_rows", "stale_tables")
+
+    def __init__(self, state):
+        self.state = state
+        self.stale_rows: Dict[str, Set[str]] = defaultdict(set)
+        self.stale_tables: Set[str] = set()
+
+
+class EngineStates:
+    """Per-engine state of one derived cache, dropped when the active database changes.
+
+    States are held weakly per engine and guarded by the re-entrant `lock`;
+    callers hold it while reading or refreshing a state. With `stale_entries`,
+    a function mapping a `ChangeSet` to `(rows by table, whole tables)` the
+    cache reads, every commit on an engine that has a state is accumulated
+    until the cache applies it and calls `clear_stale(engine)`.
+    """
+
+    def __init__(
+        self,
+        factory: Optional[Callable[[], Any]] = None,
+        stale_entries: Optional[Callable[[ChangeSet], Tuple[Dict[str, Set[str]], Set[str]]]] = None,
+    ):
+        self.factory = factory
+        self.stale_entries = stale_entries
+        self.lock = RLock()
+        self._entries: "WeakKeyDictionary[object, _EngineEntry]" = WeakKeyDictionary()
+        db_runtime.on_database_change(self.clear)
+        if stale_entries is not None:
+            on_commit(self._mark_committed)
+
+    def get(self, engine) -> Any:
+        with self.lock:
+            entry = self._entries.get(engine)
+            return entry.state if entry is not None else None
+
+    def get_or_create(self, engine) -> Any:
+        """The engine's state, made with `factory()` (and nothing stale) when it has none."""
+        with self.lock:
+            entry = self._entries.get(engine)
+            if entry is None:
+                entry = self._entries[engine] = _EngineEntry(self.factory())
+            return entry.state
+
+    def refreshed(self, engine, refresh: Callable[[Any, Dict[str, Set[str]], Set[str]], Any]) -> Any:
+        """The engine's state (created if needed) after `refresh(state, stale_rows, stale_tables)`.
+
+        Stale entries are cleared only once `refresh` returns, so a failed refresh is retried.
+        """
+        with self.lock:
+            state = self.get_or_create(engine)
+            stale_rows, stale_tables = self.stale(engine)
+            refresh(state, stale_rows, stale_tables)
+            self.clear_stale(engine)
+            return state
+
+    def set(self, engine, state) -> None:
+        with self.lock:
+            self._entries[engine] = _EngineEntry(state)
+
+    def pop(self, engine) -> None:
+        with self.lock:
+            self._entries.pop(engine, None)
+
+    def values(self) -> List[Any]:
+        with self.lock:
+            return [entry.state for entry in self._entries.values()]
+
+    def clear(self) -> None:
+        with self.lock:
+            self._entries.clear()
+
+    def stale(self, engine) -> Tuple[Dict[str, Set[str]], Set[str]]:
+        """`(rows by table, whole tables)` committed since the last `clear_stale(engine)`."""
+        with self.lock:
+            entry = self._entries.get(engine)
+            if entry is None:
+                return {}, set()
+            return entry.stale_rows, entry.stale_tables
+
+    def clear_stale(self, engine) -> None:
+        with self.lock:
+            entry = self._entries.get(engine)
+            if entry is not None:
+                entry.stale_rows.clear()
+                entry.stale_tables.clear()
+
+    def _mark_committed(self, engine, changes: ChangeSet) -> None:
+        rows, tables = self.stale_entries(changes)
+        if not (rows or tables):
+            return
+        with self.lock:
+            entry = self._entries.get(engine)
+            if entry is None:
+                return
+            for table, row_ids in rows.items():
+                entry.stale_rows[table].update(row_ids)
+            entry.stale_tables.update(tables)
+
+
+def stale_entries_for(tables: Iterable[str]) -> Callable[[ChangeSet], Tuple[Dict[str, Set[str]], Set[str]]]:
+    """`EngineStates` stale-entry mapper keeping rows and whole tables of `tables` as they are."""
+    wanted = frozenset(tables)
+
+    def stale_entries(changes: ChangeSet):
+        rows = {table: set(row_ids) for table, row_ids in changes.rows.items() if table in wanted}
+        return rows, {table for table in changes.tables if table in wanted}
+
+    return stale_entries
+
+
+class _ChangeLog:
+    """Committed `(version, table, row id, op)` entries for one engine, oldest first.
+
+    `floor` is the oldest cursor the log can still serve: entries at or below it
+    may have been dropped, so a cursor below it gets a reset.
+    """
+
+    __slots__ = ("entries", "floor")
+
+    def __init__(self, floor: int):
+        self.entries: "deque[Tuple[int, str, Optional[str], str]]" = deque()
+        self.floor = floor
+
+    def append(self, entry: Tuple[int, str, Optional[str], str]) -> None:
+        if len(self.entries) >= CHANGE_LOG_LIMIT:
+            self.floor = max(self.floor, self.entries.popleft()[0])
+        self.entries.append(entry)
+
+
+def _log_entries(version: int, changes: ChangeSet):
+    for table in sorted(changes.touched_tables()):
+        ops = changes.ops.get(table, {})
+        if table in changes.tables or len(ops) > TABLE_ENTRY_THRESHOLD:
+            yield version, table, None, TABLE
+            continue
+        for row_id in sorted(ops, key=str):
+            yield version, table, row_id, ops[row_id]
+
+
+def _bump_versions(engine, changes: ChangeSet) -> None:
+    global _change_version
+    with _versions_lock:
+        _change_version += 1
+        versions = _table_versions.get(engine)
+        if versions is None:
+            versions = _table_versions[engine] = defaultdict(int)
+        for table in changes.touched_tables():
+            versions[table] = _change_version
+        log = _change_logs.get(engine)
+        if log is None:
+            log = _change_logs[engine] = _ChangeLog(_process_floor)
+        for entry in _log_entries(_change_version, changes):
+            log.append(entry)
+
+
+def changes_since(engine, since: Optional[int], tables: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Compact deltas committed on `engine` after change version `since`.
+
+    Returns the current `version` (the next cursor), `reset` when `since` is
+    older than the log can serve or unknown to this process (reload everything
+    then), and `changes`: one `{version, table, id, op}` per row with its net
+    operation since the cursor, where `op` "table" with a null `id` means the
+    table changed wholesale. `tables` restricts the tables reported. Without a
+    cursor only the current version is returned.
+    """
+    wanted = set(tables) if tables is not None else None
+    with _versions_lock:
+        current = _change_version
+        log = _change_logs.get(engine)
+        floor = log.floor if log is not None else _process_floor
+        if since is None:
+            return {"version": current, "reset": False, "changes": []}
+        if since < floor or since > current:
+            return {"version": current, "reset": True, "changes": []}
+        entries = [entry for entry in log.entries if entry[0] > since] if log is not None else []
+    rows: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+    replaced: Dict[str, int] = {}
+    for version, table, row_id, op in entries:
+        if wanted is not None and table not in wanted:
+            continue
+        if op == TABLE:
+            replaced[table] = version
+        previous = rows.pop((table, row_id), None)
+        rows[(table, row_id)] = {
+            "version": version,
+            "table": table,
+            "id": row_id,
+            "op": merge_op(previous["op"] if previous else None, op),
+        }
+    changes = [
+        change for change in rows.values()
+        if change["id"] is None or change["version"] > replaced.get(change["table"], 0)
+    ]
+    return {"version": current, "reset": False, "changes": changes}
+
+
+def _reset_versions() -> None:
+    global _epoch, _change_version, _process_floor
+    with _versions_lock:
+        _epoch += 1
+        _table_versions.clear()
+        # Every cursor handed out so far now predates the replaced content.
+        _change_version += 1
+        _process_floor = _change_version
+        _change_logs.clear()
+
+
+db_runtime.on_database_change(_reset_versions)
+
+
+def _record_instance(changes: ChangeSet, instance, op: str = UPDATE) -> None:
+    table = getattr(instance, "__table__", None)
+    if table is None:
+        return
+    state = inspect(instance)
+    row_id = getattr(instance, "id", None)
+    if row_id is not None:
+        changes.record(table.name, row_id, op)
+    for foreign_key in table.foreign_keys:
+        prop = state.mapper._columntoproperty.get(foreign_key.parent)
+        if prop is None:
+            continue
+        history = state.attrs[prop.key].history
+        for value in (*history.added, *history.unchanged, *history.deleted):
+            if value is not None:
+                changes.parents[foreign_key.column.table.name].add(value)
+    if op == DELETE:
+        changes.tables.update(CASCADE_CHILDREN.get(table.name, ()))
+
+
+def _pending(session) -> ChangeSet:
+    changes = session.info.get(_PENDING_KEY)
+    if changes is None:
+        changes = session.info[_PENDING_KEY] = ChangeSet()
+    return changes
+
+
+def uncommitted_changes(session) -> ChangeSet:
+    """Everything the session has flushed or modified in memory but not yet committed."""
+    changes = ChangeSet()
+    flushed = session.info.get(_PENDING_KEY)
+    if flushed is not None:
+        changes.update(flushed)
+    for instance in session.dirty:
+        _record_instance(changes, instance)
+    for instance in session.deleted:
+        _record_instance(changes, instance, DELETE)
+    return changes
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_rows(session, _flush_context):
+    changes = _pending(session)
+    for instance in session.new:
+        _record_instance(changes, instance, INSERT)
+    for instance in session.dirty:
+        _record_instance(changes, instance)
+    for instance in session.deleted:
+        _record_instance(changes, instance, DELETE)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_statements(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    changes = _pending(orm_execute_state.session)
+    table = mapper.local_table.name
+    changes.tables.add(table)
+    if orm_execute_state.is_delete:
+        changes.tables.update(CASCADE_CHILDREN.get(table, ()))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_rows(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    if not changes:
+        return
+    try:
+        engine = session.get_bind()
+    except Exception:
+        return
+    _bump_versions(engine, changes)
+    for listener in list(_commit_listeners):
+        listener(engine, changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_rows(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -2,33 +2,68 @@ from pathlib import Path
 import json
 import os
 from threading import RLock
-from typing import Tuple
+from typing import Callable, List, Tuple
 
 from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.engine.url import make_url
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from backend.app.config import DATA_DIR, SQLALCHEMY_DATABASE_URI
+from backend.app.config import DATA_DIR, SQLALCHEMY_DATABASE_URI, SQLITE_PRAGMA_PROFILE
 from backend.app.models.base import Base
+from backend.app.db.search_index import ensure_search_index
+from backend.app.db.tag_index import ensure_tag_index
 from backend.app.services.dialogue_choice_actions import normalize_choice_contracts
 
 _engine_lock = RLock()
-
-
-def _set_sqlite_pragma(dbapi_connection, _connection_record):
-    """Ensure SQLite enforces foreign keys for relational integrity."""
-    try:
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
-    except Exception:
-        # Non-SQLite engines may not support this pragma.
-        pass
-
-
-def _build_engine(db_uri: str):
+# Callbacks run whenever the active database changes underneath the ORM
+# (switch, file replacement, schema reset) so derived caches can drop state.
+_database_change_listeners: List[Callable[[], None]] = []
+
+
+# Per-engine SQLite PRAGMA profiles, applied on every new DBAPI connection.
+# "live" serves concurrent UI reads alongside writes; "bulk" is for throwaway
+# staging databases that are validated with `PRAGMA foreign_key_check` and
+# discarded on failure, so durability and immediate FK enforcement are skipped.
+SQLITE_PRAGMA_PROFILES = {
+    "live": {
+        "foreign_keys": "ON",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "mmap_size": 268435456,
+    },
+    "bulk": {
+        "foreign_keys": "OFF",
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+        "cache_size": -262144,
+    },
+    "compat": {
+        "foreign_keys": "ON",
+    },
+}
+
+
+def _pragma_listener(pragmas):
+    def set_sqlite_pragmas(dbapi_connection, _connection_record):
+        try:
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+        except Exception:
+            # Non-SQLite engines may not support these pragmas.
+            pass
+    return set_sqlite_pragmas
+
+
+def _build_engine(db_uri: str, pragma_profile: str | None = None):
+    # Unknown profile names fall back to the minimal, always-safe pragmas.
+    pragmas = SQLITE_PRAGMA_PROFILES.get(pragma_profile or SQLITE_PRAGMA_PROFILE, SQLITE_PRAGMA_PROFILES["compat"])
     eng = create_engine(db_uri, future=True)
-    event.listen(eng, "connect", _set_sqlite_pragma)
+    event.listen(eng, "connect", _pragma_listener(pragmas))
     return eng
 
 
@@ -76,8 +111,24 @@ def get_db_path(db_name: str) -> Path:
     return DATA_DIR / f"{safe_name}.sqlite"
 
 
-def switch_active_database(db_name: str) -> Tuple[str, str]:
-    """Switch the runtime engine/session to another sqlite database file."""
+def on_database_change(listener: Callable[[], None]) -> Callable[[], None]:
+    """Register a callback invoked after the active database is switched, replaced or reset."""
+    if listener not in _database_change_listeners:
+        _database_change_listeners.append(listener)
+    return listener
+
+
+def notify_database_change() -> None:
+    for listener in list(_database_change_listeners):
+        listener()
+
+
+def switch_active_database(db_name: str, pragma_profile: str | None = None) -> Tuple[str, str]:
+    """Switch the runtime engine/session to another sqlite database file.
+
+    `pragma_profile` selects an entry of `SQLITE_PRAGMA_PROFILES`; the configured
+    live profile is used by default.
+    """
     global engine, SessionLocal, _active_db_uri
 
     db_path = get_db_path(db_name)
@@ -88,13 +139,39 @@ def switch_active_database(db_name: str) -> Tuple[str, str]:
     with _engine_lock:
         SessionLocal.remove()
         previous_engine = engine
-        engine = _build_engine(next_uri)
+        engine = _build_engine(next_uri, pragma_profile)
         SessionLocal = scoped_session(sessionmaker(bind=engine, autoflush=False, autocommit=False))
         _active_db_uri = next_uri
         previous_engine.dispose()
+    notify_database_change()
     return get_active_db_name(), str(db_path)
 
 
+def _checkpoint_wal(active_engine) -> None:
+    """Fold any WAL content back into the main file before it is closed or replaced."""
+    try:
+        with active_engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    except Exception:
+        pass
+
+
+def _remove_wal_sidecars(db_path: Path) -> None:
+    """Drop stale -wal/-shm files so they are never replayed onto a replaced database."""
+    for suffix in ("-wal", "-shm"):
+        sidecar = db_path.with_name(db_path.name + suffix)
+        try:
+            sidecar.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush a file written under `synchronous=OFF` before it is swapped into place."""
+    with open(path, "rb") as handle:
+        os.fsync(handle.fileno())
+
+
 def replace_active_database_file(staging_path: Path, target_db_name: str | None = None) -> Tuple[str, str]:
     """Atomically replace the active SQLite file and reconnect the runtime."""
     global engine, SessionLocal, _active_db_uri
@@ -106,12 +183,16 @@ def replace_active_database_file(staging_path: Path, target_db_name: str | None
     with _engine_lock:
         SessionLocal.remove()
         previous_engine = engine
+        _checkpoint_wal(previous_engine)
         previous_engine.dispose()
+        _remove_wal_sidecars(target_path)
+        _fsync_file(staging_path)
         os.replace(staging_path, target_path)
         next_uri = f"sqlite:///{target_path}"
         engine = _build_engine(next_uri)
         SessionLocal = scoped_session(sessionmaker(bind=engine, autoflush=False, autocommit=False))
         _active_db_uri = next_uri
+    notify_database_change()
     return get_active_db_name(), str(target_path)
 
 
@@ -119,11 +200,20 @@ def init_db():
     active_engine = get_engine()
     Base.metadata.create_all(bind=active_engine)
     _upgrade_sqlite_schema(active_engine)
+    ensure_derived_indexes(active_engine)
+    notify_database_change()
+
 
+def ensure_derived_indexes(active_engine) -> None:
+    """Create and rebuild the trigger-maintained full-text and tag indexes from their content tables."""
+    ensure_search_index(active_engine)
+    ensure_tag_index(active_engine)
 
-def _backfill_dialogue_choice_ids(connection) -> None:
-    """Persist immutable identities for legacy JSON choices exactly once."""
+
+def _backfill_dialogue_choice_ids(connection) -> int:
+    """Persist immutable identities for legacy JSON choices exactly once; returns the rewritten node count."""
     rows = connection.execute(text("SELECT id, choices FROM dialogue_nodes")).mappings().all()
+    rewritten = 0
     for row in rows:
         raw_choices = row["choices"]
         if raw_choices in (None, ""):
@@ -146,6 +236,8 @@ def _backfill_dialogue_choice_ids(connection) -> None:
                 text("UPDATE dialogue_nodes SET choices = :choices WHERE id = :id"),
                 {"choices": json.dumps(normalized, ensure_ascii=False), "id": row["id"]},
             )
+            rewritten += 1
+    return rewritten
 
 
 def _upgrade_sqlite_schema(active_engine) -> None:
@@ -161,6 +253,7 @@ def _upgrade_sqlite_schema(active_engine) -> None:
                 _rebuild_locations_table_for_nullable_biome(active_engine)
                 inspector = inspect(active_engine)
                 table_names = set(inspector.get_table_names())
+        backfilled_nodes = 0
         with active_engine.begin() as connection:
             if "abilities" in table_names:
                 ability_columns = {column["name"] for column in inspector.get_columns("abilities")}
@@ -234,7 +327,7 @@ def _upgrade_sqlite_schema(active_engine) -> None:
                     connection.execute(text("ALTER TABLE dialogue_nodes ADD COLUMN is_terminal BOOLEAN NOT NULL DEFAULT 0"))
                 connection.execute(text("UPDATE dialogue_nodes SET is_terminal = 0 WHERE is_terminal IS NULL"))
                 if "choices" in dialogue_node_columns:
-                    _backfill_dialogue_choice_ids(connection)
+                    backfilled_nodes = _backfill_dialogue_choice_ids(connection)
 
             if "creation_flow_manifests" in table_names:
                 manifest_columns = {column["name"] for column in inspector.get_columns("creation_flow_manifests")}
@@ -370,11 +463,33 @@ def _upgrade_sqlite_schema(active_engine) -> None:
                         text(f"UPDATE {table_name} SET {column_name} = :default_value WHERE {column_name} IS NULL"),
                         {"default_value": default_value},
                     )
+        _create_declared_indexes(active_engine)
+        if backfilled_nodes:
+            # The choice-id backfill is raw SQL, so the dialogue choice index cannot see it through the change feed.
+            notify_database_change()
     except Exception:
         # Keep application startup resilient; model metadata handles fresh databases.
         pass
 
 
+def _create_declared_indexes(active_engine) -> None:
+    """Add model-declared secondary indexes missing from an existing database.
+
+    `create_all` only creates indexes together with new tables, so databases made
+    before an index was declared (or tables rebuilt by an upgrade) get them here.
+    """
+    inspector = inspect(active_engine)
+    table_names = set(inspector.get_table_names())
+    with active_engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in table_names or not table.indexes:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for index in table.indexes:
+                if all(column.name in existing_columns for column in index.columns):
+                    connection.execute(CreateIndex(index, if_not_exists=True))
+
+
 def _rebuild_locations_table_for_nullable_biome(active_engine) -> None:
     """Rebuild legacy SQLite locations table so biome can become nullable."""
     with active_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
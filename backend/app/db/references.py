@@ -0,0 +1,147 @@
+"""Batched, transaction-scoped existence checks for referenced ids.
+
+Route validation used to issue one `Session.get` per foreign key, array element
+and nested action. `reference_resolver(session)` hands out one resolver per
+session transaction (and so per request, since sessions are thread-scoped and
+reused): callers queue the ids they are about to check with `expect()`, and the
+first `exists()`/`missing()` for a table resolves everything queued for it with
+a single `IN (...)` query. Ids found are remembered until the transaction ends;
+ids not found are re-checked on every call, so rows flushed later in the same
+unit of work are picked up. Rows deleted through the session (ORM, bulk or
+database-side cascade deletes) are forgotten again.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app.db.change_tracking import CASCADE_CHILDREN
+from backend.app.models.base import Base
+
+_INFO_KEY = "reference_resolver"
+# Stay well below SQLite's bound-parameter limit.
+_IN_CHUNK_SIZE = 500
+
+
+def _valid_id(value: Any) -> bool:
+    return isinstance(value, Hashable) and value not in (None, "") and not isinstance(value, bool)
+
+
+def _models_by_table() -> Dict[str, Any]:
+    return {mapper.local_table.name: mapper.class_ for mapper in Base.registry.mappers}
+
+
+class ReferenceResolver:
+    """Known-to-exist ids per table, plus ids queued for the next batch lookup."""
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+        self._known: Dict[str, Set[Any]] = defaultdict(set)
+        self._queued: Dict[str, Set[Any]] = defaultdict(set)
+
+    def expect(self, model, ids: Iterable[Any]) -> None:
+        """Queue ids so the next lookup against `model` resolves them in the same query."""
+        known = self._known[model.__tablename__]
+        queued = self._queued[model.__tablename__]
+        queued.update(ref_id for ref_id in ids if _valid_id(ref_id) and ref_id not in known)
+
+    def expect_rows(self, model, rows: Any, key: str = None) -> None:
+        """Queue `row[key]` for each object in a JSON array, or each element itself when `key` is None."""
+        if not isinstance(rows, list):
+            return
+        if key is None:
+            self.expect(model, rows)
+        else:
+            self.expect(model, [row.get(key) for row in rows if isinstance(row, dict)])
+
+    def expect_foreign_keys(self, model, rows: Iterable[Dict[str, Any]]) -> None:
+        """Queue every single-column foreign key value found in `rows` of `model`."""
+        targets = _models_by_table()
+        columns = []
+        for column in model.__table__.columns:
+            for foreign_key in column.foreign_keys:
+                target = targets.get(foreign_key.column.table.name)
+                if target is not None and foreign_key.column.name == "id":
+                    columns.append((column.name, target))
+        values = defaultdict(set)
+        for row in rows:
+            for name, target in columns:
+                value = row.get(name)
+                if _valid_id(value):
+                    values[target].add(value)
+        for target, ids in values.items():
+            self.expect(target, ids)
+
+    def missing(self, model, ids: Iterable[Any]) -> List[Any]:
+        """`ids` that do not exist, in input order; invalid ids (None, "") count as missing."""
+        ids = list(ids)
+        self.expect(model, ids)
+        self._resolve(model)
+        known = self._known[model.__tablename__]
+        deleted = self._deleted_ids(model)
+        return [ref_id for ref_id in ids if not _valid_id(ref_id) or ref_id not in known or ref_id in deleted]
+
+    def exists(self, model, ref_id: Any) -> bool:
+        return not self.missing(model, [ref_id])
+
+    def forget(self, table: str, ids: Iterable[Any] = None) -> None:
+        if ids is None:
+            self._known.pop(table, None)
+        else:
+            self._known[table].difference_update(ids)
+
+    def _deleted_ids(self, model) -> Set[Any]:
+        return {getattr(instance, "id", None) for instance in self.db_session.deleted if isinstance(instance, model)}
+
+    def _resolve(self, model) -> None:
+        table = model.__tablename__
+        pending = self._queued.pop(table, None)
+        if not pending:
+            return
+        known = self._known[table]
+        pending = [ref_id for ref_id in pending if ref_id not in known]
+        for start in range(0, len(pending), _IN_CHUNK_SIZE):
+            chunk = pending[start:start + _IN_CHUNK_SIZE]
+            known.update(row[0] for row in self.db_session.query(model.id).filter(model.id.in_(chunk)))
+
+
+def reference_resolver(db_session: Session) -> ReferenceResolver:
+    """The resolver for the session's current transaction, created on first use."""
+    resolver = db_session.info.get(_INFO_KEY)
+    if resolver is None:
+        resolver = db_session.info[_INFO_KEY] = ReferenceResolver(db_session)
+    return resolver
+
+
+@event.listens_for(Session, "after_flush")
+def _forget_flushed_deletes(session, _flush_context):
+    resolver = session.info.get(_INFO_KEY)
+    if resolver is None:
+        return
+    for instance in session.deleted:
+        table = getattr(instance, "__table__", None)
+        if table is not None:
+            resolver.forget(table.name, [getattr(instance, "id", None)])
+            for child in CASCADE_CHILDREN.get(table.name, ()):
+                resolver.forget(child)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _forget_bulk_deletes(orm_execute_state):
+    resolver = orm_execute_state.session.info.get(_INFO_KEY)
+    if resolver is None or not orm_execute_state.is_delete:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        resolver.forget(mapper.local_table.name)
+        for child in CASCADE_CHILDREN.get(mapper.local_table.name, ()):
+            resolver.forget(child)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_resolver(session, transaction):
+    # Flush subtransactions keep the resolver; commit, rollback, close and savepoints end it.
+    if transaction.parent is None or transaction.nested:
+        session.info.pop(_INFO_KEY, None)
@@ -0,0 +1,203 @@
+"""SQLite FTS5 index over the readable text columns of content tables.
+
+Every table with a name, title, speaker, description, summary or text column
+gets an external-content FTS5 table `search_<table>` keyed by the content row's
+rowid. AFTER INSERT/UPDATE/DELETE triggers keep it current, so ORM, bulk and
+raw SQL writes are all indexed without going through the change feed.
+`ensure_search_index()` (run by `init_db()` and after schema resets) creates
+missing index tables and triggers and rebuilds each index from its content
+table, which also repairs drift from table rebuilds or imports made while the
+triggers did not exist. Engines without FTS5, or without the index, report no
+indexed tables and callers fall back to `LIKE` filters.
+"""
+
+import re
+from collections import defaultdict
+from threading import Lock
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import bindparam, inspect, text
+
+from backend.app.models import ALL_MODELS
+
+# Short identifying columns, ranked above body text and used as the hit label.
+LABEL_COLUMNS = ("name", "title", "speaker", "slug", "id")
+BODY_COLUMNS = ("description", "summary", "text")
+LABEL_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+SNIPPET_MARKERS = ("[", "]")
+SNIPPET_TOKENS = 12
+_TOKENIZER = "unicode61 remove_diacritics 2"
+_PREFIX_LENGTHS = "2 3"
+_WORD = re.compile(r"\w+")
+
+
+def _searchable_columns() -> Dict[str, Tuple[str, ...]]:
+    columns = {}
+    for model in sorted(ALL_MODELS, key=lambda model: model.__tablename__):
+        table = model.__table__
+        names = set(table.columns.keys())
+        if not names & (set(LABEL_COLUMNS[:3]) | set(BODY_COLUMNS)):
+            continue
+        columns[table.name] = tuple(name for name in (*LABEL_COLUMNS, *BODY_COLUMNS) if name in names)
+    return columns
+
+
+# Content table -> indexed columns, label columns first.
+SEARCH_COLUMNS = _searchable_columns()
+
+
+def index_table(table: str) -> str:
+    return f"search_{table}"
+
+
+def label_column(table: str) -> str:
+    return next(name for name in SEARCH_COLUMNS[table] if name in LABEL_COLUMNS)
+
+
+def match_expression(search: str) -> Optional[str]:
+    """FTS5 query matching rows that contain every word of `search` as a prefix, or None without words."""
+    words = _WORD.findall((search or "").lower())
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+_indexed = WeakKeyDictionary()
+_indexed_lock = Lock()
+
+
+def _trigger_statements(table: str, columns: Iterable[str]) -> List[str]:
+    fts = index_table(table)
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{name}" for name in columns)
+    old_values = ", ".join(f"old.{name}" for name in columns)
+    remove = f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.rowid, {old_values});"
+    insert = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.rowid, {new_values});"
+    return [
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {remove} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column_list} ON {table} BEGIN {remove} {insert} END",
+    ]
+
+
+def _fts5_available(connection) -> bool:
+    try:
+        return bool(connection.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar())
+    except Exception:
+        return False
+
+
+def ensure_search_index(engine) -> FrozenSet[str]:
+    """Create missing index tables and triggers on `engine`, rebuild every index, and return the indexed tables."""
+    indexed = set()
+    if engine.dialect.name == "sqlite":
+        table_names = set(inspect(engine).get_table_names())
+        with engine.begin() as connection:
+            if _fts5_available(connection):
+                for table, columns in SEARCH_COLUMNS.items():
+                    if table not in table_names:
+                        continue
+                    fts = index_table(table)
+                    current = [row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({fts})")]
+                    if current and tuple(current) != columns:
+                        connection.exec_driver_sql(f"DROP TABLE {fts}")
+                        current = []
+                    if not current:
+                        connection.exec_driver_sql(
+                            f"CREATE VIRTUAL TABLE {fts} USING fts5({', '.join(columns)}, content='{table}', "
+                            f"tokenize='{_TOKENIZER}', prefix='{_PREFIX_LENGTHS}')"
+                        )
+                    for suffix in ("ai", "ad", "au"):
+                        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+                    for statement in _trigger_statements(table, columns):
+                        connection.exec_driver_sql(statement)
+                    connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+                    indexed.add(table)
+    indexed = frozenset(indexed)
+    with _indexed_lock:
+        _indexed[engine] = indexed
+    return indexed
+
+
+def indexed_tables(engine) -> FrozenSet[str]:
+    """Content tables on `engine` whose index table and maintenance triggers all exist."""
+    with _indexed_lock:
+        cached = _indexed.get(engine)
+    if cached is not None:
+        return cached
+    indexed = set()
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as connection:
+            names = {row[0] for row in connection.execute(text("SELECT name FROM sqlite_master WHERE name LIKE 'search_%'"))}
+        for table in SEARCH_COLUMNS:
+            fts = index_table(table)
+            if {fts, f"{fts}_ai", f"{fts}_ad", f"{fts}_au"} <= names:
+                indexed.add(table)
+    indexed = frozenset(indexed)
+    with _indexed_lock:
+        _indexed[engine] = indexed
+    return indexed
+
+
+def match_filter(db_session, model, search: str):
+    """`rowid IN (<index matches>)` for `model`, or None when its table is not indexed or `search` has no words."""
+    table = model.__tablename__
+    expression = match_expression(search)
+    if expression is None or table not in indexed_tables(db_session.get_bind()):
+        return None
+    fts = index_table(table)
+    return text(f"{table}.rowid IN (SELECT rowid FROM {fts} WHERE {fts} MATCH :search_match)").bindparams(
+        search_match=expression
+    )
+
+
+def search(db_session, search_text: str, tables: Optional[Iterable[str]] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    """Best `limit` hits across indexed tables, ranked by BM25 with label columns weighted above body text.
+
+    Each hit is `{table, id, label, snippet, score}`; lower scores rank higher.
+    Ranking runs first with a per-table `LIMIT`, and snippets (matched terms
+    wrapped in `SNIPPET_MARKERS`) are only built for the hits returned.
+    """
+    expression = match_expression(search_text)
+    available = indexed_tables(db_session.get_bind())
+    selected = [table for table in (tables or SEARCH_COLUMNS) if table in available]
+    if expression is None or not selected:
+        return []
+    ranked = []
+    for table in selected:
+        fts = index_table(table)
+        weights = ", ".join(str(LABEL_WEIGHT if name in LABEL_COLUMNS else BODY_WEIGHT) for name in SEARCH_COLUMNS[table])
+        ranked.append(
+            f"SELECT * FROM (SELECT '{table}' AS source_table, rowid AS row_key, bm25({fts}, {weights}) AS score "
+            f"FROM {fts} WHERE {fts} MATCH :match ORDER BY score LIMIT :limit)"
+        )
+    statement = text(f"SELECT * FROM ({' UNION ALL '.join(ranked)}) ORDER BY score, source_table, row_key LIMIT :limit")
+    hits = db_session.execute(statement, {"match": expression, "limit": limit}).all()
+
+    rows_by_table = defaultdict(list)
+    for table, row_key, _score in hits:
+        rows_by_table[table].append(row_key)
+    open_mark, close_mark = SNIPPET_MARKERS
+    details = {}
+    for table, row_keys in rows_by_table.items():
+        fts = index_table(table)
+        statement = text(
+            f"SELECT {fts}.rowid, content.id, content.{label_column(table)}, "
+            f"snippet({fts}, -1, :open_mark, :close_mark, '...', {SNIPPET_TOKENS}) "
+            f"FROM {fts} JOIN {table} AS content ON content.rowid = {fts}.rowid "
+            f"WHERE {fts} MATCH :match AND {fts}.rowid IN :row_keys"
+        ).bindparams(bindparam("row_keys", expanding=True))
+        for row_key, row_id, label, snippet in db_session.execute(statement, {
+            "match": expression,
+            "open_mark": open_mark,
+            "close_mark": close_mark,
+            "row_keys": row_keys,
+        }):
+            details[(table, row_key)] = {"table": table, "id": row_id, "label": label, "snippet": snippet}
+    return [
+        {**details[(table, row_key)], "score": score}
+        for table, row_key, score in hits
+        if (table, row_key) in details
+    ]
@@ -0,0 +1,186 @@
+"""Normalized tag membership index for tables with a JSON `tags` array.
+
+`entity_tags(table_name, tag, entity_id)` holds one row per tag of every row in
+a tagged table, lowercased and trimmed the same way `_normalize_common_fields`
+stores them. AFTER INSERT/UPDATE/DELETE triggers on each tagged table keep it
+in step with ORM, bulk and raw SQL writes alike (database-side cascades fire the
+delete trigger too), and `ensure_tag_index()` (run by `init_db()` and after
+schema resets) creates the table and triggers and rebuilds its rows. Tag filters
+then become lookups on the `(table_name, tag)` key instead of `json_each` scans
+of every row, and tag facet counts are one grouped scan of the index. Engines
+without the index report no indexed tables and callers fall back to `json_each`.
+"""
+
+from collections import defaultdict
+from threading import Lock
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import and_, column, func, inspect, or_, select, table, text
+
+from backend.app.models import ALL_MODELS
+
+TAG_INDEX_TABLE = "entity_tags"
+TAG_MATCH_MODES = ("contains", "prefix", "exact")
+TAG_COMBINE_MODES = ("all", "any")
+# Stored tags are lowercased, so this sorts after every tag sharing a prefix.
+_PREFIX_UPPER_BOUND = "\U0010ffff"
+
+entity_tags = table(TAG_INDEX_TABLE, column("table_name"), column("tag"), column("entity_id"))
+
+
+def _tagged_tables() -> List[str]:
+    return sorted(
+        model.__tablename__
+        for model in ALL_MODELS
+        if "tags" in model.__table__.columns and "id" in model.__table__.columns
+    )
+
+
+# Tables whose `tags` column is mirrored into `entity_tags`.
+TAGGED_TABLES = _tagged_tables()
+
+_indexed = WeakKeyDictionary()
+_indexed_lock = Lock()
+
+
+def _tag_rows(table_name: str, row: str, source: str = "") -> str:
+    """SELECT of `(table_name, entity_id, tag)` for the tags of `row`, reading rows from `source` when given."""
+    tags = f"CASE WHEN json_valid({row}.tags) AND json_type({row}.tags) = 'array' THEN {row}.tags ELSE '[]' END"
+    return (
+        f"SELECT DISTINCT '{table_name}', {row}.id, lower(trim(tag.value)) FROM {source}json_each({tags}) AS tag "
+        f"WHERE tag.type IN ('text', 'integer', 'real') AND trim(tag.value) <> ''"
+    )
+
+
+def _trigger_statements(table_name: str) -> List[str]:
+    prefix = f"{TAG_INDEX_TABLE}_{table_name}"
+    remove = f"DELETE FROM {TAG_INDEX_TABLE} WHERE table_name = '{table_name}' AND entity_id = old.id;"
+    insert = f"INSERT OR IGNORE INTO {TAG_INDEX_TABLE} (table_name, entity_id, tag) {_tag_rows(table_name, 'new')};"
+    return [
+        f"CREATE TRIGGER {prefix}_ai AFTER INSERT ON {table_name} BEGIN {insert} END",
+        f"CREATE TRIGGER {prefix}_ad AFTER DELETE ON {table_name} BEGIN {remove} END",
+        f"CREATE TRIGGER {prefix}_au AFTER UPDATE OF id, tags ON {table_name} BEGIN {remove} {insert} END",
+    ]
+
+
+def ensure_tag_index(engine) -> FrozenSet[str]:
+    """Create the index table and triggers on `engine`, rebuild its rows, and return the indexed tables."""
+    indexed = set()
+    if engine.dialect.name == "sqlite":
+        table_names = set(inspect(engine).get_table_names())
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                f"CREATE TABLE IF NOT EXISTS {TAG_INDEX_TABLE} ("
+                "table_name VARCHAR NOT NULL, tag VARCHAR NOT NULL, entity_id VARCHAR NOT NULL, "
+                "PRIMARY KEY (table_name, tag, entity_id)) WITHOUT ROWID"
+            )
+            connection.exec_driver_sql(
+                f"CREATE INDEX IF NOT EXISTS ix_{TAG_INDEX_TABLE}_entity ON {TAG_INDEX_TABLE} (table_name, entity_id)"
+            )
+            connection.exec_driver_sql(f"DELETE FROM {TAG_INDEX_TABLE}")
+            for table_name in TAGGED_TABLES:
+                if table_name not in table_names:
+                    continue
+                for suffix in ("ai", "ad", "au"):
+                    connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {TAG_INDEX_TABLE}_{table_name}_{suffix}")
+                for statement in _trigger_statements(table_name):
+                    connection.exec_driver_sql(statement)
+                connection.exec_driver_sql(
+                    f"INSERT OR IGNORE INTO {TAG_INDEX_TABLE} (table_name, entity_id, tag) "
+                    f"{_tag_rows(table_name, table_name, source=f'{table_name}, ')}"
+                )
+                indexed.add(table_name)
+    indexed = frozenset(indexed)
+    with _indexed_lock:
+        _indexed[engine] = indexed
+    return indexed
+
+
+def indexed_tables(engine) -> FrozenSet[str]:
+    """Tagged tables on `engine` whose rows are mirrored by `entity_tags` and its triggers."""
+    with _indexed_lock:
+        cached = _indexed.get(engine)
+    if cached is not None:
+        return cached
+    indexed = set()
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as connection:
+            names = {
+                row[0]
+                for row in connection.execute(text(f"SELECT name FROM sqlite_master WHERE name LIKE '{TAG_INDEX_TABLE}%'"))
+            }
+        if TAG_INDEX_TABLE in names:
+            for table_name in TAGGED_TABLES:
+                prefix = f"{TAG_INDEX_TABLE}_{table_name}"
+                if {f"{prefix}_ai", f"{prefix}_ad", f"{prefix}_au"} <= names:
+                    indexed.add(table_name)
+    indexed = frozenset(indexed)
+    with _indexed_lock:
+        _indexed[engine] = indexed
+    return indexed
+
+
+def normalize_tag(raw_tag: Any) -> str:
+    return str(raw_tag).strip().lower() if raw_tag is not None else ""
+
+
+def tag_condition(column_expression, tag: str, match: str = "contains"):
+    """Comparison of a lowercased tag column against `tag` under one of `TAG_MATCH_MODES`."""
+    if match == "exact":
+        return column_expression == tag
+    if match == "prefix":
+        return and_(column_expression >= tag, column_expression < tag + _PREFIX_UPPER_BOUND)
+    return column_expression.contains(tag, autoescape=True)
+
+
+def tag_filter(db_session, model, tags: Iterable[str], match: str = "contains", mode: str = "all"):
+    """`id IN (<entity_tags lookup>)` for `model`, or None when its table is not indexed.
+
+    With `mode="all"` a row must carry a matching tag for every requested tag;
+    with `mode="any"` one match is enough.
+    """
+    table_name = model.__tablename__
+    if table_name not in indexed_tables(db_session.get_bind()):
+        return None
+    tags = [tag for tag in dict.fromkeys(normalize_tag(tag) for tag in tags) if tag]
+    members = select(entity_tags.c.entity_id).where(entity_tags.c.table_name == table_name)
+    conditions = [tag_condition(entity_tags.c.tag, tag, match) for tag in tags]
+    if not conditions:
+        return None
+    if mode == "any":
+        return model.id.in_(members.where(or_(*conditions)))
+    return and_(*(model.id.in_(members.where(condition)) for condition in conditions))
+
+
+def tag_facets(
+    db_session,
+    tables: Optional[Iterable[str]] = None,
+    prefix: str = "",
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Tag frequencies as `{tag, count, tables: {table: count}}`, most used first.
+
+    `count` is the number of tagged rows across `tables` (every indexed table
+    when None); only tags starting with `prefix` are counted when it is given.
+    """
+    available = indexed_tables(db_session.get_bind())
+    selected = [table_name for table_name in (tables or TAGGED_TABLES) if table_name in available]
+    if not selected:
+        return []
+    statement = (
+        select(entity_tags.c.tag, entity_tags.c.table_name, func.count())
+        .where(entity_tags.c.table_name.in_(selected))
+        .group_by(entity_tags.c.tag, entity_tags.c.table_name)
+    )
+    prefix = normalize_tag(prefix)
+    if prefix:
+        statement = statement.where(tag_condition(entity_tags.c.tag, prefix, "prefix"))
+    by_tag = defaultdict(dict)
+    for tag, table_name, count in db_session.execute(statement):
+        by_tag[tag][table_name] = count
+    facets = sorted(
+        ({"tag": tag, "count": sum(counts.values()), "tables": counts} for tag, counts in by_tag.items()),
+        key=lambda facet: (-facet["count"], facet["tag"]),
+    )
+    return facets[:limit] if limit else facets
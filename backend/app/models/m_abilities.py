@@ -57,7 +57,7 @@ class Ability(Base):
     damage_type = Column(Enum(DamageType))
 
     legacy_requirements = Column("requirements", JSON)  # Legacy JSON payload kept for existing data.
-    requirements_id = Column(String, ForeignKey('requirements.id'))
+    requirements_id = Column(String, ForeignKey('requirements.id'), index=True)
     design_intent = Column(Text)
     counterplay_notes = Column(Text)
     mastery_notes = Column(Text)
@@ -28,8 +28,8 @@ class AbilityEffectLink(Base):
     __tablename__ = 'ability_effect_links'
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    ability_id = Column(String, ForeignKey('abilities.id'), nullable=False)
-    effect_id = Column(String, ForeignKey('effects.id'), nullable=False)
+    ability_id = Column(String, ForeignKey('abilities.id'), nullable=False, index=True)
+    effect_id = Column(String, ForeignKey('effects.id'), nullable=False, index=True)
     phase = Column(Enum(AbilityEffectPhase), nullable=False, default=AbilityEffectPhase.Impact)
     turn_offset = Column(Float, nullable=False, default=0)
     sort_order = Column(Integer, nullable=False, default=0)
@@ -41,8 +41,8 @@ class AbilityScalingLink(Base):
     __tablename__ = 'ability_scaling_links'
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    ability_id = Column(String, ForeignKey('abilities.id'), nullable=False)
-    stat_id = Column(String, ForeignKey('stats.id'), nullable=False)
+    ability_id = Column(String, ForeignKey('abilities.id'), nullable=False, index=True)
+    stat_id = Column(String, ForeignKey('stats.id'), nullable=False, index=True)
     multiplier = Column(Float, nullable=False)
 
     ability = relationship("Ability", back_populates="scaling")
@@ -57,7 +57,7 @@ class AbilityRelation(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     from_ability_id = Column(String, ForeignKey("abilities.id"), nullable=False)
-    to_ability_id = Column(String, ForeignKey("abilities.id"), nullable=False)
+    to_ability_id = Column(String, ForeignKey("abilities.id"), nullable=False, index=True)
     relation_type = Column(Enum(AbilityRelationType), nullable=False)
 
     from_ability = relationship("Ability", foreign_keys=[from_ability_id], back_populates="outgoing_relations")
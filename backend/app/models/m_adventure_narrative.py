@@ -89,8 +89,8 @@ class AdventureBeat(Base):
     title = Column(String, nullable=False)
     summary = Column(Text)
     beat_type = Column(Enum(AdventureBeatType), nullable=False, default=AdventureBeatType.Other)
-    timeline_id = Column(String, ForeignKey("timelines.id"))
-    story_arc_id = Column(String, ForeignKey("story_arcs.id"))
+    timeline_id = Column(String, ForeignKey("timelines.id"), index=True)
+    story_arc_id = Column(String, ForeignKey("story_arcs.id"), index=True)
     sort_order = Column(Integer, nullable=False, default=0)
     intent = Column(Text)
     required_flags = Column(JSON)
@@ -123,13 +123,13 @@ class AdventureBeatLink(Base):
     id = Column(String, primary_key=True, default=generate_ulid)
     adventure_beat_id = Column(String, ForeignKey("adventure_beats.id"), nullable=False)
     target_type = Column(Enum(AdventureBeatLinkTargetType), nullable=False)
-    target_id = Column(String, nullable=False)
+    target_id = Column(String, nullable=False, index=True)
     role = Column(Enum(AdventureBeatLinkRole), nullable=False, default=AdventureBeatLinkRole.Reference)
     occurrence_kind = Column(Enum(AdventureOccurrenceKind), nullable=False, default=AdventureOccurrenceKind.Appearance)
     change_type = Column(Enum(AdventureChangeType), nullable=False, default=AdventureChangeType.Active)
     state_label = Column(String)
-    starts_at_beat_id = Column(String, ForeignKey("adventure_beats.id"))
-    ends_at_beat_id = Column(String, ForeignKey("adventure_beats.id"))
+    starts_at_beat_id = Column(String, ForeignKey("adventure_beats.id"), index=True)
+    ends_at_beat_id = Column(String, ForeignKey("adventure_beats.id"), index=True)
     continuity_group_id = Column(String)
     importance = Column(Enum(AdventureImportance), nullable=False, default=AdventureImportance.Major)
     sort_order = Column(Integer, nullable=False, default=0)
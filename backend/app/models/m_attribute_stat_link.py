@@ -25,8 +25,8 @@ class AttributeStatLink(Base):
     __tablename__ = 'attribute_stat_links'
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    attribute_id = Column(String, ForeignKey("attributes.id"), nullable=False)
-    stat_id = Column(String, ForeignKey("stats.id"), nullable=False)
+    attribute_id = Column(String, ForeignKey("attributes.id"), nullable=False, index=True)
+    stat_id = Column(String, ForeignKey("stats.id"), nullable=False, index=True)
     scale = Column(Enum(ScaleType), nullable=False)
     multiplier = Column(Float, nullable=False)
 
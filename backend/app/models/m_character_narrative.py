@@ -47,7 +47,7 @@ class CharacterRelationship(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     from_character_id = Column(String, ForeignKey("characters.id"), nullable=False)
-    to_character_id = Column(String, ForeignKey("characters.id"), nullable=False)
+    to_character_id = Column(String, ForeignKey("characters.id"), nullable=False, index=True)
     relationship_type = Column(String, nullable=False)
     summary = Column(Text)
     public_stance = Column(Text)
@@ -66,16 +66,16 @@ class CharacterStoryBeat(Base):
     __tablename__ = "character_story_beats"
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    character_id = Column(String, ForeignKey("characters.id"), nullable=False)
+    character_id = Column(String, ForeignKey("characters.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     beat_type = Column(Enum(CharacterBeatType), nullable=False, default=CharacterBeatType.Other)
     sort_order = Column(Integer, nullable=False, default=0)
-    quest_id = Column(String, ForeignKey("quests.id"))
-    dialogue_id = Column(String, ForeignKey("dialogues.id"))
-    encounter_id = Column(String, ForeignKey("encounters.id"))
-    event_id = Column(String, ForeignKey("events.id"))
-    location_id = Column(String, ForeignKey("locations.id"))
-    story_arc_id = Column(String, ForeignKey("story_arcs.id"))
+    quest_id = Column(String, ForeignKey("quests.id"), index=True)
+    dialogue_id = Column(String, ForeignKey("dialogues.id"), index=True)
+    encounter_id = Column(String, ForeignKey("encounters.id"), index=True)
+    event_id = Column(String, ForeignKey("events.id"), index=True)
+    location_id = Column(String, ForeignKey("locations.id"), index=True)
+    story_arc_id = Column(String, ForeignKey("story_arcs.id"), index=True)
     summary = Column(Text)
     state_before = Column(Text)
     state_after = Column(Text)
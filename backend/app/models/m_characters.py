@@ -18,9 +18,9 @@ class Character(Base):
     image_path = Column(String)
 
     level = Column(Integer)
-    class_id = Column(String, ForeignKey("characterclasses.id"))
-    faction_id = Column(String, ForeignKey("factions.id"))
-    home_location_id = Column(String, ForeignKey("locations.id"))
+    class_id = Column(String, ForeignKey("characterclasses.id"), index=True)
+    faction_id = Column(String, ForeignKey("factions.id"), index=True)
+    home_location_id = Column(String, ForeignKey("locations.id"), index=True)
 
     variants = Column(JSON)  # Progression, allegiance, and presentation stages.
     tags = Column(JSON)
@@ -12,13 +12,13 @@ class DialogueNode(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     slug = Column(String, unique=True, nullable=False)
-    dialogue_id = Column(String, ForeignKey('dialogues.id'), nullable=False)  # FK to dialogue group/flow
+    dialogue_id = Column(String, ForeignKey('dialogues.id'), nullable=False, index=True)  # FK to dialogue group/flow
     speaker = Column(String, nullable=False)
-    speaker_character_id = Column(String, ForeignKey('characters.id'))
+    speaker_character_id = Column(String, ForeignKey('characters.id'), index=True)
     text = Column(Text, nullable=False)
     is_terminal = Column(Boolean, nullable=False, default=False)
 
-    requirements_id = Column(String, ForeignKey('requirements.id'))
+    requirements_id = Column(String, ForeignKey('requirements.id'), index=True)
 
     # Stable choice/action ids live inside this versioned JSON contract so existing exports stay compatible.
     choices = Column(JSON)     # List of { id, choice_text?, next_node_id?, requirements_id?, set_flags?, actions[] }
@@ -14,9 +14,9 @@ class Dialogue(Base):
     slug = Column(String, unique=True, nullable=False)
     title = Column(String, nullable=False)  # Internal dev-facing label
 
-    character_id = Column(String, ForeignKey("characters.id"))
-    location_id = Column(String, ForeignKey("locations.id"))
-    requirements_id = Column(String, ForeignKey("requirements.id"))
+    character_id = Column(String, ForeignKey("characters.id"), index=True)
+    location_id = Column(String, ForeignKey("locations.id"), index=True)
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
     # Kept as a validated string rather than an FK so an atomic bundle can
     # insert the dialogue before inserting its new nodes.
     starting_node_id = Column(String, nullable=True)
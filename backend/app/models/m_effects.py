@@ -67,17 +67,17 @@ class Effect(Base):
     value_type = Column(Enum(ValueInterpretation))
     value = Column(Float)
 
-    attribute_id = Column(String, ForeignKey('attributes.id'))
+    attribute_id = Column(String, ForeignKey('attributes.id'), index=True)
     attribute = relationship("Attribute")
 
-    scaling_stat_id = Column(String, ForeignKey('stats.id'))
+    scaling_stat_id = Column(String, ForeignKey('stats.id'), index=True)
     scaling_stat = relationship("Stat")
     scaling_multiplier = Column(Float)
     calculation_basis = Column(Enum(CalculationBasis))
     damage_type = Column(Enum(DamageType))
     tick_interval = Column(Float)
 
-    status_id = Column(String, ForeignKey('statuses.id'))
+    status_id = Column(String, ForeignKey('statuses.id'), index=True)
     status = relationship("Status")
     apply_chance = Column(Float, default=100.0)
     status_operation = Column(Enum(StatusOperation), default=StatusOperation.Apply)
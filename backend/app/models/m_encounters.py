@@ -22,7 +22,7 @@ class Encounter(Base):
     description = Column(Text)
 
     encounter_type = Column(Enum(EncounterType), nullable=False)
-    requirements_id = Column(String, ForeignKey('requirements.id'))
+    requirements_id = Column(String, ForeignKey('requirements.id'), index=True)
 
     participants = Column(JSON)  # [{ character_id, contexts, combat_side }]
 
@@ -24,11 +24,11 @@ class Event(Base):
     title = Column(String, nullable=False)
     type = Column(Enum(EventType), nullable=False)
 
-    requirements_id = Column(String, ForeignKey("requirements.id"))
-    location_id = Column(String, ForeignKey("locations.id"))
-    lore_id = Column(String, ForeignKey("lore_entries.id"))
-    dialogue_id = Column(String, ForeignKey("dialogues.id"))
-    encounter_id = Column(String, ForeignKey("encounters.id"))
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
+    location_id = Column(String, ForeignKey("locations.id"), index=True)
+    lore_id = Column(String, ForeignKey("lore_entries.id"), index=True)
+    dialogue_id = Column(String, ForeignKey("dialogues.id"), index=True)
+    encounter_id = Column(String, ForeignKey("encounters.id"), index=True)
 
     item_rewards = Column(JSON)     # [{ item_id, quantity }]
     xp_reward = Column(Float)
@@ -41,7 +41,7 @@ class Event(Base):
     flags_set = Column(JSON)        # [flag_id, ...]
     tags = Column(JSON)  # List of string tags
 
-    next_event_id = Column(String, ForeignKey("events.id"))  # Self-referential FK
+    next_event_id = Column(String, ForeignKey("events.id"), index=True)  # Self-referential FK
 
     # Relationships
     requirements = relationship("Requirement")
@@ -31,7 +31,7 @@ class Flag(Base):
     flag_type = Column(Enum(FlagType))
     default_value = Column(Boolean, default=False)
 
-    content_pack_id = Column(String, ForeignKey('content_packs.id'))
+    content_pack_id = Column(String, ForeignKey('content_packs.id'), index=True)
     tags = Column(JSON)  # Flexible tagging
 
     content_pack = relationship("ContentPack")
@@ -21,7 +21,7 @@ class InteractionProfile(Base):
     id = Column(String, primary_key=True, default=generate_ulid)
     character_id = Column(String, ForeignKey("characters.id"), nullable=False, unique=True)
 
-    dialogue_tree_id = Column(String, ForeignKey("dialogues.id"))
+    dialogue_tree_id = Column(String, ForeignKey("dialogues.id"), index=True)
     role = Column(Enum(InteractionRole))
 
     available_quests = Column(JSON)
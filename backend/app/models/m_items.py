@@ -110,7 +110,7 @@ class Item(Base):
     description = Column(Text)
 
     base_price = Column(Float, nullable=False, default=0.0)
-    base_currency_id = Column(String, ForeignKey('currencies.id'))
+    base_currency_id = Column(String, ForeignKey('currencies.id'), index=True)
 
     equipment_slot = Column(Enum(EquipmentSlot))
     weapon_type = Column(Enum(WeaponType))
@@ -126,7 +126,7 @@ class Item(Base):
     tags = Column(JSON)
     icon_path = Column(String)
 
-    requirements_id = Column(String, ForeignKey('requirements.id'))
+    requirements_id = Column(String, ForeignKey('requirements.id'), index=True)
     base_currency = relationship("Currency")
     requirements = relationship("Requirement")
 
@@ -181,8 +181,8 @@ class ItemStatModifier(Base):
     __tablename__ = 'item_stat_modifiers'
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    item_id = Column(String, ForeignKey('items.id', ondelete='CASCADE'), nullable=False)
-    stat_id = Column(String, ForeignKey('stats.id'), nullable=False)
+    item_id = Column(String, ForeignKey('items.id', ondelete='CASCADE'), nullable=False, index=True)
+    stat_id = Column(String, ForeignKey('stats.id'), nullable=False, index=True)
     value = Column(Float, nullable=False)
     value_type = Column(Enum(ModifierValueType), nullable=False, default=ModifierValueType.Flat)
     scaling_behavior = Column(Enum(StatScalingBehavior))
@@ -197,8 +197,8 @@ class ItemAttributeModifier(Base):
     __tablename__ = 'item_attribute_modifiers'
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    item_id = Column(String, ForeignKey('items.id', ondelete='CASCADE'), nullable=False)
-    attribute_id = Column(String, ForeignKey('attributes.id'), nullable=False)
+    item_id = Column(String, ForeignKey('items.id', ondelete='CASCADE'), nullable=False, index=True)
+    attribute_id = Column(String, ForeignKey('attributes.id'), nullable=False, index=True)
     value = Column(Float, nullable=False)
     scaling = Column(Enum(AttributeScaleType))
     notes = Column(Text)
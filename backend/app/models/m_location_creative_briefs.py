@@ -10,7 +10,7 @@ class LocationCreativeBrief(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     slug = Column(String, unique=True, nullable=False)
-    location_id = Column(String, ForeignKey("locations.id"), nullable=False)
+    location_id = Column(String, ForeignKey("locations.id"), nullable=False, index=True)
     mood = Column(Text)
     visual_ideas = Column(Text)
     concept_refs = Column(JSON)
@@ -10,12 +10,12 @@ class LocationEncounterTable(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     slug = Column(String, unique=True, nullable=False)
-    location_id = Column(String, ForeignKey("locations.id"), nullable=False)
+    location_id = Column(String, ForeignKey("locations.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(Text)
     spawn_rules = Column(Text)
     environmental_modifiers = Column(JSON)
-    requirements_id = Column(String, ForeignKey("requirements.id"))
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
     encounter_entries = Column(JSON)
     tags = Column(JSON)
 
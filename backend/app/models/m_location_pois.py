@@ -26,15 +26,15 @@ class LocationPoi(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     slug = Column(String, unique=True, nullable=False)
-    location_id = Column(String, ForeignKey("locations.id"), nullable=False)
+    location_id = Column(String, ForeignKey("locations.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(Text)
     poi_type = Column(Enum(PoiType), nullable=False)
-    requirements_id = Column(String, ForeignKey("requirements.id"))
-    event_id = Column(String, ForeignKey("events.id"))
-    dialogue_id = Column(String, ForeignKey("dialogues.id"))
-    encounter_id = Column(String, ForeignKey("encounters.id"))
-    item_id = Column(String, ForeignKey("items.id"))
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
+    event_id = Column(String, ForeignKey("events.id"), index=True)
+    dialogue_id = Column(String, ForeignKey("dialogues.id"), index=True)
+    encounter_id = Column(String, ForeignKey("encounters.id"), index=True)
+    item_id = Column(String, ForeignKey("items.id"), index=True)
     coordinates = Column(JSON)
     placement_notes = Column(Text)
     is_discoverable = Column(Boolean, default=True)
@@ -25,14 +25,14 @@ class LocationRoute(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     slug = Column(String, unique=True, nullable=False)
-    from_location_id = Column(String, ForeignKey("locations.id"), nullable=False)
-    to_location_id = Column(String, ForeignKey("locations.id"), nullable=False)
+    from_location_id = Column(String, ForeignKey("locations.id"), nullable=False, index=True)
+    to_location_id = Column(String, ForeignKey("locations.id"), nullable=False, index=True)
 
     bidirectional = Column(Boolean, default=True)
     route_type = Column(Enum(LocationRouteType), nullable=False)
     travel_cost = Column(Float, default=0)
     travel_time = Column(Float, default=0)
-    requirements_id = Column(String, ForeignKey("requirements.id"))
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
     is_hidden = Column(Boolean, default=False)
     is_fast_travel_enabled = Column(Boolean, default=False)
     description = Column(Text)
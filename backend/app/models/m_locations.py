@@ -85,7 +85,7 @@ class Location(Base):
     environment_tags = Column(JSON)
     biome_inheritance = Column(Enum(BiomeInheritance))
 
-    parent_location_id = Column(String, ForeignKey("locations.id"))
+    parent_location_id = Column(String, ForeignKey("locations.id"), index=True)
     location_type = Column(Enum(LocationType), default=LocationType.Zone)
     sort_order = Column(Integer, default=0)
     is_playable_space = Column(Boolean, default=True)
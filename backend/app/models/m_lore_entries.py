@@ -15,8 +15,8 @@ class LoreEntry(Base):
     title = Column(String, nullable=False)
     text = Column(Text, nullable=False)
 
-    location_id = Column(String, ForeignKey("locations.id"))
-    timeline_id = Column(String, ForeignKey("timelines.id"))
+    location_id = Column(String, ForeignKey("locations.id"), index=True)
+    timeline_id = Column(String, ForeignKey("timelines.id"), index=True)
 
     related_story_arcs = Column(JSON)  # list of story_arc_ids
     tags = Column(JSON)  # List of string tags
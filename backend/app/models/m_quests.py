@@ -15,8 +15,8 @@ class Quest(Base):
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
 
-    story_arc_id = Column(String, ForeignKey('story_arcs.id'))
-    requirements_id = Column(String, ForeignKey('requirements.id'))
+    story_arc_id = Column(String, ForeignKey('story_arcs.id'), index=True)
+    requirements_id = Column(String, ForeignKey('requirements.id'), index=True)
 
     objectives = Column(JSON)                   # List of { objective_id, description, requirements, flags_set }
     flags_set_on_completion = Column(JSON)      # List of flag IDs
@@ -25,8 +25,8 @@ class RequirementRequiredFlag(Base):
     __tablename__ = 'requirement_required_flags'
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    requirement_id = Column(String, ForeignKey('requirements.id'), nullable=False)
-    flag_id = Column(String, ForeignKey('flags.id'), nullable=False)
+    requirement_id = Column(String, ForeignKey('requirements.id'), nullable=False, index=True)
+    flag_id = Column(String, ForeignKey('flags.id'), nullable=False, index=True)
 
 
     requirement = relationship("Requirement", back_populates="required_flags")
@@ -36,8 +36,8 @@ class RequirementForbiddenFlag(Base):
     __tablename__ = 'requirement_forbidden_flags'
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    requirement_id = Column(String, ForeignKey('requirements.id'), nullable=False)
-    flag_id = Column(String, ForeignKey('flags.id'), nullable=False)
+    requirement_id = Column(String, ForeignKey('requirements.id'), nullable=False, index=True)
+    flag_id = Column(String, ForeignKey('flags.id'), nullable=False, index=True)
 
 
     requirement = relationship("Requirement", back_populates="forbidden_flags")
@@ -47,8 +47,8 @@ class RequirementMinFactionReputation(Base):
     __tablename__ = 'requirement_min_faction_reputation'
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    requirement_id = Column(String, ForeignKey('requirements.id'), nullable=False)
-    faction_id = Column(String, ForeignKey('factions.id', ondelete='CASCADE'), nullable=False)
+    requirement_id = Column(String, ForeignKey('requirements.id'), nullable=False, index=True)
+    faction_id = Column(String, ForeignKey('factions.id', ondelete='CASCADE'), nullable=False, index=True)
     min_value = Column(Float, nullable=False)
 
     requirement = relationship("Requirement", back_populates="min_faction_reputation")
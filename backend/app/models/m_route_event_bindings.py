@@ -20,11 +20,11 @@ class RouteEventBinding(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     slug = Column(String, unique=True, nullable=False)
-    route_id = Column(String, ForeignKey("location_routes.id"), nullable=False)
-    event_id = Column(String, ForeignKey("events.id"), nullable=False)
+    route_id = Column(String, ForeignKey("location_routes.id"), nullable=False, index=True)
+    event_id = Column(String, ForeignKey("events.id"), nullable=False, index=True)
     trigger_mode = Column(Enum(RouteEventTriggerMode), nullable=False)
     chance = Column(Float, default=100)
-    requirements_id = Column(String, ForeignKey("requirements.id"))
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
     priority = Column(Integer, default=0)
     cooldown = Column(Float, default=0)
     description = Column(Text)
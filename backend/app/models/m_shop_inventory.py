@@ -10,16 +10,16 @@ class ShopInventory(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     slug = Column(String, unique=True, nullable=False)
-    shop_id = Column(String, ForeignKey('shops.id'), nullable=False)
-    item_id = Column(String, ForeignKey('items.id'), nullable=False)
+    shop_id = Column(String, ForeignKey('shops.id'), nullable=False, index=True)
+    item_id = Column(String, ForeignKey('items.id'), nullable=False, index=True)
 
     price_modifier = Column(Float, default=0.0)
     price_multiplier = Column(Float, default=1.0)
     price_override = Column(Float)
-    currency_id = Column(String, ForeignKey('currencies.id'))
+    currency_id = Column(String, ForeignKey('currencies.id'), index=True)
 
     stock = Column(Integer)  # null = unlimited
-    requirements_id = Column(String, ForeignKey('requirements.id'))
+    requirements_id = Column(String, ForeignKey('requirements.id'), index=True)
     tags = Column(JSON)  # List of string tags
 
     shop = relationship("Shop", back_populates="inventory")
@@ -16,11 +16,11 @@ class Shop(Base):
     price_modifier = Column(Float, default=0.0)
     price_multiplier = Column(Float, default=1.0)
     price_override = Column(Float)
-    currency_id = Column(String, ForeignKey('currencies.id'))
+    currency_id = Column(String, ForeignKey('currencies.id'), index=True)
 
-    location_id = Column(String, ForeignKey("locations.id"))
-    character_id = Column(String, ForeignKey("characters.id"))
-    requirements_id = Column(String, ForeignKey("requirements.id"))
+    location_id = Column(String, ForeignKey("locations.id"), index=True)
+    character_id = Column(String, ForeignKey("characters.id"), index=True)
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
 
     price_modifiers = Column(JSON)  # Keep as JSON for now (optional structure)
     tags = Column(JSON)  # List of string tags
@@ -23,8 +23,8 @@ class StoryArc(Base):
     summary = Column(Text, nullable=False)
     type = Column(Enum(ArcType), nullable=False)
 
-    content_pack_id = Column(String, ForeignKey("content_packs.id"), nullable=False)
-    timeline_id = Column(String, ForeignKey("timelines.id"))
+    content_pack_id = Column(String, ForeignKey("content_packs.id"), nullable=False, index=True)
+    timeline_id = Column(String, ForeignKey("timelines.id"), index=True)
 
     related_quests = Column(JSON)      # List of quest IDs
     branching = Column(JSON)           # List of { quest_id, branches: [{ flag, next_quest_id }] }
@@ -21,8 +21,8 @@ class TalentTree(Base):
     name = Column(String, nullable=False)
     description = Column(Text)
 
-    class_id = Column(String, ForeignKey("characterclasses.id"))
-    requirements_id = Column(String, ForeignKey("requirements.id"))
+    class_id = Column(String, ForeignKey("characterclasses.id"), index=True)
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
 
     icon_path = Column(String)
     tags = Column(JSON)
@@ -33,7 +33,7 @@ class TalentNode(Base):
 
     id = Column(String, primary_key=True, default=generate_ulid)
     slug = Column(String, unique=True, nullable=False)
-    tree_id = Column(String, ForeignKey("talent_trees.id"), nullable=False)
+    tree_id = Column(String, ForeignKey("talent_trees.id"), nullable=False, index=True)
 
     name = Column(String, nullable=False)
     description = Column(Text)
@@ -41,7 +41,7 @@ class TalentNode(Base):
 
     max_rank = Column(Integer, default=1)
     point_cost = Column(Integer, default=1)
-    requirements_id = Column(String, ForeignKey("requirements.id"))
+    requirements_id = Column(String, ForeignKey("requirements.id"), index=True)
 
     granted_abilities = Column(JSON)
     stat_modifiers = Column(JSON)
@@ -54,7 +54,7 @@ class TalentNodeLink(Base):
     __tablename__ = "talent_node_links"
 
     id = Column(String, primary_key=True, default=generate_ulid)
-    tree_id = Column(String, ForeignKey("talent_trees.id"), nullable=False)
-    from_node_id = Column(String, ForeignKey("talent_nodes.id"), nullable=False)
-    to_node_id = Column(String, ForeignKey("talent_nodes.id"), nullable=False)
+    tree_id = Column(String, ForeignKey("talent_trees.id"), nullable=False, index=True)
+    from_node_id = Column(String, ForeignKey("talent_nodes.id"), nullable=False, index=True)
+    to_node_id = Column(String, ForeignKey("talent_nodes.id"), nullable=False, index=True)
     min_rank_required = Column(Integer, default=1)
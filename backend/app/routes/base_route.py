@@ -1,20 +1,53 @@
 # backend/app/routes/base_route.py
-from flask import Blueprint, request, jsonify, abort, make_response
+from flask import Blueprint, Response, current_app, request, jsonify, abort, make_response, stream_with_context
 from typing import Any, Dict, List, Optional
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
+from backend.app.db.search_index import SEARCH_COLUMNS, match_filter
+from backend.app.db.tag_index import TAG_COMBINE_MODES, TAG_MATCH_MODES, normalize_tag, tag_condition, tag_filter
 from backend.app.models.base import Base
-from sqlalchemy.orm import Session
-from sqlalchemy import cast, exists, func, literal, select, String
+from backend.app.routes.http_caching import conditional_get
+from backend.app.schemas import resolve_schema_entry, value_matches_schema_type
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, cast, exists, func, literal, or_, select, String
 from sqlalchemy.types import JSON, Enum
-import os
-import json
 import enum
 
 # Registry for resolving routes from table names (used by CSV export/import).
 ROUTE_REGISTRY = {}
 
+# Upper bound for `?limit=` on list endpoints and the ORM batch size used when streaming.
+MAX_LIST_PAGE_SIZE = 1000
+LIST_STREAM_BATCH_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Identifier columns `?search=` still matches by substring when a full-text index answers the rest.
+SUBSTRING_SEARCH_COLUMNS = ("id", "slug")
+
+# Relationship levels preloaded for serialization; deeper levels fall back to lazy loads.
+DEFAULT_EAGER_LOAD_DEPTH = 3
+# Relationship loader strategies that must not be overridden by an eager-load plan.
+_NON_EAGER_LAZY_STRATEGIES = {"dynamic", "noload", "raise", "raise_on_sql", "write_only"}
+
+
+def _relationship_load_options(mapper: Any, depth: int, parent: Any = None) -> List[Any]:
+    if depth <= 0:
+        return []
+    options = []
+    for relationship in mapper.relationships:
+        if relationship.lazy in _NON_EAGER_LAZY_STRATEGIES:
+            continue
+        attribute = getattr(mapper.class_, relationship.key)
+        loader = parent.selectinload(attribute) if parent is not None else selectinload(attribute)
+        options.append(loader)
+        options.extend(_relationship_load_options(relationship.mapper, depth - 1, loader))
+    return options
+
+
 class BaseRoute:
     """Base class for route handlers that implements basic CRUD operations."""
+    # Depth of the relationship eager-load plan; subclasses may lower or raise it.
+    eager_load_depth = DEFAULT_EAGER_LOAD_DEPTH
+
     def __init__(self, model, blueprint_name: str, route_prefix: str):
         """Initialize the route handler.
 
@@ -43,14 +76,34 @@ class BaseRoute:
     def _register_routes(self) -> None:
         """Register all CRUD routes."""
         # List all
-        self.bp.route(self.route_prefix, methods=["GET"])(self.get_all)
+        self.bp.route(self.route_prefix, methods=["GET"])(conditional_get(self.content_tables)(self.get_all))
         # Get one by ID
-        self.bp.route(f"{self.route_prefix}/<item_id>", methods=["GET"])(self.get_by_id)
+        self.bp.route(f"{self.route_prefix}/<item_id>", methods=["GET"])(conditional_get(self.content_tables)(self.get_by_id))
         # Create/Update
         self.bp.route(self.route_prefix, methods=["POST"])(self.upsert)
         # Delete
         self.bp.route(f"{self.route_prefix}/<item_id>", methods=["DELETE"])(self.delete)
     
+    def content_tables(self) -> List[str]:
+        """Tables a GET on this resource reads: its own and every table reachable through relationships.
+
+        Keys the conditional-GET ETags; subclasses whose serialization queries other tables extend it.
+        """
+        if "_content_tables" not in self.__dict__:
+            tables = set()
+            pending = [self.model.__mapper__]
+            while pending:
+                mapper = pending.pop()
+                if mapper.local_table.name in tables:
+                    continue
+                tables.add(mapper.local_table.name)
+                for relationship in mapper.relationships:
+                    if relationship.secondary is not None:
+                        tables.add(relationship.secondary.name)
+                    pending.append(relationship.mapper)
+            self._content_tables = sorted(tables)
+        return self._content_tables
+
     def get_schema_required_fields(self, schema_name: str = None) -> List[str]:
         """Load the required fields from the JSON schema file for this resource."""
         schema = self.get_schema(schema_name)
@@ -74,16 +127,8 @@ class BaseRoute:
             plural_name = model_name + 's'
             if plural_name not in schema_names:
                 schema_names.append(plural_name)
-        schemas_dir = os.path.join(os.path.dirname(__file__), '../schemas')
-        for name in schema_names:
-            schema_path = os.path.join(schemas_dir, f'{name}.json')
-            if os.path.exists(schema_path):
-                try:
-                    with open(schema_path, 'r', encoding='utf-8-sig') as f:
-                        return json.load(f)
-                except Exception:
-                    continue
-        return {}
+        entry = resolve_schema_entry(schema_names)
+        return entry["schema"] if entry else {}
 
     def validate_required_fields(self, data: Dict[str, Any], required_fields: List[str]) -> None:
         """Validate that all required fields are present in the data."""
@@ -120,12 +165,16 @@ class BaseRoute:
     
     def validate_relationships(self, db_session, data: Dict[str, Any], 
                              relationship_fields: Dict[str, Any]) -> None:
-        """Validate that referenced entities exist."""
+        """Validate that referenced entities exist, with one lookup per referenced table."""
+        references = reference_resolver(db_session)
         for field, model in relationship_fields.items():
             if field in data and data[field] == "":
                 data[field] = None
+            if data.get(field):
+                references.expect(model, [data[field]])
+        for field, model in relationship_fields.items():
             if field in data and data[field]:
-                if not db_session.get(model, data[field]):
+                if not references.exists(model, data[field]):
                     abort(400, description=f"Invalid {field}: {data[field]}")
 
     def validate_persisted_schema_types(self, model_instance: Any) -> None:
@@ -139,23 +188,16 @@ class BaseRoute:
             if value is None:
                 continue
             expected = property_schema.get("type")
-            valid = (
-                expected == "array" and isinstance(value, list)
-                or expected == "object" and isinstance(value, dict)
-                or expected == "boolean" and isinstance(value, bool)
-                or expected == "integer" and isinstance(value, int) and not isinstance(value, bool)
-                or expected == "number" and isinstance(value, (int, float)) and not isinstance(value, bool)
-                or expected == "string" and isinstance(value, (str, enum.Enum))
-            )
-            if expected and not valid:
+            if not value_matches_schema_type(expected, value):
                 article = "an" if expected[0].lower() in "aeiou" else "a"
                 raise ValueError(f"{column.name} must be {article} {expected}")
 
-    def _build_tag_filter_expression(self, raw_tag: str):
+    def _build_tag_filter_expression(self, raw_tag: str, match: str = "contains"):
         """Build a case-insensitive tag filter expression for JSON array columns.
 
         Uses SQLite JSON1 (`json_each`) to match tags reliably instead of `.any(...)`,
-        which is not valid for plain JSON array columns on SQLite.
+        which is not valid for plain JSON array columns on SQLite. `match` is one of
+        `TAG_MATCH_MODES`.
         """
         tag = (raw_tag or "").strip().lower()
         if not tag:
@@ -170,26 +212,197 @@ class BaseRoute:
             return exists(
                 select(1)
                 .select_from(tag_values)
-                .where(func.lower(cast(tag_values.c.value, String)).like(f"%{tag}%"))
+                .where(tag_condition(func.lower(cast(tag_values.c.value, String)), tag, match))
             )
         except Exception:
             # Fallback for environments without JSON1 support.
-            return func.lower(cast(tags_column, String)).like(f'%"{tag}"%')
-    
+            pattern = f'%"{tag}%' if match == "prefix" else f'%"{tag}"%'
+            return func.lower(cast(tags_column, String)).like(pattern)
+
+    def _build_tags_filter_expression(self, db_session: Session, tags: List[str]):
+        """Build the `?tags=a,b` filter expression.
+
+        `?tag_match=contains|prefix|exact` picks how each tag is compared (substring
+        by default) and `?tag_mode=all|any` whether rows need every tag or just one.
+        Tables mirrored in the `entity_tags` index are filtered with index lookups;
+        others fall back to `json_each` per row.
+        """
+        match = request.args.get("tag_match", "").strip().lower() or "contains"
+        mode = request.args.get("tag_mode", "").strip().lower() or "all"
+        if match not in TAG_MATCH_MODES:
+            abort(400, description=f"tag_match must be one of: {', '.join(TAG_MATCH_MODES)}")
+        if mode not in TAG_COMBINE_MODES:
+            abort(400, description=f"tag_mode must be one of: {', '.join(TAG_COMBINE_MODES)}")
+        tags = [tag for tag in dict.fromkeys(normalize_tag(tag) for tag in tags) if tag]
+        if not tags:
+            return literal(True)
+        indexed = tag_filter(db_session, self.model, tags, match, mode)
+        if indexed is not None:
+            return indexed
+        conditions = [self._build_tag_filter_expression(tag, match) for tag in tags]
+        return and_(self.model.tags != None, or_(*conditions) if mode == "any" else and_(*conditions))
+
+    def _build_search_filter_expression(self, db_session: Session, search: str, *columns: Any):
+        """Build the `?search=` filter expression.
+
+        Uses the table's full-text index (word-prefix matches over its name, title
+        and body text columns) when the active database has one. The match is ORed
+        with a substring `ILIKE` over the id and slug columns in `columns` and any
+        the index does not cover, so id fragments such as `lag-em` keep matching.
+        Without an index every column in `columns` uses `ILIKE`.
+        """
+        match = match_filter(db_session, self.model, search)
+        if match is None:
+            return or_(*(column.ilike(f"%{search}%") for column in columns))
+        indexed = SEARCH_COLUMNS.get(self.model.__tablename__, ())
+        substring = [column for column in columns if column.key in SUBSTRING_SEARCH_COLUMNS or column.key not in indexed]
+        return or_(match, *(column.ilike(f"%{search}%") for column in substring))
+
+    def eager_load_options(self, depth: Optional[int] = None) -> List[Any]:
+        """Build `selectinload` options mirroring the relationships `serialize_model` walks.
+
+        Each relationship path costs one SELECT for the whole result set, so the
+        number of queries per request no longer grows with the number of rows.
+        """
+        depth = self.eager_load_depth if depth is None else depth
+        cache = self.__dict__.setdefault("_eager_load_plans", {})
+        if depth not in cache:
+            cache[depth] = _relationship_load_options(self.model.__mapper__, depth)
+        return cache[depth]
+
     def get_all(self):
         """Get all items."""
         db_session = get_db_session()
         try:
-            items = db_session.query(self.model).all()
-            return jsonify(self.serialize_list(items))
+            return self.list_response(db_session.query(self.model))
         finally:
             db_session.close()
 
+    def _list_options(self) -> Dict[str, Any]:
+        """Parse the opt-in `limit`, `after`, `fields` and `format` list arguments."""
+        raw_limit = request.args.get("limit", "").strip()
+        limit = None
+        if raw_limit:
+            try:
+                limit = int(raw_limit)
+            except ValueError:
+                abort(400, description="limit must be an integer")
+            if limit < 1:
+                abort(400, description="limit must be positive")
+            limit = min(limit, MAX_LIST_PAGE_SIZE)
+
+        fields = None
+        raw_fields = request.args.get("fields", "").strip()
+        if raw_fields:
+            columns = self.model.__table__.columns
+            fields = []
+            for name in raw_fields.split(","):
+                name = name.strip()
+                if name and name not in fields:
+                    fields.append(name)
+            unknown = [name for name in fields if name not in columns]
+            if unknown:
+                abort(400, description=f"Unknown list fields: {', '.join(unknown)}")
+            primary_key = self.model.__mapper__.primary_key[0].key
+            if primary_key not in fields:
+                fields.insert(0, primary_key)
+
+        stream_format = request.args.get("format", "").strip().lower()
+        if not stream_format and "application/x-ndjson" in request.headers.get("Accept", ""):
+            stream_format = "ndjson"
+        if stream_format not in ("", "json", "ndjson"):
+            abort(400, description=f"Unsupported list format: {stream_format}")
+
+        return {
+            "limit": limit,
+            "after": request.args.get("after", "").strip() or None,
+            "fields": fields,
+            "stream": stream_format == "ndjson",
+        }
+
+    def _project_row(self, row: Any, fields: List[str]) -> Dict[str, Any]:
+        return {
+            name: value.value if isinstance(value, enum.Enum) else value
+            for name, value in zip(fields, row)
+        }
+
+    def list_response(self, query):
+        """Serialize a list query, honoring keyset pagination, projection and NDJSON streaming.
+
+        Without any list arguments this returns the full serialized list, as before.
+        `?limit=&after=` pages by primary key and reports the next cursor in the
+        `X-Next-Cursor` header; `?fields=a,b` selects only those columns; and
+        `?format=ndjson` streams one JSON object per line.
+        """
+        options = self._list_options()
+        if not options["fields"]:
+            query = query.options(*self.eager_load_options())
+        if not any((options["limit"], options["after"], options["fields"], options["stream"])):
+            return jsonify(self.serialize_list(query.all()))
+
+        primary_key = self.model.__mapper__.primary_key[0]
+        if options["limit"] or options["after"] or options["stream"]:
+            query = query.order_by(None).order_by(primary_key)
+            if options["after"]:
+                query = query.filter(primary_key > options["after"])
+
+        fields = options["fields"]
+        if fields:
+            query = query.with_entities(*(getattr(self.model, name) for name in fields))
+            serialize = lambda row: self._project_row(row, fields)
+            row_key = lambda row: row[0]
+        else:
+            serialize = self.serialize_item
+            row_key = lambda row: getattr(row, primary_key.key)
+
+        if options["stream"]:
+            return self._stream_ndjson(query, serialize, primary_key, row_key, options["limit"])
+
+        rows = query.limit(options["limit"] + 1).all() if options["limit"] else query.all()
+        next_cursor = None
+        if options["limit"] and len(rows) > options["limit"]:
+            rows = rows[:options["limit"]]
+            next_cursor = row_key(rows[-1])
+        response = jsonify([serialize(row) for row in rows])
+        if next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = str(next_cursor)
+        return response
+
+    def _stream_ndjson(self, query, serialize, primary_key, row_key, limit: Optional[int]) -> Response:
+        """Stream primary-key-ordered query rows as NDJSON; the query runs lazily and owns its session.
+
+        Rows are read in keyset pages of `LIST_STREAM_BATCH_SIZE` with plain
+        `limit().all()` queries, so eager loaders keep working and only one page
+        is held in the session at a time.
+        """
+        db_session = query.session
+        dumps = current_app.json.dumps
+
+        def generate():
+            try:
+                cursor, remaining = None, limit
+                while remaining is None or remaining > 0:
+                    size = LIST_STREAM_BATCH_SIZE if remaining is None else min(remaining, LIST_STREAM_BATCH_SIZE)
+                    page_query = query if cursor is None else query.filter(primary_key > cursor)
+                    rows = page_query.limit(size).all()
+                    for row in rows:
+                        yield dumps(serialize(row)) + "\n"
+                    if len(rows) < size:
+                        break
+                    cursor = row_key(rows[-1])
+                    if remaining is not None:
+                        remaining -= len(rows)
+                    db_session.expunge_all()
+            finally:
+                db_session.close()
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
     def get_by_id(self, item_id: str):
         """Get a single item by ID."""
         db_session = get_db_session()
         try:
-            item = db_session.get(self.model, item_id)
+            item = db_session.get(self.model, item_id, options=self.eager_load_options())
             if not item:
                 abort(404, description=f"Item {item_id} not found")
             return jsonify(self.serialize_item(item))
@@ -350,6 +563,10 @@ class BaseRoute:
             # Avoid breaking saves on normalization errors
             pass
     
+    def serialize_item(self, model_instance: Any) -> Dict[str, Any]:
+        """Serialize one item; routes without a custom shape use `serialize_model`."""
+        return self.serialize_model(model_instance)
+
     def serialize_list(self, items: List[Any]) -> List[Dict[str, Any]]:
         """Convert a list of items to JSON-serializable dicts."""
         return [self.serialize_item(item) for item in items]
@@ -0,0 +1,104 @@
+"""Conditional GETs and response compression for the JSON read endpoints.
+
+`conditional_get(tables)` tags a GET view's response with a weak ETag derived
+from `change_tracking.content_version` of the tables the view reads (every
+table when None) and the request's path, query string and Accept header. A
+request whose `If-None-Match` already names that tag is answered with 304 before
+the view runs, so unchanged packets cost no query or serialization work. Tags
+include a per-process nonce, so version counters restarting with the process
+never revive an old tag.
+
+`compress_response` is an `after_request` hook that gzip- or Brotli-encodes
+JSON bodies for clients that accept it.
+"""
+
+import gzip
+import hashlib
+import uuid
+from functools import wraps
+from typing import Callable, Iterable, Optional, Union
+
+from flask import Response, make_response, request
+
+from backend.app.config import RESPONSE_COMPRESSION_MIN_BYTES
+from backend.app.db import change_tracking
+from backend.app.db import init_db as db_runtime
+
+try:
+    import brotli
+except ImportError:  # Optional: without it responses are only gzip-encoded.
+    brotli = None
+
+# Revalidate on every use; a matching tag makes that a bodiless 304.
+REVALIDATE_CACHE_CONTROL = "no-cache"
+COMPRESSIBLE_MIMETYPES = {"application/json"}
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_PROCESS_NONCE = uuid.uuid4().hex[:8]
+
+Tables = Union[None, Iterable[str], Callable[[], Optional[Iterable[str]]]]
+
+
+def content_etag(tables: Optional[Iterable[str]] = None) -> str:
+    """Weak-ETag value for the current request over the committed state of `tables`."""
+    version = change_tracking.content_version(db_runtime.get_engine(), tables)
+    key = repr((version, request.full_path, request.headers.get("Accept", "")))
+    return f"{_PROCESS_NONCE}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}"
+
+
+def conditional_get(tables: Tables = None):
+    """Decorate a GET view so unchanged responses are revalidated with a 304.
+
+    `tables` lists every table the view reads (None for all of them) or is a
+    callable returning that list. The version is taken before the view reads, so
+    a tag never claims content newer than it describes. Views that set their own
+    ETag keep it.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(*args, **kwargs)
+            etag = content_etag(tables() if callable(tables) else tables)
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+                response.set_etag(etag, weak=True)
+                response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+                response.vary.add("Accept-Encoding")
+                return response
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and "ETag" not in response.headers:
+                response.set_etag(etag, weak=True)
+                response.headers.setdefault("Cache-Control", REVALIDATE_CACHE_CONTROL)
+            return response
+        return wrapper
+    return decorator
+
+
+def _encode(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+
+def compress_response(response):
+    """`after_request` hook: encode large JSON bodies with the best encoding the client accepts."""
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) < RESPONSE_COMPRESSION_MIN_BYTES:
+        return response
+    encoding = request.accept_encodings.best_match(["br", "gzip"] if brotli is not None else ["gzip"])
+    if encoding is None:
+        return response
+    response.set_data(_encode(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    return response
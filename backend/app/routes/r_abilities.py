@@ -7,12 +7,16 @@ from backend.app.models.m_items import DamageType
 from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_stats import Stat
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 
 
 class AbilityRoute(BaseRoute):
+    # serialize_item only reads direct links.
+    eager_load_depth = 1
+
     def __init__(self):
         super().__init__(
             model=Ability,
@@ -112,11 +116,13 @@ class AbilityRoute(BaseRoute):
         
         # Clear and reset scaling
         ability.scaling.clear()
+        references = reference_resolver(db_session)
+        references.expect_rows(Stat, data.get("scaling"), "stat_id")
         for entry in data.get("scaling", []):
             if not all(k in entry for k in ["stat_id", "multiplier"]):
                 raise ValueError("Invalid scaling entry: missing stat_id or multiplier")
             stat_id = entry["stat_id"]
-            if not db_session.get(Stat, stat_id):
+            if not references.exists(Stat, stat_id):
                 raise ValueError(f"Invalid stat_id: {stat_id}")
             link = AbilityScalingLink(
                 stat_id=stat_id,
@@ -180,19 +186,11 @@ class AbilityRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.name.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.name, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -2,6 +2,7 @@ from typing import Any, Dict, List
 
 from sqlalchemy.orm import Session
 
+from backend.app.db.references import reference_resolver
 from backend.app.models.m_adventure_narrative import (
     AdventureBeat,
     AdventureChangeType,
@@ -38,7 +39,7 @@ def _require_string_array(data: Dict[str, Any], key: str) -> List[str]:
 
 def _require_flags(db_session: Session, data: Dict[str, Any], key: str) -> List[str]:
     values = _require_string_array(data, key)
-    missing = [flag_id for flag_id in values if not db_session.get(Flag, flag_id)]
+    missing = reference_resolver(db_session).missing(Flag, values)
     if missing:
         raise ValueError(f"{key} references missing flags: {', '.join(missing)}")
     return values
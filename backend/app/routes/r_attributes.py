@@ -4,8 +4,9 @@ from backend.app.models.m_stats import Stat
 from backend.app.models.m_attribute_stat_link import AttributeStatLink, ScaleType
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 class AttributeRoute(BaseRoute):
     def __init__(self):
@@ -49,12 +50,14 @@ class AttributeRoute(BaseRoute):
         
         # Clear and reset scaling links
         attribute.scaling_links.clear()
+        references = reference_resolver(db_session)
+        references.expect_rows(Stat, data.get("results_in"), "stat_id")
         for entry in data.get("results_in", []):
             if not all(k in entry for k in ["stat_id", "scale", "multiplier"]):
                 raise ValueError("Invalid scaling entry: missing stat_id, scale, or multiplier")
             
             # Validate stat exists
-            if not db_session.get(Stat, entry["stat_id"]):
+            if not references.exists(Stat, entry["stat_id"]):
                 raise ValueError(f"Invalid stat_id: {entry['stat_id']}")
             scale_value = entry["scale"]
             if scale_value == "Custom Curve":
@@ -93,19 +96,11 @@ class AttributeRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.name.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.name, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -1,47 +1,73 @@
 # backend/app/routes/r_bulk_export.py
-from flask import Blueprint, Response, abort, send_file
+from functools import partial
+from flask import Blueprint, Response, abort, request, stream_with_context
 from backend.app.db.init_db import get_db_session
 from backend.app.models import ALL_MODELS
-from backend.app.utils.csv_tools import AUTHORING_ONLY_TABLES, build_csv_rows
-import csv
-import zipfile
-import tempfile
-import os
+from backend.app.services.parallel_export import export_tables_parallel, resolve_export_workers
+from backend.app.services.recovery import ordered_tables
+from backend.app.utils.csv_tools import AUTHORING_ONLY_TABLES, iter_csv_rows, iter_csv_text, iter_model_batches
+from backend.app.utils.zip_stream import stream_zip
 
 bp = Blueprint("bulk_export", __name__)
 
 
+def _export_tables(mode: str):
+    """`(table name, model)` per exported table, in recovery import order."""
+    model_map = {}
+    for model_class in ALL_MODELS:
+        table_name = getattr(model_class, "__tablename__", None)
+        if not table_name or (mode == "ue" and table_name in AUTHORING_ONLY_TABLES):
+            continue
+        model_map.setdefault(table_name, model_class)
+    tables, _unordered = ordered_tables(model_map.keys())
+    return [(table_name, model_map[table_name]) for table_name in tables]
+
+
+def _table_csv_entries(session, mode: str):
+    """`(file name, CSV text chunks)` per exported table, read and serialized batch by batch."""
+    for table_name, model_class in _export_tables(mode):
+        rows = iter_csv_rows(table_name, model_class, partial(iter_model_batches, session, model_class), mode=mode)
+        yield f"{table_name}.csv", iter_csv_text(rows)
+
+
+def _parallel_csv_entries(session, mode: str, workers: int):
+    """`(file name, [CSV text])` per exported table, built by worker processes; None when unsupported."""
+    tables = [table_name for table_name, _model_class in _export_tables(mode)]
+    results = export_tables_parallel(session.get_bind(), tables, mode, workers)
+    if results is None:
+        return None
+    failed = [f"{table_name}: {results[table_name]['error']}" for table_name in tables if results[table_name]["error"]]
+    if failed:
+        abort(500, description=f"CSV export failed for {'; '.join(failed)}")
+    return [(f"{table_name}.csv", [results[table_name]["text"]]) for table_name in tables]
+
+
 def _export_all_csv_zip(mode: str, download_name: str):
+    """Stream every table as a CSV member of a ZIP; the archive is produced while it downloads.
+
+    With `?workers=` (or `EXPORT_WORKERS`) above one, the tables are serialized
+    by worker processes first and the archive is streamed from their output.
+    """
+    try:
+        workers = resolve_export_workers(request.args.get("workers"))
+    except ValueError as exc:
+        abort(400, description=str(exc))
     session = get_db_session()
-    temp_dir = tempfile.mkdtemp()
-    csv_files = []
     try:
-        # Write each table to a CSV file in temp_dir
-        for model_class in ALL_MODELS:
-            table_name = getattr(model_class, "__tablename__", None)
-            if not table_name:
-                continue
-            if mode == "ue" and table_name in AUTHORING_ONLY_TABLES:
-                continue
-            rows = session.query(model_class).all()
-            csv_path = os.path.join(temp_dir, f"{table_name}.csv")
-            with open(csv_path, "w", newline='', encoding="utf-8") as f:
-                columns, data_rows = build_csv_rows(table_name, model_class, rows, mode=mode)
-                writer = csv.writer(f)
-                writer.writerow(columns)
-                writer.writerows(data_rows)
-            csv_files.append(csv_path)
-        # Create zip
-        zip_path = os.path.join(temp_dir, "all_tables.zip")
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in csv_files:
-                zipf.write(file_path, os.path.basename(file_path))
-        # Send zip
-        return send_file(zip_path, mimetype="application/zip", as_attachment=True, download_name=download_name)
-    finally:
-        # Clean up temp files after request is done
-        import shutil
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        entries = _parallel_csv_entries(session, mode, workers) if workers > 1 else None
+    except BaseException:
+        session.close()
+        raise
+
+    def generate():
+        try:
+            yield from stream_zip(entries if entries is not None else _table_csv_entries(session, mode))
+        finally:
+            session.close()
+
+    response = Response(stream_with_context(generate()), mimetype="application/zip")
+    response.headers["Content-Disposition"] = f"attachment; filename={download_name}"
+    return response
 
 
 @bp.route("/api/export/all-csv-zip", methods=["GET"])
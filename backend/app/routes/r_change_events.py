@@ -0,0 +1,35 @@
+from flask import Blueprint, Response, abort, request
+
+from backend.app.models.base import Base
+from backend.app.services.change_events import event_stream, subscribe, unsubscribe
+
+
+bp = Blueprint("change_events", __name__)
+
+
+@bp.get("/api/events/stream")
+def stream_change_events():
+    """Server-sent table/row invalidations, one message per changed table per burst.
+
+    `?tables=a,b` restricts the tables reported. A reconnecting client's
+    `Last-Event-ID` (or `?since=`) replays what it missed from the change log,
+    or sends `reset` when that is no longer possible.
+    """
+    tables = [name.strip() for name in request.args.get("tables", "").split(",") if name.strip()]
+    unknown = [name for name in tables if name not in Base.metadata.tables]
+    if unknown:
+        abort(400, description=f"Unknown tables: {', '.join(unknown)}")
+    raw_since = (request.headers.get("Last-Event-ID") or request.args.get("since", "")).strip()
+    try:
+        since = int(raw_since) if raw_since else None
+    except ValueError:
+        abort(400, description="Last-Event-ID must be an integer version")
+
+    subscriber = subscribe(tables or None, since)
+    response = Response(event_stream(subscriber), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-store"
+    # Tell reverse proxies not to buffer the stream.
+    response.headers["X-Accel-Buffering"] = "no"
+    # The stream's own cleanup only runs once it has started; cover clients that leave before that.
+    response.call_on_close(lambda: unsubscribe(subscriber))
+    return response
@@ -0,0 +1,36 @@
+from flask import Blueprint, abort, jsonify, request
+
+from backend.app.db import change_tracking
+from backend.app.db import init_db as db_runtime
+from backend.app.models.base import Base
+
+
+bp = Blueprint("changes", __name__)
+
+
+@bp.get("/api/changes")
+def get_changes():
+    """Rows committed since `?since=<version>`, one compact delta per row.
+
+    Without `since` only the current version and per-table versions are
+    returned, as a starting cursor. `?tables=a,b` restricts the tables reported.
+    When `reset` is true the cursor can no longer be served (too old, or from
+    before a restart or database switch) and the client should reload.
+    """
+    raw_since = request.args.get("since", "").strip()
+    try:
+        since = int(raw_since) if raw_since else None
+    except ValueError:
+        abort(400, description="since must be an integer version")
+    tables = [name.strip() for name in request.args.get("tables", "").split(",") if name.strip()]
+    unknown = [name for name in tables if name not in Base.metadata.tables]
+    if unknown:
+        abort(400, description=f"Unknown tables: {', '.join(unknown)}")
+
+    engine = db_runtime.get_engine()
+    result = change_tracking.changes_since(engine, since, tables or None)
+    versions = change_tracking.table_versions(engine)
+    result["tables"] = {name: versions[name] for name in tables or sorted(versions) if name in versions}
+    response = jsonify(result)
+    response.headers["Cache-Control"] = "no-store"
+    return response
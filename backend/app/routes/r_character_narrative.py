@@ -2,6 +2,7 @@ from typing import Any, Dict, List
 
 from sqlalchemy.orm import Session
 
+from backend.app.db.references import reference_resolver
 from backend.app.models.m_character_narrative import (
     CharacterBeatType,
     CharacterRelationship,
@@ -31,7 +32,7 @@ def _require_flags(db_session: Session, data: Dict[str, Any], key: str) -> List[
     if not isinstance(values, list) or any(not isinstance(value, str) or not value.strip() for value in values):
         raise ValueError(f"{key} must be an array of flag IDs")
     normalized = list(dict.fromkeys(value.strip() for value in values))
-    missing = [flag_id for flag_id in normalized if not db_session.get(Flag, flag_id)]
+    missing = reference_resolver(db_session).missing(Flag, normalized)
     if missing:
         raise ValueError(f"{key} references missing flags: {', '.join(missing)}")
     return normalized
@@ -3,7 +3,7 @@ from backend.app.models.m_characterclasses import CharacterClass, ClassRole
 from backend.app.models.m_stats import Stat
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
 
 class ClassRoute(BaseRoute):
@@ -86,19 +86,11 @@ class ClassRoute(BaseRoute):
                query = db_session.query(self.model)
                if search:
                    query = query.filter(
-                       (self.model.name.ilike(f"%{search}%")) |
-                       (self.model.id.ilike(f"%{search}%"))
+                       self._build_search_filter_expression(db_session, search, self.model.name, self.model.id)
                    )
                if tags:
-                   query = query.filter(self.model.tags != None)
-                   for tag in tags:
-                       tag = tag.strip()
-                       if tag:
-                           query = query.filter(
-                               self._build_tag_filter_expression(tag)
-                           )
-               items = query.all()
-               return jsonify(self.serialize_list(items))
+                   query = query.filter(self._build_tags_filter_expression(db_session, tags))
+               return self.list_response(query)
            finally:
                db_session.close()
 
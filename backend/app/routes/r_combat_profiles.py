@@ -12,8 +12,9 @@ from backend.app.models.m_stats import Stat
 from backend.app.models.m_statuses import Status, StatusCategory, StatusPolarity
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 
 class CombatProfileRoute(BaseRoute):
@@ -104,13 +105,22 @@ class CombatProfileRoute(BaseRoute):
         profile.aggression = data.get("aggression")
         _validate_number(data.get("xp_reward"), "xp_reward")
         profile.xp_reward = data.get("xp_reward")
+        references = reference_resolver(db_session)
+        companion_refs = data.get("companion_config") if isinstance(data.get("companion_config"), dict) else {}
+        references.expect_rows(Ability, companion_refs.get("custom_abilities"))
+        references.expect_rows(Ability, data.get("custom_abilities"))
+        references.expect_rows(Item, data.get("loot_table"), "item_id")
+        references.expect_rows(Currency, data.get("currency_rewards"), "currency_id")
+        references.expect_rows(Faction, data.get("reputation_rewards"), "faction_id")
+        references.expect_rows(Quest, data.get("related_quests"))
+        references.expect_rows(Status, data.get("status_rules"), "status_id")
         companion_config = data.get("companion_config", {})
         if companion_config and not isinstance(companion_config, dict):
             raise ValueError("companion_config must be an object")
         if companion_config:
             companion_abilities = _require_list(companion_config.get("custom_abilities", []), "companion_config.custom_abilities")
             for ability_id in companion_abilities:
-                if not db_session.get(Ability, ability_id):
+                if not references.exists(Ability, ability_id):
                     raise ValueError(f"Invalid ability_id in companion_config.custom_abilities: {ability_id}")
             companion_custom_stats = _normalize_stat_entries(
                 companion_config.get("custom_stats", []),
@@ -131,7 +141,7 @@ class CombatProfileRoute(BaseRoute):
                     companion_config["progression"] = progression
         if companion_config and "class_id" in companion_config:
             companion_config["class_id"] = companion_config.get("class_id") or None
-            if companion_config["class_id"] and not db_session.get(CharacterClass, companion_config["class_id"]):
+            if companion_config["class_id"] and not references.exists(CharacterClass, companion_config["class_id"]):
                 raise ValueError(f"Invalid class_id in companion_config: {companion_config['class_id']}")
         for key in ["level"]:
             _validate_number(companion_config.get(key), f"companion_config.{key}")
@@ -152,7 +162,7 @@ class CombatProfileRoute(BaseRoute):
         # Validate ability references
         custom_abilities = _require_list(data.get("custom_abilities", []), "custom_abilities")
         for ability_id in custom_abilities:
-            if not db_session.get(Ability, ability_id):
+            if not references.exists(Ability, ability_id):
                 raise ValueError(f"Invalid ability_id: {ability_id}")
 
         # Validate loot entries
@@ -163,7 +173,7 @@ class CombatProfileRoute(BaseRoute):
             item_id = entry.get("item_id")
             if not item_id:
                 raise ValueError("loot_table entries must include item_id")
-            if not db_session.get(Item, item_id):
+            if not references.exists(Item, item_id):
                 raise ValueError(f"Invalid item_id in loot_table: {item_id}")
             if entry.get("drop_chance") is None:
                 raise ValueError("loot_table entries must include drop_chance")
@@ -178,7 +188,7 @@ class CombatProfileRoute(BaseRoute):
             if not currency_id or entry.get("amount") is None:
                 raise ValueError("currency_rewards entries must include currency_id and amount")
             _validate_number(entry.get("amount"), "currency_rewards.amount")
-            if not db_session.get(Currency, currency_id):
+            if not references.exists(Currency, currency_id):
                 raise ValueError(f"Invalid currency_id in rewards: {currency_id}")
             _validate_chance(entry.get("drop_chance"), "currency_rewards.drop_chance")
 
@@ -191,14 +201,14 @@ class CombatProfileRoute(BaseRoute):
             if not faction_id or entry.get("amount") is None:
                 raise ValueError("reputation_rewards entries must include faction_id and amount")
             _validate_number(entry.get("amount"), "reputation_rewards.amount")
-            if not db_session.get(Faction, faction_id):
+            if not references.exists(Faction, faction_id):
                 raise ValueError(f"Invalid faction_id in rewards: {faction_id}")
             _validate_chance(entry.get("drop_chance"), "reputation_rewards.drop_chance")
 
         # Validate related quests
         related_quests = _require_list(data.get("related_quests", []), "related_quests")
         for quest_id in related_quests:
-            if not db_session.get(Quest, quest_id):
+            if not references.exists(Quest, quest_id):
                 raise ValueError(f"Invalid quest_id: {quest_id}")
 
         tags = _require_list(data.get("tags", []), "tags")
@@ -209,7 +219,7 @@ class CombatProfileRoute(BaseRoute):
             selectors = [key for key in ("status_id", "category", "polarity") if rule.get(key)]
             if len(selectors) != 1:
                 raise ValueError("status_rules entries require exactly one status_id, category, or polarity selector")
-            if rule.get("status_id") and not db_session.get(Status, rule["status_id"]):
+            if rule.get("status_id") and not references.exists(Status, rule["status_id"]):
                 raise ValueError(f"Invalid status_id in status_rules: {rule['status_id']}")
             if rule.get("category") not in (None, ""):
                 StatusCategory(rule["category"])
@@ -241,19 +251,11 @@ class CombatProfileRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.character_id.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.character_id, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -5,6 +5,7 @@ from sqlalchemy import create_engine
 from backend.app.config import DATA_DIR
 from backend.app.db import init_db as db_runtime
 from backend.app.models.base import Base
+from backend.app.services.query_plans import query_plan_report
 
 bp = Blueprint("db_admin", __name__)
 
@@ -13,6 +14,8 @@ def reset_main_db():
     engine = db_runtime.get_engine()
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    db_runtime.ensure_derived_indexes(engine)
+    db_runtime.notify_database_change()
     return jsonify({"status": "ok", "active": f"{db_runtime.get_active_db_name()}.sqlite"})
 
 
@@ -87,3 +90,9 @@ def list_preview_dbs():
         "databases": dbs,
         "active": f"{db_runtime.get_active_db_name()}.sqlite",
     })
+
+
+@bp.route("/api/db/query_plans", methods=["GET"])
+def get_query_plans():
+    """EXPLAIN QUERY PLAN of the hot lookup queries; `scanning` names those not served by an index."""
+    return jsonify(query_plan_report(db_runtime.get_engine()))
@@ -1,11 +1,14 @@
 from backend.app.routes.base_route import BaseRoute
+from backend.app.routes.http_caching import conditional_get
 from backend.app.models.m_dialogue_nodes import DialogueNode
 from backend.app.models.m_dialogues import Dialogue
 from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_flags import Flag
 from backend.app.models.m_characters import Character
 from backend.app.services.dialogue_choice_actions import validate_choice_contracts
+from backend.app.services.dialogue_choice_index import action_positions, choice_positions
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 from flask import jsonify, abort, request
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
@@ -20,7 +23,7 @@ class DialogueNodeRoute(BaseRoute):
         self.register_additional_routes()
         
     def register_additional_routes(self):
-        self.bp.route("/api/dialogues/<dialogue_id>/nodes", methods=["GET"])(self.get_dialogue_tree)
+        self.bp.route("/api/dialogues/<dialogue_id>/nodes", methods=["GET"])(conditional_get(self.content_tables)(self.get_dialogue_tree))
         
     def get_required_fields(self) -> List[str]:
         return ["id", "slug", "dialogue_id", "speaker", "text"]
@@ -47,6 +50,12 @@ class DialogueNodeRoute(BaseRoute):
         # Optional relationship
         node.requirements_id = data.get("requirements_id") or None
         
+        references = reference_resolver(db_session)
+        references.expect_rows(Flag, data.get("set_flags"))
+        references.expect_rows(Requirement, data.get("choices"), "requirements_id")
+        for choice in data.get("choices") or []:
+            if isinstance(choice, dict):
+                references.expect_rows(Flag, choice.get("set_flags"))
         # Validate flags if present
         set_flags = data.get("set_flags", [])
         if not isinstance(set_flags, list):
@@ -55,24 +64,19 @@ class DialogueNodeRoute(BaseRoute):
             for flag_id in set_flags:
                 if not isinstance(flag_id, str) or not flag_id:
                     raise ValueError("set_flags entries must be non-empty ids")
-                if not db_session.get(Flag, flag_id):
+                if not references.exists(Flag, flag_id):
                     raise ValueError(f"Invalid flag_id: {flag_id}")
         
         # JSON fields with validation
         choices = validate_choice_contracts(db_session, node, data.get("choices", []))
         incoming_choice_ids = {choice["id"] for choice in choices}
         incoming_action_ids = {action.get("id") or action.get("action_id") for choice in choices for action in choice.get("actions") or []}
-        for other_node in db_session.query(DialogueNode).filter(DialogueNode.id != node.id).all():
-            for other_choice in other_node.choices or []:
-                if not isinstance(other_choice, dict):
-                    continue
-                other_choice_id = other_choice.get("id") or other_choice.get("choice_id")
-                if other_choice_id in incoming_choice_ids:
-                    raise ValueError(f"Dialogue choice id already belongs to another node: {other_choice_id}")
-                for other_action in other_choice.get("actions") or []:
-                    other_action_id = (other_action.get("id") or other_action.get("action_id")) if isinstance(other_action, dict) else None
-                    if other_action_id in incoming_action_ids:
-                        raise ValueError(f"Dialogue choice action id already belongs to another node: {other_action_id}")
+        for choice_id in sorted(incoming_choice_ids):
+            if any(owner_id != node.id for owner_id, _index in choice_positions(db_session, choice_id)):
+                raise ValueError(f"Dialogue choice id already belongs to another node: {choice_id}")
+        for action_id in sorted(action_id for action_id in incoming_action_ids if action_id):
+            if any(owner_id != node.id for owner_id, _index in action_positions(db_session, action_id)):
+                raise ValueError(f"Dialogue choice action id already belongs to another node: {action_id}")
         for choice in choices:
             next_node_id = choice.get("next_node_id")
             if next_node_id:
@@ -84,7 +88,7 @@ class DialogueNodeRoute(BaseRoute):
 
             # Validate requirements in choices if present
             if choice.get("requirements_id"):
-                if not db_session.get(Requirement, choice["requirements_id"]):
+                if not references.exists(Requirement, choice["requirements_id"]):
                     raise ValueError(f"Invalid requirements_id in choice: {choice['requirements_id']}")
             
             # Validate flags in choices if present
@@ -94,7 +98,7 @@ class DialogueNodeRoute(BaseRoute):
                 for flag_id in choice["set_flags"]:
                     if not isinstance(flag_id, str) or not flag_id:
                         raise ValueError("Choice set_flags entries must be non-empty ids")
-                    if not db_session.get(Flag, flag_id):
+                    if not references.exists(Flag, flag_id):
                         raise ValueError(f"Invalid flag_id in choice: {flag_id}")
         
         tags = data.get("tags", [])
@@ -126,20 +130,11 @@ class DialogueNodeRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.speaker.ilike(f"%{search}%")) |
-                    (self.model.text.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.speaker, self.model.text, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
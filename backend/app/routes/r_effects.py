@@ -6,8 +6,9 @@ from backend.app.models.m_statuses import Status, StatusCategory, StatusPolarity
 from backend.app.models.m_items import DamageType
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 class EffectRoute(BaseRoute):
     def __init__(self):
@@ -71,8 +72,10 @@ class EffectRoute(BaseRoute):
         status_filter = data.get("status_filter", {})
         if status_filter is not None and not isinstance(status_filter, dict):
             raise ValueError("status_filter must be an object")
+        references = reference_resolver(db_session)
+        references.expect_rows(Status, status_filter.get("status_ids") if isinstance(status_filter, dict) else None)
         for status_id in status_filter.get("status_ids", []) if isinstance(status_filter, dict) else []:
-            if not db_session.get(Status, status_id):
+            if not references.exists(Status, status_id):
                 raise ValueError(f"Invalid status_id in status_filter: {status_id}")
         for category in status_filter.get("categories", []) if isinstance(status_filter, dict) else []:
             StatusCategory(category)
@@ -105,19 +108,11 @@ class EffectRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.name.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.name, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
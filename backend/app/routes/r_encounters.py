@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, abort
+from flask import request, jsonify, abort
 from backend.app.routes.base_route import BaseRoute
 from backend.app.models.m_adventure_narrative import AdventureBeatLink, AdventureBeatLinkTargetType
 from backend.app.models.m_encounters import Encounter, EncounterType
@@ -15,6 +15,7 @@ from backend.app.models.m_locations import Location
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 from backend.app.services.narrative_contracts import validate_outcome_transitions, validate_repeat_policy
 
 class EncounterRoute(BaseRoute):
@@ -62,6 +63,13 @@ class EncounterRoute(BaseRoute):
         encounter.description = data.get("description")
         encounter.requirements_id = data.get("requirements_id") or None
         
+        references = reference_resolver(db_session)
+        references.expect_rows(Character, data.get("participants"), "character_id")
+        reward_refs = data.get("rewards") if isinstance(data.get("rewards"), dict) else {}
+        references.expect_rows(Flag, reward_refs.get("flags_set"))
+        references.expect_rows(Item, reward_refs.get("items"), "item_id")
+        references.expect_rows(Currency, reward_refs.get("currencies"), "currency_id")
+        references.expect_rows(Faction, reward_refs.get("reputation"), "faction_id")
         # Validate participants
         participants = _require_list(data.get("participants", []), "participants")
         allowed_contexts = {"Combat", "Interaction"}
@@ -71,7 +79,7 @@ class EncounterRoute(BaseRoute):
             if not isinstance(entry, dict):
                 raise ValueError("Participant entries must be objects")
             character_id = entry.get("character_id")
-            if not character_id or not db_session.get(Character, character_id):
+            if not character_id or not references.exists(Character, character_id):
                 raise ValueError(f"Invalid character_id: {character_id}")
             participant_ids.append(character_id)
             contexts = entry.get("contexts", [])
@@ -95,7 +103,7 @@ class EncounterRoute(BaseRoute):
             _validate_number(rewards.get("xp"), "rewards.xp")
         flags_set = _require_list(rewards.get("flags_set", []), "rewards.flags_set")
         for flag_id in flags_set:
-                if not db_session.get(Flag, flag_id):
+                if not references.exists(Flag, flag_id):
                     raise ValueError(f"Invalid flag_id in rewards: {flag_id}")
         items = _require_list(rewards.get("items", []), "rewards.items")
         for entry in items:
@@ -105,7 +113,7 @@ class EncounterRoute(BaseRoute):
             if not item_id or entry.get("quantity") is None:
                 raise ValueError("Item rewards must include item_id and quantity")
             _validate_number(entry.get("quantity"), "rewards.items.quantity")
-            if not db_session.get(Item, item_id):
+            if not references.exists(Item, item_id):
                 raise ValueError(f"Invalid item_id in rewards: {item_id}")
         currencies = _require_list(rewards.get("currencies", []), "rewards.currencies")
         for entry in currencies:
@@ -115,7 +123,7 @@ class EncounterRoute(BaseRoute):
             if not currency_id or entry.get("amount") is None:
                 raise ValueError("Currency rewards must include currency_id and amount")
             _validate_number(entry.get("amount"), "rewards.currencies.amount")
-            if not db_session.get(Currency, currency_id):
+            if not references.exists(Currency, currency_id):
                 raise ValueError(f"Invalid currency_id in rewards: {currency_id}")
         reputation = _require_list(rewards.get("reputation", []), "rewards.reputation")
         for entry in reputation:
@@ -125,7 +133,7 @@ class EncounterRoute(BaseRoute):
             if not faction_id or entry.get("amount") is None:
                 raise ValueError("Reputation rewards must include faction_id and amount")
             _validate_number(entry.get("amount"), "rewards.reputation.amount")
-            if not db_session.get(Faction, faction_id):
+            if not references.exists(Faction, faction_id):
                 raise ValueError(f"Invalid faction_id in rewards: {faction_id}")
         rewards["currencies"] = currencies
         rewards["reputation"] = reputation
@@ -221,19 +229,11 @@ class EncounterRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.name.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.name, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
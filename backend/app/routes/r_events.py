@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, abort
+from flask import request
 from backend.app.routes.base_route import BaseRoute
 from backend.app.models.m_events import Event, EventType
 from backend.app.models.m_requirements import Requirement
@@ -13,6 +13,7 @@ from backend.app.models.m_items import Item
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 from backend.app.services.narrative_contracts import validate_narrative_actions, validate_outcome_transitions, validate_repeat_policy
 
 class EventRoute(BaseRoute):
@@ -58,10 +59,15 @@ class EventRoute(BaseRoute):
         event.encounter_id = data.get("encounter_id")
         event.next_event_id = data.get("next_event_id")
         
+        references = reference_resolver(db_session)
+        references.expect_rows(Flag, data.get("flags_set"))
+        references.expect_rows(Item, data.get("item_rewards"), "item_id")
+        references.expect_rows(Currency, data.get("currency_rewards"), "currency_id")
+        references.expect_rows(Faction, data.get("reputation_rewards"), "faction_id")
         # Validate flags if present
         flags_set = data.get("flags_set", [])
         for flag_id in flags_set:
-            if not db_session.get(Flag, flag_id):
+            if not references.exists(Flag, flag_id):
                 raise ValueError(f"Invalid flag_id: {flag_id}")
         event.flags_set = flags_set
         
@@ -77,7 +83,7 @@ class EventRoute(BaseRoute):
                 raise ValueError("item_rewards entries must include item_id and quantity")
             if isinstance(reward.get("quantity"), bool) or not isinstance(reward.get("quantity"), (int, float)):
                 raise ValueError("item_rewards.quantity must be a number")
-            if not db_session.get(Item, item_id):
+            if not references.exists(Item, item_id):
                 raise ValueError(f"Invalid item_id in rewards: {item_id}")
         event.item_rewards = item_rewards
         event.xp_reward = data.get("xp_reward")
@@ -86,7 +92,7 @@ class EventRoute(BaseRoute):
             if not isinstance(reward, dict):
                 raise ValueError("Currency reward entries must be objects")
             currency_id = reward.get("currency_id")
-            if currency_id and not db_session.get(Currency, currency_id):
+            if currency_id and not references.exists(Currency, currency_id):
                 raise ValueError(f"Invalid currency_id in rewards: {currency_id}")
         event.currency_rewards = currency_rewards
 
@@ -95,7 +101,7 @@ class EventRoute(BaseRoute):
             if not isinstance(reward, dict):
                 raise ValueError("Reputation reward entries must be objects")
             faction_id = reward.get("faction_id")
-            if faction_id and not db_session.get(Faction, faction_id):
+            if faction_id and not references.exists(Faction, faction_id):
                 raise ValueError(f"Invalid faction_id in rewards: {faction_id}")
         event.reputation_rewards = reputation_rewards
 
@@ -120,19 +126,11 @@ class EventRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.title.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.title, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
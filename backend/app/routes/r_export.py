@@ -1,16 +1,18 @@
 # backend/app/routes/r_export.py
 from flask import Blueprint, Response, abort, request, jsonify
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 from backend.app.models import ALL_MODELS
 from backend.app.models.m_requirements import RequirementMinFactionReputation
 from backend.app.routes.base_route import ROUTE_REGISTRY
+from backend.app.schemas import get_schema_entry
 from backend.app.utils.csv_tools import (
     AUTHORING_ONLY_TABLES,
-    UE_ROW_KEY_HEADER,
+    apply_import_row_key,
     build_csv_rows,
     write_csv_string,
     coerce_row_from_schema,
-    load_schema,
+    compile_row_coercer,
 )
 import json
 import csv
@@ -19,18 +21,6 @@ import io
 bp = Blueprint("export", __name__)
 
 
-def _slugify(s: str) -> str:
-    import re
-    if not s:
-        return ""
-    s = s.strip().lower()
-    s = re.sub(r"[\u0300-\u036f]", "", s)
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"^-+|-+$", "", s)
-    s = re.sub(r"-{2,}", "-", s)
-    return s
-
-
 def _read_uploaded_csv():
     if 'file' not in request.files:
         return None, (jsonify({"error": "No file uploaded."}), 400)
@@ -43,15 +33,12 @@ def _read_uploaded_csv():
 
 def _coercion_warnings(table_name, raw_row, row_number):
     warnings = []
-    schema = load_schema(table_name) or {}
-    properties = schema.get("properties", {}) if isinstance(schema.get("properties"), dict) else {}
+    entry = get_schema_entry(table_name)
+    field_types = entry["types"] if entry else {}
     for key, raw_value in raw_row.items():
         if not key or raw_value is None or str(raw_value).strip() == "":
             continue
-        field_schema = properties.get(key)
-        if not isinstance(field_schema, dict):
-            continue
-        field_type = field_schema.get("type")
+        field_type = field_types.get(key)
         if field_type not in ("array", "object"):
             continue
         try:
@@ -65,20 +52,18 @@ def _coercion_warnings(table_name, raw_row, row_number):
     return warnings
 
 
-def _normalize_import_row(table_name, model_class, route, raw_row, strict_json=False):
-    clean_row = {k: v for k, v in raw_row.items() if k}
-    clean_row = coerce_row_from_schema(table_name, clean_row, strict_json=strict_json)
-    row_key_value = clean_row.get(UE_ROW_KEY_HEADER)
-    if row_key_value is not None and str(row_key_value).strip() != "":
-        if not clean_row.get("slug"):
-            clean_row["slug"] = str(row_key_value).strip().lower()
-    clean_row.pop(UE_ROW_KEY_HEADER, None)
-    if hasattr(model_class, '__table__') and 'slug' in model_class.__table__.columns:
-        if not clean_row.get('slug'):
-            base = clean_row.get('name') or clean_row.get('title') or clean_row.get('id')
-            clean_row['slug'] = _slugify(str(base))
-        else:
-            clean_row['slug'] = str(clean_row.get('slug') or '').strip().lower()
+def _row_coercer(table_name, raw_rows, strict_json=False):
+    fieldnames = [key for key in raw_rows[0] if key] if raw_rows else []
+    return compile_row_coercer(table_name, fieldnames, strict_json=strict_json)
+
+
+def _normalize_import_row(table_name, model_class, route, raw_row, strict_json=False, coerce=None):
+    if coerce is not None:
+        clean_row = coerce(raw_row)
+    else:
+        clean_row = {k: v for k, v in raw_row.items() if k}
+        clean_row = coerce_row_from_schema(table_name, clean_row, strict_json=strict_json)
+    apply_import_row_key(model_class, clean_row)
     item_id = str(route.get_id_from_data(clean_row) if route else clean_row.get("id", ""))
     return item_id, clean_row
 
@@ -159,10 +144,11 @@ def _preview_import_csv(table_name, strict_json=False):
         imported_ids = set()
         added = updated = unchanged = 0
 
+        coerce = _row_coercer(table_name, raw_rows, strict_json=strict_json)
         for index, raw_row in enumerate(raw_rows or [], start=2):
             warnings.extend(_coercion_warnings(table_name, raw_row, index))
             try:
-                item_id, clean_row = _normalize_import_row(table_name, model_class, route, raw_row, strict_json=strict_json)
+                item_id, clean_row = _normalize_import_row(table_name, model_class, route, raw_row, strict_json=strict_json, coerce=coerce)
             except Exception as exc:
                 errors.append({"row": index, "message": f"Failed to parse row: {str(exc)}"})
                 continue
@@ -243,9 +229,14 @@ def _import_csv(table_name, strict_json=False):
         cascade_deleted = 0
 
         try:
-            for row in raw_rows or []:
-                item_id, clean_row = _normalize_import_row(table_name, model_class, route, row, strict_json=strict_json)
-
+            coerce = _row_coercer(table_name, raw_rows, strict_json=strict_json)
+            normalized_rows = [
+                _normalize_import_row(table_name, model_class, route, row, strict_json=strict_json, coerce=coerce)
+                for row in raw_rows or []
+            ]
+            # Check every referenced id with one query per target table instead of one per row.
+            reference_resolver(session).expect_foreign_keys(model_class, [clean_row for _item_id, clean_row in normalized_rows])
+            for item_id, clean_row in normalized_rows:
                 # Validate id present
                 if not clean_row.get("id"):
                     raise ValueError("Missing required column 'id' or empty id value")
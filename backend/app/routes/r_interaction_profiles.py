@@ -8,8 +8,9 @@ from backend.app.models.m_items import Item
 from backend.app.models.m_flags import Flag
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 
 class InteractionProfileRoute(BaseRoute):
@@ -56,10 +57,14 @@ class InteractionProfileRoute(BaseRoute):
         profile.role = data.get("role")
         profile.dialogue_tree_id = data.get("dialogue_tree_id") or None
 
+        references = reference_resolver(db_session)
+        references.expect_rows(Quest, data.get("available_quests"))
+        references.expect_rows(Item, data.get("inventory"), "item_id")
+        references.expect_rows(Flag, data.get("flags_set_on_interaction"))
         # Validate quests
         available_quests = _require_list(data.get("available_quests", []), "available_quests")
         for quest_id in available_quests:
-            if not db_session.get(Quest, quest_id):
+            if not references.exists(Quest, quest_id):
                 raise ValueError(f"Invalid quest_id: {quest_id}")
 
         # Validate inventory items
@@ -71,13 +76,13 @@ class InteractionProfileRoute(BaseRoute):
             if not item_id or item.get("price") is None:
                 raise ValueError("inventory entries must include item_id and price")
             _validate_number(item.get("price"), "inventory.price")
-            if not db_session.get(Item, item_id):
+            if not references.exists(Item, item_id):
                 raise ValueError(f"Invalid item_id in inventory: {item_id}")
 
         # Validate flags
         flags_set_on_interaction = _require_list(data.get("flags_set_on_interaction", []), "flags_set_on_interaction")
         for flag_id in flags_set_on_interaction:
-            if not db_session.get(Flag, flag_id):
+            if not references.exists(Flag, flag_id):
                 raise ValueError(f"Invalid flag_id: {flag_id}")
         tags = _require_list(data.get("tags", []), "tags")
 
@@ -98,19 +103,11 @@ class InteractionProfileRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.character_id.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.character_id, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
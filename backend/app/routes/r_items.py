@@ -1,4 +1,4 @@
-from flask import request, jsonify
+from flask import request
 from backend.app.routes.base_route import BaseRoute
 from backend.app.models.m_items import (
     Item,
@@ -18,11 +18,15 @@ from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_effects import Effect
 from backend.app.models.m_currencies import Currency
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
 
 
 class ItemRoute(BaseRoute):
+    # serialize_item reads modifiers and their stats/attributes.
+    eager_load_depth = 2
+
     def __init__(self):
         super().__init__(
             model=Item,
@@ -54,10 +58,11 @@ class ItemRoute(BaseRoute):
         })
 
         # Effects validation if provided
+        references = reference_resolver(db_session)
         if "effects" in data and data["effects"]:
-            for effect_id in data["effects"]:
-                if not db_session.get(Effect, effect_id):
-                    raise ValueError(f"Invalid effect_id: {effect_id}")
+            missing_effects = references.missing(Effect, data["effects"])
+            if missing_effects:
+                raise ValueError(f"Invalid effect_id: {missing_effects[0]}")
 
         # Update fields
         item.slug = data["slug"]
@@ -110,6 +115,7 @@ class ItemRoute(BaseRoute):
         # Replace stat modifiers when provided
         if "stat_modifiers" in data:
             incoming_modifiers = data.get("stat_modifiers") or []
+            references.expect_rows(Stat, incoming_modifiers, "stat_id")
             item.stat_modifiers[:] = []
             for idx, entry in enumerate(incoming_modifiers):
                 if not isinstance(entry, dict):
@@ -117,7 +123,7 @@ class ItemRoute(BaseRoute):
                 stat_id = entry.get("stat_id")
                 if not stat_id:
                     raise ValueError("stat_modifiers entries require stat_id")
-                if not db_session.get(Stat, stat_id):
+                if not references.exists(Stat, stat_id):
                     raise ValueError(f"Invalid stat_id: {stat_id}")
                 value = entry.get("value")
                 if value is None:
@@ -150,6 +156,7 @@ class ItemRoute(BaseRoute):
         # Replace attribute modifiers when provided
         if "attribute_modifiers" in data:
             incoming_attributes = data.get("attribute_modifiers") or []
+            references.expect_rows(Attribute, incoming_attributes, "attribute_id")
             item.attribute_modifiers[:] = []
             for idx, entry in enumerate(incoming_attributes):
                 if not isinstance(entry, dict):
@@ -157,7 +164,7 @@ class ItemRoute(BaseRoute):
                 attribute_id = entry.get("attribute_id")
                 if not attribute_id:
                     raise ValueError("attribute_modifiers entries require attribute_id")
-                if not db_session.get(Attribute, attribute_id):
+                if not references.exists(Attribute, attribute_id):
                     raise ValueError(f"Invalid attribute_id: {attribute_id}")
                 value = entry.get("value")
                 if value is None:
@@ -260,20 +267,11 @@ class ItemRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.name.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.name, self.model.id)
                 )
             if tags:
-                # Filter items where any tag matches (case-insensitive, partial)
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -6,6 +6,7 @@ from backend.app.models.m_encounters import Encounter
 from backend.app.models.m_location_encounter_tables import LocationEncounterTable
 from backend.app.models.m_locations import Location
 from backend.app.models.m_requirements import Requirement
+from backend.app.db.references import reference_resolver
 from backend.app.routes.base_route import BaseRoute
 
 
@@ -39,13 +40,15 @@ class LocationEncounterTableRoute(BaseRoute):
             entries = []
         if not isinstance(entries, list):
             raise ValueError("encounter_entries must be a list")
+        references = reference_resolver(db_session)
+        references.expect_rows(Encounter, entries, "encounter_id")
         for index, entry in enumerate(entries):
             if not isinstance(entry, dict):
                 raise ValueError(f"encounter_entries[{index}] must be an object")
             encounter_id = entry.get("encounter_id")
             if not encounter_id:
                 raise ValueError(f"encounter_entries[{index}] must include encounter_id")
-            if not db_session.get(Encounter, encounter_id):
+            if not references.exists(Encounter, encounter_id):
                 raise ValueError(f"Invalid encounter_entries[{index}].encounter_id: {encounter_id}")
             weight = _non_negative_number(entry.get("weight", 1), f"encounter_entries[{index}].weight")
             min_count = _non_negative_int(entry.get("min_count", 1), f"encounter_entries[{index}].min_count")
@@ -3,8 +3,9 @@ from backend.app.models.m_locations import Biome, BiomeInheritance, BiomeModifie
 from backend.app.models.m_encounters import Encounter
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 class LocationRoute(BaseRoute):
     def __init__(self):
@@ -112,9 +113,11 @@ class LocationRoute(BaseRoute):
         location.coordinates = coordinates
         
         # JSON fields
+        references = reference_resolver(db_session)
+        references.expect_rows(Encounter, data.get("encounters"))
         encounters = data.get("encounters", [])
         for encounter_id in encounters:
-            if not db_session.get(Encounter, encounter_id):
+            if not references.exists(Encounter, encounter_id):
                 raise ValueError(f"Invalid encounter_id in encounters: {encounter_id}")
         location.encounters = encounters
         variants = data.get("variants") or []
@@ -142,19 +145,11 @@ class LocationRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.name.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.name, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -5,8 +5,9 @@ from backend.app.models.m_timelines import Timeline
 from backend.app.models.m_story_arcs import StoryArc
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 class LoreEntryRoute(BaseRoute):
     def __init__(self):
@@ -38,10 +39,12 @@ class LoreEntryRoute(BaseRoute):
         entry.location_id = data.get("location_id")
         entry.timeline_id = data.get("timeline_id")
         
+        references = reference_resolver(db_session)
+        references.expect_rows(StoryArc, data.get("related_story_arcs"))
         # Validate story arcs if present
         if "related_story_arcs" in data:
             for arc_id in data["related_story_arcs"]:
-                if not db_session.get(StoryArc, arc_id):
+                if not references.exists(StoryArc, arc_id):
                     raise ValueError(f"Invalid story_arc_id: {arc_id}")
         
         # JSON fields
@@ -59,19 +62,11 @@ class LoreEntryRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.title.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.title, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -1,4 +1,4 @@
-from flask import request, jsonify
+from flask import request
 from backend.app.routes.base_route import BaseRoute
 from backend.app.models.m_quests import Quest
 from backend.app.models.m_story_arcs import StoryArc
@@ -10,6 +10,7 @@ from backend.app.models.m_flags import Flag
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 from backend.app.services.narrative_contracts import validate_repeat_policy
 
 class QuestRoute(BaseRoute):
@@ -50,12 +51,23 @@ class QuestRoute(BaseRoute):
         objectives = data.get("objectives", [])
         if not isinstance(objectives, list):
             raise ValueError("objectives must be an array")
+        references = reference_resolver(db_session)
+        references.expect_rows(Requirement, objectives, "requirements_id")
+        references.expect_rows(Requirement, objectives, "requirements")
+        references.expect_rows(Item, objectives, "item_id")
+        for objective in objectives:
+            if isinstance(objective, dict):
+                references.expect_rows(Flag, objective.get("flags_set"))
+        references.expect_rows(Flag, data.get("flags_set_on_completion"))
+        references.expect_rows(Item, data.get("item_rewards"), "item_id")
+        references.expect_rows(Currency, data.get("currency_rewards"), "currency_id")
+        references.expect_rows(Faction, data.get("reputation_rewards"), "faction_id")
         normalized_objectives = []
         for objective in objectives:
             if not isinstance(objective, dict):
                 raise ValueError("Objective entries must be objects")
             req_id = objective.get("requirements_id") or objective.get("requirements")
-            if req_id and not db_session.get(Requirement, req_id):
+            if req_id and not references.exists(Requirement, req_id):
                 raise ValueError(f"Invalid requirements_id in objective: {req_id}")
             if req_id and "requirements_id" not in objective:
                 objective = {**objective, "requirements_id": req_id}
@@ -64,14 +76,14 @@ class QuestRoute(BaseRoute):
             if not isinstance(flags_set, list):
                 raise ValueError("objective flags_set must be an array")
             for flag_id in flags_set:
-                if not db_session.get(Flag, flag_id):
+                if not references.exists(Flag, flag_id):
                     raise ValueError(f"Invalid flag_id in objective: {flag_id}")
             objective_type = objective.get("objective_type") or "custom"
             if objective_type not in {"custom", "inventory_count", "interaction", "encounter", "location"}:
                 raise ValueError(f"Invalid objective_type: {objective_type}")
             if objective_type == "inventory_count":
                 item_id = objective.get("item_id")
-                if not item_id or not db_session.get(Item, item_id):
+                if not item_id or not references.exists(Item, item_id):
                     raise ValueError(f"Invalid item_id in inventory objective: {item_id}")
                 count = objective.get("required_count", 1)
                 if isinstance(count, bool) or not isinstance(count, int) or count < 1:
@@ -97,7 +109,7 @@ class QuestRoute(BaseRoute):
             if not item_id or reward.get("quantity") is None:
                 raise ValueError("item_rewards entries must include item_id and quantity")
             _require_number(reward["quantity"], "item_rewards.quantity")
-            if not db_session.get(Item, item_id):
+            if not references.exists(Item, item_id):
                 raise ValueError(f"Invalid item_id in rewards: {item_id}")
         quest.item_rewards = item_rewards
         
@@ -109,7 +121,7 @@ class QuestRoute(BaseRoute):
             if not currency_id or reward.get("amount") is None:
                 raise ValueError("currency_rewards entries must include currency_id and amount")
             _require_number(reward["amount"], "currency_rewards.amount")
-            if not db_session.get(Currency, currency_id):
+            if not references.exists(Currency, currency_id):
                 raise ValueError(f"Invalid currency_id in rewards: {currency_id}")
         quest.currency_rewards = currency_rewards
 
@@ -121,7 +133,7 @@ class QuestRoute(BaseRoute):
             if not faction_id or reward.get("amount") is None:
                 raise ValueError("reputation_rewards entries must include faction_id and amount")
             _require_number(reward["amount"], "reputation_rewards.amount")
-            if not db_session.get(Faction, faction_id):
+            if not references.exists(Faction, faction_id):
                 raise ValueError(f"Invalid faction_id in rewards: {faction_id}")
         quest.reputation_rewards = reputation_rewards
 
@@ -130,7 +142,7 @@ class QuestRoute(BaseRoute):
         if not isinstance(completion_flags, list):
             raise ValueError("flags_set_on_completion must be an array")
         for flag_id in completion_flags:
-            if not db_session.get(Flag, flag_id):
+            if not references.exists(Flag, flag_id):
                 raise ValueError(f"Invalid flag_id in flags_set_on_completion: {flag_id}")
         quest.flags_set_on_completion = completion_flags
         if data.get("xp_reward") is not None:
@@ -169,19 +181,11 @@ class QuestRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.title.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.title, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
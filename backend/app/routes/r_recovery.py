@@ -1,13 +1,18 @@
-from flask import Blueprint, current_app, jsonify
+from flask import Blueprint, abort, current_app, jsonify, request
 
 from backend.app.services import recovery
+from backend.app.services.parallel_export import resolve_export_workers
 
 bp = Blueprint("recovery", __name__)
 
 
 @bp.route("/api/recovery/export-source", methods=["POST"])
 def export_recovery_source():
-    report = recovery.export_source_csvs()
+    try:
+        workers = resolve_export_workers(request.args.get("workers"))
+    except ValueError as exc:
+        abort(400, description=str(exc))
+    report = recovery.export_source_csvs(workers=workers)
     status_code = 500 if report.get("status") == "error" else 200
     return jsonify(report), status_code
 
@@ -7,8 +7,9 @@ from backend.app.models.m_flags import Flag
 from backend.app.models.m_factions import Faction
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 class RequirementRoute(BaseRoute):
     def __init__(self):
@@ -32,16 +33,20 @@ class RequirementRoute(BaseRoute):
         requirement.forbidden_flags.clear()
         requirement.min_faction_reputation.clear()
         
+        references = reference_resolver(db_session)
+        references.expect_rows(Flag, data.get("required_flags"))
+        references.expect_rows(Flag, data.get("forbidden_flags"))
+        references.expect_rows(Faction, data.get("min_faction_reputation"), "faction_id")
         # Required flags validation and creation
         for flag_id in data.get("required_flags", []):
-            if not db_session.get(Flag, flag_id):
+            if not references.exists(Flag, flag_id):
                 raise ValueError(f"Invalid flag_id: {flag_id}")
             flag_req = RequirementRequiredFlag(requirement=requirement, flag_id=flag_id)
             db_session.add(flag_req)
         
         # Forbidden flags validation and creation
         for flag_id in data.get("forbidden_flags", []):
-            if not db_session.get(Flag, flag_id):
+            if not references.exists(Flag, flag_id):
                 raise ValueError(f"Invalid flag_id: {flag_id}")
             flag_req = RequirementForbiddenFlag(requirement=requirement, flag_id=flag_id)
             db_session.add(flag_req)
@@ -51,7 +56,7 @@ class RequirementRoute(BaseRoute):
             if not all(k in rep_req for k in ["faction_id", "min"]):
                 raise ValueError("Invalid faction reputation entry: missing faction_id or min")
                 
-            if not db_session.get(Faction, rep_req["faction_id"]):
+            if not references.exists(Faction, rep_req["faction_id"]):
                 raise ValueError(f"Invalid faction_id: {rep_req['faction_id']}")
                 
             faction_req = RequirementMinFactionReputation(
@@ -84,18 +89,11 @@ class RequirementRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    self.model.id.ilike(f"%{search}%")
+                    self._build_search_filter_expression(db_session, search, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -0,0 +1,42 @@
+from flask import Blueprint, abort, jsonify, request
+
+from backend.app.db.init_db import get_db_session
+from backend.app.db.search_index import SEARCH_COLUMNS, indexed_tables, search
+from backend.app.routes.http_caching import conditional_get
+
+
+bp = Blueprint("search", __name__)
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+
+@bp.get("/api/search")
+@conditional_get()
+def search_content():
+    """Ranked word-prefix search across every indexed table.
+
+    `?q=` is the search text, `?tables=a,b` restricts the tables searched and
+    `?limit=` caps the number of hits (default 20, at most 100).
+    """
+    query = request.args.get("q", "").strip()
+    raw_limit = request.args.get("limit", "").strip()
+    try:
+        limit = int(raw_limit) if raw_limit else DEFAULT_SEARCH_LIMIT
+    except ValueError:
+        abort(400, description="limit must be an integer")
+    if limit < 1:
+        abort(400, description="limit must be positive")
+    limit = min(limit, MAX_SEARCH_LIMIT)
+    tables = [name.strip() for name in request.args.get("tables", "").split(",") if name.strip()]
+    unknown = [name for name in tables if name not in SEARCH_COLUMNS]
+    if unknown:
+        abort(400, description=f"Unknown search tables: {', '.join(unknown)}")
+
+    db_session = get_db_session()
+    try:
+        if not indexed_tables(db_session.get_bind()):
+            abort(503, description="Full-text search index is not available for the active database")
+        return jsonify({"query": query, "results": search(db_session, query, tables or None, limit)})
+    finally:
+        db_session.close()
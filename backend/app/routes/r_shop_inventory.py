@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, abort
+from flask import request, jsonify, abort
 from backend.app.routes.base_route import BaseRoute
 from backend.app.models.m_shop_inventory import ShopInventory
 from backend.app.models.m_shops import Shop
@@ -91,19 +91,11 @@ class ShopInventoryRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.shop_id.ilike(f"%{search}%")) |
-                    (self.model.item_id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.shop_id, self.model.item_id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -11,8 +11,9 @@ from backend.app.utils.id import generate_ulid
 from backend.app.utils.pricing import compute_shop_price
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 class ShopRoute(BaseRoute):
     def __init__(self):
@@ -80,6 +81,10 @@ class ShopRoute(BaseRoute):
         if not isinstance(rows, list):
             raise ValueError("inventory must be an array")
 
+        references = reference_resolver(db_session)
+        references.expect_rows(Item, rows, "item_id")
+        references.expect_rows(Requirement, rows, "requirements_id")
+        references.expect_rows(Currency, rows, "currency_id")
         existing_by_id = {row.id: row for row in list(shop.inventory or []) if row.id}
         next_rows: List[ShopInventory] = []
         seen_ids = set()
@@ -90,13 +95,13 @@ class ShopRoute(BaseRoute):
             item_id = row.get("item_id")
             if not item_id:
                 raise ValueError("inventory entries require item_id")
-            if not db_session.get(Item, item_id):
+            if not references.exists(Item, item_id):
                 raise ValueError(f"Invalid inventory item_id: {item_id}")
             requirements_id = row.get("requirements_id")
-            if requirements_id and not db_session.get(Requirement, requirements_id):
+            if requirements_id and not references.exists(Requirement, requirements_id):
                 raise ValueError(f"Invalid inventory requirements_id: {requirements_id}")
             currency_id = row.get("currency_id")
-            if currency_id and not db_session.get(Currency, currency_id):
+            if currency_id and not references.exists(Currency, currency_id):
                 raise ValueError(f"Invalid inventory currency_id: {currency_id}")
 
             row_id = row.get("id") or generate_ulid()
@@ -158,19 +163,11 @@ class ShopRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.name.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.name, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
@@ -6,8 +6,9 @@ from backend.app.models.m_timelines import Timeline
 from backend.app.models.m_quests import Quest
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 class StoryArcRoute(BaseRoute):
     def __init__(self):
@@ -45,10 +46,18 @@ class StoryArcRoute(BaseRoute):
         # Optional relationship
         story_arc.timeline_id = data.get("timeline_id")
         
+        references = reference_resolver(db_session)
+        references.expect_rows(Flag, data.get("required_flags"))
+        references.expect_rows(Quest, data.get("related_quests"))
+        references.expect_rows(Quest, data.get("branching"), "quest_id")
+        for branch in data.get("branching") or []:
+            if isinstance(branch, dict):
+                references.expect_rows(Quest, branch.get("branches"), "next_quest_id")
+                references.expect_rows(Flag, branch.get("branches"), "condition_flag")
         # Validate flags if present
         if "required_flags" in data:
             for flag_id in data["required_flags"]:
-                if not db_session.get(Flag, flag_id):
+                if not references.exists(Flag, flag_id):
                     raise ValueError(f"Invalid flag_id: {flag_id}")
         
         # JSON fields
@@ -56,7 +65,7 @@ class StoryArcRoute(BaseRoute):
         if not isinstance(related_quests, list):
             raise ValueError("related_quests must be an array")
         for quest_id in related_quests:
-            if not db_session.get(Quest, quest_id):
+            if not references.exists(Quest, quest_id):
                 raise ValueError(f"Invalid quest_id in related_quests: {quest_id}")
         branching = data.get("branching", [])
         if not isinstance(branching, list):
@@ -64,15 +73,15 @@ class StoryArcRoute(BaseRoute):
         for branch in branching:
             if not isinstance(branch, dict) or not branch.get("quest_id") or not isinstance(branch.get("branches", []), list):
                 raise ValueError("branching entries require quest_id and branches")
-            if not db_session.get(Quest, branch["quest_id"]):
+            if not references.exists(Quest, branch["quest_id"]):
                 raise ValueError(f"Invalid quest_id in branching: {branch['quest_id']}")
             for target in branch.get("branches", []):
                 if not isinstance(target, dict) or not target.get("next_quest_id"):
                     raise ValueError("branch targets require next_quest_id")
-                if not db_session.get(Quest, target["next_quest_id"]):
+                if not references.exists(Quest, target["next_quest_id"]):
                     raise ValueError(f"Invalid next_quest_id in branching: {target['next_quest_id']}")
                 condition_flag = target.get("condition_flag") or target.get("flag")
-                if condition_flag and not db_session.get(Flag, condition_flag):
+                if condition_flag and not references.exists(Flag, condition_flag):
                     raise ValueError(f"Invalid condition flag in branching: {condition_flag}")
         story_arc.related_quests = related_quests
         story_arc.branching = branching
@@ -90,19 +99,11 @@ class StoryArcRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.title.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.title, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
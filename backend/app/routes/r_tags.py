@@ -0,0 +1,37 @@
+from flask import Blueprint, abort, jsonify, request
+
+from backend.app.db.init_db import get_db_session
+from backend.app.db.tag_index import TAGGED_TABLES, indexed_tables, tag_facets
+from backend.app.routes.http_caching import conditional_get
+
+
+bp = Blueprint("tags", __name__)
+
+
+@bp.get("/api/tags")
+@conditional_get()
+def get_tag_facets():
+    """Tag frequency facets from the `entity_tags` index.
+
+    `?tables=a,b` restricts the tables counted, `?prefix=` keeps tags starting
+    with it and `?limit=` caps the number of tags returned.
+    """
+    tables = [name.strip() for name in request.args.get("tables", "").split(",") if name.strip()]
+    unknown = [name for name in tables if name not in TAGGED_TABLES]
+    if unknown:
+        abort(400, description=f"Unknown tagged tables: {', '.join(unknown)}")
+    raw_limit = request.args.get("limit", "").strip()
+    try:
+        limit = int(raw_limit) if raw_limit else None
+    except ValueError:
+        abort(400, description="limit must be an integer")
+    if limit is not None and limit < 1:
+        abort(400, description="limit must be positive")
+
+    db_session = get_db_session()
+    try:
+        if not indexed_tables(db_session.get_bind()):
+            abort(503, description="Tag index is not available for the active database")
+        return jsonify({"tags": tag_facets(db_session, tables or None, request.args.get("prefix", ""), limit)})
+    finally:
+        db_session.close()
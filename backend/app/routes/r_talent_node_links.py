@@ -2,7 +2,7 @@ from backend.app.routes.base_route import BaseRoute
 from backend.app.models.m_talent_trees import TalentNodeLink, TalentTree, TalentNode
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
 
 
@@ -57,11 +57,9 @@ class TalentNodeLinkRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.id.ilike(f"%{search}%")) |
-                    (self.model.tree_id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.id, self.model.tree_id)
                 )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+            return self.list_response(query)
         finally:
             db_session.close()
 
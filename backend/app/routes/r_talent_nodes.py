@@ -8,8 +8,9 @@ from backend.app.models.m_items import ModifierValueType
 from backend.app.models.m_attribute_stat_link import ScaleType as AttributeScaleType
 from typing import Any, Dict, List
 from sqlalchemy.orm import Session
-from flask import request, jsonify
+from flask import request
 from backend.app.db.init_db import get_db_session
+from backend.app.db.references import reference_resolver
 
 
 class TalentNodeRoute(BaseRoute):
@@ -60,9 +61,13 @@ class TalentNodeRoute(BaseRoute):
         node.point_cost = point_cost
         node.requirements_id = data.get("requirements_id")
 
+        references = reference_resolver(db_session)
+        references.expect_rows(Ability, data.get("granted_abilities"))
+        references.expect_rows(Stat, data.get("stat_modifiers"), "stat_id")
+        references.expect_rows(Attribute, data.get("attribute_modifiers"), "attribute_id")
         granted_abilities = data.get("granted_abilities") or []
         for ability_id in granted_abilities:
-            if not db_session.get(Ability, ability_id):
+            if not references.exists(Ability, ability_id):
                 raise ValueError(f"Invalid ability_id: {ability_id}")
         node.granted_abilities = granted_abilities
 
@@ -92,7 +97,7 @@ class TalentNodeRoute(BaseRoute):
             stat_id = entry.get("stat_id")
             if not stat_id:
                 raise ValueError("stat_modifiers entries require stat_id")
-            if not db_session.get(Stat, stat_id):
+            if not reference_resolver(db_session).exists(Stat, stat_id):
                 raise ValueError(f"Invalid stat_id: {stat_id}")
             value = entry.get("value")
             if value is None:
@@ -117,7 +122,7 @@ class TalentNodeRoute(BaseRoute):
             attribute_id = entry.get("attribute_id")
             if not attribute_id:
                 raise ValueError("attribute_modifiers entries require attribute_id")
-            if not db_session.get(Attribute, attribute_id):
+            if not reference_resolver(db_session).exists(Attribute, attribute_id):
                 raise ValueError(f"Invalid attribute_id: {attribute_id}")
             value = entry.get("value")
             if value is None:
@@ -149,20 +154,11 @@ class TalentNodeRoute(BaseRoute):
             query = db_session.query(self.model)
             if search:
                 query = query.filter(
-                    (self.model.name.ilike(f"%{search}%")) |
-                    (self.model.slug.ilike(f"%{search}%")) |
-                    (self.model.id.ilike(f"%{search}%"))
+                    self._build_search_filter_expression(db_session, search, self.model.name, self.model.slug, self.model.id)
                 )
             if tags:
-                query = query.filter(self.model.tags != None)
-                for tag in tags:
-                    tag = tag.strip()
-                    if tag:
-                        query = query.filter(
-                            self._build_tag_filter_expression(tag)
-                        )
-            items = query.all()
-            return jsonify(self.serialize_list(items))
+                query = query.filter(self._build_tags_filter_expression(db_session, tags))
+            return self.list_response(query)
         finally:
             db_session.close()
 
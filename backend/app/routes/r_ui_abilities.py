@@ -1,6 +1,8 @@
+from collections import defaultdict
 from copy import deepcopy
 
 from flask import Blueprint, abort, jsonify, request
+from sqlalchemy.orm import selectinload
 from werkzeug.exceptions import HTTPException
 
 from backend.app.db.init_db import get_db_session
@@ -17,12 +19,16 @@ from backend.app.models.m_stats import Stat
 from backend.app.models.m_statuses import Status
 from backend.app.models.m_talent_trees import TalentNode
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_abilities import route as ability_route
 from backend.app.routes.r_ability_links import relation_route
 from backend.app.routes.r_combat_profiles import route as combat_profile_route
 from backend.app.routes.r_effects import route as effect_route
 from backend.app.routes.r_requirements import route as requirement_route
 from backend.app.routes.r_statuses import route as status_route
+from backend.app.routes.r_ui_catalogs import catalog_fields
+from backend.app.services.catalog_cache import REQUIREMENT_TABLES, register_catalog
+from backend.app.services.json_references import referencing_rows
 from backend.app.utils.id import generate_ulid
 
 
@@ -73,68 +79,39 @@ def _upsert(db_session, route, model, data, path):
         raise wrap_bundle_error(path, error) from error
 
 
-def _contains(values, item_id):
-    return isinstance(values, list) and item_id in values
-
-
 def _ability_usage(db_session, ability_id):
-    profiles = [
-        _compact(row)
-        for row in db_session.query(CombatProfile).all()
-        if _contains(row.custom_abilities, ability_id)
-    ]
-    classes = [
-        _compact(row)
-        for row in db_session.query(CharacterClass).all()
-        if _contains(row.starting_abilities, ability_id)
-    ]
-    talent_nodes = [
-        _compact(row)
-        for row in db_session.query(TalentNode).all()
-        if _contains(row.granted_abilities, ability_id)
-    ]
     return {
-        "combat_profiles": profiles,
-        "characterclasses": classes,
-        "talent_nodes": talent_nodes,
-    }
-
-
-def _effect_usage(db_session, effect_id):
-    abilities = [
-        _compact(row)
-        for row in db_session.query(Ability).all()
-        if any(link.effect_id == effect_id for link in (row.effects or []))
-    ]
-    items = [
-        _compact(row)
-        for row in db_session.query(Item).all()
-        if _contains(row.effects, effect_id)
-    ]
-    return {"abilities": abilities, "items": items}
-
-
-def _status_usage(db_session, status_id):
-    return {
-        "effects": [
-            _compact(row)
-            for row in db_session.query(Effect).filter(Effect.status_id == status_id).all()
-        ]
+        "combat_profiles": [_compact(row) for row in referencing_rows(db_session, CombatProfile, "custom_abilities", ability_id)],
+        "characterclasses": [_compact(row) for row in referencing_rows(db_session, CharacterClass, "starting_abilities", ability_id)],
+        "talent_nodes": [_compact(row) for row in referencing_rows(db_session, TalentNode, "granted_abilities", ability_id)],
     }
 
 
 def _all_usage(db_session):
+    abilities = db_session.query(Ability).options(selectinload(Ability.effects)).all()
+    effects = db_session.query(Effect).all()
+    # Owners found through the JSON reference index resolve from the identity map
+    # while these lists keep them alive, so per-target lookups issue no SQL.
+    owners = [db_session.query(model).all() for model in (CombatProfile, CharacterClass, TalentNode, Item)]
+    abilities_by_effect = defaultdict(list)
+    for ability in abilities:
+        for effect_id in dict.fromkeys(link.effect_id for link in ability.effects or []):
+            abilities_by_effect[effect_id].append(_compact(ability))
+    effects_by_status = defaultdict(list)
+    for effect in effects:
+        if effect.status_id:
+            effects_by_status[effect.status_id].append(_compact(effect))
     return {
-        "abilities": {
-            row.id: _ability_usage(db_session, row.id)
-            for row in db_session.query(Ability).all()
-        },
+        "abilities": {row.id: _ability_usage(db_session, row.id) for row in abilities},
         "effects": {
-            row.id: _effect_usage(db_session, row.id)
-            for row in db_session.query(Effect).all()
+            row.id: {
+                "abilities": abilities_by_effect.get(row.id, []),
+                "items": [_compact(item) for item in referencing_rows(db_session, Item, "effects", row.id)],
+            }
+            for row in effects
         },
         "statuses": {
-            row.id: _status_usage(db_session, row.id)
+            row.id: {"effects": effects_by_status.get(row.id, [])}
             for row in db_session.query(Status).all()
         },
     }
@@ -169,7 +146,7 @@ def _similar_abilities(db_session, ability):
     return sorted(matches, key=lambda row: (-row["similarity_score"], row.get("name") or row["id"]))
 
 
-def _catalogs(db_session):
+def _build_catalogs(db_session):
     characters = {row.id: row for row in db_session.query(Character).all()}
     return {
         "abilities": [ability_route.serialize_item(row) for row in db_session.query(Ability).all()],
@@ -192,6 +169,14 @@ def _catalogs(db_session):
     }
 
 
+CATALOG = "abilities"
+register_catalog(CATALOG, (
+    "abilities", "ability_effect_links", "ability_scaling_links", "characterclasses", "characters",
+    "combat_profiles", "effects", "encounters", "items", "stats", "statuses", "talent_nodes",
+    *REQUIREMENT_TABLES,
+), _build_catalogs)
+
+
 def _packet(db_session, ability):
     effects = [link.effect for link in (ability.effects or []) if link.effect]
     status_ids = {effect.status_id for effect in effects if effect.status_id}
@@ -206,11 +191,9 @@ def _packet(db_session, ability):
         ] if status_ids else [],
         "requirement": requirement_route.serialize_item(requirement) if requirement else None,
         "assigned_combat_profile_ids": [
-            row.id
-            for row in db_session.query(CombatProfile).all()
-            if _contains(row.custom_abilities, ability.id)
+            row.id for row in referencing_rows(db_session, CombatProfile, "custom_abilities", ability.id)
         ],
-        "catalogs": _catalogs(db_session),
+        **catalog_fields(db_session, CATALOG),
         "usage": usage,
         "analysis": {
             "similar_abilities": _similar_abilities(db_session, ability),
@@ -240,7 +223,7 @@ def _new_packet(db_session):
         "linked_statuses": [],
         "requirement": None,
         "assigned_combat_profile_ids": [],
-        "catalogs": _catalogs(db_session),
+        **catalog_fields(db_session, CATALOG),
         "usage": _all_usage(db_session),
         "analysis": {"similar_abilities": []},
         "relations": [],
@@ -376,6 +359,7 @@ def _reconcile_bundle(db_session, payload):
 
 
 @bp.get("/api/ui/abilities")
+@conditional_get()
 def get_ability_selector():
     db_session = get_db_session()
     try:
@@ -385,6 +369,7 @@ def get_ability_selector():
 
 
 @bp.get("/api/ui/abilities/<ability_id>")
+@conditional_get()
 def get_ability_lab(ability_id):
     db_session = get_db_session()
     try:
@@ -6,14 +6,20 @@ from werkzeug.exceptions import HTTPException
 from backend.app.db.init_db import get_db_session
 from backend.app.models.m_adventure_narrative import AdventureBeat, AdventureBeatLink
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_adventure_narrative import adventure_beat_link_route, adventure_beat_route
-from backend.app.services.adventure_timeline import build_adventure_timeline
+from backend.app.services.adventure_timeline import (
+    adventure_timeline_basis,
+    build_adventure_timeline,
+    preview_adventure_timeline_warnings,
+)
 
 
 bp = Blueprint("ui_adventure_timeline", __name__)
 
 
 @bp.get("/api/ui/adventure-timeline")
+@conditional_get()
 def get_adventure_timeline():
     db_session = get_db_session()
     try:
@@ -62,6 +68,16 @@ def _review_change(review, category, table, item_id):
 def _reconcile(db_session, payload):
     if not isinstance(payload, dict):
         abort(400, description="request body must be an object")
+    basis = adventure_timeline_basis(db_session)
+    review = _apply_bundle(db_session, payload)
+    return {
+        "review": review,
+        "warnings": preview_adventure_timeline_warnings(db_session, basis),
+        "blockers": [],
+    }
+
+
+def _apply_bundle(db_session, payload):
     beat_rows = _require_rows(payload, "adventure_beats")
     link_rows = _require_rows(payload, "adventure_beat_links")
     review = {"created": [], "changed": [], "deleted": []}
@@ -106,20 +122,14 @@ def _reconcile(db_session, payload):
                 db_session.delete(item)
                 _review_change(review, "deleted", key, item_id)
     db_session.flush()
-
-    packet = build_adventure_timeline(db_session)
-    return {
-        "review": review,
-        "warnings": packet["health"]["warnings"],
-        "blockers": [],
-    }, packet
+    return review
 
 
 @bp.post("/api/ui/adventure-timeline/preview")
 def preview_adventure_timeline():
     db_session = get_db_session()
     try:
-        result, _ = _reconcile(db_session, deepcopy(request.get_json(silent=True)))
+        result = _reconcile(db_session, deepcopy(request.get_json(silent=True)))
         db_session.rollback()
         return jsonify(result)
     except Exception as error:
@@ -135,9 +145,9 @@ def preview_adventure_timeline():
 def save_adventure_timeline():
     db_session = get_db_session()
     try:
-        result, packet = _reconcile(db_session, request.get_json(silent=True))
+        result = _reconcile(db_session, request.get_json(silent=True))
         db_session.commit()
-        return jsonify({"result": result, "packet": packet})
+        return jsonify({"result": result, "packet": build_adventure_timeline(db_session)})
     except Exception as error:
         db_session.rollback()
         if isinstance(error, HTTPException) and error.code != 400:
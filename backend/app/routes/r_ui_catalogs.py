@@ -0,0 +1,64 @@
+from flask import Blueprint, abort, jsonify, request
+
+from backend.app.db.init_db import get_db_session
+from backend.app.services.catalog_cache import CATALOGS, get_catalog
+
+
+bp = Blueprint("ui_catalogs", __name__)
+
+CATALOG_URL = "/api/ui/catalogs/{name}?v={version}"
+# A versioned catalog URL never changes content, so browsers may keep it for a year.
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def catalog_fields(db_session, name, key="catalogs"):
+    """Packet fields for catalog `name`: the catalog under `key` plus its version token and URL.
+
+    With `?catalogs=ref` the catalog itself is left out, so clients that already
+    hold (or will fetch) that version only receive the reference.
+    """
+    version, catalog = get_catalog(db_session, name)
+    fields = {
+        f"{key}_version": version,
+        f"{key}_url": CATALOG_URL.format(name=name, version=version) if version else None,
+    }
+    if version is None or request.args.get("catalogs") != "ref":
+        fields[key] = catalog
+    return fields
+
+
+@bp.get("/api/ui/catalogs")
+def list_catalogs():
+    """Current version token and URL of every registered workspace catalog."""
+    db_session = get_db_session()
+    try:
+        result = {}
+        for name, definition in sorted(CATALOGS.items()):
+            version, _catalog = get_catalog(db_session, name)
+            result[name] = {
+                "version": version,
+                "url": CATALOG_URL.format(name=name, version=version),
+                "tables": list(definition.tables) if definition.tables is not None else None,
+            }
+        return jsonify({"catalogs": result})
+    finally:
+        db_session.close()
+
+
+@bp.get("/api/ui/catalogs/<name>")
+def get_catalog_resource(name):
+    """One catalog; long-cached when `?v=` names the version being served."""
+    if name not in CATALOGS:
+        abort(404, description=f"Unknown catalog: {name}")
+    db_session = get_db_session()
+    try:
+        version, catalog = get_catalog(db_session, name)
+        response = jsonify({"name": name, "version": version, "catalog": catalog})
+        response.set_etag(version)
+        if request.args.get("v") == version:
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
+    finally:
+        db_session.close()
@@ -23,10 +23,14 @@ from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_shops import Shop
 from backend.app.models.m_story_arcs import StoryArc
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_character_narrative import relationship_route, story_beat_route, story_profile_route
 from backend.app.routes.r_characters import route as character_route
 from backend.app.routes.r_combat_profiles import route as combat_profile_route
 from backend.app.routes.r_interaction_profiles import route as interaction_profile_route
+from backend.app.routes.r_ui_catalogs import catalog_fields
+from backend.app.services.catalog_cache import register_catalog
+from backend.app.services.json_references import referencing_rows
 from backend.app.utils.id import generate_ulid
 
 
@@ -98,10 +102,7 @@ def _navigator(db_session):
 
 
 def _presence(db_session, character_id):
-    encounters = [
-        encounter for encounter in db_session.query(Encounter).all()
-        if any(isinstance(row, dict) and row.get("character_id") == character_id for row in encounter.participants or [])
-    ]
+    encounters = referencing_rows(db_session, Encounter, "participants", character_id)
     dialogues = {
         dialogue.id: dialogue for dialogue in db_session.query(Dialogue).filter_by(character_id=character_id).all()
     }
@@ -114,7 +115,7 @@ def _presence(db_session, character_id):
     interaction = db_session.query(InteractionProfile).filter_by(character_id=character_id).first()
     combat = db_session.query(CombatProfile).filter_by(character_id=character_id).first()
     quest_ids = set((interaction.available_quests if interaction else []) or []) | set((combat.related_quests if combat else []) or [])
-    quests = [quest for quest in db_session.query(Quest).all() if quest.id in quest_ids]
+    quests = db_session.query(Quest).filter(Quest.id.in_(quest_ids)).all() if quest_ids else []
     locations = {}
     character = db_session.get(Character, character_id)
     if character and character.home_location_id:
@@ -357,7 +358,7 @@ def _unplaced(presence, beats):
     ]
 
 
-def _catalogs(db_session):
+def _build_catalogs(db_session):
     return {
         "characters": [_compact(row) for row in db_session.query(Character).all()],
         "abilities": [_compact(row) for row in db_session.query(Ability).all()],
@@ -375,6 +376,13 @@ def _catalogs(db_session):
     }
 
 
+CATALOG = "character_studio"
+register_catalog(CATALOG, (
+    "abilities", "characterclasses", "characters", "dialogue_nodes", "dialogues", "encounters",
+    "events", "factions", "flags", "locations", "quests", "shops", "story_arcs",
+), _build_catalogs)
+
+
 def _packet(db_session, character):
     character_data = _columns(character)
     combat_model = db_session.query(CombatProfile).filter_by(character_id=character.id).first()
@@ -403,7 +411,7 @@ def _packet(db_session, character):
         "story_beats": beats,
         "world_presence": presence,
         "graph": _graph(db_session, character_data, combat, interaction, profile, relationships, beats, presence, flag_coverage),
-        "catalogs": _catalogs(db_session),
+        **catalog_fields(db_session, CATALOG),
         "health": _health(character_data, combat, interaction, profile, relationships, beats, presence, flag_coverage),
         "flag_coverage": flag_coverage,
         "unplaced_presence": _unplaced(presence, beats),
@@ -415,10 +423,11 @@ def _new_character():
 
 
 @bp.get("/api/ui/character-studio")
+@conditional_get()
 def get_character_studio_selector():
     db_session = get_db_session()
     try:
-        return jsonify({"navigator": _navigator(db_session), "catalogs": _catalogs(db_session)})
+        return jsonify({"navigator": _navigator(db_session), **catalog_fields(db_session, CATALOG)})
     finally:
         db_session.close()
 
@@ -438,6 +447,7 @@ def get_new_character_studio():
 
 
 @bp.get("/api/ui/character-studio/<character_id>")
+@conditional_get()
 def get_character_studio(character_id):
     db_session = get_db_session()
     try:
@@ -8,6 +8,7 @@ from backend.app.models.m_dialogues import Dialogue
 from backend.app.models.m_encounters import Encounter
 from backend.app.models.m_interaction_profiles import InteractionProfile
 from backend.app.models.m_shops import Shop
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_characters import route as character_route
 from backend.app.routes.r_combat_profiles import route as combat_profile_route
 from backend.app.routes.r_encounters import route as encounter_route
@@ -184,6 +185,7 @@ def _validate_profile_ownership(db_session, model, data, character_id, label):
 
 
 @bp.route("/api/ui/characters/<character_id>", methods=["GET"])
+@conditional_get()
 def get_character_authoring_view(character_id: str):
     db_session = get_db_session()
     try:
@@ -16,12 +16,14 @@ from backend.app.models.m_items import Item
 from backend.app.models.m_locations import Location
 from backend.app.models.m_quests import Quest
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_adventure_narrative import adventure_beat_link_route
 from backend.app.routes.r_dialogue_nodes import route as dialogue_node_route
 from backend.app.routes.r_encounters import route as encounter_route
 from backend.app.routes.r_events import EventRoute
 from backend.app.routes.r_quests import QuestRoute
 from backend.app.services.adventure_timeline import build_adventure_timeline
+from backend.app.services.catalog_cache import get_catalog, register_catalog
 from backend.app.services.dependency_index import build_dependency_index
 
 
@@ -60,7 +62,7 @@ def _compact(model):
     }
 
 
-def _catalog(db_session):
+def _build_catalog(db_session):
     dependency_index = build_dependency_index(db_session)
     timeline = build_adventure_timeline(db_session)
     return {
@@ -81,6 +83,16 @@ def _catalog(db_session):
     }
 
 
+CATALOG = "consequences"
+# Reads the dependency index, which spans nearly every table, so it is keyed on all of them.
+register_catalog(CATALOG, None, _build_catalog)
+
+
+def _catalog(db_session):
+    version, catalog = get_catalog(db_session, CATALOG)
+    return {**catalog, "catalog_version": version}
+
+
 def _payload_list(payload, key):
     value = payload.get(key, [])
     if value is None:
@@ -170,6 +182,7 @@ def _reconcile(db_session, payload):
 
 
 @bp.get("/api/ui/consequences")
+@conditional_get()
 def get_consequences():
     db_session = get_db_session()
     try:
@@ -5,6 +5,7 @@ from werkzeug.exceptions import HTTPException
 
 from backend.app.db.init_db import get_db_session
 from backend.app.routes.bundle_validation import bundle_error_response
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_creation_flow_manifests import route as manifest_route
 from backend.app.services.bundle_operations import apply_creation_flow_mutation
 from backend.app.services.creation_flow_catalog import creation_flow_catalog
@@ -27,6 +28,7 @@ def _draft_from_payload(payload):
 
 
 @bp.get("/api/ui/creation-flow/catalog")
+@conditional_get()
 def get_creation_flow_catalog():
     db_session = get_db_session()
     try:
@@ -16,12 +16,15 @@ from backend.app.models.m_location_encounter_tables import LocationEncounterTabl
 from backend.app.models.m_locations import Location
 from backend.app.models.m_stats import Stat
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_characters import route as character_route
 from backend.app.routes.r_combat_profiles import route as combat_profile_route
 from backend.app.routes.r_encounters import route as encounter_route
 from backend.app.routes.r_location_encounter_tables import route as encounter_table_route
+from backend.app.routes.r_ui_catalogs import catalog_fields
 from backend.app.services.adventure_timeline import build_adventure_timeline
 from backend.app.services.adventure_timeline_coherence import _important_item
+from backend.app.services.catalog_cache import register_catalog
 from backend.app.utils.id import generate_ulid
 
 
@@ -129,7 +132,7 @@ def _serialize_table(db_session, table):
     return {**_columns(table), "location": _compact(location)}
 
 
-def _catalogs(db_session):
+def _build_catalogs(db_session):
     return {
         "abilities": [_compact(row) for row in db_session.query(Ability).all()],
         "characterclasses": [_compact(row) for row in db_session.query(CharacterClass).all()],
@@ -143,6 +146,13 @@ def _catalogs(db_session):
     }
 
 
+CATALOG = "creatures"
+register_catalog(CATALOG, (
+    "abilities", "characterclasses", "currencies", "encounters", "factions", "items",
+    "location_encounter_tables", "locations", "stats",
+), _build_catalogs)
+
+
 def _encounter_uses_character(encounter, character_id):
     return any(
         isinstance(row, dict) and row.get("character_id") == character_id
@@ -262,7 +272,7 @@ def _packet(db_session, character):
         "combat_profile": combat_data,
         "appearances": appearances,
         "habitats": habitats,
-        "catalogs": _catalogs(db_session),
+        **catalog_fields(db_session, CATALOG),
         "health": _health(character_data, combat_data, appearances, habitats),
         "boss_payoff": boss_payoff,
     }
@@ -391,10 +401,11 @@ def _reconcile(db_session, payload):
 
 
 @bp.get("/api/ui/creatures")
+@conditional_get()
 def get_creature_selector():
     db_session = get_db_session()
     try:
-        return jsonify({"navigator": _navigator(db_session), "catalogs": _catalogs(db_session)})
+        return jsonify({"navigator": _navigator(db_session), **catalog_fields(db_session, CATALOG)})
     finally:
         db_session.close()
 
@@ -414,6 +425,7 @@ def get_new_creature():
 
 
 @bp.get("/api/ui/creatures/<character_id>")
+@conditional_get()
 def get_creature(character_id):
     db_session = get_db_session()
     try:
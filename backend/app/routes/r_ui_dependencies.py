@@ -6,6 +6,7 @@ from backend.app.models import ALL_MODELS
 from backend.app.models.m_flags import Flag
 from backend.app.models.m_requirements import Requirement
 from backend.app.routes.bundle_validation import bundle_error_response
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_requirements import route as requirement_route
 from backend.app.routes.r_ui_item_ecosystem import _columns, _upsert
 from backend.app.services.dependency_index import build_dependency_index
@@ -19,6 +20,7 @@ def _models_by_table():
 
 
 @bp.get("/api/ui/dependencies")
+@conditional_get()
 def get_dependencies():
     db_session = get_db_session()
     try:
@@ -16,11 +16,12 @@ from backend.app.models.m_interaction_profiles import InteractionProfile
 from backend.app.models.m_location_pois import LocationPoi
 from backend.app.models.m_requirements import Requirement
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_character_narrative import story_beat_route
 from backend.app.routes.r_dialogue_nodes import route as node_route
 from backend.app.routes.r_dialogues import route as dialogue_route
 from backend.app.routes.r_requirements import route as requirement_route
-from backend.app.services.dependency_index import build_dependency_index
+from backend.app.services.dependency_index import build_dependency_index, index_node
 from backend.app.services.dialogue_choice_actions import normalize_choice_contracts
 
 
@@ -130,24 +131,24 @@ def _route_for_node(node):
 
 def _world_echo(db_session, dialogue_id, nodes):
     index = build_dependency_index(db_session)
-    node_map = {node["id"]: node for node in index["nodes"]}
-    source_ids = {f"dialogue_nodes:{node.id}" for node in nodes}
+    outgoing = index.lookup["outgoing"]
+    positions = sorted(position for node in nodes for position in outgoing.get(f"dialogue_nodes:{node.id}", ()))
     produced_flags = []
     consumers = []
     seen_flags = set()
     seen_consumers = set()
-    for edge in index["edges"]:
-        if edge["source"] in source_ids and edge["relation"] == "sets" and edge["target"] not in seen_flags:
+    for edge in (index["edges"][position] for position in positions):
+        if edge["relation"] == "sets" and edge["target"] not in seen_flags:
             seen_flags.add(edge["target"])
-            flag = node_map.get(edge["target"])
+            flag = index_node(index, edge["target"])
             if flag:
                 produced_flags.append({
                     **flag, "source_id": edge["source"], "path": edge.get("path", ""),
                     "route": f"/flags?selected={flag['entry_id']}",
                 })
-        if edge["source"] in source_ids and edge["relation"] == "unlocks" and edge["target"] not in seen_consumers:
+        if edge["relation"] == "unlocks" and edge["target"] not in seen_consumers:
             seen_consumers.add(edge["target"])
-            target = node_map.get(edge["target"])
+            target = index_node(index, edge["target"])
             if target:
                 consumers.append({
                     **target, "source_id": edge["source"], "path": edge.get("path", ""),
@@ -410,6 +411,7 @@ def _reconcile(db_session, payload, commit):
 
 
 @bp.get("/api/ui/dialogues/<dialogue_id>")
+@conditional_get()
 def get_dialogue_authoring_view(dialogue_id):
     db_session = get_db_session()
     try:
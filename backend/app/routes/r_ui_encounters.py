@@ -2,11 +2,9 @@ from flask import Blueprint, abort, jsonify, request
 from werkzeug.exceptions import HTTPException
 
 from backend.app.db.init_db import get_db_session
-from backend.app.models import ALL_MODELS
 from backend.app.models.m_characters import Character
 from backend.app.models.m_combat_profiles import CombatProfile
 from backend.app.models.m_currencies import Currency
-from backend.app.models.m_dialogue_nodes import DialogueNode
 from backend.app.models.m_encounters import Encounter
 from backend.app.models.m_events import Event
 from backend.app.models.m_factions import Faction
@@ -18,9 +16,12 @@ from backend.app.models.m_location_pois import LocationPoi
 from backend.app.models.m_locations import Location
 from backend.app.models.m_requirements import Requirement
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_encounters import route as encounter_route
 from backend.app.routes.r_location_encounter_tables import route as encounter_table_route
 from backend.app.routes.r_requirements import route as requirement_route
+from backend.app.services.catalog_cache import REQUIREMENT_TABLES, get_catalog, register_catalog
+from backend.app.services.requirement_usage import REQUIREMENT_USAGE_TABLES, requirement_usages
 
 
 bp = Blueprint("ui_encounters", __name__)
@@ -61,46 +62,16 @@ def _serialize_character(db_session, character):
     }
 
 
-def _requirement_usages(db_session, requirement_id):
-    if not requirement_id:
-        return []
-    usages = []
-    seen = set()
-    for model in ALL_MODELS:
-        if model is Requirement or not hasattr(model, "requirements_id"):
-            continue
-        for item in db_session.query(model).filter(model.requirements_id == requirement_id).all():
-            key = (model.__tablename__, item.id, "requirements_id")
-            if key in seen:
-                continue
-            seen.add(key)
-            usages.append({
-                "schema_name": model.__tablename__,
-                "entry_id": item.id,
-                "entry_label": getattr(item, "name", None) or getattr(item, "title", None) or getattr(item, "slug", None) or item.id,
-                "path": "requirements_id",
-            })
-    for node in db_session.query(DialogueNode).all():
-        for index, choice in enumerate(node.choices or []):
-            if isinstance(choice, dict) and choice.get("requirements_id") == requirement_id:
-                usages.append({
-                    "schema_name": "dialogue_nodes",
-                    "entry_id": node.id,
-                    "entry_label": node.slug or node.id,
-                    "path": f"choices[{index}].requirements_id",
-                })
-    return usages
-
-
-def _catalogs(db_session):
+def _build_catalogs(db_session):
     locations = {item.id: item for item in db_session.query(Location).all()}
     requirements = db_session.query(Requirement).all()
+    usages = requirement_usages(db_session)
     return {
         "encounters": [_columns(item) for item in db_session.query(Encounter).all()],
         "characters": [_serialize_character(db_session, item) for item in db_session.query(Character).all()],
         "requirements": [requirement_route.serialize_item(item) for item in requirements],
         "requirement_usages_by_id": {
-            item.id: _requirement_usages(db_session, item.id)
+            item.id: usages.get(item.id, [])
             for item in requirements
         },
         "items": [_compact(item) for item in db_session.query(Item).all()],
@@ -117,20 +88,37 @@ def _catalogs(db_session):
     }
 
 
+CATALOG = "encounters"
+register_catalog(CATALOG, (
+    *REQUIREMENT_USAGE_TABLES,
+    "characters", "combat_profiles", "interaction_profiles", "currencies", "factions", "flags",
+    "location_encounter_tables", "locations", *REQUIREMENT_TABLES,
+), _build_catalogs)
+
+
+def _catalog_packet(db_session):
+    # The shared catalog is copied shallowly; packets only add or replace top-level keys.
+    version, catalogs = get_catalog(db_session, CATALOG)
+    return {**catalogs, "catalogs_version": version}
+
+
 def _encounter_packet(db_session, encounter):
-    packet = _catalogs(db_session)
+    packet = _catalog_packet(db_session)
     requirement = db_session.get(Requirement, encounter.requirements_id) if encounter.requirements_id else None
-    requirement_usages = [
+    other_usages = [
         usage
-        for usage in _requirement_usages(db_session, encounter.requirements_id)
+        for usage in requirement_usages(db_session).get(encounter.requirements_id, [])
         if not (usage["schema_name"] == "encounters" and usage["entry_id"] == encounter.id)
     ]
     if encounter.requirements_id:
-        packet["requirement_usages_by_id"][encounter.requirements_id] = requirement_usages
+        packet["requirement_usages_by_id"] = {
+            **packet["requirement_usages_by_id"],
+            encounter.requirements_id: other_usages,
+        }
     packet.update({
         "encounter": _columns(encounter),
         "requirement": requirement_route.serialize_item(requirement) if requirement else None,
-        "requirement_usages": requirement_usages,
+        "requirement_usages": other_usages,
         "placements": [
             {"table_id": table.id, "entry": dict(entry)}
             for table in db_session.query(LocationEncounterTable).all()
@@ -212,15 +200,17 @@ def _save_placements(db_session, encounter_id, placements):
 
 
 @bp.route("/api/ui/encounters", methods=["GET"], strict_slashes=False)
+@conditional_get()
 def get_encounter_selector():
     db_session = get_db_session()
     try:
-        return jsonify(_catalogs(db_session))
+        return jsonify(_catalog_packet(db_session))
     finally:
         db_session.close()
 
 
 @bp.route("/api/ui/encounters/<encounter_id>", methods=["GET"])
+@conditional_get()
 def get_encounter_authoring_view(encounter_id):
     db_session = get_db_session()
     try:
@@ -16,6 +16,7 @@ from backend.app.models.m_characters import Character
 from backend.app.models.m_locations import Location
 from backend.app.models.m_adventure_narrative import AdventureBeatLink
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_combat_profiles import route as combat_profile_route
 from backend.app.routes.r_encounters import route as encounter_route
 from backend.app.routes.r_events import EventRoute
@@ -24,6 +25,9 @@ from backend.app.routes.r_location_pois import route as poi_route
 from backend.app.routes.r_quests import QuestRoute
 from backend.app.routes.r_requirements import route as requirement_route
 from backend.app.routes.r_shop_inventory import route_instance as shop_inventory_route
+from backend.app.routes.r_ui_catalogs import catalog_fields
+from backend.app.services.catalog_cache import REQUIREMENT_TABLES, register_catalog
+from backend.app.services.json_references import referencing_rows
 from backend.app.utils.pricing import compute_shop_price
 from backend.app.utils.id import generate_ulid
 from backend.app.models.m_items import ItemType, Rarity
@@ -118,7 +122,8 @@ def _normalize_route_lists(model, data):
 def _source_rows(db_session, item_id):
     sources = {key: [] for key in SOURCE_CONFIG}
     for key, (model, _route, field) in SOURCE_CONFIG.items():
-        for owner in db_session.query(model).all():
+        path = "rewards.items" if field == "rewards" else field
+        for owner in referencing_rows(db_session, model, path, item_id):
             container = getattr(owner, field) or ([] if field != "rewards" else {})
             rows = container.get("items", []) if field == "rewards" and isinstance(container, dict) else container
             for row in rows or []:
@@ -267,7 +272,7 @@ def _analysis(db_session, item, sources):
     }
 
 
-def _catalogs(db_session):
+def _build_catalogs(db_session):
     characters = {row.id: row for row in db_session.query(Character).all()}
     locations = {row.id: row for row in db_session.query(Location).all()}
     return {
@@ -291,24 +296,32 @@ def _catalogs(db_session):
     }
 
 
+CATALOG = "item_ecosystem"
+register_catalog(CATALOG, (
+    "characters", "combat_profiles", "currencies", "encounters", "events", "items",
+    "location_pois", "locations", "quests", "shops", *REQUIREMENT_TABLES,
+), _build_catalogs)
+
+
 def _packet(db_session, item):
     sources = _source_rows(db_session, item.id)
     return {
         "item": item_route.serialize_item(item),
         "requirement": requirement_route.serialize_item(item.requirements) if item.requirements else None,
         "sources": sources,
-        "catalogs": _catalogs(db_session),
+        **catalog_fields(db_session, CATALOG),
         "analysis": _analysis(db_session, item, sources),
     }
 
 
 @bp.get("/api/ui/items/ecosystem")
+@conditional_get()
 def get_item_ecosystem_selector():
     db_session = get_db_session()
     try:
         return jsonify({
             "items": [item_route.serialize_item(row) for row in db_session.query(Item).all()],
-            "catalogs": _catalogs(db_session),
+            **catalog_fields(db_session, CATALOG),
         })
     finally:
         db_session.close()
@@ -399,6 +412,7 @@ def _replace_pois(db_session, item_id, poi_ids):
 
 
 @bp.get("/api/ui/items/ecosystem/<item_id>")
+@conditional_get()
 def get_item_ecosystem(item_id):
     db_session = get_db_session()
     try:
@@ -428,7 +442,7 @@ def get_new_item_ecosystem():
             "item": item_route.serialize_item(item),
             "requirement": None,
             "sources": {**{key: [] for key in SOURCE_CONFIG}, "shop_inventory": [], "poi_ids": []},
-            "catalogs": _catalogs(db_session),
+            **catalog_fields(db_session, CATALOG),
             "analysis": {
                 "source_counts": {},
                 "total_sources": 0,
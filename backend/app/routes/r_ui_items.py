@@ -8,6 +8,7 @@ from backend.app.models.m_effects import Effect
 from backend.app.models.m_items import Item
 from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_shop_inventory import ShopInventory
+from backend.app.routes.http_caching import conditional_get
 from backend.app.utils.pricing import compute_shop_price
 
 bp = Blueprint("ui_items", __name__)
@@ -122,6 +123,7 @@ def _shop_source(entry: ShopInventory) -> Dict[str, Any]:
 
 
 @bp.get("/api/ui/items/<item_id>")
+@conditional_get()
 def get_item_view(item_id: str):
     db_session = get_db_session()
     try:
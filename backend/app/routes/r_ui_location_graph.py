@@ -1,53 +1,31 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, abort, jsonify, request
 
 from backend.app.db.init_db import get_db_session
 from backend.app.models.m_location_routes import LocationRoute
 from backend.app.models.m_locations import Location
+from backend.app.routes.http_caching import conditional_get
+from backend.app.services.location_hierarchy import LocationHierarchy, location_hierarchy
+from backend.app.services.route_planning import (
+    METRICS,
+    REQUIREMENT_MODES,
+    distance_matrix,
+    reachable_from,
+    route_graph,
+    shortest_paths,
+)
 
 
 bp = Blueprint("ui_location_graph", __name__)
 
+MAX_K_PATHS = 10
+MAX_MATRIX_LOCATIONS = 500
+
 
 def _enum_value(value):
     return getattr(value, "value", value)
 
 
-def _auto_biome_mode(location: Location) -> str:
-    explicit = _enum_value(getattr(location, "biome_inheritance", None))
-    if explicit:
-        return explicit
-    location_type = _enum_value(location.location_type)
-    if location_type in {"World", "Continent", "Region"}:
-        return "None"
-    if location_type in {"Room", "Interior"}:
-        return "InheritFromParent"
-    return "Own"
-
-
-def _effective_biome(location: Location, locations_by_id: dict[str, Location]) -> str | None:
-    mode = _auto_biome_mode(location)
-    own_biome = _enum_value(location.biome)
-    if mode == "Own":
-        return own_biome
-    if mode == "Mixed":
-        return own_biome
-    if mode == "None":
-        return None
-    parent_id = location.parent_location_id
-    visited = {location.id}
-    while parent_id and parent_id not in visited:
-        visited.add(parent_id)
-        parent = locations_by_id.get(parent_id)
-        if parent is None:
-            return None
-        parent_biome = _enum_value(parent.biome)
-        if parent_biome:
-            return parent_biome
-        parent_id = parent.parent_location_id
-    return None
-
-
-def _serialize_location(location: Location, route_count: int, locations_by_id: dict[str, Location]):
+def _serialize_location(location: Location, route_count: int, hierarchy: LocationHierarchy):
     return {
         "id": location.id,
         "slug": location.slug,
@@ -58,7 +36,7 @@ def _serialize_location(location: Location, route_count: int, locations_by_id: d
         "place_kind": _enum_value(getattr(location, "place_kind", None)),
         "environment_tags": location.environment_tags or [],
         "biome_inheritance": _enum_value(getattr(location, "biome_inheritance", None)),
-        "effective_biome": _effective_biome(location, locations_by_id),
+        "effective_biome": hierarchy.effective_biome(location.id),
         "region": location.region,
         "parent_location_id": location.parent_location_id,
         "location_type": _enum_value(location.location_type),
@@ -96,13 +74,14 @@ def _serialize_route(route: LocationRoute):
 
 
 @bp.route("/api/ui/location_graph", methods=["GET"])
+@conditional_get()
 def get_location_graph():
     db_session = get_db_session()
     try:
         locations = db_session.query(Location).all()
         routes = db_session.query(LocationRoute).all()
         location_ids = {location.id for location in locations}
-        locations_by_id = {location.id: location for location in locations}
+        hierarchy = location_hierarchy(db_session)
         route_counts = {location.id: 0 for location in locations}
         warnings = []
         serialized_routes = []
@@ -124,9 +103,122 @@ def get_location_graph():
             serialized_routes.append(_serialize_route(route))
 
         return jsonify({
-            "locations": [_serialize_location(location, route_counts.get(location.id, 0), locations_by_id) for location in locations],
+            "locations": [_serialize_location(location, route_counts.get(location.id, 0), hierarchy) for location in locations],
             "routes": serialized_routes,
             "warnings": warnings,
         })
     finally:
         db_session.close()
+
+
+def _list_arg(name):
+    return [value.strip() for value in request.args.get(name, "").split(",") if value.strip()]
+
+
+def _number_arg(name):
+    raw = request.args.get(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        abort(400, description=f"{name} must be a number")
+    if value < 0:
+        abort(400, description=f"{name} must not be negative")
+    return value
+
+
+def _location_arg(graph, name):
+    location_id = request.args.get(name, "").strip()
+    if not location_id:
+        abort(400, description=f"{name} is required")
+    if location_id not in graph.index:
+        abort(400, description=f"{name} references missing location {location_id}")
+    return location_id
+
+
+def _edge_mask(graph):
+    include_hidden = request.args.get("include_hidden", "true").strip().lower() not in {"false", "0", "no"}
+    requirement_mode = request.args.get("requirements", "ignore").strip().lower()
+    if requirement_mode not in REQUIREMENT_MODES:
+        abort(400, description=f"requirements must be one of: {', '.join(REQUIREMENT_MODES)}")
+    reputation = {}
+    for entry in _list_arg("reputation"):
+        faction_id, _separator, value = entry.partition(":")
+        try:
+            reputation[faction_id] = float(value)
+        except ValueError:
+            abort(400, description="reputation entries must look like faction_id:value")
+    return graph.edge_mask(include_hidden, requirement_mode, _list_arg("flags"), reputation)
+
+
+@bp.route("/api/ui/location_graph/paths", methods=["GET"])
+@conditional_get()
+def get_location_graph_paths():
+    """Plan routes over the tuned location graph.
+
+    `mode=path` (default) returns up to `k` shortest paths `from` -> `to`;
+    `mode=reachable` returns distances from `from`, cut off at `budget`;
+    `mode=matrix` returns all-pairs distances over `ids` (default: every location).
+    `metric` is time, cost or hops. `include_hidden=false` skips hidden routes and
+    `requirements=exclude|evaluate` skips gated routes, or checks their requirement
+    against `flags=a,b` and `reputation=faction:value`. `skipped_route_ids` lists
+    routes left out because their travel time or cost is NaN or infinite.
+    """
+    db_session = get_db_session()
+    try:
+        graph = route_graph(db_session)
+        mode = request.args.get("mode", "path").strip().lower()
+        metric = request.args.get("metric", "time").strip().lower()
+        if metric not in METRICS:
+            abort(400, description=f"metric must be one of: {', '.join(METRICS)}")
+        mask = _edge_mask(graph)
+        budget = _number_arg("budget")
+        result = {"mode": mode, "metric": metric, "skipped_route_ids": graph.skipped_route_ids}
+
+        if mode == "path":
+            source_id = _location_arg(graph, "from")
+            target_id = _location_arg(graph, "to")
+            try:
+                k = int(request.args.get("k", "1"))
+            except ValueError:
+                abort(400, description="k must be an integer")
+            if not 1 <= k <= MAX_K_PATHS:
+                abort(400, description=f"k must be between 1 and {MAX_K_PATHS}")
+            paths = shortest_paths(graph, source_id, target_id, metric, k, mask)
+            result.update({
+                "from": source_id,
+                "to": target_id,
+                "paths": paths,
+                "within_budget": None if budget is None else [path["distance"] <= budget for path in paths],
+            })
+        elif mode == "reachable":
+            source_id = _location_arg(graph, "from")
+            distances = reachable_from(graph, source_id, metric, mask, budget)
+            result.update({
+                "from": source_id,
+                "budget": budget,
+                "reachable": [{"location_id": location_id, "distance": distance} for location_id, distance in distances.items()],
+                "unreachable_ids": [location_id for location_id in graph.location_ids if location_id not in distances],
+            })
+        elif mode == "matrix":
+            location_ids = _list_arg("ids") or graph.location_ids
+            missing = [location_id for location_id in location_ids if location_id not in graph.index]
+            if missing:
+                abort(400, description=f"ids reference missing locations: {', '.join(missing)}")
+            if len(location_ids) > MAX_MATRIX_LOCATIONS:
+                abort(400, description=f"matrix supports at most {MAX_MATRIX_LOCATIONS} locations; pass ids")
+            matrix = distance_matrix(graph, location_ids, metric, mask)
+            cells = [value for row in matrix for value in row]
+            result.update({
+                "location_ids": location_ids,
+                "matrix": matrix,
+                "budget": budget,
+                "unreachable_pairs": sum(value is None for value in cells),
+                "over_budget_pairs": None if budget is None else sum(value is not None and value > budget for value in cells),
+            })
+        else:
+            abort(400, description="mode must be one of: path, reachable, matrix")
+        return jsonify(result)
+    finally:
+        db_session.close()
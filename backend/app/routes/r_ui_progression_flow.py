@@ -18,10 +18,13 @@ from backend.app.models.m_quests import Quest
 from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_shops import Shop
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_encounters import route as encounter_route
 from backend.app.routes.r_flags import route as flag_route
 from backend.app.routes.r_requirements import route as requirement_route
-from backend.app.services.dependency_index import build_dependency_index
+from backend.app.services.catalog_cache import get_catalog, register_catalog
+from backend.app.services.dependency_index import build_dependency_index, incoming_edges, index_node, outgoing_edges
+from backend.app.services.requirement_usage import requirement_usages
 
 
 bp = Blueprint("ui_progression_flow", __name__)
@@ -108,44 +111,25 @@ def _event_context(db_session, event):
     }
 
 
-def _requirement_usages_from_index(index, requirement_id):
-    node_id = f"requirement:{requirement_id}"
-    nodes = {node["id"]: node for node in index["nodes"]}
-    usages = []
-    for edge in index["edges"]:
-        if edge["source"] != node_id or edge["relation"] != "gates":
-            continue
-        target = nodes.get(edge["target"])
-        if target:
-            usages.append({
-                "schema_name": target["schema_name"],
-                "entry_id": target["entry_id"],
-                "entry_label": target["label"],
-                "path": edge.get("path", "requirements_id"),
-            })
-    return usages
-
-
 def _flag_usage_from_index(index, flag_id):
     node_id = f"flag:{flag_id}"
-    nodes = {node["id"]: node for node in index["nodes"]}
     producers = []
     consumers = []
-    for edge in index["edges"]:
-        if edge["target"] == node_id and edge["relation"] == "sets":
-            source = nodes.get(edge["source"])
-            if source:
-                producers.append({**source, "path": edge.get("path", "")})
-        if edge["source"] == node_id and edge["relation"] in {"required_by", "forbidden_by"}:
-            target = nodes.get(edge["target"])
-            if target:
-                consumers.append({**target, "relation": edge["relation"], "path": edge.get("path", "")})
+    for edge in incoming_edges(index, node_id, {"sets"}):
+        source = index_node(index, edge["source"])
+        if source:
+            producers.append({**source, "path": edge.get("path", "")})
+    for edge in outgoing_edges(index, node_id, {"required_by", "forbidden_by"}):
+        target = index_node(index, edge["target"])
+        if target:
+            consumers.append({**target, "relation": edge["relation"], "path": edge.get("path", "")})
     return {"producers": producers, "consumers": consumers}
 
 
-def _catalog(db_session):
+def _build_catalog(db_session):
     index = build_dependency_index(db_session)
     requirements = db_session.query(Requirement).all()
+    usages = requirement_usages(db_session)
     flags = db_session.query(Flag).all()
     events = db_session.query(Event).all()
     encounters = db_session.query(Encounter).all()
@@ -157,7 +141,7 @@ def _catalog(db_session):
         "lore_entries": [_compact(item) for item in db_session.query(LoreEntry).all()],
         "requirements": [requirement_route.serialize_item(item) for item in requirements],
         "requirement_usages_by_id": {
-            item.id: _requirement_usages_from_index(index, item.id)
+            item.id: usages.get(item.id, [])
             for item in requirements
         },
         "flags": [_columns(item) for item in flags],
@@ -176,6 +160,16 @@ def _catalog(db_session):
     }
 
 
+CATALOG = "progression_flow"
+# Reads the dependency index, which spans nearly every table, so it is keyed on all of them.
+register_catalog(CATALOG, None, _build_catalog)
+
+
+def _catalog(db_session):
+    version, catalog = get_catalog(db_session, CATALOG)
+    return {**catalog, "catalog_version": version}
+
+
 def _review_change(review, action, table, item_id, details=None):
     review[action].append({"table": table, "id": item_id, "details": details or {}})
 
@@ -347,6 +341,7 @@ def _reconcile(db_session, payload):
 
 
 @bp.get("/api/ui/progression-flow")
+@conditional_get()
 def get_progression_flow():
     db_session = get_db_session()
     try:
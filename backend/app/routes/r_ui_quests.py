@@ -11,6 +11,7 @@ from backend.app.models.m_quests import Quest
 from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_story_arcs import StoryArc
 from backend.app.routes.bundle_validation import bundle_error_response
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_interaction_profiles import route as interaction_route
 from backend.app.routes.r_quests import QuestRoute
 from backend.app.routes.r_requirements import route as requirement_route
@@ -117,6 +118,7 @@ def _reconcile_givers(db_session, quest_id, profile_ids):
 
 
 @bp.get("/api/ui/quests")
+@conditional_get()
 def get_quest_selector():
     db_session = get_db_session()
     try:
@@ -126,6 +128,7 @@ def get_quest_selector():
 
 
 @bp.get("/api/ui/quests/<quest_id>")
+@conditional_get()
 def get_quest_journey(quest_id):
     db_session = get_db_session()
     try:
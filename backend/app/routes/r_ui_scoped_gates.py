@@ -17,9 +17,11 @@ from backend.app.models.m_quests import Quest
 from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_shops import Shop
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_flags import route as flag_route
 from backend.app.routes.r_requirements import route as requirement_route
-from backend.app.services.dependency_index import build_dependency_index
+from backend.app.services.dependency_index import build_dependency_index, incoming_edges, index_node, outgoing_edges
+from backend.app.services.requirement_usage import requirement_usages
 
 
 bp = Blueprint("ui_scoped_gates", __name__)
@@ -65,49 +67,30 @@ def _compact(model):
     }
 
 
-def _requirement_usages_from_index(index, requirement_id):
-    node_id = f"requirement:{requirement_id}"
-    nodes = {node["id"]: node for node in index["nodes"]}
-    usages = []
-    for edge in index["edges"]:
-        if edge["source"] != node_id or edge["relation"] != "gates":
-            continue
-        target = nodes.get(edge["target"])
-        if target:
-            usages.append({
-                "schema_name": target["schema_name"],
-                "entry_id": target["entry_id"],
-                "entry_label": target["label"],
-                "path": edge.get("path", "requirements_id"),
-            })
-    return usages
-
-
 def _flag_usage_from_index(index, flag_id):
     node_id = f"flag:{flag_id}"
-    nodes = {node["id"]: node for node in index["nodes"]}
     producers = []
     consumers = []
-    for edge in index["edges"]:
-        if edge["target"] == node_id and edge["relation"] == "sets":
-            source = nodes.get(edge["source"])
-            if source:
-                producers.append({**source, "path": edge.get("path", "")})
-        if edge["source"] == node_id and edge["relation"] in {"required_by", "forbidden_by"}:
-            target = nodes.get(edge["target"])
-            if target:
-                consumers.append({**target, "relation": edge["relation"], "path": edge.get("path", "")})
+    for edge in incoming_edges(index, node_id, {"sets"}):
+        source = index_node(index, edge["source"])
+        if source:
+            producers.append({**source, "path": edge.get("path", "")})
+    for edge in outgoing_edges(index, node_id, {"required_by", "forbidden_by"}):
+        target = index_node(index, edge["target"])
+        if target:
+            consumers.append({**target, "relation": edge["relation"], "path": edge.get("path", "")})
     return {"producers": producers, "consumers": consumers}
 
 
 def _catalog(db_session):
     index = build_dependency_index(db_session)
     requirements = db_session.query(Requirement).all()
+    usages = requirement_usages(db_session)
     flags = db_session.query(Flag).all()
     return {
         "requirements": [requirement_route.serialize_item(item) for item in requirements],
         "requirement_usages_by_id": {
-            item.id: _requirement_usages_from_index(index, item.id)
+            item.id: usages.get(item.id, [])
             for item in requirements
         },
         "flags": [_columns(item) for item in flags],
@@ -218,6 +201,7 @@ def _reconcile(db_session, payload):
 
 
 @bp.get("/api/ui/scoped-gates")
+@conditional_get()
 def get_scoped_gates():
     db_session = get_db_session()
     try:
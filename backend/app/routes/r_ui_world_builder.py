@@ -18,6 +18,7 @@ from backend.app.models.m_route_event_bindings import RouteEventBinding
 from backend.app.models.m_quests import Quest
 from backend.app.models.m_story_arcs import StoryArc
 from backend.app.models.m_travel_tuning import TravelTuning
+from backend.app.routes.http_caching import conditional_get
 from backend.app.routes.r_location_creative_briefs import route as creative_brief_route
 from backend.app.routes.r_location_encounter_tables import route as encounter_table_route
 from backend.app.routes.r_location_pois import route as poi_route
@@ -32,6 +33,7 @@ from backend.app.routes.r_combat_profiles import route as combat_profile_route
 from backend.app.routes.r_encounters import route as encounter_route
 from backend.app.routes.r_events import EventRoute
 from backend.app.routes.bundle_validation import bundle_error_response, wrap_bundle_error
+from backend.app.services.location_hierarchy import LocationHierarchy, location_hierarchy
 from backend.app.utils.id import generate_ulid
 
 
@@ -91,44 +93,11 @@ def _slug(value):
     return text or "chain"
 
 
-def _auto_biome_mode(location: Location) -> str:
-    explicit = _enum_value(getattr(location, "biome_inheritance", None))
-    if explicit:
-        return explicit
-    location_type = _enum_value(location.location_type)
-    if location_type in {"World", "Continent", "Region"}:
-        return "None"
-    if location_type in {"Room", "Interior"}:
-        return "InheritFromParent"
-    return "Own"
-
-
-def _effective_biome(location: Location, locations_by_id: dict[str, Location]) -> str | None:
-    mode = _auto_biome_mode(location)
-    own_biome = _enum_value(location.biome)
-    if mode in {"Own", "Mixed"}:
-        return own_biome
-    if mode == "None":
-        return None
-    parent_id = location.parent_location_id
-    visited = {location.id}
-    while parent_id and parent_id not in visited:
-        visited.add(parent_id)
-        parent = locations_by_id.get(parent_id)
-        if parent is None:
-            return None
-        parent_biome = _enum_value(parent.biome)
-        if parent_biome:
-            return parent_biome
-        parent_id = parent.parent_location_id
-    return None
-
-
-def _location_columns(location: Location, locations_by_id: dict[str, Location]):
+def _location_columns(location: Location, hierarchy: LocationHierarchy):
     payload = _columns(location)
     payload["environment_tags"] = location.environment_tags or []
-    payload["effective_biome"] = _effective_biome(location, locations_by_id)
-    payload["resolved_biome_inheritance"] = _auto_biome_mode(location)
+    payload["effective_biome"] = hierarchy.effective_biome(location.id)
+    payload["resolved_biome_inheritance"] = hierarchy.biome_mode(location.id)
     return payload
 
 
@@ -150,7 +119,7 @@ def _world_packet(db_session):
     dialogues = db_session.query(Dialogue).all()
 
     location_ids = {location.id for location in locations}
-    locations_by_id = {location.id: location for location in locations}
+    hierarchy = location_hierarchy(db_session)
     route_ids = {route.id for route in routes}
     event_ids = {event.id for event in events}
     encounter_ids = {encounter.id for encounter in encounters}
@@ -163,19 +132,12 @@ def _world_packet(db_session):
                 "entry_id": location.id,
                 "message": f"Location parent_location_id references missing location {location.parent_location_id}",
             })
-        visited = {location.id}
-        parent_id = location.parent_location_id
-        while parent_id:
-            if parent_id in visited:
-                warnings.append({
-                    "schema": "locations",
-                    "entry_id": location.id,
-                    "message": "Location participates in a parent hierarchy cycle",
-                })
-                break
-            visited.add(parent_id)
-            parent = locations_by_id.get(parent_id)
-            parent_id = parent.parent_location_id if parent else None
+        if hierarchy.in_cycle(location.id):
+            warnings.append({
+                "schema": "locations",
+                "entry_id": location.id,
+                "message": "Location participates in a parent hierarchy cycle",
+            })
         for encounter_id in location.encounters or []:
             if encounter_id not in encounter_ids:
                 warnings.append({
@@ -233,7 +195,7 @@ def _world_packet(db_session):
             })
 
     return {
-        "locations": [_location_columns(location, locations_by_id) for location in locations],
+        "locations": [_location_columns(location, hierarchy) for location in locations],
         "routes": [_columns(route) for route in routes],
         "pois": [_columns(poi) for poi in pois],
         "encounter_tables": [_columns(table) for table in encounter_tables],
@@ -344,17 +306,10 @@ def _save_locations_parent_first(db_session, rows):
 
 
 def _validate_location_hierarchy(db_session):
-    locations = db_session.query(Location).all()
-    by_id = {location.id: location for location in locations}
-    for location in locations:
-        visited = {location.id}
-        parent_id = location.parent_location_id
-        while parent_id:
-            if parent_id in visited:
-                abort(400, description=f"location hierarchy cycle includes {location.id}")
-            visited.add(parent_id)
-            parent = by_id.get(parent_id)
-            parent_id = parent.parent_location_id if parent else None
+    hierarchy = location_hierarchy(db_session)
+    for location in db_session.query(Location).all():
+        if hierarchy.in_cycle(location.id):
+            abort(400, description=f"location hierarchy cycle includes {location.id}")
 
 
 def _first_or_create_chain_class(db_session, review):
@@ -616,6 +571,7 @@ def _combat_chain_payload(db_session, payload):
 
 
 @bp.route("/api/ui/world_builder", methods=["GET"])
+@conditional_get()
 def get_world_builder():
     db_session = get_db_session()
     try:
@@ -1,14 +1,120 @@
+import enum
 import json
 import os
+from threading import RLock
+from typing import Any, Dict, List, Optional
 
 
 SCHEMA_DIR = os.path.dirname(__file__)
 
+# Process-wide schema registry keyed by schema name. Each entry remembers the
+# file mtime it was loaded from so edits on disk are picked up on next lookup.
+_registry: Dict[str, Dict[str, Any]] = {}
+_registry_lock = RLock()
+
+
+def schema_path(name: str) -> str:
+    return os.path.join(SCHEMA_DIR, f"{name}.json")
+
+
+def _index_schema(name: str, schema: Dict[str, Any], mtime: float) -> Dict[str, Any]:
+    properties = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
+    required = schema.get("required") if isinstance(schema.get("required"), list) else []
+    types: Dict[str, Any] = {}
+    number_formats: Dict[str, str] = {}
+    for key, field_schema in properties.items():
+        if not isinstance(field_schema, dict):
+            continue
+        types[key] = field_schema.get("type")
+        field_ui = field_schema.get("ui") if isinstance(field_schema.get("ui"), dict) else {}
+        if field_ui.get("number_format"):
+            number_formats[key] = field_ui["number_format"]
+    return {
+        "name": name,
+        "mtime": mtime,
+        "schema": schema,
+        "properties": properties,
+        "columns": list(properties.keys()),
+        "required": list(required),
+        "types": types,
+        "number_formats": number_formats,
+    }
+
+
+def get_schema_entry(name: str) -> Optional[Dict[str, Any]]:
+    """Return the indexed registry entry for a schema, reloading it when the file changed.
+
+    Entries are shared across requests and must be treated as read-only.
+    """
+    if not name:
+        return None
+    path = schema_path(name)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        with _registry_lock:
+            _registry.pop(name, None)
+        return None
+    entry = _registry.get(name)
+    if entry is not None and entry["mtime"] == mtime:
+        return entry
+    with _registry_lock:
+        entry = _registry.get(name)
+        if entry is not None and entry["mtime"] == mtime:
+            return entry
+        try:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                schema = json.load(f)
+        except Exception:
+            _registry.pop(name, None)
+            return None
+        if not isinstance(schema, dict):
+            _registry.pop(name, None)
+            return None
+        entry = _index_schema(name, schema, mtime)
+        _registry[name] = entry
+        return entry
+
+
+def get_schema(name: str) -> Optional[Dict[str, Any]]:
+    entry = get_schema_entry(name)
+    return entry["schema"] if entry else None
+
+
+def resolve_schema_entry(names: List[str]) -> Optional[Dict[str, Any]]:
+    """Return the first registered schema among candidate names (table aliases)."""
+    for name in names:
+        entry = get_schema_entry(name)
+        if entry is not None:
+            return entry
+    return None
+
+
+def value_matches_schema_type(expected: Any, value: Any) -> bool:
+    """Check a persisted (non-null) value against a JSON-schema `type`."""
+    if not expected:
+        return True
+    return (
+        expected == "array" and isinstance(value, list)
+        or expected == "object" and isinstance(value, dict)
+        or expected == "boolean" and isinstance(value, bool)
+        or expected == "integer" and isinstance(value, int) and not isinstance(value, bool)
+        or expected == "number" and isinstance(value, (int, float)) and not isinstance(value, bool)
+        or expected == "string" and isinstance(value, (str, enum.Enum))
+    )
+
+
+def clear_schema_registry() -> None:
+    with _registry_lock:
+        _registry.clear()
+
+
 def load_schemas():
     schemas = {}
     for file in os.listdir(SCHEMA_DIR):
         if file.endswith(".json"):
             name = file[:-5]  # strip ".json"
-            with open(os.path.join(SCHEMA_DIR, file), "r") as f:
-                schemas[name] = json.load(f)
+            schema = get_schema(name)
+            if schema is not None:
+                schemas[name] = schema
     return schemas
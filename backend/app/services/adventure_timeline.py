@@ -1,4 +1,16 @@
+"""Read-only adventure timeline packet for the timeline board.
+
+The packet is memoized per engine under a content-version key over every table
+it reads, so repeated GETs are served without touching the database. Warnings
+are kept in named sections alongside a small basis, which lets a preview of
+adventure beat/link edits recompute only the sections and coherence rule
+families those edits can affect.
+"""
+
 from collections import defaultdict
+from types import SimpleNamespace
+
+from backend.app.db import change_tracking
 
 from backend.app.models.m_adventure_narrative import AdventureBeat, AdventureBeatLink
 from backend.app.models.m_character_narrative import CharacterStoryBeat
@@ -18,8 +30,14 @@ from backend.app.models.m_quests import Quest
 from backend.app.models.m_requirements import Requirement
 from backend.app.models.m_story_arcs import StoryArc
 from backend.app.models.m_timelines import Timeline
-from backend.app.services.dependency_index import build_dependency_index
-from backend.app.services.adventure_timeline_coherence import build_adventure_timeline_coherence_warnings
+from backend.app.services.dependency_index import INDEXED_TABLES, build_dependency_index
+from backend.app.services.adventure_timeline_coherence import (
+    COHERENCE_RULES,
+    CoherenceContext,
+    _canonical_occurrences,
+    coherence_warnings_by_rule,
+    occurrence_fingerprints,
+)
 
 
 def _enum_value(value):
@@ -72,35 +90,212 @@ ENTITY_TRACK_GROUPS = {
 }
 
 
-def build_adventure_timeline(db_session):
-    timelines = sorted(
-        db_session.query(Timeline).all(),
-        key=lambda item: (item.start_year is None, item.start_year or 0, item.id),
-    )
-    arcs = sorted(db_session.query(StoryArc).all(), key=lambda item: item.id)
-    quests = sorted(db_session.query(Quest).all(), key=lambda item: item.id)
-    events = sorted(db_session.query(Event).all(), key=lambda item: item.id)
-    beats = sorted(db_session.query(CharacterStoryBeat).all(), key=lambda item: item.id)
-    adventure_beats = sorted(
-        db_session.query(AdventureBeat).all(),
-        key=lambda item: (item.timeline_id or "", item.story_arc_id or "", item.sort_order, item.id),
-    )
-    adventure_beat_links = sorted(
-        db_session.query(AdventureBeatLink).all(),
-        key=lambda item: (item.adventure_beat_id, item.sort_order, item.id),
-    )
-    characters = sorted(db_session.query(Character).all(), key=lambda item: item.id)
-    combat_profiles = sorted(db_session.query(CombatProfile).all(), key=lambda item: item.id)
-    interaction_profiles = sorted(db_session.query(InteractionProfile).all(), key=lambda item: item.id)
-    locations = sorted(db_session.query(Location).all(), key=lambda item: item.id)
-    dialogues = sorted(db_session.query(Dialogue).all(), key=lambda item: item.id)
-    dialogue_nodes = sorted(db_session.query(DialogueNode).all(), key=lambda item: item.id)
-    encounters = sorted(db_session.query(Encounter).all(), key=lambda item: item.id)
-    lore_entries = sorted(db_session.query(LoreEntry).all(), key=lambda item: item.id)
-    items = sorted(db_session.query(Item).all(), key=lambda item: item.id)
-    factions = sorted(db_session.query(Faction).all(), key=lambda item: item.id)
-    flags = sorted(db_session.query(Flag).all(), key=lambda item: item.id)
-    requirements = sorted(db_session.query(Requirement).all(), key=lambda item: item.id)
+def _by_id(item):
+    return item.id
+
+
+# Every table the packet is built from, keyed by table name, with its sort order.
+TIMELINE_SOURCES = {
+    "timelines": (Timeline, lambda item: (item.start_year is None, item.start_year or 0, item.id)),
+    "story_arcs": (StoryArc, _by_id),
+    "quests": (Quest, _by_id),
+    "events": (Event, _by_id),
+    "character_story_beats": (CharacterStoryBeat, _by_id),
+    "adventure_beats": (
+        AdventureBeat,
+        lambda item: (item.timeline_id or "", item.story_arc_id or "", item.sort_order, item.id),
+    ),
+    "adventure_beat_links": (AdventureBeatLink, lambda item: (item.adventure_beat_id, item.sort_order, item.id)),
+    "characters": (Character, _by_id),
+    "combat_profiles": (CombatProfile, _by_id),
+    "interaction_profiles": (InteractionProfile, _by_id),
+    "locations": (Location, _by_id),
+    "dialogues": (Dialogue, _by_id),
+    "dialogue_nodes": (DialogueNode, _by_id),
+    "encounters": (Encounter, _by_id),
+    "lore_entries": (LoreEntry, _by_id),
+    "items": (Item, _by_id),
+    "factions": (Faction, _by_id),
+    "flags": (Flag, _by_id),
+    "requirements": (Requirement, _by_id),
+}
+TIMELINE_TABLES = tuple(sorted(set(TIMELINE_SOURCES) | INDEXED_TABLES))
+
+# Tables an adventure timeline bundle edits; changes confined to these can take
+# the incremental warning path.
+BEAT_TABLES = frozenset({"adventure_beats", "adventure_beat_links"})
+
+# Catalog name -> tables its serialized rows depend on.
+_CATALOG_TABLES = {
+    "quests": {"quests"},
+    "events": {"events"},
+    "character_story_beats": {"character_story_beats"},
+    "adventure_beats": BEAT_TABLES,
+    "adventure_beat_links": {"adventure_beat_links"},
+    "characters": {"characters"},
+    "locations": {"locations"},
+    "dialogues": {"dialogues"},
+    "encounters": {"encounters"},
+    "lore_entries": {"lore_entries"},
+    "items": {"items"},
+    "factions": {"factions"},
+    "flags": {"flags"},
+}
+
+# Warning sections in report order; coherence rule families sit between the
+# builder's own checks and the timeline/story arc emptiness checks.
+_BUILDER_SECTIONS = [
+    "story_arcs",
+    "quests",
+    "adventure_beat_links",
+    "adventure_beats",
+    "character_story_beats",
+    "events",
+    "timelines",
+    "story_arc_contents",
+]
+WARNING_SECTIONS = _BUILDER_SECTIONS[:6] + [name for name, _target_types, _rule in COHERENCE_RULES] + _BUILDER_SECTIONS[6:]
+
+
+def _load_source(db_session, name):
+    model, sort_key = TIMELINE_SOURCES[name]
+    return sorted(db_session.query(model).all(), key=sort_key)
+
+
+def _flatten_sections(sections):
+    return [warning for name in WARNING_SECTIONS for warning in sections.get(name, [])]
+
+
+def _adventure_link_warnings(adventure_beat_links, beat_ids, catalog_ids):
+    warnings = []
+    for link in adventure_beat_links:
+        target_type = _enum_value(link.target_type)
+        if link.adventure_beat_id not in beat_ids:
+            warnings.append({
+                "code": "missing_adventure_beat",
+                "schema_name": "adventure_beat_links",
+                "entry_id": link.id,
+                "message": f"Adventure beat link references missing adventure beat {link.adventure_beat_id}.",
+            })
+        if link.target_id not in catalog_ids.get(target_type, ()):
+            warnings.append({
+                "code": "missing_adventure_beat_link_target",
+                "schema_name": "adventure_beat_links",
+                "entry_id": link.id,
+                "message": f"Adventure beat link references missing {target_type} {link.target_id}.",
+            })
+    return warnings
+
+
+def _adventure_beat_warnings(adventure_beats, arc_timelines, timeline_ids, flag_ids):
+    warnings = []
+    for beat in adventure_beats:
+        arc_known = beat.story_arc_id in arc_timelines if beat.story_arc_id else False
+        if beat.story_arc_id and not arc_known:
+            warnings.append({
+                "code": "missing_adventure_beat_arc",
+                "schema_name": "adventure_beats",
+                "entry_id": beat.id,
+                "message": f"Adventure beat references missing story arc {beat.story_arc_id}.",
+            })
+        if beat.timeline_id and beat.timeline_id not in timeline_ids:
+            warnings.append({
+                "code": "missing_adventure_beat_timeline",
+                "schema_name": "adventure_beats",
+                "entry_id": beat.id,
+                "message": f"Adventure beat references missing timeline {beat.timeline_id}.",
+            })
+        if arc_known and beat.timeline_id and arc_timelines[beat.story_arc_id] != beat.timeline_id:
+            warnings.append({
+                "code": "adventure_beat_scope_conflict",
+                "schema_name": "adventure_beats",
+                "entry_id": beat.id,
+                "message": "Adventure beat timeline conflicts with its story arc timeline.",
+            })
+        for field in ["required_flags", "forbidden_flags", "expected_output_flags"]:
+            for flag_id in getattr(beat, field) or []:
+                if flag_id not in flag_ids:
+                    warnings.append({
+                        "code": "missing_adventure_beat_flag",
+                        "schema_name": "adventure_beats",
+                        "entry_id": beat.id,
+                        "message": f"Adventure beat {field} references missing flag {flag_id}.",
+                    })
+    return warnings
+
+
+def _empty_story_arc_warnings(arc_ids, arcs_with_placements, adventure_beats):
+    arcs_with_beats = {beat.story_arc_id for beat in adventure_beats if beat.story_arc_id}
+    return [
+        {
+            "code": "empty_story_arc",
+            "schema_name": "story_arcs",
+            "entry_id": arc_id,
+            "message": "Story arc has no ordered quests or placed character story beats.",
+        }
+        for arc_id in arc_ids
+        if arc_id not in arcs_with_placements and arc_id not in arcs_with_beats
+    ]
+
+
+def _changed_fingerprint_types(before, after):
+    return {
+        target_type
+        for target_type in set(before) | set(after)
+        if before.get(target_type) != after.get(target_type)
+    }
+
+
+def _reusable_coherence(previous, changed_tables, fingerprints):
+    """Coherence sections from `previous` that no changed occurrence can affect.
+
+    Rules read catalog rows plus the occurrences of their target types, so when
+    only adventure beats/links changed, a rule whose types' occurrences are
+    unchanged reports exactly what it did before.
+    """
+    if previous is None or changed_tables is None or not changed_tables <= BEAT_TABLES:
+        return {}
+    changed_types = _changed_fingerprint_types(previous["basis"]["fingerprints"], fingerprints)
+    return {
+        name: previous["basis"]["sections"][name]
+        for name, target_types, _rule in COHERENCE_RULES
+        if not target_types & changed_types
+    }
+
+
+def _catalogs(sources, adventure_links_by_beat, previous, changed_tables):
+    reusable = previous["packet"]["catalogs"] if previous is not None and changed_tables is not None else {}
+    catalogs = {}
+    for name, tables in _CATALOG_TABLES.items():
+        if name in reusable and not tables & changed_tables:
+            catalogs[name] = reusable[name]
+        elif name == "adventure_beats":
+            catalogs[name] = [
+                {**_columns(item), "attachments": adventure_links_by_beat[item.id]}
+                for item in sources[name]
+            ]
+        else:
+            catalogs[name] = [_columns(item) for item in sources[name]]
+    return catalogs
+
+
+def _build_packet(db_session, previous=None, changed_tables=None):
+    sources = {name: _load_source(db_session, name) for name in TIMELINE_SOURCES}
+    timelines = sources["timelines"]
+    arcs = sources["story_arcs"]
+    quests = sources["quests"]
+    events = sources["events"]
+    beats = sources["character_story_beats"]
+    adventure_beats = sources["adventure_beats"]
+    adventure_beat_links = sources["adventure_beat_links"]
+    characters = sources["characters"]
+    locations = sources["locations"]
+    dialogues = sources["dialogues"]
+    encounters = sources["encounters"]
+    lore_entries = sources["lore_entries"]
+    items = sources["items"]
+    factions = sources["factions"]
+    flags = sources["flags"]
 
     timeline_by_id = {item.id: item for item in timelines}
     arc_by_id = {item.id: item for item in arcs}
@@ -118,7 +313,7 @@ def build_adventure_timeline(db_session):
 
     relationships = []
     placements = []
-    warnings = []
+    sections = {name: [] for name in _BUILDER_SECTIONS}
     arc_ids_by_timeline = defaultdict(list)
     arcs_by_quest = defaultdict(list)
     beat_ids_by_event = defaultdict(list)
@@ -137,7 +332,7 @@ def build_adventure_timeline(db_session):
                     path="story_arcs.timeline_id",
                 ))
             else:
-                warnings.append({
+                sections["story_arcs"].append({
                     "code": "missing_timeline",
                     "schema_name": "story_arcs",
                     "entry_id": arc.id,
@@ -147,7 +342,7 @@ def build_adventure_timeline(db_session):
         seen_quest_ids = set()
         for order, quest_id in enumerate(arc.related_quests or []):
             if quest_id in seen_quest_ids:
-                warnings.append({
+                sections["story_arcs"].append({
                     "code": "duplicate_arc_quest",
                     "schema_name": "story_arcs",
                     "entry_id": arc.id,
@@ -157,7 +352,7 @@ def build_adventure_timeline(db_session):
             seen_quest_ids.add(quest_id)
             quest = quest_by_id.get(quest_id)
             if not quest:
-                warnings.append({
+                sections["story_arcs"].append({
                     "code": "missing_arc_quest",
                     "schema_name": "story_arcs",
                     "entry_id": arc.id,
@@ -189,28 +384,28 @@ def build_adventure_timeline(db_session):
     for quest in quests:
         ordered_arc_ids = arcs_by_quest.get(quest.id, [])
         if len(ordered_arc_ids) > 1:
-            warnings.append({
+            sections["quests"].append({
                 "code": "quest_in_multiple_arc_orders",
                 "schema_name": "quests",
                 "entry_id": quest.id,
                 "message": f"Quest is ordered by multiple story arcs: {', '.join(ordered_arc_ids)}.",
             })
         if quest.story_arc_id and quest.story_arc_id not in arc_by_id:
-            warnings.append({
+            sections["quests"].append({
                 "code": "missing_quest_arc",
                 "schema_name": "quests",
                 "entry_id": quest.id,
                 "message": f"Quest references missing story arc {quest.story_arc_id}.",
             })
         elif quest.story_arc_id and quest.story_arc_id not in ordered_arc_ids:
-            warnings.append({
+            sections["quests"].append({
                 "code": "quest_missing_from_arc_order",
                 "schema_name": "quests",
                 "entry_id": quest.id,
                 "message": f"Quest belongs to story arc {quest.story_arc_id} but is not in its related_quests order.",
             })
         if ordered_arc_ids and quest.story_arc_id and quest.story_arc_id not in ordered_arc_ids:
-            warnings.append({
+            sections["quests"].append({
                 "code": "quest_arc_order_conflict",
                 "schema_name": "quests",
                 "entry_id": quest.id,
@@ -229,6 +424,8 @@ def build_adventure_timeline(db_session):
         "faction": faction_by_id,
         "story_arc": arc_by_id,
     }
+    catalog_ids = {target_type: set(catalog) for target_type, catalog in adventure_target_catalogs.items()}
+    sections["adventure_beat_links"] = _adventure_link_warnings(adventure_beat_links, adventure_beat_by_id, catalog_ids)
     for link in adventure_beat_links:
         target_type = _enum_value(link.target_type)
         target = adventure_target_catalogs.get(target_type, {}).get(link.target_id)
@@ -237,20 +434,6 @@ def build_adventure_timeline(db_session):
             "label": _label(target) if target else link.target_id,
         }
         adventure_links_by_beat[link.adventure_beat_id].append(link_data)
-        if link.adventure_beat_id not in adventure_beat_by_id:
-            warnings.append({
-                "code": "missing_adventure_beat",
-                "schema_name": "adventure_beat_links",
-                "entry_id": link.id,
-                "message": f"Adventure beat link references missing adventure beat {link.adventure_beat_id}.",
-            })
-        if not target:
-            warnings.append({
-                "code": "missing_adventure_beat_link_target",
-                "schema_name": "adventure_beat_links",
-                "entry_id": link.id,
-                "message": f"Adventure beat link references missing {target_type} {link.target_id}.",
-            })
         relationships.append(_relationship(
             f"adventure_beat:{link.adventure_beat_id}",
             f"{target_type}:{link.target_id}",
@@ -287,32 +470,15 @@ def build_adventure_timeline(db_session):
                 "notes": link.notes,
             })
 
+    arc_timelines = {arc.id: arc.timeline_id for arc in arcs}
+    sections["adventure_beats"] = _adventure_beat_warnings(
+        adventure_beats, arc_timelines, set(timeline_by_id), set(flag_by_id),
+    )
     for beat in adventure_beats:
         story_arc = arc_by_id.get(beat.story_arc_id) if beat.story_arc_id else None
         timeline_id = beat.timeline_id or (story_arc.timeline_id if story_arc else None)
         if beat.story_arc_id:
             adventure_beat_ids_by_arc[beat.story_arc_id].append(beat.id)
-        if beat.story_arc_id and not story_arc:
-            warnings.append({
-                "code": "missing_adventure_beat_arc",
-                "schema_name": "adventure_beats",
-                "entry_id": beat.id,
-                "message": f"Adventure beat references missing story arc {beat.story_arc_id}.",
-            })
-        if beat.timeline_id and beat.timeline_id not in timeline_by_id:
-            warnings.append({
-                "code": "missing_adventure_beat_timeline",
-                "schema_name": "adventure_beats",
-                "entry_id": beat.id,
-                "message": f"Adventure beat references missing timeline {beat.timeline_id}.",
-            })
-        if story_arc and beat.timeline_id and story_arc.timeline_id != beat.timeline_id:
-            warnings.append({
-                "code": "adventure_beat_scope_conflict",
-                "schema_name": "adventure_beats",
-                "entry_id": beat.id,
-                "message": "Adventure beat timeline conflicts with its story arc timeline.",
-            })
         lane_id = (
             f"story_arc:{beat.story_arc_id}"
             if beat.story_arc_id
@@ -341,13 +507,6 @@ def build_adventure_timeline(db_session):
             ("expected_output_flags", "expected_after", "output"),
         ]:
             for index, flag_id in enumerate(getattr(beat, field) or []):
-                if flag_id not in flag_by_id:
-                    warnings.append({
-                        "code": "missing_adventure_beat_flag",
-                        "schema_name": "adventure_beats",
-                        "entry_id": beat.id,
-                        "message": f"Adventure beat {field} references missing flag {flag_id}.",
-                    })
                 source = f"adventure_beat:{beat.id}" if direction == "output" else f"flag:{flag_id}"
                 target = f"flag:{flag_id}" if direction == "output" else f"adventure_beat:{beat.id}"
                 relationships.append(_relationship(
@@ -383,7 +542,7 @@ def build_adventure_timeline(db_session):
                     path=source_field,
                 ))
             else:
-                warnings.append({
+                sections["character_story_beats"].append({
                     "code": "missing_story_beat_source",
                     "schema_name": "character_story_beats",
                     "entry_id": beat.id,
@@ -416,7 +575,7 @@ def build_adventure_timeline(db_session):
             "source": _reference(source_kind, source_id, _label(source)) if source else None,
         })
         if not character:
-            warnings.append({
+            sections["character_story_beats"].append({
                 "code": "missing_story_beat_character",
                 "schema_name": "character_story_beats",
                 "entry_id": beat.id,
@@ -435,7 +594,7 @@ def build_adventure_timeline(db_session):
                 path="next_event_id",
             ))
             if event.next_event_id not in event_by_id:
-                warnings.append({
+                sections["events"].append({
                     "code": "missing_next_event",
                     "schema_name": "events",
                     "entry_id": event.id,
@@ -479,23 +638,13 @@ def build_adventure_timeline(db_session):
             row["label"],
             row["id"],
         ))
-    warnings.extend(build_adventure_timeline_coherence_warnings(
-        adventure_beats=adventure_beats,
-        adventure_beat_links=adventure_beat_links,
-        characters=characters,
-        items=items,
-        story_arcs=arcs,
-        requirements=requirements,
-        quests=quests,
-        dialogues=dialogues,
-        dialogue_nodes=dialogue_nodes,
-        events=events,
-        encounters=encounters,
-        character_story_beats=beats,
-        combat_profiles=combat_profiles,
-        interaction_profiles=interaction_profiles,
-        locations=locations,
-        factions=factions,
+    occurrences = _canonical_occurrences(adventure_beats, adventure_beat_links)
+    fingerprints = occurrence_fingerprints(occurrences)
+    reusable = _reusable_coherence(previous, changed_tables, fingerprints)
+    sections.update(reusable)
+    sections.update(coherence_warnings_by_rule(
+        CoherenceContext(occurrences, sources),
+        {name for name, _target_types, _rule in COHERENCE_RULES if name not in reusable},
     ))
     timeline_payload = []
     for timeline in timelines:
@@ -503,7 +652,7 @@ def build_adventure_timeline(db_session):
         data["story_arc_ids"] = arc_ids_by_timeline[timeline.id]
         timeline_payload.append(data)
         if not data["story_arc_ids"]:
-            warnings.append({
+            sections["timelines"].append({
                 "code": "empty_timeline",
                 "schema_name": "timelines",
                 "entry_id": timeline.id,
@@ -511,6 +660,7 @@ def build_adventure_timeline(db_session):
             })
 
     arc_payload = []
+    arcs_with_placements = set()
     for arc in arcs:
         data = _columns(arc)
         data["ordered_quest_ids"] = [
@@ -525,13 +675,10 @@ def build_adventure_timeline(db_session):
         ]
         data["adventure_beat_ids"] = adventure_beat_ids_by_arc[arc.id]
         arc_payload.append(data)
-        if not data["ordered_quest_ids"] and not data["character_story_beat_ids"] and not data["adventure_beat_ids"]:
-            warnings.append({
-                "code": "empty_story_arc",
-                "schema_name": "story_arcs",
-                "entry_id": arc.id,
-                "message": "Story arc has no ordered quests or placed character story beats.",
-            })
+        if data["ordered_quest_ids"] or data["character_story_beat_ids"]:
+            arcs_with_placements.add(arc.id)
+    arc_ids = [arc.id for arc in arcs]
+    sections["story_arc_contents"] = _empty_story_arc_warnings(arc_ids, arcs_with_placements, adventure_beats)
 
     unplaced = {
         "story_arc_ids": [arc.id for arc in arcs if not arc.timeline_id],
@@ -547,7 +694,7 @@ def build_adventure_timeline(db_session):
         ],
     }
 
-    return {
+    packet = {
         "meta": {
             "read_only": True,
             "canonical_adventure_beats": True,
@@ -575,27 +722,127 @@ def build_adventure_timeline(db_session):
         "event_chains": event_chains,
         "relationships": relationships,
         "unplaced": unplaced,
-        "catalogs": {
-            "quests": [_columns(item) for item in quests],
-            "events": [_columns(item) for item in events],
-            "character_story_beats": [_columns(item) for item in beats],
-            "adventure_beats": [
-                {**_columns(item), "attachments": adventure_links_by_beat[item.id]}
-                for item in adventure_beats
-            ],
-            "adventure_beat_links": [_columns(item) for item in adventure_beat_links],
-            "characters": [_columns(item) for item in characters],
-            "locations": [_columns(item) for item in locations],
-            "dialogues": [_columns(item) for item in dialogues],
-            "encounters": [_columns(item) for item in encounters],
-            "lore_entries": [_columns(item) for item in lore_entries],
-            "items": [_columns(item) for item in items],
-            "factions": [_columns(item) for item in factions],
-            "flags": [_columns(item) for item in flags],
-        },
+        "catalogs": _catalogs(sources, adventure_links_by_beat, previous, changed_tables),
         "dependency_index": dependency_index,
         "health": {
-            "warnings": warnings,
+            "warnings": _flatten_sections(sections),
             "dependency": dependency_index["health"],
         },
     }
+    basis = {
+        "sections": sections,
+        "fingerprints": fingerprints,
+        "catalog_ids": catalog_ids,
+        "arc_timelines": arc_timelines,
+        "timeline_ids": set(timeline_by_id),
+        "flag_ids": set(flag_by_id),
+        "arc_ids": arc_ids,
+        "arcs_with_placements": arcs_with_placements,
+        # Serialized beat/link rows; a preview patches in only the rows it changed.
+        "rows": {name: packet["catalogs"][name] for name in BEAT_TABLES},
+    }
+    return packet, basis
+
+
+# engine -> {version, packet, basis} of the last committed build.
+_memo = change_tracking.EngineStates()
+
+
+def _changed_tables(before, after):
+    """Tables whose version differs between two `content_version` keys, or None if incomparable."""
+    if before[0] != after[0]:
+        return None
+    return {table for table, old, new in zip(TIMELINE_TABLES, before[1], after[1]) if old != new}
+
+
+def _packet_and_basis(db_session):
+    if change_tracking.uncommitted_changes(db_session):
+        # Pending rows are private to this session; never share what they produce.
+        packet, basis = _build_packet(db_session)
+        basis["version"] = None
+        return packet, basis
+    engine = db_session.get_bind()
+    version = change_tracking.content_version(engine, TIMELINE_TABLES)
+    previous = _memo.get(engine)
+    if previous is not None and previous["version"] == version:
+        return previous["packet"], previous["basis"]
+    changed_tables = _changed_tables(previous["version"], version) if previous is not None else None
+    packet, basis = _build_packet(db_session, previous, changed_tables)
+    basis["version"] = version
+    _memo.set(engine, {"version": version, "packet": packet, "basis": basis})
+    return packet, basis
+
+
+def build_adventure_timeline(db_session):
+    """The timeline packet for the session's view of the database.
+
+    Committed state is memoized per engine and rebuilt only after a commit to a
+    table it reads; the returned packet is shared, so treat it as read-only.
+    After beat/link-only commits, unaffected catalogs and coherence rule
+    families are carried over from the previous packet.
+    """
+    packet, _basis = _packet_and_basis(db_session)
+    return packet
+
+
+def adventure_timeline_basis(db_session):
+    """Snapshot for `preview_adventure_timeline_warnings`; take it before changing the session."""
+    _packet, basis = _packet_and_basis(db_session)
+    return basis
+
+
+def _patched_rows(db_session, name, serialized_rows, changes):
+    """Rows of `name` as the session sees them: basis rows with its own changes swapped in."""
+    if name in changes.tables:
+        return _load_source(db_session, name)
+    model, sort_key = TIMELINE_SOURCES[name]
+    changed_ids = changes.rows.get(name, set())
+    rows = [SimpleNamespace(**row) for row in serialized_rows if row["id"] not in changed_ids]
+    for row_id in changed_ids:
+        item = db_session.get(model, row_id)
+        if item is not None:
+            rows.append(item)
+    return sorted(rows, key=sort_key)
+
+
+def preview_adventure_timeline_warnings(db_session, basis):
+    """`health.warnings` of the packet for the session's pending beat/link edits.
+
+    Recomputes the link, beat and story arc content checks plus the coherence
+    rule families whose occurrences changed, reusing `basis` for the rest.
+    Falls back to a full build when the session touched other tables or another
+    commit landed since the basis was taken.
+    """
+    changes = change_tracking.uncommitted_changes(db_session)
+    touched = changes.touched_tables()
+    engine = db_session.get_bind()
+    if (
+        basis.get("version") is None
+        or not touched <= BEAT_TABLES
+        or change_tracking.content_version(engine, TIMELINE_TABLES) != basis["version"]
+    ):
+        return build_adventure_timeline(db_session)["health"]["warnings"]
+
+    adventure_beats = _patched_rows(db_session, "adventure_beats", basis["rows"]["adventure_beats"], changes)
+    adventure_beat_links = _patched_rows(
+        db_session, "adventure_beat_links", basis["rows"]["adventure_beat_links"], changes,
+    )
+    beat_ids = {beat.id for beat in adventure_beats}
+    sections = dict(basis["sections"])
+    sections["adventure_beat_links"] = _adventure_link_warnings(adventure_beat_links, beat_ids, basis["catalog_ids"])
+    sections["adventure_beats"] = _adventure_beat_warnings(
+        adventure_beats, basis["arc_timelines"], basis["timeline_ids"], basis["flag_ids"],
+    )
+    sections["story_arc_contents"] = _empty_story_arc_warnings(
+        basis["arc_ids"], basis["arcs_with_placements"], adventure_beats,
+    )
+
+    occurrences = _canonical_occurrences(adventure_beats, adventure_beat_links)
+    changed_types = _changed_fingerprint_types(basis["fingerprints"], occurrence_fingerprints(occurrences))
+    stale_rules = {name for name, target_types, _rule in COHERENCE_RULES if target_types & changed_types}
+    if stale_rules:
+        context = CoherenceContext(occurrences, {
+            name: (lambda name=name: _load_source(db_session, name)) for name in TIMELINE_SOURCES
+        })
+        sections.update(coherence_warnings_by_rule(context, stale_rules))
+    return _flatten_sections(sections)
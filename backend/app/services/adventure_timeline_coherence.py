@@ -1263,6 +1263,127 @@ def _faction_warnings(occurrences, factions_by_id, quests, events, encounters):
     return warnings
 
 
+def occurrence_fingerprints(occurrences):
+    """Per target type, everything coherence rules read from its occurrences and their links, in list order."""
+    fingerprints = defaultdict(list)
+    for row in occurrences:
+        fingerprints[row["target_type"]].append((
+            row["link"].id, row["target_id"], row["continuity_group_id"], row["scope_kind"], row["scope_id"],
+            row["order"], row["role"], row["occurrence_kind"], row["change_type"], row["importance"],
+            row["beat"].id, row["beat"].title, _enum_value(row["beat"].beat_type),
+            row["link"].continuity_group_id, row["link"].state_label, row["link"].notes,
+        ))
+    return {target_type: tuple(rows) for target_type, rows in fingerprints.items()}
+
+
+class CoherenceContext:
+    """Occurrences plus lazily resolved source rows for the coherence rules.
+
+    `sources` maps a source name (the keyword names of
+    `build_adventure_timeline_coherence_warnings`) to a row list or a zero-argument
+    loader, so rules that are not evaluated never load their inputs.
+    """
+
+    def __init__(self, occurrences, sources):
+        self.occurrences = occurrences
+        self._sources = sources
+        self._cache = {}
+
+    def rows(self, name):
+        if name not in self._cache:
+            value = self._sources[name]
+            self._cache[name] = value() if callable(value) else value
+        return self._cache[name]
+
+    def by_id(self, name):
+        key = ("by_id", name)
+        if key not in self._cache:
+            self._cache[key] = {item.id: item for item in self.rows(name)}
+        return self._cache[key]
+
+    def placed_event_ids(self):
+        if "placed_event_ids" not in self._cache:
+            self._cache["placed_event_ids"] = _placed_event_ids(
+                self.occurrences,
+                self.rows("character_story_beats"),
+                self.rows("events"),
+            )
+        return self._cache["placed_event_ids"]
+
+
+def _character_introduction_rule(context):
+    return _character_introduction_warnings(
+        context.occurrences,
+        context.by_id("characters"),
+        _character_usage_evidence(
+            context.occurrences,
+            context.rows("dialogues"),
+            context.rows("dialogue_nodes"),
+            context.rows("encounters"),
+            context.rows("events"),
+            context.rows("quests"),
+            context.rows("character_story_beats"),
+            context.rows("combat_profiles"),
+            context.rows("interaction_profiles"),
+        ),
+    )
+
+
+# Rule families in report order: (name, occurrence target types read, rule).
+# Apart from occurrences of those types, rules only read catalog rows, so a
+# change confined to adventure beats/links can skip every rule whose types'
+# occurrences are unchanged.
+COHERENCE_RULES = [
+    ("character_lifecycle", {"character"}, lambda context: _character_warnings(
+        context.occurrences, context.by_id("characters"),
+    )),
+    ("character_introduction", {"character", "dialogue", "encounter", "event", "quest"}, _character_introduction_rule),
+    ("item_lifecycle", {"item"}, lambda context: _item_warnings(context.occurrences, context.by_id("items"))),
+    ("quest_placement", {"quest", "item", "event"}, lambda context: _quest_warnings(
+        context.occurrences,
+        context.rows("quests"),
+        context.rows("story_arcs"),
+        context.rows("requirements"),
+        context.rows("events"),
+        context.by_id("items"),
+    )),
+    ("dialogue_placement", {"dialogue", "event"}, lambda context: _dialogue_warnings(
+        context.occurrences,
+        context.by_id("dialogues"),
+        context.rows("dialogue_nodes"),
+        context.rows("events"),
+        context.placed_event_ids(),
+    )),
+    ("encounter_placement", {"encounter", "event", "item"}, lambda context: _encounter_warnings(
+        context.occurrences,
+        context.rows("encounters"),
+        context.rows("character_story_beats"),
+        context.rows("events"),
+        context.placed_event_ids(),
+        context.by_id("items"),
+    )),
+    ("location_lifecycle", {"location"}, lambda context: _location_warnings(context.occurrences, context.by_id("locations"))),
+    ("location_introduction", {"location", "event"}, lambda context: _location_introduction_warnings(
+        context.occurrences, context.rows("events"), context.by_id("locations"),
+    )),
+    ("faction_state", {"faction", "quest", "event", "encounter"}, lambda context: _faction_warnings(
+        context.occurrences,
+        context.by_id("factions"),
+        context.rows("quests"),
+        context.rows("events"),
+        context.rows("encounters"),
+    )),
+]
+
+
+def coherence_warnings_by_rule(context, rule_names=None):
+    return {
+        name: rule(context)
+        for name, _target_types, rule in COHERENCE_RULES
+        if rule_names is None or name in rule_names
+    }
+
+
 def build_adventure_timeline_coherence_warnings(
     *,
     adventure_beats,
@@ -1282,42 +1403,20 @@ def build_adventure_timeline_coherence_warnings(
     locations,
     factions,
 ):
-    occurrences = _canonical_occurrences(adventure_beats, adventure_beat_links)
-    characters_by_id = {item.id: item for item in characters}
-    items_by_id = {item.id: item for item in items}
-    dialogues_by_id = {item.id: item for item in dialogues}
-    locations_by_id = {item.id: item for item in locations}
-    factions_by_id = {item.id: item for item in factions}
-    placed_event_ids = _placed_event_ids(occurrences, character_story_beats, events)
-    warnings = []
-    warnings.extend(_character_warnings(occurrences, characters_by_id))
-    warnings.extend(_character_introduction_warnings(
-        occurrences,
-        characters_by_id,
-        _character_usage_evidence(
-            occurrences,
-            dialogues,
-            dialogue_nodes,
-            encounters,
-            events,
-            quests,
-            character_story_beats,
-            combat_profiles,
-            interaction_profiles,
-        ),
-    ))
-    warnings.extend(_item_warnings(occurrences, items_by_id))
-    warnings.extend(_quest_warnings(occurrences, quests, story_arcs, requirements, events, items_by_id))
-    warnings.extend(_dialogue_warnings(occurrences, dialogues_by_id, dialogue_nodes, events, placed_event_ids))
-    warnings.extend(_encounter_warnings(
-        occurrences,
-        encounters,
-        character_story_beats,
-        events,
-        placed_event_ids,
-        items_by_id,
-    ))
-    warnings.extend(_location_warnings(occurrences, locations_by_id))
-    warnings.extend(_location_introduction_warnings(occurrences, events, locations_by_id))
-    warnings.extend(_faction_warnings(occurrences, factions_by_id, quests, events, encounters))
-    return warnings
+    context = CoherenceContext(_canonical_occurrences(adventure_beats, adventure_beat_links), {
+        "characters": characters,
+        "items": items,
+        "story_arcs": story_arcs,
+        "requirements": requirements,
+        "quests": quests,
+        "dialogues": dialogues,
+        "dialogue_nodes": dialogue_nodes,
+        "events": events,
+        "encounters": encounters,
+        "character_story_beats": character_story_beats,
+        "combat_profiles": combat_profiles,
+        "interaction_profiles": interaction_profiles,
+        "locations": locations,
+        "factions": factions,
+    })
+    return [warning for rows in coherence_warnings_by_rule(context).values() for warning in rows]
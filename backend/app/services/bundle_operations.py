@@ -2,6 +2,7 @@
 
 from flask import abort
 
+from backend.app.db.references import reference_resolver
 from backend.app.models.m_abilities import Ability
 from backend.app.models.m_adventure_narrative import AdventureBeatLink
 from backend.app.models.m_dialogue_nodes import DialogueNode
@@ -83,16 +84,21 @@ def _upsert_with_route(db_session, route, model, data, path):
         raise wrap_bundle_error(path, error) from error
 
 
+_REWARD_REFS = (
+    ("item_rewards", "item_id", Item),
+    ("currency_rewards", "currency_id", Currency),
+    ("reputation_rewards", "faction_id", Faction),
+)
+
+
 def _validate_reward_refs(db_session, data, path):
-    for index, reward in enumerate(data.get("item_rewards") or []):
-        if not isinstance(reward, dict) or not db_session.get(Item, reward.get("item_id")):
-            abort(400, description=f"{path}.item_rewards[{index}].item_id is invalid")
-    for index, reward in enumerate(data.get("currency_rewards") or []):
-        if not isinstance(reward, dict) or not db_session.get(Currency, reward.get("currency_id")):
-            abort(400, description=f"{path}.currency_rewards[{index}].currency_id is invalid")
-    for index, reward in enumerate(data.get("reputation_rewards") or []):
-        if not isinstance(reward, dict) or not db_session.get(Faction, reward.get("faction_id")):
-            abort(400, description=f"{path}.reputation_rewards[{index}].faction_id is invalid")
+    references = reference_resolver(db_session)
+    for field, key, model in _REWARD_REFS:
+        references.expect_rows(model, data.get(field), key)
+    for field, key, model in _REWARD_REFS:
+        for index, reward in enumerate(data.get(field) or []):
+            if not isinstance(reward, dict) or not references.exists(model, reward.get(key)):
+                abort(400, description=f"{path}.{field}[{index}].{key} is invalid")
 
 
 def upsert_event(db_session, data, path, *, defer_next=False):
@@ -115,14 +121,18 @@ def upsert_event(db_session, data, path, *, defer_next=False):
             "lore_id": LoreEntry,
             "location_id": Location,
         }
+        references = reference_resolver(db_session)
+        for field, model in refs.items():
+            references.expect(model, [data.get(field)])
+        references.expect(Flag, data.get("flags_set") or [])
         for field, model in refs.items():
-            if data.get(field) and not db_session.get(model, data[field]):
+            if data.get(field) and not references.exists(model, data[field]):
                 abort(400, description=f"{path}.{field} is invalid")
-        if data.get("next_event_id") and not defer_next and not db_session.get(Event, data["next_event_id"]):
+        if data.get("next_event_id") and not defer_next and not references.exists(Event, data["next_event_id"]):
             abort(400, description=f"{path}.next_event_id is invalid")
-        for flag_id in data.get("flags_set") or []:
-            if not db_session.get(Flag, flag_id):
-                abort(400, description=f"{path}.flags_set references missing flag {flag_id}")
+        missing_flags = references.missing(Flag, data.get("flags_set") or [])
+        if missing_flags:
+            abort(400, description=f"{path}.flags_set references missing flag {missing_flags[0]}")
         _validate_reward_refs(db_session, data, path)
 
         event.slug = str(data["slug"]).strip().lower()
@@ -169,7 +179,7 @@ def attach_requirement(db_session, attachment, path):
         if not item:
             abort(400, description=f"{path}.entry_id references missing {schema_name}")
         requirement_id = attachment.get("requirements_id")
-        if requirement_id and not db_session.get(Requirement, requirement_id):
+        if requirement_id and not reference_resolver(db_session).exists(Requirement, requirement_id):
             abort(400, description=f"{path}.requirements_id references missing requirement")
         item.requirements_id = requirement_id or None
         db_session.add(item)
@@ -224,7 +234,7 @@ def apply_dialogue_choice_flag(db_session, change, path):
         if choices[index] != change.get("expected_previous"):
             abort(409, description=f"{path}.expected_previous is stale")
         flag_id = change.get("flag_id")
-        if not db_session.get(Flag, flag_id):
+        if not reference_resolver(db_session).exists(Flag, flag_id):
             abort(400, description=f"{path}.flag_id references a missing flag")
         choices[index] = {**choices[index], "set_flags": list(dict.fromkeys([*(choices[index].get("set_flags") or []), flag_id]))}
         node.choices = validate_choice_contracts(db_session, node, choices)
@@ -0,0 +1,85 @@
+"""Shared, versioned catalogs for the `/api/ui/*` workspace packets.
+
+Workspace routes register the compact lookup lists their packets embed (items,
+characters, requirements, ...) with `register_catalog(name, tables, build)`.
+`get_catalog()` builds a catalog once per committed state of the tables it is
+declared to read, keyed per engine by `change_tracking.content_version`, and
+hands every later request the same object until one of those tables is written.
+Sessions holding uncommitted changes to those tables get a private build of
+their own view. Each cached build carries a version token that packets echo and
+that `GET /api/ui/catalogs/<name>` serves as a long-cacheable resource; tokens
+include a per-process nonce, so counters that restart with the process never
+reuse a token for different content.
+
+Cached catalogs are shared between requests: callers must copy before changing them.
+"""
+
+import hashlib
+import uuid
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from backend.app.db import change_tracking
+
+
+# Tables read by `requirement_route.serialize_item`.
+REQUIREMENT_TABLES = (
+    "requirements",
+    "requirement_required_flags",
+    "requirement_forbidden_flags",
+    "requirement_min_faction_reputation",
+)
+
+
+class CatalogDefinition:
+    """A named catalog, the tables its builder reads (None for every table) and the builder."""
+
+    __slots__ = ("name", "tables", "build")
+
+    def __init__(self, name: str, tables: Optional[Iterable[str]], build: Callable[[Any], Any]):
+        self.name = name
+        self.tables = tuple(sorted(set(tables))) if tables is not None else None
+        self.build = build
+
+
+CATALOGS: Dict[str, CatalogDefinition] = {}
+_PROCESS_NONCE = uuid.uuid4().hex[:8]
+
+# engine -> {catalog name: (content version, token, catalog)}.
+_cache = change_tracking.EngineStates(dict)
+
+
+def register_catalog(name: str, tables: Optional[Iterable[str]], build: Callable[[Any], Any]) -> CatalogDefinition:
+    """Register `build(db_session)` as catalog `name`, reading only `tables`."""
+    definition = CatalogDefinition(name, tables, build)
+    CATALOGS[name] = definition
+    with _cache.lock:
+        for catalogs in _cache.values():
+            catalogs.pop(name, None)
+    return definition
+
+
+def _version_token(version) -> str:
+    return f"{_PROCESS_NONCE}-{hashlib.sha1(repr(version).encode('utf-8')).hexdigest()[:16]}"
+
+
+def get_catalog(db_session, name: str) -> Tuple[Optional[str], Any]:
+    """`(version token, catalog)` for `name` as the session sees it.
+
+    The token is None for a private build made for uncommitted changes, which no
+    other request can fetch by token.
+    """
+    definition = CATALOGS[name]
+    touched = change_tracking.uncommitted_changes(db_session).touched_tables()
+    if touched and (definition.tables is None or touched & set(definition.tables)):
+        return None, definition.build(db_session)
+    engine = db_session.get_bind()
+    version = change_tracking.content_version(engine, definition.tables)
+    with _cache.lock:
+        cached = _cache.get_or_create(engine).get(name)
+    if cached is not None and cached[0] == version:
+        return cached[1], cached[2]
+    catalog = definition.build(db_session)
+    token = _version_token(version)
+    with _cache.lock:
+        _cache.get_or_create(engine)[name] = (version, token, catalog)
+    return token, catalog
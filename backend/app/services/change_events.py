@@ -0,0 +1,151 @@
+"""Server-sent invalidation events for open authoring workspaces.
+
+Each `/api/events/stream` client holds a `ChangeSubscriber`. After every commit
+the change feed merges the committed rows into each subscriber's pending map:
+one entry per table with the newest change version and the net op per row id,
+collapsing to a whole-table invalidation past `ROW_LIMIT` ids. A subscriber's
+backlog is therefore bounded by the number of tables no matter how fast commits
+arrive or how slowly the client reads. `event_stream()` waits out a short
+coalescing window after the first pending change, so a burst of bundle commits or
+a CSV import becomes one message per table. It sends a keep-alive comment while
+idle. Database switches and resets are sent as a single `reset` event.
+"""
+
+import json
+import time
+from threading import Condition, Lock
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from backend.app.db import change_tracking
+from backend.app.db import init_db as db_runtime
+
+# Seconds to let a burst of commits accumulate before sending it.
+COALESCE_SECONDS = 0.25
+# Seconds between keep-alive comments on an idle stream.
+HEARTBEAT_SECONDS = 15.0
+# Row ids kept per pending table before it collapses to a whole-table invalidation.
+ROW_LIMIT = 200
+RETRY_MILLISECONDS = 3000
+
+_subscribers = set()
+_subscribers_lock = Lock()
+
+
+class ChangeSubscriber:
+    """Pending invalidations for one stream client, merged per table until sent."""
+
+    def __init__(self, tables: Optional[Iterable[str]] = None):
+        self.tables = set(tables) if tables is not None else None
+        self.condition = Condition()
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self.reset = False
+
+    def push(self, table: str, version: int, rows: Optional[Dict[str, str]]) -> None:
+        """Merge `rows` (`{id: op}`, or None for the whole table) committed at `version`."""
+        if self.tables is not None and table not in self.tables:
+            return
+        with self.condition:
+            entry = self.pending.setdefault(table, {"version": version, "rows": {}})
+            entry["version"] = max(entry["version"], version)
+            if rows is None or entry["rows"] is None:
+                entry["rows"] = None
+            else:
+                for row_id, op in rows.items():
+                    entry["rows"][row_id] = change_tracking.merge_op(entry["rows"].get(row_id), op)
+                if len(entry["rows"]) > ROW_LIMIT:
+                    entry["rows"] = None
+            self.condition.notify()
+
+    def push_reset(self) -> None:
+        with self.condition:
+            self.pending.clear()
+            self.reset = True
+            self.condition.notify()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until something is pending or `timeout` passes; True when something is."""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.reset or bool(self.pending), timeout)
+
+    def take(self):
+        """`(reset, {table: entry})` pending now, clearing both."""
+        with self.condition:
+            reset, pending = self.reset, self.pending
+            self.reset, self.pending = False, {}
+            return reset, pending
+
+
+def subscribe(tables: Optional[Iterable[str]] = None, since: Optional[int] = None) -> ChangeSubscriber:
+    """Register a subscriber; with `since`, changes committed after that version are queued first."""
+    subscriber = ChangeSubscriber(tables)
+    with _subscribers_lock:
+        _subscribers.add(subscriber)
+    if since is not None:
+        replay = change_tracking.changes_since(db_runtime.get_engine(), since, subscriber.tables)
+        if replay["reset"]:
+            subscriber.push_reset()
+        for change in replay["changes"]:
+            rows = None if change["id"] is None else {change["id"]: change["op"]}
+            subscriber.push(change["table"], change["version"], rows)
+    return subscriber
+
+
+def unsubscribe(subscriber: ChangeSubscriber) -> None:
+    with _subscribers_lock:
+        _subscribers.discard(subscriber)
+
+
+def _format(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data, separators=(',', ':'))}"]
+    return "\n".join(lines) + "\n\n"
+
+
+def event_stream(subscriber: ChangeSubscriber) -> Iterator[str]:
+    """SSE text for `subscriber` until the client goes away; unsubscribes on close."""
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        while True:
+            if not subscriber.wait(HEARTBEAT_SECONDS):
+                yield ": keep-alive\n\n"
+                continue
+            time.sleep(COALESCE_SECONDS)
+            reset, pending = subscriber.take()
+            if reset:
+                yield _format("reset", {"version": change_tracking.current_version()})
+            if not pending:
+                continue
+            # Every message of a batch carries its newest version, so Last-Event-ID resumes after the batch.
+            batch_version = max(entry["version"] for entry in pending.values())
+            for table in sorted(pending):
+                entry = pending[table]
+                yield _format(
+                    "invalidate",
+                    {"table": table, "version": entry["version"], "rows": entry["rows"]},
+                    batch_version,
+                )
+    finally:
+        unsubscribe(subscriber)
+
+
+@change_tracking.on_commit
+def _publish_commit(engine, changes):
+    with _subscribers_lock:
+        subscribers = list(_subscribers)
+    if not subscribers or engine is not db_runtime.get_engine():
+        return
+    versions = change_tracking.table_versions(engine)
+    for table in changes.touched_tables():
+        rows = None if table in changes.tables else dict(changes.ops.get(table, {}))
+        for subscriber in subscribers:
+            subscriber.push(table, versions.get(table, 0), rows)
+
+
+def _publish_reset():
+    with _subscribers_lock:
+        subscribers = list(_subscribers)
+    for subscriber in subscribers:
+        subscriber.push_reset()
+
+
+db_runtime.on_database_change(_publish_reset)
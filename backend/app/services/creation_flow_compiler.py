@@ -23,6 +23,7 @@ from backend.app.services.creation_flow_catalog import (
     STORY_ONLY_STEP_KINDS,
 )
 from backend.app.services.dialogue_choice_actions import find_dialogue_choice
+from backend.app.services.dialogue_choice_index import action_positions
 from backend.app.services.narrative_contracts import validate_narrative_actions
 
 
@@ -611,17 +612,15 @@ class CreationFlowCompiler:
             self.step_review.append({"step_id": step_id, "kind": kind, "status": "blocked", "artifacts": []})
             return
         action_id = self.artifact_id(f"step:{step_id}:dialogue_choice_action")
-        for other_node in self.db_session.query(DialogueNode).all():
-            for other_choice in other_node.choices or []:
-                if not isinstance(other_choice, dict):
-                    continue
-                for existing_action in other_choice.get("actions") or []:
-                    if existing_action.get("id") == action_id and other_choice.get("id") != choice_id:
-                        self.blocker(
-                            "artifact_id_collision",
-                            f"Generated dialogue action id '{action_id}' already belongs to another choice.",
-                            step_id=step_id,
-                        )
+        for other_node_id, other_index in action_positions(self.db_session, action_id):
+            other_choice = (self.db_session.get(DialogueNode, other_node_id).choices or [])[other_index]
+            for existing_action in other_choice.get("actions") or []:
+                if isinstance(existing_action, dict) and existing_action.get("id") == action_id and other_choice.get("id") != choice_id:
+                    self.blocker(
+                        "artifact_id_collision",
+                        f"Generated dialogue action id '{action_id}' already belongs to another choice.",
+                        step_id=step_id,
+                    )
         existing_owned_action = next(
             (row for row in choice.get("actions") or [] if isinstance(row, dict) and row.get("id") == action_id),
             None,
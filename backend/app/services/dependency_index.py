@@ -1,5 +1,6 @@
 from collections import defaultdict
 
+from backend.app.db import change_tracking
 from backend.app.models import ALL_MODELS
 from backend.app.models.m_dialogue_nodes import DialogueNode
 from backend.app.models.m_character_narrative import CharacterStoryBeat
@@ -9,7 +10,12 @@ from backend.app.models.m_factions import Faction
 from backend.app.models.m_flags import Flag
 from backend.app.models.m_interaction_profiles import InteractionProfile
 from backend.app.models.m_quests import Quest
-from backend.app.models.m_requirements import Requirement
+from backend.app.models.m_requirements import (
+    Requirement,
+    RequirementForbiddenFlag,
+    RequirementMinFactionReputation,
+    RequirementRequiredFlag,
+)
 from backend.app.models.m_story_arcs import StoryArc
 
 
@@ -21,147 +27,314 @@ def _node_id(kind, entry_id):
     return f"{kind}:{entry_id}"
 
 
-def build_dependency_index(db_session):
-    nodes = {}
-    edges = []
+class _Contribution:
+    """Nodes and explicit edges derived from a single row within one indexing phase."""
+
+    __slots__ = ("nodes", "edges")
 
-    def node(kind, item, **metadata):
+    def __init__(self):
+        self.nodes = []
+        self.edges = []
+
+    def node(self, kind, item, **metadata):
         key = _node_id(kind, item.id)
-        nodes[key] = {
+        self.nodes.append({
             "id": key, "kind": kind, "entry_id": item.id, "label": _label(item),
             "schema_name": getattr(item, "__tablename__", kind), "metadata": metadata,
-        }
+        })
         return key
 
-    def edge(source, target, relation, explicit=True, path="", metadata=None):
-        edges.append({
+    def edge(self, source, target, relation, explicit=True, path="", metadata=None):
+        self.edges.append({
             "id": f"{source}>{relation}>{target}>{path}", "source": source, "target": target,
             "relation": relation, "explicit": explicit, "path": path, "metadata": metadata or {},
         })
 
-    for flag in db_session.query(Flag).all():
-        node("flag", flag)
-    for faction in db_session.query(Faction).all():
-        node("faction_reputation", faction, faction_id=faction.id)
-    for beat in db_session.query(CharacterStoryBeat).all():
-        beat_id = node("character_story_beats", beat)
-        for flag_id in beat.required_flags or []:
-            edge(_node_id("flag", flag_id), beat_id, "required_by_beat", True, "required_flags")
-        for flag_id in beat.forbidden_flags or []:
-            edge(_node_id("flag", flag_id), beat_id, "forbidden_by_beat", True, "forbidden_flags")
-        for flag_id in beat.expected_output_flags or []:
-            edge(beat_id, _node_id("flag", flag_id), "expects_to_set", True, "expected_output_flags")
-    requirements = db_session.query(Requirement).all()
-    for requirement in requirements:
-        req_id = node("requirement", requirement)
-        for row in requirement.required_flags:
-            edge(_node_id("flag", row.flag_id), req_id, "required_by", True, "required_flags")
-        for row in requirement.forbidden_flags:
-            edge(_node_id("flag", row.flag_id), req_id, "forbidden_by", True, "forbidden_flags")
-        for row in requirement.min_faction_reputation:
-            edge(
-                _node_id("faction_reputation", row.faction_id),
-                req_id,
-                "reputation_required_by",
-                True,
-                "min_faction_reputation",
-                {"faction_id": row.faction_id, "minimum": row.min_value},
-            )
 
-    for model in ALL_MODELS:
-        if model is Requirement or not hasattr(model, "requirements_id"):
+def _flag_rows(out, flag):
+    out.node("flag", flag)
+
+
+def _faction_rows(out, faction):
+    out.node("faction_reputation", faction, faction_id=faction.id)
+
+
+def _story_beat_rows(out, beat):
+    beat_id = out.node("character_story_beats", beat)
+    for flag_id in beat.required_flags or []:
+        out.edge(_node_id("flag", flag_id), beat_id, "required_by_beat", True, "required_flags")
+    for flag_id in beat.forbidden_flags or []:
+        out.edge(_node_id("flag", flag_id), beat_id, "forbidden_by_beat", True, "forbidden_flags")
+    for flag_id in beat.expected_output_flags or []:
+        out.edge(beat_id, _node_id("flag", flag_id), "expects_to_set", True, "expected_output_flags")
+
+
+def _requirement_rows(out, requirement):
+    req_id = out.node("requirement", requirement)
+    for row in requirement.required_flags:
+        out.edge(_node_id("flag", row.flag_id), req_id, "required_by", True, "required_flags")
+    for row in requirement.forbidden_flags:
+        out.edge(_node_id("flag", row.flag_id), req_id, "forbidden_by", True, "forbidden_flags")
+    for row in requirement.min_faction_reputation:
+        out.edge(
+            _node_id("faction_reputation", row.faction_id),
+            req_id,
+            "reputation_required_by",
+            True,
+            "min_faction_reputation",
+            {"faction_id": row.faction_id, "minimum": row.min_value},
+        )
+
+
+def _gated_rows(out, item):
+    content_id = out.node(item.__tablename__, item)
+    if item.requirements_id:
+        out.edge(_node_id("requirement", item.requirements_id), content_id, "gates", True, "requirements_id")
+
+
+def _flag_setter(field):
+    def contribute(out, item):
+        source_id = out.node(item.__tablename__, item)
+        for flag_id in getattr(item, field) or []:
+            out.edge(source_id, _node_id("flag", flag_id), "sets", True, field)
+    return contribute
+
+
+def _quest_objective_rows(out, quest):
+    source_id = out.node("quests", quest)
+    for index, objective in enumerate(quest.objectives or []):
+        if not isinstance(objective, dict):
             continue
-        for item in db_session.query(model).all():
-            content_id = node(model.__tablename__, item)
-            if item.requirements_id:
-                edge(_node_id("requirement", item.requirements_id), content_id, "gates", True, "requirements_id")
-
-    flag_sources = [
-        (Quest, "flags_set_on_completion"),
-        (Event, "flags_set"),
-        (InteractionProfile, "flags_set_on_interaction"),
-    ]
-    for model, field in flag_sources:
-        for item in db_session.query(model).all():
-            source_id = node(model.__tablename__, item)
-            for flag_id in getattr(item, field) or []:
-                edge(source_id, _node_id("flag", flag_id), "sets", True, field)
-
-    for quest in db_session.query(Quest).all():
-        source_id = node("quests", quest)
-        for index, objective in enumerate(quest.objectives or []):
-            if not isinstance(objective, dict):
-                continue
-            for flag_id in objective.get("flags_set", []) or []:
-                edge(source_id, _node_id("flag", flag_id), "sets", True, f"objectives[{index}].flags_set")
-            if objective.get("requirements_id"):
-                edge(_node_id("requirement", objective["requirements_id"]), source_id, "gates", True, f"objectives[{index}].requirements_id")
-
-    for encounter in db_session.query(Encounter).all():
-        source_id = node("encounters", encounter)
-        for flag_id in (encounter.rewards or {}).get("flags_set", []) if isinstance(encounter.rewards, dict) else []:
-            edge(source_id, _node_id("flag", flag_id), "sets", True, "rewards.flags_set")
-
-    reputation_sources = [
-        (Quest, "reputation_rewards", "reputation_rewards"),
-        (Event, "reputation_rewards", "reputation_rewards"),
-    ]
-    for model, field, path in reputation_sources:
-        for item in db_session.query(model).all():
-            source_id = node(model.__tablename__, item)
-            for index, reward in enumerate(getattr(item, field) or []):
-                if not isinstance(reward, dict) or not reward.get("faction_id"):
-                    continue
-                edge(
-                    source_id,
-                    _node_id("faction_reputation", reward["faction_id"]),
-                    "grants_reputation",
-                    True,
-                    f"{path}[{index}]",
-                    {"faction_id": reward["faction_id"], "amount": reward.get("amount", 0)},
-                )
-    for encounter in db_session.query(Encounter).all():
-        source_id = node("encounters", encounter)
-        rewards = encounter.rewards if isinstance(encounter.rewards, dict) else {}
-        for index, reward in enumerate(rewards.get("reputation", []) or []):
+        for flag_id in objective.get("flags_set", []) or []:
+            out.edge(source_id, _node_id("flag", flag_id), "sets", True, f"objectives[{index}].flags_set")
+        if objective.get("requirements_id"):
+            out.edge(_node_id("requirement", objective["requirements_id"]), source_id, "gates", True, f"objectives[{index}].requirements_id")
+
+
+def _encounter_flag_rows(out, encounter):
+    source_id = out.node("encounters", encounter)
+    for flag_id in (encounter.rewards or {}).get("flags_set", []) if isinstance(encounter.rewards, dict) else []:
+        out.edge(source_id, _node_id("flag", flag_id), "sets", True, "rewards.flags_set")
+
+
+def _reputation_rewards(field, path):
+    def contribute(out, item):
+        source_id = out.node(item.__tablename__, item)
+        for index, reward in enumerate(getattr(item, field) or []):
             if not isinstance(reward, dict) or not reward.get("faction_id"):
                 continue
-            edge(
+            out.edge(
                 source_id,
                 _node_id("faction_reputation", reward["faction_id"]),
                 "grants_reputation",
                 True,
-                f"rewards.reputation[{index}]",
+                f"{path}[{index}]",
                 {"faction_id": reward["faction_id"], "amount": reward.get("amount", 0)},
             )
+    return contribute
+
+
+def _encounter_reputation_rows(out, encounter):
+    source_id = out.node("encounters", encounter)
+    rewards = encounter.rewards if isinstance(encounter.rewards, dict) else {}
+    for index, reward in enumerate(rewards.get("reputation", []) or []):
+        if not isinstance(reward, dict) or not reward.get("faction_id"):
+            continue
+        out.edge(
+            source_id,
+            _node_id("faction_reputation", reward["faction_id"]),
+            "grants_reputation",
+            True,
+            f"rewards.reputation[{index}]",
+            {"faction_id": reward["faction_id"], "amount": reward.get("amount", 0)},
+        )
+
+
+def _dialogue_node_rows(out, dialogue):
+    source_id = out.node("dialogue_nodes", dialogue)
+    for flag_id in dialogue.set_flags or []:
+        out.edge(source_id, _node_id("flag", flag_id), "sets", True, "set_flags")
+    for index, choice in enumerate(dialogue.choices or []):
+        if not isinstance(choice, dict):
+            continue
+        for flag_id in choice.get("set_flags", []) or []:
+            out.edge(source_id, _node_id("flag", flag_id), "sets", True, f"choices[{index}].set_flags")
+        if choice.get("requirements_id"):
+            out.edge(_node_id("requirement", choice["requirements_id"]), source_id, "gates", True, f"choices[{index}].requirements_id")
+
+
+def _event_next_rows(out, event_row):
+    source_id = out.node("events", event_row)
+    if event_row.next_event_id:
+        out.edge(source_id, _node_id("events", event_row.next_event_id), "next", True, "next_event_id")
+
+
+def _story_arc_rows(out, arc):
+    arc_id = out.node("story_arcs", arc)
+    for quest_id in arc.related_quests or []:
+        out.edge(arc_id, _node_id("quests", quest_id), "contains", True, "related_quests")
+    for index, branch in enumerate(arc.branching or []):
+        if not isinstance(branch, dict) or not branch.get("quest_id"):
+            continue
+        for branch_index, target in enumerate(branch.get("branches", []) or []):
+            if isinstance(target, dict) and target.get("next_quest_id"):
+                out.edge(_node_id("quests", branch["quest_id"]), _node_id("quests", target["next_quest_id"]), "branches_to", True, f"branching[{index}].branches[{branch_index}]")
+
+
+# Indexing phases in output order: (model, per-row contribution). Each phase
+# keeps its rows' contributions separately so a changed row only re-derives its own.
+_PHASES = [
+    (Flag, _flag_rows),
+    (Faction, _faction_rows),
+    (CharacterStoryBeat, _story_beat_rows),
+    (Requirement, _requirement_rows),
+    *[
+        (model, _gated_rows)
+        for model in ALL_MODELS
+        if model is not Requirement and hasattr(model, "requirements_id")
+    ],
+    (Quest, _flag_setter("flags_set_on_completion")),
+    (Event, _flag_setter("flags_set")),
+    (InteractionProfile, _flag_setter("flags_set_on_interaction")),
+    (Quest, _quest_objective_rows),
+    (Encounter, _encounter_flag_rows),
+    (Quest, _reputation_rewards("reputation_rewards", "reputation_rewards")),
+    (Event, _reputation_rewards("reputation_rewards", "reputation_rewards")),
+    (Encounter, _encounter_reputation_rows),
+    (DialogueNode, _dialogue_node_rows),
+    (Event, _event_next_rows),
+    (StoryArc, _story_arc_rows),
+]
+_PHASES_BY_TABLE = defaultdict(list)
+for _phase_index, (_model, _contribute) in enumerate(_PHASES):
+    _PHASES_BY_TABLE[_model.__tablename__].append(_phase_index)
+_MODELS_BY_TABLE = {model.__tablename__: model for model, _contribute in _PHASES}
+
+# Child rows folded into their owning requirement's contribution.
+_REQUIREMENT_CHILD_TABLES = {
+    model.__tablename__
+    for model in (RequirementRequiredFlag, RequirementForbiddenFlag, RequirementMinFactionReputation)
+}
+# Every table the index reads, for callers keying their own caches on its content.
+INDEXED_TABLES = frozenset(_MODELS_BY_TABLE) | _REQUIREMENT_CHILD_TABLES
+
+
+class _IndexState:
+    """Per-engine cache: row contributions per phase plus the assembled index."""
+
+    def __init__(self):
+        self.phases = None
+        self.snapshot = None
+
+    def sync(self, db_session, stale_rows, stale_tables):
+        """Bring cached contributions up to date, reassembling the index when anything changed."""
+        if self.phases is None:
+            self.phases = _load_phases(db_session)
+        elif stale_rows or stale_tables:
+            _apply_changes(db_session, self.phases, stale_rows, stale_tables)
+        elif self.snapshot is not None:
+            return
+        self.snapshot = _assemble_index(self.phases)
+
+
+def _contribute(phase_index, item):
+    out = _Contribution()
+    _PHASES[phase_index][1](out, item)
+    return out
+
+
+def _load_phase_table(db_session, phases, table):
+    rows = db_session.query(_MODELS_BY_TABLE[table]).all()
+    for phase_index in _PHASES_BY_TABLE[table]:
+        phases[phase_index] = {item.id: _contribute(phase_index, item) for item in rows}
+
+
+def _refresh_rows(db_session, phases, table, row_ids):
+    model = _MODELS_BY_TABLE[table]
+    found = {item.id: item for item in db_session.query(model).filter(model.id.in_(list(row_ids))).all()}
+    for phase_index in _PHASES_BY_TABLE[table]:
+        contributions = phases[phase_index]
+        for row_id in row_ids:
+            item = found.get(row_id)
+            if item is None:
+                contributions.pop(row_id, None)
+            else:
+                contributions[row_id] = _contribute(phase_index, item)
 
-    for dialogue in db_session.query(DialogueNode).all():
-        source_id = node("dialogue_nodes", dialogue)
-        for flag_id in dialogue.set_flags or []:
-            edge(source_id, _node_id("flag", flag_id), "sets", True, "set_flags")
-        for index, choice in enumerate(dialogue.choices or []):
-            if not isinstance(choice, dict):
-                continue
-            for flag_id in choice.get("set_flags", []) or []:
-                edge(source_id, _node_id("flag", flag_id), "sets", True, f"choices[{index}].set_flags")
-            if choice.get("requirements_id"):
-                edge(_node_id("requirement", choice["requirements_id"]), source_id, "gates", True, f"choices[{index}].requirements_id")
-
-    for event in db_session.query(Event).all():
-        source_id = node("events", event)
-        if event.next_event_id:
-            edge(source_id, _node_id("events", event.next_event_id), "next", True, "next_event_id")
-
-    for arc in db_session.query(StoryArc).all():
-        arc_id = node("story_arcs", arc)
-        for quest_id in arc.related_quests or []:
-            edge(arc_id, _node_id("quests", quest_id), "contains", True, "related_quests")
-        for index, branch in enumerate(arc.branching or []):
-            if not isinstance(branch, dict) or not branch.get("quest_id"):
-                continue
-            for branch_index, target in enumerate(branch.get("branches", []) or []):
-                if isinstance(target, dict) and target.get("next_quest_id"):
-                    edge(_node_id("quests", branch["quest_id"]), _node_id("quests", target["next_quest_id"]), "branches_to", True, f"branching[{index}].branches[{branch_index}]")
+
+def _load_phases(db_session):
+    phases = [None] * len(_PHASES)
+    for table in _PHASES_BY_TABLE:
+        _load_phase_table(db_session, phases, table)
+    return phases
+
+
+def _apply_changes(db_session, phases, stale_rows, stale_tables):
+    for table in stale_tables:
+        _load_phase_table(db_session, phases, table)
+    for table, row_ids in stale_rows.items():
+        if table not in stale_tables:
+            _refresh_rows(db_session, phases, table, row_ids)
+
+
+def build_dependency_index(db_session):
+    """Return the dependency index for the session's database.
+
+    The index is built once per engine and then kept current from committed ORM
+    changes, so repeated calls are a cache lookup. The returned structure is
+    shared between callers and must be treated as read-only. A session holding
+    uncommitted changes gets a private index with those rows overlaid instead.
+    """
+    engine = db_session.get_bind()
+    local_rows, local_tables = _stale_entries(change_tracking.uncommitted_changes(db_session))
+    with _states.lock:
+        if local_rows or local_tables:
+            state = _states.get(engine)
+            stale_rows, stale_tables = _states.stale(engine)
+            if state is None or state.phases is None or stale_rows or stale_tables:
+                return _assemble_index(_load_phases(db_session))
+            phases = [dict(contributions) for contributions in state.phases]
+            _apply_changes(db_session, phases, local_rows, local_tables)
+            return _assemble_index(phases)
+        state = _states.refreshed(engine, lambda state, rows, tables: state.sync(db_session, rows, tables))
+        return state.snapshot
+
+
+def _stale_entries(changes):
+    """Map a change set onto indexed tables: `(rows by table, whole tables)`."""
+    rows = defaultdict(set)
+    tables = set()
+    for table, row_ids in changes.rows.items():
+        if table in _PHASES_BY_TABLE:
+            rows[table].update(row_ids)
+    for table in changes.tables:
+        if table in _REQUIREMENT_CHILD_TABLES:
+            tables.add(Requirement.__tablename__)
+        elif table in _PHASES_BY_TABLE:
+            tables.add(table)
+    if _REQUIREMENT_CHILD_TABLES & set(changes.rows):
+        rows[Requirement.__tablename__].update(changes.parents.get(Requirement.__tablename__, ()))
+    return rows, tables
+
+
+_states = change_tracking.EngineStates(_IndexState, _stale_entries)
+
+
+def _assemble_index(phases):
+    nodes = {}
+    edges = []
+
+    def edge(source, target, relation, explicit=True, path="", metadata=None):
+        edges.append({
+            "id": f"{source}>{relation}>{target}>{path}", "source": source, "target": target,
+            "relation": relation, "explicit": explicit, "path": path, "metadata": metadata or {},
+        })
+
+    for contributions in phases:
+        for contribution in contributions.values():
+            for entry in contribution.nodes:
+                nodes[entry["id"]] = entry
+            edges.extend(contribution.edges)
 
     explicit_edges = list(edges)
     set_by_flag = defaultdict(set)
@@ -184,19 +357,7 @@ def build_dependency_index(db_session):
     for entry in explicit_edges:
         if entry["relation"] in {"next", "branches_to"}:
             adjacency[entry["source"]].add(entry["target"])
-
-    cycles = set()
-
-    def visit(current, path, active):
-        if current in active:
-            start = path.index(current)
-            cycles.add(tuple(path[start:]))
-            return
-        for target in adjacency.get(current, set()):
-            visit(target, path + [target], active | {current})
-
-    for start in adjacency:
-        visit(start, [start], set())
+    cycles = _elementary_cycles(adjacency)
 
     producers = {entry["target"] for entry in edges if entry["relation"] == "sets"}
     consumers = {entry["source"] for entry in edges if entry["relation"] in {"required_by", "forbidden_by", "required_by_beat", "forbidden_by_beat"}}
@@ -220,31 +381,180 @@ def build_dependency_index(db_session):
             for requirement_id in sorted(requirements_by_flag.get(flag_id, set()))
             if requirement_id in nodes
         ],
-        "cycles": [list(cycle) for cycle in sorted(cycles)],
+        "cycles": cycles,
+    }
+    return DependencyIndex(list(nodes.values()), edges, health)
+
+
+class DependencyIndex(dict):
+    """The `nodes`/`edges`/`health` payload, plus position maps kept off the payload.
+
+    `lookup` is an attribute rather than a key, so serializing the index (or a
+    packet embedding it) yields exactly the three payload keys.
+    """
+
+    def __init__(self, nodes, edges, health):
+        super().__init__(nodes=nodes, edges=edges, health=health)
+        self.lookup = _lookup_maps(nodes, edges)
+
+
+def _lookup_maps(node_list, edges):
+    """Positions into `nodes`/`edges` keyed by node id, for O(1) neighbourhood lookups."""
+    outgoing = defaultdict(list)
+    incoming = defaultdict(list)
+    for position, entry in enumerate(edges):
+        outgoing[entry["source"]].append(position)
+        incoming[entry["target"]].append(position)
+    return {
+        "nodes": {entry["id"]: position for position, entry in enumerate(node_list)},
+        "outgoing": dict(outgoing),
+        "incoming": dict(incoming),
     }
-    return {"nodes": list(nodes.values()), "edges": edges, "health": health}
+
+
+def index_node(index, node_id):
+    position = index.lookup["nodes"].get(node_id)
+    return index["nodes"][position] if position is not None else None
+
+
+def outgoing_edges(index, node_id, relations=None):
+    edges = index["edges"]
+    return [
+        edges[position] for position in index.lookup["outgoing"].get(node_id, ())
+        if relations is None or edges[position]["relation"] in relations
+    ]
+
+
+def incoming_edges(index, node_id, relations=None):
+    edges = index["edges"]
+    return [
+        edges[position] for position in index.lookup["incoming"].get(node_id, ())
+        if relations is None or edges[position]["relation"] in relations
+    ]
+
+
+def _strongly_connected_components(adjacency, nodes):
+    """Tarjan's algorithm, iterative; yields components of `adjacency` restricted to `nodes`."""
+    order = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    for root in sorted(nodes):
+        if root in order:
+            continue
+        work = [(root, iter(sorted(adjacency.get(root, ()))))]
+        order[root] = low[root] = len(order)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            current, targets = work[-1]
+            advanced = False
+            for target in targets:
+                if target not in nodes:
+                    continue
+                if target not in order:
+                    order[target] = low[target] = len(order)
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(sorted(adjacency.get(target, ())))))
+                    advanced = True
+                    break
+                if target in on_stack:
+                    low[current] = min(low[current], order[target])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[current])
+            if low[current] == order[current]:
+                component = set()
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.add(member)
+                    if member == current:
+                        break
+                yield component
+
+
+def _unblock(node, blocked, blocked_by):
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        if current in blocked:
+            blocked.discard(current)
+            pending.extend(blocked_by.pop(current, ()))
+
+
+def _circuits_from(start, component, adjacency):
+    """Johnson's circuit search for cycles through `start` inside one component."""
+    path = [start]
+    blocked = {start}
+    blocked_by = defaultdict(set)
+    closed = set()
+    work = [(start, sorted(target for target in adjacency.get(start, ()) if target in component))]
+    while work:
+        current, targets = work[-1]
+        if targets:
+            target = targets.pop()
+            if target == start:
+                yield list(path)
+                closed.update(path)
+            elif target not in blocked:
+                path.append(target)
+                blocked.add(target)
+                closed.discard(target)
+                work.append((target, sorted(next_target for next_target in adjacency.get(target, ()) if next_target in component)))
+                continue
+        if not targets:
+            if current in closed:
+                _unblock(current, blocked, blocked_by)
+            else:
+                for target in adjacency.get(current, ()):
+                    if target in component:
+                        blocked_by[target].add(current)
+            work.pop()
+            path.pop()
+
+
+def _elementary_cycles(adjacency):
+    """Every elementary cycle once, as a closed path starting at its smallest node id.
+
+    Cycles only exist inside strongly connected components, so acyclic chains
+    cost a single linear pass; enumeration is then linear per reported cycle.
+    """
+    cycles = [[node, node] for node in sorted(adjacency) if node in adjacency[node]]
+    loop_free = {node: {target for target in targets if target != node} for node, targets in adjacency.items()}
+    nodes = set(loop_free) | {target for targets in loop_free.values() for target in targets}
+    components = [component for component in _strongly_connected_components(loop_free, nodes) if len(component) > 1]
+    while components:
+        component = components.pop()
+        start = min(component)
+        for circuit in _circuits_from(start, component, loop_free):
+            cycles.append(circuit + [start])
+        component.discard(start)
+        components.extend(
+            remainder for remainder in _strongly_connected_components(loop_free, component)
+            if len(remainder) > 1
+        )
+    return sorted(cycles)
 
 
 def quest_context(index, quest_id):
     quest_node = _node_id("quests", quest_id)
-    nodes_by_id = {node["id"]: node for node in index["nodes"]}
-    outgoing_flags = {edge["target"] for edge in index["edges"] if edge["source"] == quest_node and edge["relation"] == "sets"}
-    gated_requirements = {edge["source"] for edge in index["edges"] if edge["target"] == quest_node and edge["relation"] == "gates"}
+    edges = index["edges"]
+    incoming = index.lookup["incoming"]
+    gated_requirements = {edge["source"] for edge in incoming_edges(index, quest_node, {"gates"})}
     prerequisites = [
-        edge for edge in index["edges"]
-        if edge["target"] in gated_requirements and edge["relation"] in {"required_by", "forbidden_by"}
-    ]
-    aftermath = [
-        edge for edge in index["edges"]
-        if edge["source"] == quest_node and edge["relation"] == "unlocks"
+        edges[position]
+        for position in sorted(position for requirement_id in gated_requirements for position in incoming.get(requirement_id, ()))
+        if edges[position]["relation"] in {"required_by", "forbidden_by"}
     ]
+    aftermath = outgoing_edges(index, quest_node, {"unlocks"})
     referenced_node_ids = {quest_node}
     for edge in prerequisites + aftermath:
         referenced_node_ids.add(edge["source"])
         referenced_node_ids.add(edge["target"])
-    nodes = [
-        nodes_by_id[node_id]
-        for node_id in sorted(referenced_node_ids)
-        if node_id in nodes_by_id
-    ]
-    return {"prerequisites": prerequisites, "aftermath": aftermath, "nodes": nodes}
+    nodes = [index_node(index, node_id) for node_id in sorted(referenced_node_ids)]
+    return {"prerequisites": prerequisites, "aftermath": aftermath, "nodes": [node for node in nodes if node is not None]}
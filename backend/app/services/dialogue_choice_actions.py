@@ -120,7 +120,9 @@ def validate_dialogue_action(db_session, action, path="action"):
     target_id = action.get("target_ref_id")
     if not isinstance(target_id, str) or not target_id.strip():
         raise ValueError(f"{path}.target_ref_id must be a non-empty canonical id")
-    if not db_session.get(_legacy_target_models()[expected_target_type], target_id):
+    from backend.app.db.references import reference_resolver
+
+    if not reference_resolver(db_session).exists(_legacy_target_models()[expected_target_type], target_id):
         raise ValueError(f"{path}.target_ref_id does not reference an existing {expected_target_type}: {target_id}")
     if action.get("timing") not in {"immediate", "after_completion", "on_turn_in"}:
         raise ValueError(f"{path}.timing must be explicit")
@@ -138,6 +140,21 @@ def validate_dialogue_action(db_session, action, path="action"):
         raise ValueError(f"{path}.sort_order must be a non-negative integer")
 
 
+def _expect_action_targets(references, choices):
+    """Queue every action target of the normalized choices for one lookup per target table."""
+    legacy_models = _legacy_target_models()
+    for choice in choices:
+        for action in choice["actions"]:
+            if "action_id" in action or "target_ref_type" in action or "target_ref_id" in action:
+                model = legacy_models.get(action.get("target_ref_type"))
+                if model is not None:
+                    references.expect(model, [action.get("target_ref_id")])
+                continue
+            contract = ACTION_CONTRACTS.get(str(action.get("action_type") or "").strip())
+            if contract:
+                references.expect(contract["target_model"], [str(action.get(contract["target_field"]) or "").strip()])
+
+
 def validate_dialogue_choice_actions(db_session, choice, path="choice"):
     actions = choice.get("actions") or []
     ids = []
@@ -201,7 +218,12 @@ def normalize_choice_contracts(choices: Any, node_id: str = "legacy") -> list[di
 
 def validate_choice_contracts(db_session, node, choices: Any, *, validate_targets: bool = True) -> list[dict[str, Any]]:
     """Normalize and validate choice identity, navigation, and typed action references."""
+    from backend.app.db.references import reference_resolver
+
     normalized = normalize_choice_contracts(choices, str(getattr(node, "id", "legacy") or "legacy"))
+    references = reference_resolver(db_session)
+    if validate_targets:
+        _expect_action_targets(references, normalized)
     for choice in normalized:
         choice_id = choice["id"]
         next_node_id = str(choice.get("next_node_id") or "").strip()
@@ -231,7 +253,7 @@ def validate_choice_contracts(db_session, node, choices: Any, *, validate_target
             target_id = str(action.get(target_field) or "").strip()
             if not target_id:
                 raise ValueError(f"Choice action '{action['id']}' requires {target_field}")
-            if validate_targets and not db_session.get(contract["target_model"], target_id):
+            if validate_targets and not references.exists(contract["target_model"], target_id):
                 raise ValueError(f"Choice action '{action['id']}' has invalid {target_field}: {target_id}")
             continuation = str(action.get("continuation_policy") or "").strip()
             if continuation not in contract["continuation_policies"]:
@@ -253,8 +275,12 @@ def validate_choice_contracts(db_session, node, choices: Any, *, validate_target
 
 def find_dialogue_choice(db_session, choice_id: str):
     """Locate a canonical JSON choice by immutable id."""
-    for node in db_session.query(DialogueNode).order_by(DialogueNode.id).all():
-        for index, choice in enumerate(node.choices or []):
-            if isinstance(choice, dict) and (choice.get("id") == choice_id or choice.get("choice_id") == choice_id):
-                return node, index, choice
+    from backend.app.services.dialogue_choice_index import choice_positions
+
+    for node_id, index in choice_positions(db_session, choice_id):
+        node = db_session.get(DialogueNode, node_id)
+        choices = (node.choices if node is not None else None) or []
+        choice = choices[index] if index < len(choices) else None
+        if isinstance(choice, dict) and (choice.get("id") == choice_id or choice.get("choice_id") == choice_id):
+            return node, index, choice
     return None
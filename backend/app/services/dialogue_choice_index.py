@@ -0,0 +1,167 @@
+"""Index of dialogue choice and action ids stored in `DialogueNode.choices`.
+
+Choices and their actions carry immutable ids inside the JSON `choices` column,
+which SQLite cannot index. This module keeps a per-engine map from each choice
+id and each action id to the `(node_id, choice_index)` positions holding it, so
+"which node owns choice X" and "is action id Y taken" are dictionary lookups
+instead of scans over every node. Like `json_references`, the map is built on
+first use and kept current from the committed-row change feed; sessions holding
+uncommitted dialogue node changes see them overlaid on the shared map. When a
+session's changes cover the whole table, it indexes its flushed nodes once and
+reuses that private map until its next flush, write statement or transaction end.
+"""
+
+from collections import defaultdict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app.db import change_tracking
+from backend.app.models.m_dialogue_nodes import DialogueNode
+
+_TABLE = DialogueNode.__tablename__
+_INFO_KEY = "dialogue_choice_index"
+# Stay well below SQLite's bound-parameter limit.
+_IN_CHUNK_SIZE = 500
+
+
+def node_entries(choices):
+    """`(choice_ids, action_ids)` of one node; each maps an id to the choice indexes holding it."""
+    choice_ids = defaultdict(list)
+    action_ids = defaultdict(list)
+    for index, choice in enumerate(choices if isinstance(choices, list) else []):
+        if not isinstance(choice, dict):
+            continue
+        for key in dict.fromkeys(value for value in (choice.get("id"), choice.get("choice_id")) if value):
+            choice_ids[key].append(index)
+        for action in choice.get("actions") or []:
+            action_id = (action.get("id") or action.get("action_id")) if isinstance(action, dict) else None
+            if action_id and index not in action_ids[action_id]:
+                action_ids[action_id].append(index)
+    return choice_ids, action_ids
+
+
+class _ChoiceIndexState:
+    """Forward (node -> ids) and reverse (id -> node positions) maps for one engine."""
+
+    def __init__(self):
+        self.loaded = False
+        self.forward = {}
+        self.choices = defaultdict(dict)
+        self.actions = defaultdict(dict)
+
+    def discard(self, node_id):
+        choice_ids, action_ids = self.forward.pop(node_id, ({}, {}))
+        for reverse, ids in ((self.choices, choice_ids), (self.actions, action_ids)):
+            for entry_id in ids:
+                owners = reverse.get(entry_id)
+                if owners is not None:
+                    owners.pop(node_id, None)
+                    if not owners:
+                        del reverse[entry_id]
+
+    def put(self, node_id, choices):
+        self.discard(node_id)
+        choice_ids, action_ids = node_entries(choices)
+        self.forward[node_id] = (choice_ids, action_ids)
+        for entry_id, indexes in choice_ids.items():
+            self.choices[entry_id][node_id] = indexes
+        for entry_id, indexes in action_ids.items():
+            self.actions[entry_id][node_id] = indexes
+
+    def load(self, db_session):
+        self.forward.clear()
+        self.choices.clear()
+        self.actions.clear()
+        for node_id, choices in db_session.query(DialogueNode.id, DialogueNode.choices):
+            self.put(node_id, choices)
+
+    def refresh_rows(self, db_session, node_ids):
+        node_ids = list(node_ids)
+        found = {}
+        for start in range(0, len(node_ids), _IN_CHUNK_SIZE):
+            chunk = node_ids[start:start + _IN_CHUNK_SIZE]
+            found.update(db_session.query(DialogueNode.id, DialogueNode.choices).filter(DialogueNode.id.in_(chunk)))
+        for node_id in node_ids:
+            if node_id in found:
+                self.put(node_id, found[node_id])
+            else:
+                self.discard(node_id)
+
+    def sync(self, db_session, stale_rows, stale_tables):
+        if not self.loaded or _TABLE in stale_tables:
+            self.load(db_session)
+            self.loaded = True
+        elif stale_rows.get(_TABLE):
+            self.refresh_rows(db_session, stale_rows[_TABLE])
+
+
+_states = change_tracking.EngineStates(_ChoiceIndexState, change_tracking.stale_entries_for([_TABLE]))
+
+
+def _session_state(db_session):
+    """The session's flushed dialogue nodes, indexed on first use and kept until its next write."""
+    state = db_session.info.get(_INFO_KEY)
+    if state is None:
+        state = _ChoiceIndexState()
+        state.load(db_session)
+        db_session.info[_INFO_KEY] = state
+    return state
+
+
+def _overlay(owners, nodes, kind, entry_id):
+    for node in nodes:
+        choice_ids, action_ids = node_entries(node.choices)
+        indexes = (choice_ids if kind == "choices" else action_ids).get(entry_id)
+        if indexes:
+            owners[node.id] = indexes
+        else:
+            owners.pop(node.id, None)
+
+
+def _positions(db_session, kind, entry_id):
+    """Sorted `(node_id, choice_index)` positions of a choice or action id in the session's view."""
+    changes = change_tracking.uncommitted_changes(db_session)
+    if _TABLE in changes.tables:
+        owners = dict(getattr(_session_state(db_session), kind).get(entry_id, {}))
+        for node in db_session.deleted:
+            if isinstance(node, DialogueNode):
+                owners.pop(node.id, None)
+        _overlay(owners, [node for node in db_session.dirty if isinstance(node, DialogueNode)], kind, entry_id)
+        return sorted((node_id, index) for node_id, indexes in owners.items() for index in indexes)
+    with _states.lock:
+        state = _states.refreshed(db_session.get_bind(), lambda state, rows, tables: state.sync(db_session, rows, tables))
+        owners = dict(getattr(state, kind).get(entry_id, {}))
+    if changes.rows.get(_TABLE):
+        changed = changes.rows[_TABLE]
+        owners = {node_id: indexes for node_id, indexes in owners.items() if node_id not in changed}
+        _overlay(owners, db_session.query(DialogueNode).filter(DialogueNode.id.in_(list(changed))), kind, entry_id)
+    return sorted((node_id, index) for node_id, indexes in owners.items() for index in indexes)
+
+
+def choice_positions(db_session, choice_id):
+    """Every `(node_id, choice_index)` whose choice has `id` or `choice_id` equal to `choice_id`."""
+    return _positions(db_session, "choices", choice_id) if choice_id else []
+
+
+def action_positions(db_session, action_id):
+    """Every `(node_id, choice_index)` whose choice holds an action with this `id`/`action_id`."""
+    return _positions(db_session, "actions", action_id) if action_id else []
+
+
+@event.listens_for(Session, "after_flush")
+def _drop_session_state_on_flush(session, _flush_context):
+    session.info.pop(_INFO_KEY, None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _drop_session_state_on_write(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info.pop(_INFO_KEY, None)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_session_state(session, transaction):
+    # Flush subtransactions keep the map; commit, rollback, close and savepoints end it.
+    if transaction.parent is None or transaction.nested:
+        session.info.pop(_INFO_KEY, None)
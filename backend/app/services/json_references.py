@@ -0,0 +1,219 @@
+"""Inverted index over ids stored inside JSON columns.
+
+Several tables keep foreign keys in JSON arrays (`CombatProfile.custom_abilities`,
+`Quest.item_rewards`, `Encounter.participants`, ...) that SQLite cannot index.
+This module keeps a per-engine reverse map `(target_table, target_id) -> owners`
+so "who uses X" is a dictionary lookup. The map is built on first use, then kept
+current from the committed-row change feed: changed owner rows are re-read on
+the next lookup. `rebuild_json_references()` rebuilds it from scratch.
+"""
+
+from collections import defaultdict
+
+from backend.app.db import change_tracking
+from backend.app.models.m_characterclasses import CharacterClass
+from backend.app.models.m_combat_profiles import CombatProfile
+from backend.app.models.m_encounters import Encounter
+from backend.app.models.m_events import Event
+from backend.app.models.m_interaction_profiles import InteractionProfile
+from backend.app.models.m_items import Item
+from backend.app.models.m_quests import Quest
+from backend.app.models.m_story_arcs import StoryArc
+from backend.app.models.m_talent_trees import TalentNode
+
+# (owner model, JSON path, target table, key inside each element or None for bare ids)
+REFERENCE_FIELDS = [
+    (CombatProfile, "custom_abilities", "abilities", None),
+    (CombatProfile, "loot_table", "items", "item_id"),
+    (CombatProfile, "related_quests", "quests", None),
+    (CharacterClass, "starting_abilities", "abilities", None),
+    (TalentNode, "granted_abilities", "abilities", None),
+    (Item, "effects", "effects", None),
+    (Encounter, "participants", "characters", "character_id"),
+    (Encounter, "rewards.items", "items", "item_id"),
+    (Quest, "item_rewards", "items", "item_id"),
+    (Event, "item_rewards", "items", "item_id"),
+    (StoryArc, "related_quests", "quests", None),
+    (InteractionProfile, "available_quests", "quests", None),
+]
+
+_FIELDS_BY_TABLE = defaultdict(list)
+for _model, _path, _target_table, _key in REFERENCE_FIELDS:
+    _FIELDS_BY_TABLE[_model.__tablename__].append((_path, _target_table, _key))
+_MODELS_BY_TABLE = {model.__tablename__: model for model, *_spec in REFERENCE_FIELDS}
+
+
+def _column_value(item, name):
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _json_value(item, path):
+    field, *keys = path.split(".")
+    value = _column_value(item, field)
+    for key in keys:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def row_references(table, item):
+    """JSON references held by one `table` row, given as an ORM instance or a dict of column values."""
+    references = []
+    source_id = _column_value(item, "id")
+    for path, target_table, key in _FIELDS_BY_TABLE.get(table, ()):
+        values = _json_value(item, path)
+        if not isinstance(values, list):
+            continue
+        for index, entry in enumerate(values):
+            target_id = entry.get(key) if key and isinstance(entry, dict) else (None if key else entry)
+            if isinstance(target_id, str) and target_id:
+                references.append({
+                    "source_table": table, "source_id": source_id, "path": f"{path}[{index}]",
+                    "target_table": target_table, "target_id": target_id,
+                })
+    return references
+
+
+class _ReferenceState:
+    """Forward and reverse reference maps for one engine."""
+
+    def __init__(self):
+        self.loaded = False
+        self.forward = {}
+        self.reverse = defaultdict(dict)
+        # Owner position in table scan order, so results keep a stable order across refreshes.
+        self.ordinals = {}
+
+    def discard(self, owner):
+        for reference in self.forward.pop(owner, ()):
+            target = (reference["target_table"], reference["target_id"])
+            owners = self.reverse.get(target)
+            if owners is not None:
+                owners.pop(owner, None)
+                if not owners:
+                    del self.reverse[target]
+
+    def put(self, table, item):
+        owner = (table, item.id)
+        self.discard(owner)
+        self.ordinals.setdefault(owner, len(self.ordinals))
+        references = row_references(table, item)
+        self.forward[owner] = references
+        for reference in references:
+            self.reverse[(reference["target_table"], reference["target_id"])].setdefault(owner, []).append(reference)
+
+    def load_table(self, db_session, table):
+        for owner in [owner for owner in self.forward if owner[0] == table]:
+            self.discard(owner)
+            self.ordinals.pop(owner, None)
+        for item in db_session.query(_MODELS_BY_TABLE[table]).all():
+            self.put(table, item)
+
+    def refresh_rows(self, db_session, table, row_ids):
+        model = _MODELS_BY_TABLE[table]
+        found = {item.id: item for item in db_session.query(model).filter(model.id.in_(list(row_ids))).all()}
+        for row_id in row_ids:
+            item = found.get(row_id)
+            if item is None:
+                self.discard((table, row_id))
+                self.ordinals.pop((table, row_id), None)
+            else:
+                self.put(table, item)
+
+    def sync(self, db_session, stale_rows, stale_tables):
+        if not self.loaded:
+            for table in _MODELS_BY_TABLE:
+                self.load_table(db_session, table)
+            self.loaded = True
+            return
+        for table in stale_tables:
+            self.load_table(db_session, table)
+        for table, row_ids in stale_rows.items():
+            if table not in stale_tables:
+                self.refresh_rows(db_session, table, row_ids)
+
+
+_states = change_tracking.EngineStates(_ReferenceState, change_tracking.stale_entries_for(_MODELS_BY_TABLE))
+
+
+def _state_for(db_session):
+    return _states.refreshed(db_session.get_bind(), lambda state, rows, tables: state.sync(db_session, rows, tables))
+
+
+def _local_overlay(db_session, state, target):
+    """References to `target` as seen by a session holding uncommitted owner changes."""
+    changes = change_tracking.uncommitted_changes(db_session)
+    tables = {table for table in changes.tables if table in _MODELS_BY_TABLE}
+    rows = {
+        table: row_ids for table, row_ids in changes.rows.items()
+        if table in _MODELS_BY_TABLE and table not in tables
+    }
+    if not (tables or rows):
+        return None
+    owners = {
+        owner: references for owner, references in state.reverse.get(target, {}).items()
+        if owner[0] not in tables and owner[1] not in rows.get(owner[0], ())
+    }
+    fresh = [item for table in tables for item in db_session.query(_MODELS_BY_TABLE[table]).all()]
+    for table, row_ids in rows.items():
+        model = _MODELS_BY_TABLE[table]
+        fresh.extend(db_session.query(model).filter(model.id.in_(list(row_ids))).all())
+    for item in fresh:
+        table = item.__tablename__
+        matches = [
+            reference for reference in row_references(table, item)
+            if (reference["target_table"], reference["target_id"]) == target
+        ]
+        if matches:
+            owners[(table, item.id)] = matches
+    return owners
+
+
+def references_to(db_session, target_table, target_id, source_table=None, path=None):
+    """Every JSON reference to one row, in owner scan order.
+
+    `source_table` narrows to one owner table and `path` to one JSON field (the
+    `REFERENCE_FIELDS` path, without element indexes).
+    """
+    target = (target_table, target_id)
+    with _states.lock:
+        state = _state_for(db_session)
+        owners = _local_overlay(db_session, state, target)
+        if owners is None:
+            owners = dict(state.reverse.get(target, {}))
+        ordinals = state.ordinals
+    ordered = sorted(owners.items(), key=lambda pair: ordinals.get(pair[0], len(ordinals)))
+    return [
+        reference
+        for owner, references in ordered
+        if source_table is None or owner[0] == source_table
+        for reference in references
+        if path is None or reference["path"].startswith(f"{path}[")
+    ]
+
+
+def referencing_rows(db_session, model, path, target_id):
+    """Owner rows of `model` whose JSON `path` references `target_id`, in scan order.
+
+    Owners are resolved with `Session.get`, so callers that already hold the owner
+    table in the identity map issue no further SQL.
+    """
+    target_table = next(
+        (target for owner_model, field, target, _key in REFERENCE_FIELDS if owner_model is model and field == path),
+        None,
+    )
+    if target_table is None:
+        raise KeyError(f"{model.__tablename__}.{path} is not an indexed JSON reference")
+    owner_ids = dict.fromkeys(
+        reference["source_id"]
+        for reference in references_to(db_session, target_table, target_id, model.__tablename__, path)
+    )
+    rows = (db_session.get(model, owner_id) for owner_id in owner_ids)
+    return [row for row in rows if row is not None]
+
+
+def rebuild_json_references(db_session):
+    """Discard and rebuild the index for the session's engine; returns the reference count."""
+    with _states.lock:
+        _states.pop(db_session.get_bind())
+        state = _state_for(db_session)
+        return sum(len(references) for references in state.forward.values())
@@ -0,0 +1,161 @@
+"""Precomputed location parent hierarchy.
+
+`location_hierarchy()` answers ancestor, descendant, depth, cycle and
+effective-biome questions from maps built once per committed state of the
+`locations` table, instead of walking `parent_location_id` chains per location
+and per request. The structure is cached per engine under
+`change_tracking.content_version(engine, ["locations"])`, so any committed
+location write rebuilds it on next use; sessions holding uncommitted location
+changes get a private copy built from their own view.
+"""
+
+from collections import defaultdict
+
+from backend.app.db import change_tracking
+from backend.app.models.m_locations import Location
+
+_TABLES = ("locations",)
+
+
+def _enum_value(value):
+    return getattr(value, "value", value)
+
+
+def auto_biome_mode(location) -> str:
+    """Resolved `biome_inheritance`: the explicit value, else a default by location type."""
+    explicit = _enum_value(getattr(location, "biome_inheritance", None))
+    if explicit:
+        return explicit
+    location_type = _enum_value(location.location_type)
+    if location_type in {"World", "Continent", "Region"}:
+        return "None"
+    if location_type in {"Room", "Interior"}:
+        return "InheritFromParent"
+    return "Own"
+
+
+class LocationHierarchy:
+    """Closure of the `parent_location_id` forest over a set of location rows.
+
+    Ancestors are nearest-first and stop at a missing parent or where a parent
+    chain loops. A location is `in_cycle` when its own parent chain revisits a
+    location, whether it sits on the loop or descends from one.
+    """
+
+    def __init__(self, rows):
+        self._parents = {}
+        self._biomes = {}
+        self._modes = {}
+        for row in rows:
+            self._parents[row.id] = row.parent_location_id
+            self._biomes[row.id] = _enum_value(row.biome)
+            self._modes[row.id] = auto_biome_mode(row)
+        self._ancestors = {}
+        self._cyclic = set()
+        for location_id in self._parents:
+            self._resolve(location_id)
+        for location_id in self._cyclic:
+            self._ancestors[location_id] = self._walk(location_id)
+
+        descendants = defaultdict(list)
+        for location_id, ancestors in self._ancestors.items():
+            for ancestor_id in ancestors:
+                descendants[ancestor_id].append(location_id)
+        self._descendants = {location_id: tuple(rows) for location_id, rows in descendants.items()}
+
+        self._effective_biomes = {
+            location_id: self._resolve_biome(location_id) for location_id in self._parents
+        }
+
+    def _resolve(self, start):
+        """Fill `_ancestors` along the chain from `start`, or mark the chain cyclic."""
+        path = []
+        on_path = set()
+        node = start
+        while node in self._parents and node not in self._ancestors and node not in self._cyclic:
+            if node in on_path:
+                self._cyclic.update(path)
+                return
+            path.append(node)
+            on_path.add(node)
+            node = self._parents[node]
+        if node in self._cyclic:
+            self._cyclic.update(path)
+            return
+        above = (node, *self._ancestors[node]) if node in self._ancestors else ()
+        for location_id in reversed(path):
+            self._ancestors[location_id] = above
+            above = (location_id, *above)
+
+    def _walk(self, location_id):
+        ancestors = []
+        visited = {location_id}
+        parent_id = self._parents.get(location_id)
+        while parent_id in self._parents and parent_id not in visited:
+            visited.add(parent_id)
+            ancestors.append(parent_id)
+            parent_id = self._parents[parent_id]
+        return tuple(ancestors)
+
+    def _resolve_biome(self, location_id):
+        mode = self._modes[location_id]
+        if mode in {"Own", "Mixed"}:
+            return self._biomes[location_id]
+        if mode == "None":
+            return None
+        return next((self._biomes[ancestor_id] for ancestor_id in self._ancestors[location_id] if self._biomes[ancestor_id]), None)
+
+    def __contains__(self, location_id):
+        return location_id in self._parents
+
+    def parent(self, location_id):
+        return self._parents.get(location_id)
+
+    def missing_parent(self, location_id) -> bool:
+        parent_id = self._parents.get(location_id)
+        return bool(parent_id) and parent_id not in self._parents
+
+    def ancestors(self, location_id):
+        return self._ancestors.get(location_id, ())
+
+    def descendants(self, location_id):
+        return self._descendants.get(location_id, ())
+
+    def depth(self, location_id) -> int:
+        return len(self._ancestors.get(location_id, ()))
+
+    def in_cycle(self, location_id) -> bool:
+        return location_id in self._cyclic
+
+    def cyclic_ids(self):
+        return set(self._cyclic)
+
+    def biome_mode(self, location_id):
+        return self._modes.get(location_id)
+
+    def effective_biome(self, location_id):
+        return self._effective_biomes.get(location_id)
+
+
+# engine -> (content version, hierarchy).
+_cache = change_tracking.EngineStates()
+
+
+def location_hierarchy(db_session) -> LocationHierarchy:
+    """The hierarchy as the session sees it; shared and read-only unless the session has pending location changes."""
+    if set(_TABLES) & change_tracking.uncommitted_changes(db_session).touched_tables():
+        return LocationHierarchy(db_session.query(Location).all())
+    engine = db_session.get_bind()
+    version = change_tracking.content_version(engine, _TABLES)
+    cached = _cache.get(engine)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    hierarchy = LocationHierarchy(db_session.query(
+        Location.id,
+        Location.parent_location_id,
+        Location.biome,
+        Location.biome_inheritance,
+        Location.location_type,
+    ).all())
+    _cache.set(engine, (version, hierarchy))
+    return hierarchy
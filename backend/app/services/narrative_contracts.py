@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from backend.app.db.references import reference_resolver
 from backend.app.models.m_characters import Character
 from backend.app.models.m_currencies import Currency
 from backend.app.models.m_effects import Effect
@@ -39,9 +40,24 @@ REMOVAL_MODES = {"cleanse", "dispel", "system"}
 TRANSITION_TRIGGERS = {"complete", "dialogue_choice", "victory", "interaction_closed", "condition", "fallback"}
 
 
+ACTION_REFS = {
+    "effect_id": Effect, "status_id": Status, "currency_id": Currency,
+    "quest_id": Quest, "item_id": Item, "character_id": Character,
+    "location_id": Location,
+    "location_poi_id": LocationPoi,
+}
+
+
+def _expect_refs(db_session, rows: Any, refs: dict[str, Any]) -> None:
+    """Queue every id the rows reference so each table is checked with one query."""
+    references = reference_resolver(db_session)
+    for key, model in refs.items():
+        references.expect_rows(model, rows, key)
+
+
 def _require_ref(db_session, model, value: Any, path: str) -> str:
     ref_id = str(value or "").strip()
-    if not ref_id or not db_session.get(model, ref_id):
+    if not ref_id or not reference_resolver(db_session).exists(model, ref_id):
         raise ValueError(f"{path} references a missing record")
     return ref_id
 
@@ -51,6 +67,7 @@ def validate_narrative_actions(db_session, value: Any, path: str = "actions") ->
         return []
     if not isinstance(value, list):
         raise ValueError(f"{path} must be an array")
+    _expect_refs(db_session, value, ACTION_REFS)
     normalized: list[dict[str, Any]] = []
     seen_ids: set[str] = set()
     for index, raw in enumerate(value):
@@ -79,12 +96,7 @@ def validate_narrative_actions(db_session, value: Any, path: str = "actions") ->
         if isinstance(sort_order, bool) or not isinstance(sort_order, int) or sort_order < 0:
             raise ValueError(f"{row_path}.sort_order must be a non-negative integer")
 
-        refs = {
-            "effect_id": Effect, "status_id": Status, "currency_id": Currency,
-            "quest_id": Quest, "item_id": Item, "character_id": Character,
-            "location_id": Location,
-            "location_poi_id": LocationPoi,
-        }
+        refs = ACTION_REFS
         required_by_action = {
             "apply_effect": "effect_id", "restore_resource": "effect_id",
             "apply_status": "status_id", "remove_status": "status_id",
@@ -174,6 +186,8 @@ def validate_outcome_transitions(
     if not isinstance(value, list):
         raise ValueError(f"{path} must be an array")
     allowed = allowed_triggers or TRANSITION_TRIGGERS
+    from backend.app.models.m_requirements import Requirement
+    _expect_refs(db_session, value, {"target_event_id": Event, "requirement_id": Requirement})
     normalized: list[dict[str, Any]] = []
     seen_ids: set[str] = set()
     fallback_count = 0
@@ -195,7 +209,6 @@ def validate_outcome_transitions(
         if trigger == "condition" and not requirement_id:
             raise ValueError(f"{row_path}.requirement_id is required for a condition")
         if requirement_id:
-            from backend.app.models.m_requirements import Requirement
             _require_ref(db_session, Requirement, requirement_id, f"{row_path}.requirement_id")
         if trigger == "dialogue_choice" and not source_ref_id:
             raise ValueError(f"{row_path}.source_ref_id is required for a dialogue choice")
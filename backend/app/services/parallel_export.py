@@ -0,0 +1,131 @@
+"""Per-table CSV export spread over worker processes.
+
+`export_tables_parallel()` copies the database into a private snapshot file
+with SQLite's online backup (one consistent read of the live database), splits
+the requested tables into one subset per worker, balanced by row count, and
+lets each worker process open the snapshot read-only and build
+`build_csv_rows` output for its subset. Callers assemble the returned CSV text
+in their own table order, so files and ZIP members are byte-for-byte what the
+sequential export writes. Workers are started with `spawn` so they never
+inherit the parent's open connections or request state.
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.config import EXPORT_WORKERS
+from backend.app.models import ALL_MODELS
+from backend.app.utils.csv_tools import CSVExportMode, build_csv_rows, write_csv_string
+
+SNAPSHOT_FILE_NAME = "export_snapshot.sqlite"
+
+
+def resolve_export_workers(requested: Union[str, int, None] = None) -> int:
+    """Worker count for `requested` (or `EXPORT_WORKERS`); "auto" and 0 mean one per CPU."""
+    raw = EXPORT_WORKERS if requested is None or str(requested).strip() == "" else requested
+    raw = str(raw).strip().lower()
+    if raw == "auto":
+        return os.cpu_count() or 1
+    try:
+        workers = int(raw)
+    except ValueError:
+        raise ValueError(f"Export workers must be an integer or 'auto', got {raw!r}") from None
+    if workers < 0:
+        raise ValueError("Export workers must not be negative")
+    return workers or os.cpu_count() or 1
+
+
+def _model_by_table() -> Dict[str, Any]:
+    return {model.__tablename__: model for model in ALL_MODELS if getattr(model, "__tablename__", None)}
+
+
+def _snapshot_database(engine, path: Path) -> None:
+    with engine.connect() as connection:
+        source = connection.connection.driver_connection
+        target = sqlite3.connect(str(path))
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+
+
+def _partition_tables(table_names: Sequence[str], row_counts: Dict[str, int], workers: int) -> List[List[str]]:
+    # Largest tables first onto the least loaded worker keeps subsets even.
+    subsets: List[List[str]] = [[] for _ in range(min(workers, len(table_names)))]
+    loads = [0] * len(subsets)
+    for table_name in sorted(table_names, key=lambda name: (-row_counts.get(name, 0), name)):
+        target = loads.index(min(loads))
+        subsets[target].append(table_name)
+        loads[target] += row_counts.get(table_name, 0) + 1
+    return [subset for subset in subsets if subset]
+
+
+def _export_table_subset(snapshot_path: str, table_names: List[str], mode: CSVExportMode) -> List[Dict[str, Any]]:
+    """Worker entry point: CSV text and row count for each table in `table_names`."""
+    engine = create_engine(f"sqlite:///file:{Path(snapshot_path).as_posix()}?mode=ro&uri=true", future=True)
+    model_map = _model_by_table()
+    session = sessionmaker(bind=engine, autoflush=False)()
+    results = []
+    try:
+        for table_name in table_names:
+            try:
+                model_class = model_map[table_name]
+                columns, data_rows = build_csv_rows(table_name, model_class, session.query(model_class).all(), mode=mode)
+                results.append({"table": table_name, "text": write_csv_string(columns, data_rows), "rows": len(data_rows), "error": None})
+            except Exception as exc:
+                results.append({"table": table_name, "text": None, "rows": 0, "error": str(exc)})
+            session.expunge_all()
+    finally:
+        session.close()
+        engine.dispose()
+    return results
+
+
+def export_tables_parallel(
+    engine,
+    table_names: Sequence[str],
+    mode: CSVExportMode,
+    workers: int,
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """`{table: {"text", "rows", "error"}}` for `table_names`, built by `workers` processes.
+
+    Returns None when the engine is not SQLite, so callers keep their sequential path.
+    """
+    if engine.dialect.name != "sqlite":
+        return None
+    model_map = _model_by_table()
+    with tempfile.TemporaryDirectory(prefix="soa_export_") as temp_dir:
+        snapshot_path = Path(temp_dir) / SNAPSHOT_FILE_NAME
+        _snapshot_database(engine, snapshot_path)
+        snapshot_engine = create_engine(f"sqlite:///{snapshot_path.as_posix()}", future=True)
+        try:
+            row_counts = {}
+            with snapshot_engine.connect() as connection:
+                for table_name in table_names:
+                    try:
+                        row_counts[table_name] = connection.execute(
+                            select(func.count()).select_from(model_map[table_name])
+                        ).scalar() or 0
+                    except Exception:
+                        # Missing tables still go to a worker, which reports the error.
+                        row_counts[table_name] = 0
+        finally:
+            snapshot_engine.dispose()
+        subsets = _partition_tables(table_names, row_counts, workers)
+        results: Dict[str, Dict[str, Any]] = {}
+        if not subsets:
+            return results
+        with ProcessPoolExecutor(max_workers=len(subsets), mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(_export_table_subset, str(snapshot_path), subset, mode) for subset in subsets]
+            for future in futures:
+                for result in future.result():
+                    results[result["table"]] = result
+    return results
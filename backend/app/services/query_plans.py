@@ -0,0 +1,93 @@
+"""`EXPLAIN QUERY PLAN` report over the application's hot lookup queries.
+
+`HOT_QUERIES` names the filters the UI endpoints run per request (item
+ecosystem usage, character presence, status usage, dialogue node graphs, tag
+lookups), and every single-column foreign key contributes a lookup by that
+column. `query_plan_report()` asks SQLite how it would run each one and flags
+the queries whose plan still scans a table instead of searching an index, so a
+missing or dropped index shows up without profiling individual requests.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import inspect, select
+
+from backend.app.db.tag_index import entity_tags
+from backend.app.models import ALL_MODELS
+from backend.app.models.m_adventure_narrative import AdventureBeatLink
+from backend.app.models.m_combat_profiles import CombatProfile
+from backend.app.models.m_dialogue_nodes import DialogueNode
+from backend.app.models.m_dialogues import Dialogue
+from backend.app.models.m_effects import Effect
+from backend.app.models.m_interaction_profiles import InteractionProfile
+from backend.app.models.m_location_pois import LocationPoi
+from backend.app.models.m_shop_inventory import ShopInventory
+from backend.app.models.m_shops import Shop
+
+# Placeholder bound into every query; plans do not depend on the value.
+_SAMPLE = "sample"
+
+# (name, tables the query needs, statement builder)
+HOT_QUERIES: List[Tuple[str, Tuple[str, ...], Callable[[], Any]]] = [
+    ("item_ecosystem.shop_inventory_by_item", ("shops_inventory",),
+     lambda: select(ShopInventory.id).where(ShopInventory.item_id == _SAMPLE)),
+    ("item_ecosystem.pois_by_item", ("location_pois",),
+     lambda: select(LocationPoi.id).where(LocationPoi.item_id == _SAMPLE)),
+    ("item_ecosystem.beat_links_by_target", ("adventure_beat_links",),
+     lambda: select(AdventureBeatLink.id).where(AdventureBeatLink.target_id == _SAMPLE)),
+    ("character_studio.dialogues_by_character", ("dialogues",),
+     lambda: select(Dialogue.id).where(Dialogue.character_id == _SAMPLE)),
+    ("character_studio.nodes_by_speaker", ("dialogue_nodes",),
+     lambda: select(DialogueNode.id).where(DialogueNode.speaker_character_id == _SAMPLE)),
+    ("character_studio.shops_by_character", ("shops",),
+     lambda: select(Shop.id).where(Shop.character_id == _SAMPLE)),
+    ("character_studio.interaction_profile_by_character", ("interaction_profiles",),
+     lambda: select(InteractionProfile.id).where(InteractionProfile.character_id == _SAMPLE)),
+    ("character_studio.combat_profile_by_character", ("combat_profiles",),
+     lambda: select(CombatProfile.id).where(CombatProfile.character_id == _SAMPLE)),
+    ("abilities.effects_by_status", ("effects",),
+     lambda: select(Effect.id).where(Effect.status_id.in_([_SAMPLE, _SAMPLE + "-2"]))),
+    ("dialogues.node_graph", ("dialogue_nodes",),
+     lambda: select(DialogueNode.id).where(DialogueNode.dialogue_id == _SAMPLE)),
+    ("tags.exact_lookup", ("entity_tags",),
+     lambda: select(entity_tags.c.entity_id).where(entity_tags.c.table_name == _SAMPLE, entity_tags.c.tag == _SAMPLE)),
+]
+
+
+def _foreign_key_queries() -> List[Tuple[str, Tuple[str, ...], Callable[[], Any]]]:
+    queries = []
+    for model in sorted(ALL_MODELS, key=lambda model: model.__tablename__):
+        table = model.__table__
+        for column in table.columns:
+            if column.foreign_keys and not column.primary_key:
+                queries.append((
+                    f"foreign_key.{table.name}.{column.name}",
+                    (table.name,),
+                    lambda table=table, column=column: select(table.c.id).where(column == _SAMPLE),
+                ))
+    return queries
+
+
+def _scans(plan: List[str]) -> List[str]:
+    # "SEARCH ..." uses an index; "SCAN ..." walks a whole table or index.
+    return [detail for detail in plan if detail.startswith("SCAN ")]
+
+
+def query_plan_report(engine) -> Dict[str, Any]:
+    """Plan of every hot and foreign-key lookup query on `engine`, and which of them scan."""
+    if engine.dialect.name != "sqlite":
+        return {"dialect": engine.dialect.name, "queries": [], "scanning": []}
+    table_names = set(inspect(engine).get_table_names())
+    queries = []
+    with engine.connect() as connection:
+        for name, tables, build in [*HOT_QUERIES, *_foreign_key_queries()]:
+            if not set(tables) <= table_names:
+                continue
+            sql = str(build().compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+            plan = [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+            queries.append({"name": name, "sql": sql, "plan": plan, "scans": _scans(plan)})
+    return {
+        "dialect": engine.dialect.name,
+        "queries": queries,
+        "scanning": [query["name"] for query in queries if query["scans"]],
+    }
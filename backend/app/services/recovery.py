@@ -1,22 +1,30 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
+import os
 import uuid
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Iterable
-from threading import RLock
+from threading import Lock, RLock
+from weakref import WeakKeyDictionary
 
 from flask import Flask
 from sqlalchemy import func, text
 
 from backend.app.config import DATA_DIR, RECOVERY_STARTUP_IMPORT_MODE
+from backend.app.db import change_tracking
 from backend.app.db import init_db as db_runtime
 from backend.app.models import ALL_MODELS
 from backend.app.models.base import Base
-from backend.app.utils.csv_tools import UE_ROW_KEY_HEADER, build_csv_rows, coerce_row_from_schema
+from backend.app.routes.base_route import ROUTE_REGISTRY
+from backend.app.services.bulk_loader import bulk_insert_table, prepare_table_rows
+from backend.app.services.json_references import row_references
+from backend.app.services.parallel_export import export_tables_parallel, resolve_export_workers
+from backend.app.utils.csv_tools import UE_ROW_KEY_HEADER, build_csv_rows, coerce_csv_rows, write_csv_string
 
 RECOVERY_IMPORT_ORDER = [
     "content_packs",
@@ -122,12 +130,20 @@ def collect_csv_paths(source_dir: Path | None = None) -> dict[str, Path]:
     return paths
 
 
-def preflight_source_csvs(source_dir: Path | None = None) -> dict[str, Any]:
-    """Validate the complete source CSV set before a destructive rebuild."""
+def preflight_source_csvs(
+    source_dir: Path | None = None,
+    parsed_rows: dict[str, list[tuple[int, dict[str, Any]]]] | None = None,
+) -> dict[str, Any]:
+    """Validate the complete source CSV set before a destructive rebuild.
+
+    When `parsed_rows` is given it is filled with the coerced rows per table so
+    the bulk loader can write them without parsing the files a second time.
+    """
     directory = source_dir or DATA_DIR
     paths = collect_csv_paths(directory)
     model_map = _model_by_table()
-    parsed_rows: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+    if parsed_rows is None:
+        parsed_rows = {}
     final_ids: dict[str, set[str]] = {}
     errors: list[dict[str, Any]] = []
 
@@ -143,10 +159,8 @@ def preflight_source_csvs(source_dir: Path | None = None) -> dict[str, Any]:
         ids: set[str] = set()
         try:
             with path.open("r", newline="", encoding="utf-8-sig") as handle:
-                for row_number, raw_row in enumerate(csv.DictReader(handle), start=2):
-                    try:
-                        row = coerce_row_from_schema(table_name, {key: value for key, value in raw_row.items() if key}, strict_json=True)
-                    except Exception as exc:
+                for row_number, row, exc in coerce_csv_rows(table_name, csv.DictReader(handle), strict_json=True):
+                    if exc is not None:
                         errors.append({"table": table_name, "row": row_number, "field": None, "message": f"Failed to parse row: {exc}"})
                         continue
                     row.pop(UE_ROW_KEY_HEADER, None)
@@ -183,6 +197,20 @@ def preflight_source_csvs(source_dir: Path | None = None) -> dict[str, Any]:
                             "message": f"Missing referenced {target_table}.id: {target_id}",
                         })
 
+    # Ids kept in JSON arrays (`custom_abilities`, `loot_table`, ...) have no database constraint.
+    for table_name, rows in parsed_rows.items():
+        for row_number, row in rows:
+            for reference in row_references(table_name, row):
+                target_table, target_id = reference["target_table"], reference["target_id"]
+                if target_id not in final_ids.get(target_table, set()):
+                    errors.append({
+                        "table": table_name,
+                        "row": row_number,
+                        "field": reference["path"],
+                        "referenced_id": target_id,
+                        "message": f"Missing referenced {target_table}.id: {target_id}",
+                    })
+
     faction_ids = final_ids.get("factions", set())
     nested_reputation = set()
     for row_number, requirement in parsed_rows.get("requirements", []):
@@ -300,7 +328,63 @@ def _is_default_source_dir(source_dir: Path | None = None) -> bool:
         return False
 
 
-def _write_recovery_state(operation: str, source_dir: Path | None = None) -> None:
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _source_file_record(path: Path, recorded: dict[str, Any] | None = None) -> dict[str, Any] | None:
+    """`{sha256, size, mtime_ns}` of `path`; the recorded hash is reused while size and mtime still match."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if (
+        isinstance(recorded, dict)
+        and recorded.get("sha256")
+        and recorded.get("size") == stat.st_size
+        and recorded.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return {"sha256": recorded["sha256"], "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return {"sha256": _hash_bytes(path.read_bytes()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _recorded_tables(source_dir: Path | None = None) -> dict[str, Any]:
+    if not _is_default_source_dir(source_dir):
+        return {}
+    tables = _read_recovery_state().get("tables")
+    return tables if isinstance(tables, dict) else {}
+
+
+def _source_file_records(source_dir: Path | None = None) -> dict[str, dict[str, Any]]:
+    recorded = _recorded_tables(source_dir)
+    records = {}
+    for table_name, path in collect_csv_paths(source_dir).items():
+        record = _source_file_record(path, recorded.get(table_name))
+        if record is not None:
+            records[table_name] = record
+    return records
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Replace `path` with `text` so readers never see a partially written file."""
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with temp_path.open("w", newline="", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def _write_recovery_state(
+    operation: str,
+    source_dir: Path | None = None,
+    table_records: dict[str, dict[str, Any]] | None = None,
+) -> None:
+    """Record the sync point; `table_records` (hashes of the source CSVs) is recomputed when omitted."""
     if not _is_default_source_dir(source_dir):
         return
     latest_csv_mtime = latest_recovery_csv_mtime(source_dir)
@@ -312,6 +396,7 @@ def _write_recovery_state(operation: str, source_dir: Path | None = None) -> Non
         "source_dir": str(source_dir or DATA_DIR),
         "latest_csv_mtime": latest_csv_mtime,
         "latest_csv_mtime_iso": _iso_from_mtime(latest_csv_mtime),
+        "tables": table_records if table_records is not None else _source_file_records(source_dir),
     }
     try:
         RECOVERY_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -321,7 +406,8 @@ def _write_recovery_state(operation: str, source_dir: Path | None = None) -> Non
         pass
 
 
-def get_sync_status(source_dir: Path | None = None) -> dict[str, Any]:
+def get_sync_status(source_dir: Path | None = None, include_tables: bool = False) -> dict[str, Any]:
+    """Whole-directory sync markers, plus per-table dirty status when `include_tables` is set."""
     database_empty = is_database_empty()
     csv_mtime = latest_recovery_csv_mtime(source_dir)
     db_mtime = active_db_mtime()
@@ -335,7 +421,7 @@ def get_sync_status(source_dir: Path | None = None) -> dict[str, Any]:
         and state.get("active_db") == f"{db_runtime.get_active_db_name()}.sqlite"
     )
     restore_recommended = bool(not database_empty and csv_newer_than_db and not marker_matches_csv)
-    return {
+    status = {
         "active_db": f"{db_runtime.get_active_db_name()}.sqlite",
         "active_db_path": str(active_db_path()),
         "active_db_mtime": db_mtime,
@@ -345,8 +431,12 @@ def get_sync_status(source_dir: Path | None = None) -> dict[str, Any]:
         "csv_newer_than_db": csv_newer_than_db,
         "database_empty": database_empty,
         "restore_recommended": restore_recommended,
-        "local_recovery_state": state,
+        "local_recovery_state": {key: value for key, value in state.items() if key != "tables"},
     }
+    if include_tables:
+        status["tables"] = table_sync_status(source_dir)
+        status["dirty_tables"] = [table["table"] for table in status["tables"] if table["status"] != "clean"]
+    return status
 
 
 def ordered_tables(existing_tables: Iterable[str]) -> tuple[list[str], list[str]]:
@@ -512,6 +602,65 @@ def import_source_csvs(
     return report
 
 
+def bulk_import_source_rows(
+    parsed_rows: dict[str, list[tuple[int, dict[str, Any]]]],
+    source_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Write preflighted source rows into the active database with batched Core inserts.
+
+    Intended for freshly created (staging) databases: tables are inserted in
+    recovery order inside one transaction, and nothing is written unless every
+    table passes enum, required-field and schema-type validation.
+    """
+    directory = source_dir or DATA_DIR
+    paths = collect_csv_paths(directory)
+    model_map = _model_by_table()
+    report = _empty_report("success", "Bulk source import completed.", directory)
+    tables, unordered = ordered_tables(table for table in parsed_rows if table in model_map)
+    if unordered:
+        report["warnings"].append({
+            "message": "Some CSV files are not in the canonical recovery order and were imported alphabetically afterward.",
+            "tables": unordered,
+        })
+
+    prepared: dict[str, list[dict[str, Any]]] = {}
+    for table_name in tables:
+        values, errors = prepare_table_rows(table_name, model_map[table_name], parsed_rows[table_name])
+        prepared[table_name] = values
+        report["tables"].append({
+            "table": table_name,
+            "file": str(paths.get(table_name, "")),
+            "imported": 0,
+            "deleted": 0,
+            "status": "error" if errors else "success",
+            "warnings": [],
+            "errors": [error["message"] for error in errors],
+        })
+        report["errors"].extend(errors)
+    if report["errors"]:
+        report["status"] = "error"
+        report["message"] = "Bulk source import validation failed; no rows were written."
+        return report
+
+    table_reports = {table["table"]: table for table in report["tables"]}
+    current_table = None
+    try:
+        with db_runtime.get_engine().begin() as connection:
+            for table_name in tables:
+                current_table = table_name
+                table_reports[table_name]["imported"] = bulk_insert_table(connection, model_map[table_name], prepared[table_name])
+    except Exception as exc:
+        if current_table in table_reports:
+            table_reports[current_table]["status"] = "error"
+            table_reports[current_table]["errors"].append(str(exc))
+        for table in report["tables"]:
+            table["imported"] = 0
+        report["status"] = "error"
+        report["message"] = "Bulk source import failed; the transaction was rolled back."
+        report["errors"].append({"table": current_table, "message": str(exc)})
+    return report
+
+
 def import_missing_source_csvs(app: Flask, source_dir: Path | None = None) -> dict[str, Any]:
     return import_source_csvs(app, source_dir, reset_first=False, only_empty_tables=True)
 
@@ -568,20 +717,144 @@ def run_startup_recovery(app: Flask, source_dir: Path | None = None) -> dict[str
     return report
 
 
-def export_source_csvs(output_dir: Path | None = None) -> dict[str, Any]:
+def _sequential_table_exports(tables: list[str], model_map: dict[str, Any]) -> Iterable[dict[str, Any]]:
+    session = db_runtime.get_db_session()
+    try:
+        for table_name in tables:
+            model_class = model_map[table_name]
+            try:
+                rows = session.query(model_class).all()
+                columns, data_rows = build_csv_rows(table_name, model_class, rows, mode="source")
+                yield {"table": table_name, "text": write_csv_string(columns, data_rows), "rows": len(data_rows), "error": None}
+            except Exception as exc:
+                yield {"table": table_name, "text": None, "rows": 0, "error": str(exc)}
+    finally:
+        session.close()
+
+
+def _parallel_table_exports(tables: list[str], workers: int) -> Iterable[dict[str, Any]] | None:
+    results = export_tables_parallel(_active_bind(), tables, "source", workers)
+    if results is None:
+        return None
+    return (results[table_name] for table_name in tables)
+
+
+def _table_exports(tables: list[str], model_map: dict[str, Any], workers: int, report: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Source CSV text, row count and SHA-256 per table, built by `workers` processes when above one."""
+    exports = None
+    if workers > 1 and tables:
+        try:
+            exports = _parallel_table_exports(tables, workers)
+        except Exception as exc:
+            report["warnings"].append({"message": f"Parallel export failed; tables were exported sequentially instead: {exc}"})
+        if exports is not None:
+            report["workers"] = workers
+    if exports is None:
+        exports = _sequential_table_exports(tables, model_map)
+    results = {}
+    for exported in exports:
+        if exported["error"] is None:
+            exported["sha256"] = _hash_bytes(exported["text"].encode("utf-8"))
+        results[exported["table"]] = exported
+    return results
+
+
+def _active_bind():
+    session = db_runtime.get_db_session()
+    try:
+        return session.get_bind()
+    finally:
+        session.close()
+
+
+# engine -> {table: (content version key, SHA-256 of its source CSV, row count)}.
+# Lets export and status skip serializing tables with no commits since they were
+# last hashed; the key changes with every commit and every database switch.
+_database_hashes: WeakKeyDictionary = WeakKeyDictionary()
+_database_hashes_lock = Lock()
+
+
+def _export_content_tables(table_name: str) -> list[str]:
+    """Tables a table's source CSV is serialized from: its route's relationship closure, or itself."""
+    route = ROUTE_REGISTRY.get(table_name)
+    return route.content_tables() if route is not None else [table_name]
+
+
+def _table_versions(engine, tables: Iterable[str]) -> dict[str, Any]:
+    # Source CSVs embed related rows (a POI row carries its location), so each
+    # hash is keyed on every table its serializer reads.
+    return {table_name: change_tracking.content_version(engine, _export_content_tables(table_name)) for table_name in tables}
+
+
+def _known_database_hashes(engine, versions: dict[str, Any]) -> dict[str, tuple[str, int]]:
+    with _database_hashes_lock:
+        known = _database_hashes.get(engine, {})
+        return {
+            table_name: (sha256, rows)
+            for table_name, (version, sha256, rows) in known.items()
+            if versions.get(table_name) == version
+        }
+
+
+def _remember_database_hashes(engine, versions: dict[str, Any], exports: dict[str, dict[str, Any]]) -> None:
+    with _database_hashes_lock:
+        known = _database_hashes.setdefault(engine, {})
+        for table_name, exported in exports.items():
+            if exported["error"] is None:
+                known[table_name] = (versions[table_name], exported["sha256"], exported["rows"])
+
+
+def _database_table_hashes(
+    tables: list[str],
+    model_map: dict[str, Any],
+    report: dict[str, Any],
+    skip: Any = None,
+    workers: int = 1,
+) -> tuple[dict[str, tuple[str, int]], dict[str, dict[str, Any]]]:
+    """`(hashes, exports)`: the current source CSV hash and row count per table, and the tables serialized for it.
+
+    Tables hashed since their last commit are answered from memory; the rest are
+    serialized unless `skip(table, sha256)` says the remembered hash is enough.
+    """
+    engine = _active_bind()
+    # Versions are read before the rows, so a concurrent commit only makes the entry stale.
+    versions = _table_versions(engine, tables)
+    known = _known_database_hashes(engine, versions)
+    stale = [table_name for table_name in tables if table_name not in known or (skip is not None and not skip(table_name, known[table_name][0]))]
+    exports = _table_exports(stale, model_map, workers, report)
+    _remember_database_hashes(engine, versions, exports)
+    hashes = dict(known)
+    for table_name, exported in exports.items():
+        if exported["error"] is None:
+            hashes[table_name] = (exported["sha256"], exported["rows"])
+    return hashes, exports
+
+
+def export_source_csvs(output_dir: Path | None = None, workers: int | str | None = None) -> dict[str, Any]:
+    """Write changed tables as `<table>_seed.csv` and leave files that already match untouched.
+
+    A table is rewritten (atomically) only when its source CSV would differ from
+    the file on disk, compared by SHA-256; tables without commits since they were
+    last hashed are not even re-serialized. `workers` (default `EXPORT_WORKERS`)
+    above one builds the changed tables in worker processes. The report lists
+    `rewritten` and `unchanged` tables, and the file hashes are recorded in
+    `.recovery_state.json` for `table_sync_status()`.
+    """
     global _last_export_report
     directory = output_dir or DATA_DIR
     directory.mkdir(parents=True, exist_ok=True)
     model_map = _model_by_table()
     tables, unordered = ordered_tables(model_map.keys())
-    session = db_runtime.get_db_session()
     report = {
         "status": "success",
         "message": "Recovery source CSV export completed.",
         "timestamp": _now_iso(),
         "active_db": f"{db_runtime.get_active_db_name()}.sqlite",
         "source_dir": str(directory),
+        "workers": 1,
         "tables": [],
+        "rewritten": [],
+        "unchanged": [],
         "warnings": [],
         "errors": [],
     }
@@ -590,45 +863,103 @@ def export_source_csvs(output_dir: Path | None = None) -> dict[str, Any]:
             "message": "Some database tables are not in the canonical recovery order and were exported alphabetically afterward.",
             "tables": unordered,
         })
-    try:
-        for table_name in tables:
-            model_class = model_map[table_name]
-            table_report: dict[str, Any] = {
-                "table": table_name,
-                "file": str(directory / f"{table_name}_seed.csv"),
-                "rows": 0,
-                "status": "success",
-                "errors": [],
-            }
-            try:
-                rows = session.query(model_class).all()
-                columns, data_rows = build_csv_rows(table_name, model_class, rows, mode="source")
-                with (directory / f"{table_name}_seed.csv").open("w", newline="", encoding="utf-8") as handle:
-                    writer = csv.writer(handle)
-                    writer.writerow(columns)
-                    writer.writerows(data_rows)
-                table_report["rows"] = len(data_rows)
-            except Exception as exc:
-                table_report["status"] = "error"
-                table_report["errors"].append(str(exc))
-                report["errors"].append({"table": table_name, "message": str(exc)})
-            report["tables"].append(table_report)
-    finally:
-        session.close()
+    recorded = _recorded_tables(directory)
+    file_records = {
+        table_name: _source_file_record(directory / f"{table_name}_seed.csv", recorded.get(table_name))
+        for table_name in tables
+    }
+
+    def file_matches(table_name: str, sha256: str) -> bool:
+        return file_records[table_name] is not None and file_records[table_name]["sha256"] == sha256
+
+    hashes, exports = _database_table_hashes(
+        tables, model_map, report, skip=file_matches, workers=resolve_export_workers(workers)
+    )
+    for table_name in tables:
+        path = directory / f"{table_name}_seed.csv"
+        table_report: dict[str, Any] = {
+            "table": table_name,
+            "file": str(path),
+            "rows": 0,
+            "written": False,
+            "status": "success",
+            "errors": [],
+        }
+        try:
+            exported = exports.get(table_name)
+            if exported is not None and exported["error"] is not None:
+                raise RuntimeError(exported["error"])
+            sha256, table_report["rows"] = hashes[table_name]
+            if not file_matches(table_name, sha256):
+                _write_text_atomic(path, exported["text"])
+                stat = path.stat()
+                file_records[table_name] = {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+                table_report["written"] = True
+            report["rewritten" if table_report["written"] else "unchanged"].append(table_name)
+        except Exception as exc:
+            table_report["status"] = "error"
+            table_report["errors"].append(str(exc))
+            report["errors"].append({"table": table_name, "message": str(exc)})
+        report["tables"].append(table_report)
 
     if report["errors"]:
         report["status"] = "error"
         report["message"] = "Recovery source CSV export completed with failures."
     else:
-        _write_recovery_state("export", directory)
+        if report["unchanged"]:
+            report["message"] = f"Recovery source CSV export rewrote {len(report['rewritten'])} changed tables."
+        _write_recovery_state(
+            "export",
+            directory,
+            {table_name: record for table_name, record in file_records.items() if record is not None},
+        )
     _last_export_report = report
     return report
 
 
+def table_sync_status(source_dir: Path | None = None) -> list[dict[str, Any]]:
+    """Per-table comparison of the database with its source CSV.
+
+    `status` is `clean` when exporting the table would write the file's exact
+    bytes, `dirty` when it would change the file, `missing_source` when there is
+    no file and `error` when the table cannot be serialized. `source_edited`
+    flags files changed since the last export or restore recorded their hash.
+    """
+    directory = source_dir or DATA_DIR
+    model_map = _model_by_table()
+    tables, _unordered = ordered_tables(model_map.keys())
+    report: dict[str, Any] = {"warnings": []}
+    hashes, exports = _database_table_hashes(tables, model_map, report)
+    recorded = _recorded_tables(directory)
+    paths = collect_csv_paths(directory)
+    statuses = []
+    for table_name in tables:
+        path = paths.get(table_name)
+        file_record = _source_file_record(path, recorded.get(table_name)) if path is not None else None
+        recorded_sha = (recorded.get(table_name) or {}).get("sha256")
+        entry: dict[str, Any] = {
+            "table": table_name,
+            "file": str(path) if path is not None else None,
+            "rows": None,
+            "status": "missing_source",
+            "source_edited": bool(file_record and recorded_sha and recorded_sha != file_record["sha256"]),
+        }
+        if table_name not in hashes:
+            entry["status"] = "error"
+            entry["error"] = exports[table_name]["error"]
+        else:
+            sha256, entry["rows"] = hashes[table_name]
+            if file_record is not None:
+                entry["status"] = "clean" if file_record["sha256"] == sha256 else "dirty"
+        statuses.append(entry)
+    return statuses
+
+
 def reset_database() -> None:
     engine = db_runtime.get_engine()
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    db_runtime.ensure_derived_indexes(engine)
 
 
 def rebuild_database_from_source(app: Flask, source_dir: Path | None = None) -> dict[str, Any]:
@@ -662,7 +993,8 @@ def staged_rebuild_database_from_source(app: Flask, source_dir: Path | None = No
     })
 
     with _recovery_lock:
-        preflight = preflight_source_csvs(directory)
+        parsed_rows: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+        preflight = preflight_source_csvs(directory, parsed_rows)
         report["preflight"] = preflight
         if preflight["status"] == "error":
             report["message"] = "Recovery preflight failed; active database was not reset or modified."
@@ -673,9 +1005,9 @@ def staged_rebuild_database_from_source(app: Flask, source_dir: Path | None = No
         try:
             staging_path.parent.mkdir(parents=True, exist_ok=True)
             staging_path.touch(exist_ok=False)
-            db_runtime.switch_active_database(staging_name)
+            db_runtime.switch_active_database(staging_name, pragma_profile="bulk")
             db_runtime.init_db()
-            report = import_source_csvs(app, directory, reset_first=False)
+            report = bulk_import_source_rows(parsed_rows, directory)
             report.update({
                 "preflight": preflight,
                 "staging_path": str(staging_path),
@@ -688,6 +1020,9 @@ def staged_rebuild_database_from_source(app: Flask, source_dir: Path | None = No
                 report["message"] = "Staging import failed; active database was not modified."
                 report["failure_phase"] = "import"
                 return report
+            # Re-run the additive upgrade pass so legacy rows (e.g. dialogue choices
+            # without ids) get the same backfill a normal startup would apply.
+            db_runtime.init_db()
             integrity_errors = foreign_key_integrity_errors()
             report["integrity"] = {"status": "error" if integrity_errors else "ok", "errors": integrity_errors}
             if integrity_errors:
@@ -742,7 +1077,7 @@ def staged_rebuild_database_from_source(app: Flask, source_dir: Path | None = No
 
 
 def get_recovery_status() -> dict[str, Any]:
-    sync_status = get_sync_status(DATA_DIR)
+    sync_status = get_sync_status(DATA_DIR, include_tables=True)
     return {
         "active_db": f"{db_runtime.get_active_db_name()}.sqlite",
         "source_dir": str(DATA_DIR),
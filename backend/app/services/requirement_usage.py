@@ -0,0 +1,144 @@
+"""Inverted index of requirement usage: requirement id -> every gate pointing at it.
+
+A requirement gates content through a `requirements_id` column, through a quest
+objective's `requirements_id` and through a dialogue choice's `requirements_id`.
+`requirement_usages()` answers "where is requirement X used" for every
+requirement at once from a per-engine map that is built on first use with one
+narrow query per gated table and then kept current from the committed-row change
+feed, so workspace packets no longer sweep every model once per requirement.
+Sessions holding uncommitted changes to gated rows see them overlaid on the
+shared map.
+
+The returned mapping is shared between callers and must be treated as read-only.
+"""
+
+from collections import defaultdict
+
+from backend.app.db import change_tracking
+from backend.app.models import ALL_MODELS
+from backend.app.models.m_dialogue_nodes import DialogueNode
+from backend.app.models.m_quests import Quest
+from backend.app.models.m_requirements import Requirement
+
+# Stay well below SQLite's bound-parameter limit.
+_IN_CHUNK_SIZE = 500
+_LABEL_COLUMNS = ("name", "title", "slug")
+# JSON columns whose list entries carry their own `requirements_id`.
+_NESTED_GATES = {
+    Quest.__tablename__: ("objectives", "objectives"),
+    DialogueNode.__tablename__: ("choices", "choices"),
+}
+
+_GATED_MODELS = {}
+for _model in ALL_MODELS:
+    if _model is not Requirement and hasattr(_model, "requirements_id"):
+        _GATED_MODELS.setdefault(_model.__tablename__, _model)
+_TABLE_ORDER = {table: position for position, table in enumerate(_GATED_MODELS)}
+
+# Every table the index reads, for callers keying their own caches on its content.
+REQUIREMENT_USAGE_TABLES = frozenset(_GATED_MODELS)
+
+
+def _columns(table):
+    model = _GATED_MODELS[table]
+    names = ["id", "requirements_id", *(name for name in _LABEL_COLUMNS if hasattr(model, name))]
+    if table in _NESTED_GATES:
+        names.append(_NESTED_GATES[table][0])
+    return [getattr(model, name) for name in names]
+
+
+def row_usages(table, row):
+    """`[(requirement_id, usage)]` for one gated row, in field order."""
+    label = next((getattr(row, name, None) for name in _LABEL_COLUMNS if getattr(row, name, None)), None) or row.id
+    entries = []
+
+    def usage(requirement_id, path):
+        entries.append((requirement_id, {"schema_name": table, "entry_id": row.id, "entry_label": label, "path": path}))
+
+    if row.requirements_id:
+        usage(row.requirements_id, "requirements_id")
+    if table in _NESTED_GATES:
+        column, path = _NESTED_GATES[table]
+        values = getattr(row, column)
+        for index, entry in enumerate(values if isinstance(values, list) else []):
+            if isinstance(entry, dict) and entry.get("requirements_id"):
+                usage(entry["requirements_id"], f"{path}[{index}].requirements_id")
+    return entries
+
+
+class _UsageIndexState:
+    """Usages per gated row plus the assembled requirement -> usages mapping for one engine."""
+
+    def __init__(self):
+        self.loaded = False
+        self.rows = {}
+        self.snapshot = None
+
+    def copy(self):
+        other = _UsageIndexState()
+        other.loaded = self.loaded
+        other.rows = dict(self.rows)
+        return other
+
+    def load_table(self, db_session, table):
+        for key in [key for key in self.rows if key[0] == table]:
+            del self.rows[key]
+        for row in db_session.query(*_columns(table)):
+            self.rows[(table, row.id)] = row_usages(table, row)
+
+    def refresh_rows(self, db_session, table, row_ids):
+        row_ids = list(row_ids)
+        found = {}
+        model_id = _GATED_MODELS[table].id
+        for start in range(0, len(row_ids), _IN_CHUNK_SIZE):
+            chunk = row_ids[start:start + _IN_CHUNK_SIZE]
+            found.update((row.id, row) for row in db_session.query(*_columns(table)).filter(model_id.in_(chunk)))
+        for row_id in row_ids:
+            if row_id in found:
+                self.rows[(table, row_id)] = row_usages(table, found[row_id])
+            else:
+                self.rows.pop((table, row_id), None)
+
+    def apply(self, db_session, stale_rows, stale_tables):
+        """Re-read stale rows and tables; returns True when anything was re-read."""
+        if not self.loaded:
+            stale_tables = set(_GATED_MODELS)
+            self.loaded = True
+        for table in stale_tables:
+            self.load_table(db_session, table)
+        for table, row_ids in stale_rows.items():
+            if table not in stale_tables:
+                self.refresh_rows(db_session, table, row_ids)
+        return bool(stale_tables or stale_rows)
+
+    def sync(self, db_session, stale_rows, stale_tables):
+        if self.apply(db_session, stale_rows, stale_tables) or self.snapshot is None:
+            self.snapshot = self.assemble()
+
+    def assemble(self):
+        usages = defaultdict(list)
+        for key in sorted(self.rows, key=lambda key: (_TABLE_ORDER[key[0]], key[1])):
+            for requirement_id, usage in self.rows[key]:
+                usages[requirement_id].append(usage)
+        return dict(usages)
+
+
+# Maps a change set onto gated tables: `(rows by table, whole tables)`.
+_stale_entries = change_tracking.stale_entries_for(_GATED_MODELS)
+_states = change_tracking.EngineStates(_UsageIndexState, _stale_entries)
+
+
+def requirement_usages(db_session):
+    """`{requirement_id: [usage]}` for every gated row the session can see.
+
+    Each usage is `{schema_name, entry_id, entry_label, path}`; requirements that
+    gate nothing are absent. Usages are ordered by table, then row id, then field.
+    """
+    local_rows, local_tables = _stale_entries(change_tracking.uncommitted_changes(db_session))
+    with _states.lock:
+        state = _states.refreshed(db_session.get_bind(), lambda state, rows, tables: state.sync(db_session, rows, tables))
+        if not (local_rows or local_tables):
+            return state.snapshot
+        local = state.copy()
+    local.apply(db_session, local_rows, local_tables)
+    return local.assemble()
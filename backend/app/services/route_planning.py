@@ -0,0 +1,399 @@
+"""Route planning over `location_routes` with `travel_tuning` applied.
+
+`route_graph()` compiles locations, routes, tuning rows and route requirements
+into a CSR adjacency (per-node offsets into flat target/weight arrays) once per
+content version of those tables. Queries then run on the arrays:
+
+- `shortest_paths()`: A* (Dijkstra when coordinates give no usable bound) plus
+  Yen's algorithm for the k shortest loopless paths.
+- `reachable_from()`: single-source distances, optionally cut off at a budget.
+- `distance_matrix()`: all-pairs distances over a set of locations.
+
+Each directed leg takes the most specific `travel_tuning` row matching its
+route type and the destination's place kind and effective biome (unset tuning
+fields match anything; ties go to the lowest id). The leg's travel time is
+multiplied by `travel_time_multiplier`, and also by `safe_zone_multiplier`
+when the destination is a safe zone. Its travel cost is multiplied by
+`travel_cost_multiplier`. Fatigue and risk add up per leg.
+
+Negative travel times, costs and multipliers count as 0 so every leg weight
+stays non-negative, as Dijkstra and A* require. A route whose weight comes out
+NaN or infinite is left out of the graph and listed in `skipped_route_ids`.
+"""
+
+import heapq
+import math
+from array import array
+
+from sqlalchemy.orm import selectinload
+
+from backend.app.db import change_tracking
+from backend.app.models.m_location_routes import LocationRoute
+from backend.app.models.m_locations import Location
+from backend.app.models.m_requirements import Requirement
+from backend.app.models.m_travel_tuning import TravelTuning
+from backend.app.services.location_hierarchy import location_hierarchy
+
+GRAPH_TABLES = (
+    "locations",
+    "location_routes",
+    "travel_tuning",
+    "requirements",
+    "requirement_required_flags",
+    "requirement_forbidden_flags",
+    "requirement_min_faction_reputation",
+)
+METRICS = ("time", "cost", "hops")
+REQUIREMENT_MODES = ("ignore", "exclude", "evaluate")
+
+
+def _enum_value(value):
+    return getattr(value, "value", value)
+
+
+def _number(value, default=0.0):
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+        return float(value)
+    return default
+
+
+def _weight(value, default=0.0):
+    """A travel time, cost or multiplier clamped at 0; None when it is NaN or infinite."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and not math.isfinite(value):
+        return None
+    return max(_number(value, default), 0.0)
+
+
+def _tuning_for(tunings, route_type, place_kind, biome):
+    best = None
+    for tuning in tunings:
+        keys = (tuning["route_type"], tuning["place_kind"], tuning["biome"])
+        if any(key is not None and key != actual for key, actual in zip(keys, (route_type, place_kind, biome))):
+            continue
+        specificity = sum(key is not None for key in keys)
+        if best is None or specificity > best[0]:
+            best = (specificity, tuning)
+    return best[1] if best else None
+
+
+class RouteGraph:
+    """Directed CSR adjacency over locations; bidirectional routes contribute two legs."""
+
+    def __init__(self, locations, routes, tunings, requirements, hierarchy):
+        self.location_ids = sorted(location.id for location in locations)
+        self.index = {location_id: position for position, location_id in enumerate(self.location_ids)}
+        by_id = {location.id: location for location in locations}
+        self.coordinates = [self._point(by_id[location_id].coordinates) for location_id in self.location_ids]
+        self.requirements = requirements
+
+        tuning_rows = sorted(
+            (
+                {
+                    "id": tuning.id,
+                    "route_type": _enum_value(tuning.route_type),
+                    "place_kind": _enum_value(tuning.place_kind),
+                    "biome": _enum_value(tuning.biome),
+                    "time": _weight(tuning.travel_time_multiplier, 1.0),
+                    "cost": _weight(tuning.travel_cost_multiplier, 1.0),
+                    "safe_zone": _weight(tuning.safe_zone_multiplier, 1.0),
+                    "fatigue": _number(tuning.fatigue_cost),
+                    "risk": _number(tuning.risk_score),
+                }
+                for tuning in tunings
+            ),
+            key=lambda row: row["id"],
+        )
+
+        legs = []
+        skipped = set()
+        for route in sorted(routes, key=lambda item: item.id):
+            if route.from_location_id not in self.index or route.to_location_id not in self.index:
+                continue
+            ends = [(route.from_location_id, route.to_location_id)]
+            if route.bidirectional is not False:
+                ends.append((route.to_location_id, route.from_location_id))
+            for source_id, target_id in ends:
+                target = by_id[target_id]
+                tuning = _tuning_for(
+                    tuning_rows,
+                    _enum_value(route.route_type),
+                    _enum_value(target.place_kind),
+                    hierarchy.effective_biome(target_id),
+                )
+                time_factors = [_weight(route.travel_time)]
+                cost_factors = [_weight(route.travel_cost)]
+                if tuning:
+                    time_factors += [tuning["time"], tuning["safe_zone"] if target.is_safe_zone else 1.0]
+                    cost_factors.append(tuning["cost"])
+                if None in time_factors or None in cost_factors:
+                    skipped.add(route.id)
+                    continue
+                time, cost = math.prod(time_factors), math.prod(cost_factors)
+                if not (math.isfinite(time) and math.isfinite(cost)):
+                    skipped.add(route.id)
+                    continue
+                legs.append((self.index[source_id], self.index[target_id], {
+                    "route_id": route.id,
+                    "from": source_id,
+                    "to": target_id,
+                    "travel_time": time,
+                    "travel_cost": cost,
+                    "fatigue": tuning["fatigue"] if tuning else 0.0,
+                    "risk": tuning["risk"] if tuning else 0.0,
+                    "tuning_id": tuning["id"] if tuning else None,
+                    "is_hidden": bool(route.is_hidden),
+                    "requirements_id": route.requirements_id,
+                }))
+        legs.sort(key=lambda leg: leg[0])
+        self.skipped_route_ids = sorted(skipped)
+
+        self.offsets = array("l", [0] * (len(self.location_ids) + 1))
+        for source, _target, _leg in legs:
+            self.offsets[source + 1] += 1
+        for position in range(len(self.location_ids)):
+            self.offsets[position + 1] += self.offsets[position]
+        self.targets = array("l", (target for _source, target, _leg in legs))
+        self.sources = array("l", (source for source, _target, _leg in legs))
+        self.legs = [leg for _source, _target, leg in legs]
+        self.weights = {
+            "time": array("d", (leg["travel_time"] for leg in self.legs)),
+            "cost": array("d", (leg["travel_cost"] for leg in self.legs)),
+            "hops": array("d", [1.0] * len(self.legs)),
+        }
+        self._heuristic_scale = {metric: self._scale(metric) for metric in METRICS}
+
+    @staticmethod
+    def _point(coordinates):
+        if not isinstance(coordinates, dict):
+            return None
+        x, y = coordinates.get("x"), coordinates.get("y")
+        if all(isinstance(value, (int, float)) and math.isfinite(value) for value in (x, y)):
+            return (float(x), float(y))
+        return None
+
+    def _distance(self, source, target):
+        first, second = self.coordinates[source], self.coordinates[target]
+        if first is None or second is None:
+            return None
+        return math.hypot(first[0] - second[0], first[1] - second[1])
+
+    def _scale(self, metric):
+        """Largest factor keeping `factor * straight-line distance` a lower bound on leg weight."""
+        if any(point is None for point in self.coordinates):
+            return 0.0
+        scale = math.inf
+        weights = self.weights[metric]
+        for edge, weight in enumerate(weights):
+            distance = self._distance(self.sources[edge], self.targets[edge])
+            if distance:
+                scale = min(scale, weight / distance)
+        return 0.0 if math.isinf(scale) else max(scale, 0.0)
+
+    def edge_mask(self, include_hidden=True, requirement_mode="ignore", flags=(), reputation=None):
+        """Per-leg passability for a query, or None when every leg passes."""
+        if include_hidden and requirement_mode == "ignore":
+            return None
+        flags = set(flags)
+        reputation = reputation or {}
+        passes = {}
+        mask = bytearray(len(self.legs))
+        for edge, leg in enumerate(self.legs):
+            if leg["is_hidden"] and not include_hidden:
+                continue
+            requirement_id = leg["requirements_id"]
+            if requirement_id and requirement_mode != "ignore":
+                if requirement_mode == "exclude":
+                    continue
+                if requirement_id not in passes:
+                    passes[requirement_id] = self._requirement_passes(requirement_id, flags, reputation)
+                if not passes[requirement_id]:
+                    continue
+            mask[edge] = 1
+        return mask
+
+    def _requirement_passes(self, requirement_id, flags, reputation):
+        requirement = self.requirements.get(requirement_id)
+        if requirement is None:
+            return False
+        required, forbidden, minimums = requirement
+        return (
+            required <= flags
+            and not forbidden & flags
+            and all(reputation.get(faction_id, 0.0) >= value for faction_id, value in minimums)
+        )
+
+    def search(self, source, target, metric, mask=None, blocked_edges=(), blocked_nodes=()):
+        """A* from `source` to `target`; returns `(distance, edge list)` or None."""
+        weights = self.weights[metric]
+        scale = self._heuristic_scale[metric]
+
+        def heuristic(node):
+            if not scale:
+                return 0.0
+            return scale * (self._distance(node, target) or 0.0)
+
+        best = {source: 0.0}
+        via = {}
+        queue = [(heuristic(source), 0.0, source)]
+        closed = set()
+        while queue:
+            _estimate, distance, node = heapq.heappop(queue)
+            if node in closed:
+                continue
+            if node == target:
+                path = []
+                while node != source:
+                    edge = via[node]
+                    path.append(edge)
+                    node = self.sources[edge]
+                return distance, path[::-1]
+            closed.add(node)
+            for edge in range(self.offsets[node], self.offsets[node + 1]):
+                if (mask is not None and not mask[edge]) or edge in blocked_edges:
+                    continue
+                neighbor = self.targets[edge]
+                if neighbor in closed or neighbor in blocked_nodes:
+                    continue
+                candidate = distance + weights[edge]
+                if candidate < best.get(neighbor, math.inf):
+                    best[neighbor] = candidate
+                    via[neighbor] = edge
+                    heapq.heappush(queue, (candidate + heuristic(neighbor), candidate, neighbor))
+        return None
+
+    def distances_from(self, source, metric, mask=None, budget=None):
+        """Dijkstra distances from `source` by node position, optionally cut off above `budget`."""
+        weights = self.weights[metric]
+        best = {source: 0.0}
+        queue = [(0.0, source)]
+        settled = {}
+        while queue:
+            distance, node = heapq.heappop(queue)
+            if node in settled:
+                continue
+            settled[node] = distance
+            for edge in range(self.offsets[node], self.offsets[node + 1]):
+                if mask is not None and not mask[edge]:
+                    continue
+                neighbor = self.targets[edge]
+                candidate = distance + weights[edge]
+                if budget is not None and candidate > budget:
+                    continue
+                if neighbor not in settled and candidate < best.get(neighbor, math.inf):
+                    best[neighbor] = candidate
+                    heapq.heappush(queue, (candidate, neighbor))
+        return settled
+
+    def describe(self, source, edges, distance):
+        legs = [self.legs[edge] for edge in edges]
+        return {
+            "location_ids": [self.location_ids[source], *(leg["to"] for leg in legs)],
+            "route_ids": [leg["route_id"] for leg in legs],
+            "legs": [
+                {key: leg[key] for key in ("route_id", "from", "to", "travel_time", "travel_cost", "tuning_id")}
+                for leg in legs
+            ],
+            "distance": distance,
+            "travel_time": sum(leg["travel_time"] for leg in legs),
+            "travel_cost": sum(leg["travel_cost"] for leg in legs),
+            "hops": len(legs),
+            "fatigue": sum(leg["fatigue"] for leg in legs),
+            "risk": sum(leg["risk"] for leg in legs),
+        }
+
+
+def shortest_paths(graph, source_id, target_id, metric="time", k=1, mask=None):
+    """Up to `k` loopless paths in increasing `metric` order (Yen's algorithm)."""
+    source, target = graph.index[source_id], graph.index[target_id]
+    first = graph.search(source, target, metric, mask)
+    if first is None:
+        return []
+    weights = graph.weights[metric]
+    found = [first]
+    candidates = []
+    seen = {tuple(first[1])}
+    while len(found) < k:
+        _distance, previous = found[-1]
+        nodes = [source, *(graph.targets[edge] for edge in previous)]
+        for spur_index in range(len(previous)):
+            root = previous[:spur_index]
+            blocked_edges = {
+                edges[spur_index]
+                for _distance, edges in found
+                if len(edges) > spur_index and edges[:spur_index] == root
+            }
+            spur = graph.search(
+                nodes[spur_index], target, metric, mask,
+                blocked_edges=blocked_edges, blocked_nodes=set(nodes[:spur_index]),
+            )
+            if spur is None:
+                continue
+            edges = root + spur[1]
+            if tuple(edges) in seen:
+                continue
+            seen.add(tuple(edges))
+            heapq.heappush(candidates, (sum(weights[edge] for edge in root) + spur[0], edges))
+        if not candidates:
+            break
+        found.append(heapq.heappop(candidates))
+    return [graph.describe(source, edges, distance) for distance, edges in found]
+
+
+def reachable_from(graph, source_id, metric="time", mask=None, budget=None):
+    """`{location_id: distance}` for every location reachable from `source_id`, nearest first."""
+    settled = graph.distances_from(graph.index[source_id], metric, mask, budget)
+    return {graph.location_ids[node]: distance for node, distance in sorted(settled.items(), key=lambda pair: (pair[1], pair[0]))}
+
+
+def distance_matrix(graph, location_ids, metric="time", mask=None):
+    """Row per source: distance to each of `location_ids`, None where unreachable."""
+    positions = [graph.index[location_id] for location_id in location_ids]
+    matrix = []
+    for source in positions:
+        settled = graph.distances_from(source, metric, mask)
+        matrix.append([settled.get(target) for target in positions])
+    return matrix
+
+
+def _requirement_rows(db_session):
+    requirements = {}
+    query = db_session.query(Requirement).options(
+        selectinload(Requirement.required_flags),
+        selectinload(Requirement.forbidden_flags),
+        selectinload(Requirement.min_faction_reputation),
+    )
+    for requirement in query.all():
+        requirements[requirement.id] = (
+            {row.flag_id for row in requirement.required_flags},
+            {row.flag_id for row in requirement.forbidden_flags},
+            [(row.faction_id, row.min_value) for row in requirement.min_faction_reputation],
+        )
+    return requirements
+
+
+# engine -> (content version, compiled graph).
+_graphs = change_tracking.EngineStates()
+
+
+def _compile(db_session):
+    return RouteGraph(
+        db_session.query(Location).all(),
+        db_session.query(LocationRoute).all(),
+        db_session.query(TravelTuning).all(),
+        _requirement_rows(db_session),
+        location_hierarchy(db_session),
+    )
+
+
+def route_graph(db_session) -> RouteGraph:
+    """Compiled graph for the session; shared per engine and graph version unless the session has pending changes."""
+    if set(GRAPH_TABLES) & change_tracking.uncommitted_changes(db_session).touched_tables():
+        return _compile(db_session)
+    engine = db_session.get_bind()
+    version = change_tracking.content_version(engine, GRAPH_TABLES)
+    cached = _graphs.get(engine)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    graph = _compile(db_session)
+    _graphs.set(engine, (version, graph))
+    return graph
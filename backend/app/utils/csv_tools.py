@@ -2,15 +2,16 @@ import csv
 import enum
 import io
 import json
-import os
 import re
 import unicodedata
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
+from sqlalchemy import select
 from sqlalchemy.types import Enum as SAEnum
 from sqlalchemy.orm import object_session
 
 from backend.app.routes.base_route import ROUTE_REGISTRY
+from backend.app.schemas import get_schema, get_schema_entry
 from backend.app.utils.dragon_era import parse_dragon_era_year
 
 UE_ROW_KEY_HEADER = "Name"
@@ -52,34 +53,36 @@ AUTHORING_ONLY_TABLES = {
 }
 
 
-def _schema_path(table_name: str) -> str:
-    return os.path.join(os.path.dirname(__file__), "..", "schemas", f"{table_name}.json")
-
-
 def load_schema(table_name: str) -> Optional[Dict[str, Any]]:
-    path = _schema_path(table_name)
-    if not os.path.exists(path):
-        return None
-    try:
-        with open(path, "r", encoding="utf-8-sig") as f:
-            return json.load(f)
-    except Exception:
-        return None
+    return get_schema(table_name)
 
 
 def load_schema_columns(table_name: str) -> List[str]:
-    schema = load_schema(table_name)
-    if not schema:
-        return []
-    props = schema.get("properties", {})
-    if isinstance(props, dict):
-        return list(props.keys())
-    return []
+    entry = get_schema_entry(table_name)
+    return list(entry["columns"]) if entry else []
+
+
+PRELOAD_CHUNK_SIZE = 500
+
+
+def _preload_relationships(route: Any, model_class: Any, rows: List[Any]) -> None:
+    """Populate the route's eager-load plan on already loaded rows in a few batched queries."""
+    options = route.eager_load_options()
+    session = object_session(rows[0]) if rows else None
+    if not options or session is None:
+        return
+    primary_key = model_class.__mapper__.primary_key[0]
+    ids = [getattr(row, primary_key.key) for row in rows]
+    for start in range(0, len(ids), PRELOAD_CHUNK_SIZE):
+        chunk = ids[start:start + PRELOAD_CHUNK_SIZE]
+        session.query(model_class).options(*options).filter(primary_key.in_(chunk)).all()
 
 
 def serialize_items_for_table(table_name: str, model_class: Any, rows: Iterable[Any]) -> List[Dict[str, Any]]:
     route = ROUTE_REGISTRY.get(table_name)
     if route:
+        rows = list(rows)
+        _preload_relationships(route, model_class, rows)
         serializer = getattr(route, "serialize_item", None) or route.serialize_model
         return [serializer(row) for row in rows]
     # Fallback: raw column data
@@ -351,13 +354,13 @@ def _make_unique_row_key(base_key: str, used: set) -> str:
     return candidate
 
 
-def _assign_row_keys(table_name: str, items: List[Dict[str, Any]], sync_slug: bool) -> None:
+def _assign_row_keys(table_name: str, items: List[Dict[str, Any]], sync_slug: bool, used: Optional[set] = None) -> None:
     """Row key rules for UE DataTables:
     - derive from slug/slugName/name/title/id (in that priority)
     - trim + deterministic slug normalization
-    - enforce uniqueness with _2, _3, ... suffixes
+    - enforce uniqueness with _2, _3, ... suffixes (across batches when `used` is shared)
     """
-    used: set = set()
+    used = set() if used is None else used
     for item in items:
         key_parts = _pick_row_key_parts(table_name, item, has_slug_column=sync_slug)
         base_key = _compose_row_key(key_parts)
@@ -459,38 +462,133 @@ def _serialize_ue_property_text(value: Any) -> str:
     return _serialize_ue_property_scalar(value)
 
 
-def build_csv_rows(
-    table_name: str,
-    model_class: Any,
-    rows: Iterable[Any],
-    mode: CSVExportMode = "ue",
-) -> Tuple[List[str], List[List[Any]]]:
-    if mode not in ("ue", "source"):
-        raise ValueError(f"Unsupported CSV export mode: {mode}")
+def _serialize_export_batch(table_name: str, model_class: Any, rows_list: List[Any]) -> List[Dict[str, Any]]:
+    return [dict(item) for item in serialize_items_for_table(table_name, model_class, rows_list)]
 
-    rows_list = list(rows)
-    items = serialize_items_for_table(table_name, model_class, rows_list)
-    items = [dict(item) for item in items]
 
+def _header_keys(items: List[Dict[str, Any]], sync_slug: bool) -> Dict[str, None]:
+    """Keys a batch contributes to the header, in first-seen order, before row keys and exclusions apply.
+
+    Serializers only emit some keys (a loaded relationship, say) for some rows.
+    The row key column is always in the header and UE exclusions are applied to
+    the header itself, so only a synced `slug` needs adding here.
+    """
+    keys: Dict[str, None] = {}
+    for item in items:
+        keys.update(dict.fromkeys(item))
+    if sync_slug:
+        keys.setdefault("slug")
+    return keys
+
+
+def _prepare_export_items(
+    table_name: str,
+    model_class: Any,
+    rows_list: List[Any],
+    items: List[Dict[str, Any]],
+    mode: CSVExportMode,
+    sync_slug: bool,
+    used_row_keys: set,
+) -> None:
     if mode == "ue":
         ref_slug_lookups = _build_reference_slug_lookups(model_class, rows_list, items)
         transient_aliases = _inject_reference_slug_aliases(items, ref_slug_lookups)
         _normalize_enum_columns(model_class, items)
-        _assign_row_keys(table_name, items, sync_slug=_model_has_column(model_class, "slug"))
+        _assign_row_keys(table_name, items, sync_slug=sync_slug, used=used_row_keys)
         _strip_transient_alias_fields(items, transient_aliases)
         _drop_excluded_columns_from_items(table_name, items)
     else:
-        _assign_row_keys(table_name, items, sync_slug=False)
+        _assign_row_keys(table_name, items, sync_slug=False, used=used_row_keys)
+
+
+def iter_csv_rows(
+    table_name: str,
+    model_class: Any,
+    read_batches: Callable[[], Iterable[Iterable[Any]]],
+    mode: CSVExportMode = "ue",
+) -> Iterator[List[Any]]:
+    """Yield the header row, then data rows, serializing one batch of model rows at a time.
+
+    `read_batches()` is called twice. The first pass only serializes each batch
+    to collect its keys, so the header is the table schema plus every key of
+    every row, exactly as for a single batch. The second pass re-reads the
+    table and yields rows as each batch is serialized. Row keys stay unique
+    across batches, and at most one batch of model rows is held at a time.
+    """
+    if mode not in ("ue", "source"):
+        raise ValueError(f"Unsupported CSV export mode: {mode}")
+
+    serializer = _serialize_cell if mode == "ue" else _serialize_source_cell
+    sync_slug = mode == "ue" and _model_has_column(model_class, "slug")
+    seen_keys: Dict[str, None] = {}
+    for batch in read_batches():
+        seen_keys.update(_header_keys(_serialize_export_batch(table_name, model_class, list(batch)), sync_slug))
+    columns = _resolve_export_columns(table_name, model_class, [seen_keys], mode)
+    yield columns
+
+    used_row_keys: set = set()
+    for batch in read_batches():
+        rows_list = list(batch)
+        items = _serialize_export_batch(table_name, model_class, rows_list)
+        _prepare_export_items(table_name, model_class, rows_list, items, mode, sync_slug, used_row_keys)
+        for item in items:
+            yield [serializer(item.get(col)) for col in columns]
+
 
+def _resolve_export_columns(table_name: str, model_class: Any, items: List[Dict[str, Any]], mode: CSVExportMode) -> List[str]:
     columns = resolve_columns(table_name, model_class, items)
     if mode == "ue":
         columns = _drop_excluded_columns_from_header(table_name, columns)
+    return columns
+
+
+def build_csv_rows(
+    table_name: str,
+    model_class: Any,
+    rows: Iterable[Any],
+    mode: CSVExportMode = "ue",
+) -> Tuple[List[str], List[List[Any]]]:
+    if mode not in ("ue", "source"):
+        raise ValueError(f"Unsupported CSV export mode: {mode}")
+
+    serializer = _serialize_cell if mode == "ue" else _serialize_source_cell
+    sync_slug = mode == "ue" and _model_has_column(model_class, "slug")
+    rows_list = list(rows)
+    items = _serialize_export_batch(table_name, model_class, rows_list)
+    header_keys = _header_keys(items, sync_slug)
+    _prepare_export_items(table_name, model_class, rows_list, items, mode, sync_slug, set())
+    columns = _resolve_export_columns(table_name, model_class, [header_keys], mode)
+    return columns, [[serializer(item.get(col)) for col in columns] for item in items]
 
-    data_rows: List[List[Any]] = []
-    for item in items:
-        serializer = _serialize_cell if mode == "ue" else _serialize_source_cell
-        data_rows.append([serializer(item.get(col)) for col in columns])
-    return columns, data_rows
+
+EXPORT_BATCH_SIZE = 500
+
+
+def iter_model_batches(session: Any, model_class: Any, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[List[Any]]:
+    """Read every row of `model_class` in batches, in the same order as `query(model_class).all()`.
+
+    The session's identity map only holds rows weakly, so once the caller drops
+    a batch only the next one (plus its preloaded relationships) stays in memory.
+    """
+    result = session.execute(select(model_class).execution_options(yield_per=batch_size))
+    yield from result.scalars().partitions()
+
+
+def iter_csv_text(rows: Iterable[List[Any]], flush_rows: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """Encode CSV rows as text chunks of at most `flush_rows` rows, formatted like `csv.writer`."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= flush_rows:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+            pending = 0
+    if pending:
+        yield output.getvalue()
 
 
 def write_csv_string(columns: List[str], data_rows: List[List[Any]]) -> str:
@@ -502,6 +600,33 @@ def write_csv_string(columns: List[str], data_rows: List[List[Any]]) -> str:
     return output.read()
 
 
+def slugify_text(value: str) -> str:
+    if not value:
+        return ""
+    value = value.strip().lower()
+    value = re.sub(r"[\u0300-\u036f]", "", value)
+    value = re.sub(r"[^a-z0-9]+", "-", value)
+    value = re.sub(r"^-+|-+$", "", value)
+    value = re.sub(r"-{2,}", "-", value)
+    return value
+
+
+def apply_import_row_key(model_class: Any, clean_row: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold the UE row-key column into `slug` and normalize slugs for slugged tables."""
+    row_key_value = clean_row.get(UE_ROW_KEY_HEADER)
+    if row_key_value is not None and str(row_key_value).strip() != "":
+        if not clean_row.get("slug"):
+            clean_row["slug"] = str(row_key_value).strip().lower()
+    clean_row.pop(UE_ROW_KEY_HEADER, None)
+    if hasattr(model_class, "__table__") and "slug" in model_class.__table__.columns:
+        if not clean_row.get("slug"):
+            base = clean_row.get("name") or clean_row.get("title") or clean_row.get("id")
+            clean_row["slug"] = slugify_text(str(base))
+        else:
+            clean_row["slug"] = str(clean_row.get("slug") or "").strip().lower()
+    return clean_row
+
+
 def _parse_json_value(raw: str) -> Optional[Any]:
     try:
         return json.loads(raw)
@@ -520,64 +645,138 @@ def _coerce_primitive(raw: str) -> Any:
     return raw
 
 
-def coerce_row_from_schema(table_name: str, row: Dict[str, str], strict_json: bool = False) -> Dict[str, Any]:
-    schema = load_schema(table_name) or {}
-    properties = schema.get("properties", {}) if isinstance(schema.get("properties"), dict) else {}
-    coerced: Dict[str, Any] = {}
-    for key, raw_value in row.items():
-        if key is None:
-            continue
-        value = raw_value if raw_value is not None else ""
-        value = value.strip()
-        if value == "":
-            coerced[key] = None
-            continue
-        field_schema = properties.get(key) if isinstance(properties, dict) else None
-        if isinstance(field_schema, dict):
-            field_type = field_schema.get("type")
-            if field_type == "array":
-                parsed = _parse_json_value(value)
-                if isinstance(parsed, list):
-                    coerced[key] = parsed
-                elif strict_json:
-                    raise ValueError(f"Field '{key}' must be a JSON array.")
-                else:
-                    coerced[key] = [v.strip() for v in value.split(",") if v.strip()]
-                continue
-            if field_type == "object":
-                parsed = _parse_json_value(value)
-                if isinstance(parsed, dict):
-                    coerced[key] = parsed
-                elif strict_json:
-                    raise ValueError(f"Field '{key}' must be a JSON object.")
-                else:
-                    coerced[key] = parsed if parsed is not None else _coerce_primitive(value)
-                continue
-            if field_type == "integer":
-                field_ui = field_schema.get("ui") if isinstance(field_schema.get("ui"), dict) else {}
-                if field_ui.get("number_format") == "dragon_era_year":
-                    try:
-                        coerced[key] = parse_dragon_era_year(value)
-                    except Exception:
-                        coerced[key] = _coerce_primitive(value)
-                    continue
-                try:
-                    coerced[key] = int(value)
-                except Exception:
-                    coerced[key] = _coerce_primitive(value)
-                continue
-            if field_type == "number":
-                try:
-                    coerced[key] = float(value)
-                except Exception:
-                    coerced[key] = _coerce_primitive(value)
-                continue
-            if field_type == "boolean":
-                coerced[key] = _coerce_primitive(value)
-                continue
+def _json_array_converter(key: str, strict_json: bool) -> Callable[[str], Any]:
+    def convert(value: str) -> Any:
+        parsed = _parse_json_value(value) if value[0] == "[" else None
+        if isinstance(parsed, list):
+            return parsed
+        if strict_json:
+            raise ValueError(f"Field '{key}' must be a JSON array.")
+        return [v.strip() for v in value.split(",") if v.strip()]
+    return convert
+
+
+def _json_object_converter(key: str, strict_json: bool) -> Callable[[str], Any]:
+    def convert(value: str) -> Any:
+        if strict_json:
+            parsed = _parse_json_value(value) if value[0] == "{" else None
+            if isinstance(parsed, dict):
+                return parsed
+            raise ValueError(f"Field '{key}' must be a JSON object.")
+        parsed = _parse_json_value(value)
+        return parsed if parsed is not None else _coerce_primitive(value)
+    return convert
+
+
+def _dragon_era_converter(value: str) -> Any:
+    try:
+        return parse_dragon_era_year(value)
+    except Exception:
+        return _coerce_primitive(value)
+
+
+def _integer_converter(value: str) -> Any:
+    try:
+        return int(value)
+    except Exception:
+        return _coerce_primitive(value)
+
+
+def _number_converter(value: str) -> Any:
+    try:
+        return float(value)
+    except Exception:
+        return _coerce_primitive(value)
+
+
+def _untyped_converter(value: str) -> Any:
+    # Only a leading bracket can produce a JSON container; skip the parse otherwise.
+    if value[0] in "[{":
         parsed = _parse_json_value(value)
         if isinstance(parsed, (list, dict)):
-            coerced[key] = parsed
-        else:
-            coerced[key] = _coerce_primitive(value)
-    return coerced
+            return parsed
+    return _coerce_primitive(value)
+
+
+def _field_converter(key: str, field_type: Any, number_format: Optional[str], strict_json: bool) -> Callable[[str], Any]:
+    if field_type == "array":
+        return _json_array_converter(key, strict_json)
+    if field_type == "object":
+        return _json_object_converter(key, strict_json)
+    if field_type == "integer":
+        return _dragon_era_converter if number_format == "dragon_era_year" else _integer_converter
+    if field_type == "number":
+        return _number_converter
+    if field_type == "boolean":
+        return _coerce_primitive
+    return _untyped_converter
+
+
+_coercer_cache: Dict[Tuple[str, bool], Tuple[Any, Dict[str, Callable[[str], Any]]]] = {}
+
+
+def _table_converters(table_name: str, strict_json: bool) -> Dict[str, Callable[[str], Any]]:
+    """Per-field converters for a table, rebuilt only when its schema registry entry changes."""
+    entry = get_schema_entry(table_name)
+    cache_key = (table_name, bool(strict_json))
+    cached = _coercer_cache.get(cache_key)
+    if cached is not None and cached[0] is entry:
+        return cached[1]
+    converters: Dict[str, Callable[[str], Any]] = {}
+    if entry:
+        for key, field_type in entry["types"].items():
+            converters[key] = _field_converter(key, field_type, entry["number_formats"].get(key), strict_json)
+    _coercer_cache[cache_key] = (entry, converters)
+    return converters
+
+
+def compile_row_coercer(
+    table_name: str,
+    fieldnames: Iterable[Optional[str]],
+    strict_json: bool = False,
+) -> Callable[[Dict[str, Optional[str]]], Dict[str, Any]]:
+    """Build a row coercer for a fixed CSV header.
+
+    The header is resolved once into a tuple of (column, converter) pairs so each
+    row only strips cells and calls the converter chosen for its column.
+    """
+    converters = _table_converters(table_name, strict_json)
+    columns = tuple(
+        (key, converters.get(key, _untyped_converter))
+        for key in dict.fromkeys(fieldnames)
+        if key is not None
+    )
+
+    def coerce(row: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        coerced: Dict[str, Any] = {}
+        for key, convert in columns:
+            value = row.get(key)
+            value = value.strip() if value is not None else ""
+            coerced[key] = convert(value) if value else None
+        return coerced
+
+    return coerce
+
+
+def coerce_csv_rows(
+    table_name: str,
+    reader: "csv.DictReader",
+    strict_json: bool = False,
+    start: int = 2,
+) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[Exception]]]:
+    """Coerce a whole `csv.DictReader` stream with one compiled coercer.
+
+    Yields `(row_number, row, error)` so callers can report per-row failures
+    without aborting the rest of the file.
+    """
+    fieldnames = [name for name in reader.fieldnames or [] if name]
+    coerce = compile_row_coercer(table_name, fieldnames, strict_json=strict_json)
+    for row_number, raw_row in enumerate(reader, start=start):
+        try:
+            yield row_number, coerce(raw_row), None
+        except Exception as exc:
+            yield row_number, None, exc
+
+
+def coerce_row_from_schema(table_name: str, row: Dict[str, str], strict_json: bool = False) -> Dict[str, Any]:
+    return compile_row_coercer(table_name, row.keys(), strict_json=strict_json)(row)
@@ -0,0 +1,45 @@
+import io
+import zipfile
+from typing import Iterable, Iterator, List, Tuple, Union
+
+
+class _ZipSink(io.RawIOBase):
+    """Write-only, non-seekable target that hands written bytes back to the caller.
+
+    `zipfile` detects the missing `tell()`/`seek()` and writes each member with a
+    trailing data descriptor instead of patching its local header afterwards.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> Iterator[bytes]:
+        if self._chunks:
+            chunk = b"".join(self._chunks)
+            self._chunks.clear()
+            yield chunk
+
+
+def stream_zip(entries: Iterable[Tuple[str, Iterable[Union[str, bytes]]]]) -> Iterator[bytes]:
+    """Yield a deflated ZIP archive piece by piece as each member's content is produced.
+
+    `entries` yields `(member_name, chunks)`; text chunks are encoded as UTF-8.
+    Nothing is buffered beyond the compressor's window and the pending output.
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in entries:
+            with archive.open(name, "w", force_zip64=True) as member:
+                for chunk in chunks:
+                    member.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+    yield from sink.drain()
@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+
+@contextmanager
+def _count_queries(engine):
+    statements = []
+
+    def record(_connection, _cursor, statement, _parameters, _context, _executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def count_queries():
+    """Context manager collecting the SQL statements an engine executes inside the block.
+
+    Usage: `with count_queries(engine) as statements: ...` then assert on `len(statements)`.
+    """
+    return _count_queries
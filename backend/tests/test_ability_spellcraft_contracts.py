@@ -15,6 +15,7 @@ from backend.app.models.m_stats import Stat, StatCategory, ValueType
 from backend.app.models.m_statuses import Status, StatusCategory
 from backend.app.models.m_talent_trees import TalentNode, TalentNodeType, TalentTree
 from backend.app.routes import r_ui_abilities
+from backend.app.services.json_references import rebuild_json_references, references_to
 
 
 def _client(monkeypatch):
@@ -301,3 +302,26 @@ def test_bundle_saves_timed_links_advanced_status_and_relation(monkeypatch):
     assert payload["ability"]["effect_links"][0]["turn_offset"] == 1.5
     assert payload["relations"][0]["relation_type"] == "Setup"
     assert payload["linked_statuses"][0]["reapplication_policy"] == "AddIndependentStack"
+
+
+def test_json_reference_index_follows_committed_and_pending_owner_changes(monkeypatch, count_queries):
+    client, Session = _client(monkeypatch)
+    _seed(Session)
+    session = Session()
+    assert [ref["source_id"] for ref in references_to(session, "abilities", "ability-old")] == ["profile-1", "class-1", "node-1"]
+    with count_queries(Session.kw["bind"]) as statements:
+        references_to(session, "abilities", "ability-old", source_table="talent_nodes")
+    assert statements == []
+
+    session.get(CharacterClass, "class-1").starting_abilities = []
+    session.add(Item(id="item-2", slug="staff", name="Staff", type=ItemType.Weapon, base_price=1, effects=["effect-shared"], tags=[]))
+    session.flush()
+    assert [ref["source_id"] for ref in references_to(session, "abilities", "ability-old")] == ["profile-1", "node-1"]
+    session.commit()
+
+    usage = client.get("/api/ui/abilities/ability-old").get_json()["usage"]
+    assert usage["abilities"]["ability-old"]["characterclasses"] == []
+    assert [row["id"] for row in usage["effects"]["effect-shared"]["items"]] == ["item-1", "item-2"]
+    assert references_to(session, "effects", "effect-shared", path="effects")[1]["path"] == "effects[0]"
+    assert rebuild_json_references(session) == 4
+    session.close()
@@ -920,6 +920,43 @@ def test_lifecycle_warnings_require_item_continuity_context_for_transformation(m
     )
 
 
+
+def test_memoized_timeline_follows_link_notes_and_state_label_edits(monkeypatch):
+    client, Session = _client(monkeypatch)
+    _seed(Session)
+    session = Session()
+    session.add_all([
+        _adventure_beat("item-transformed", "Key Awakens", 2),
+        _adventure_link(
+            "item-link-transformed", "item-transformed", AdventureBeatLinkTargetType.Item, "item-1",
+            AdventureBeatLinkRole.State, AdventureOccurrenceKind.Transition, AdventureChangeType.Transformed,
+        ),
+    ])
+    session.commit()
+    session.close()
+
+    def continuity_warned(warnings):
+        return any(
+            row["code"] == "item_continuity_group_missing" and row["entry_id"] == "item-link-transformed"
+            for row in warnings
+        )
+
+    assert continuity_warned(client.get("/api/ui/adventure-timeline").get_json()["health"]["warnings"])
+    packet = client.get("/api/ui/adventure-timeline").get_json()
+    link = next(row for row in packet["catalogs"]["adventure_beat_links"] if row["id"] == "item-link-transformed")
+    preview = client.post(
+        "/api/ui/adventure-timeline/preview",
+        json={"adventure_beats": [], "adventure_beat_links": [{**link, "state_label": "Awakened"}]},
+    ).get_json()
+    assert not continuity_warned(preview["warnings"])
+
+    session = Session()
+    session.get(AdventureBeatLink, "item-link-transformed").notes = "The key now answers to the old city."
+    session.commit()
+    session.close()
+
+    assert not continuity_warned(client.get("/api/ui/adventure-timeline").get_json()["health"]["warnings"])
+
 def test_lifecycle_warnings_require_quest_start_and_resolution_in_its_arc(monkeypatch):
     client, Session = _client(monkeypatch)
     _seed(Session)
@@ -1549,3 +1586,60 @@ def test_adventure_narrative_tables_export_to_source_but_not_ue(monkeypatch):
     assert "target_type" in link_source.get_data(as_text=True)
     assert client.get("/api/export/ue/csv/adventure_beats").status_code == 400
     assert client.get("/api/export/ue/csv/adventure_beat_links").status_code == 400
+
+
+def test_adventure_timeline_is_memoized_and_preview_matches_full_rebuild(monkeypatch, count_queries):
+    client, Session = _client(monkeypatch)
+    _seed(Session)
+    _seed_track_parity_links(Session)
+    engine = Session.kw["bind"]
+    before = client.get("/api/ui/adventure-timeline").get_json()
+
+    with count_queries(engine) as statements:
+        assert client.get("/api/ui/adventure-timeline").get_json() == before
+    assert statements == []
+
+    payload = {
+        "adventure_beats": [{
+            "id": "adventure-beat-spend",
+            "slug": "spend-city-key",
+            "title": "Spend The City Key",
+            "beat_type": "Payoff",
+            "timeline_id": "timeline-1",
+            "story_arc_id": "arc-1",
+            "sort_order": 1,
+            "required_flags": [],
+            "forbidden_flags": [],
+            "expected_output_flags": [],
+            "tags": [],
+        }],
+        "adventure_beat_links": [{
+            "id": "adventure-link-spend",
+            "adventure_beat_id": "adventure-beat-spend",
+            "target_type": "item",
+            "target_id": "item-1",
+            "role": "state",
+            "occurrence_kind": "requirement",
+            "change_type": "consumed",
+            "importance": "critical",
+            "sort_order": 0,
+            "tags": [],
+        }],
+        "deletions": {"adventure_beat_links": ["adventure-link-faction"]},
+    }
+    preview = client.post("/api/ui/adventure-timeline/preview", json=payload).get_json()
+    assert preview["warnings"] != before["health"]["warnings"]
+    assert client.get("/api/ui/adventure-timeline").get_json() == before
+
+    commit = client.post("/api/ui/adventure-timeline/bundle", json=payload).get_json()
+    after = client.get("/api/ui/adventure-timeline").get_json()
+    assert after == commit["packet"]
+    assert preview["warnings"] == commit["result"]["warnings"] == after["health"]["warnings"]
+    assert not any(warning["code"] == "item_obtained_never_used" for warning in after["health"]["warnings"])
+
+    session = Session()
+    session.get(Location, "location-1").name = "Renamed City"
+    session.commit()
+    session.close()
+    renamed = client.get("/api/ui/adventure-timeline").get_json()
+    assert next(row for row in renamed["catalogs"]["locations"] if row["id"] == "location-1")["name"] == "Renamed City"
@@ -3,6 +3,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from backend.app.db import init_db as db_runtime
 from backend.app.models.base import Base
 from backend.app.models.m_characters import Character
 from backend.app.models.m_combat_profiles import CombatProfile
@@ -21,6 +22,7 @@ from backend.app.models.m_requirements import Requirement, RequirementMinFaction
 from backend.app.models.m_shops import Shop
 from backend.app.models.m_shop_inventory import ShopInventory
 from backend.app.routes import r_ui_dependencies, r_ui_item_ecosystem, r_ui_quests
+from backend.app.services.dependency_index import _elementary_cycles, build_dependency_index, incoming_edges, outgoing_edges
 
 
 def _client(monkeypatch, module):
@@ -285,4 +287,81 @@ def test_dependency_index_adds_inferred_unlocks_and_cycles(monkeypatch):
     session.close()
     payload = client.get("/api/ui/dependencies").get_json()
     assert any(edge["relation"] == "unlocks" and edge["explicit"] is False for edge in payload["edges"])
-    assert payload["health"]["cycles"]
+    assert payload["health"]["cycles"] == [["events:event-1", "events:event-2", "events:event-1"]]
+
+
+def test_dependency_cycles_are_reported_once_per_circuit():
+    adjacency = {"a": {"b", "c"}, "b": {"a", "c"}, "c": {"a", "c"}, "d": {"e"}}
+    assert _elementary_cycles(adjacency) == [
+        ["a", "b", "a"],
+        ["a", "b", "c", "a"],
+        ["a", "c", "a"],
+        ["c", "c"],
+    ]
+    ladder = {f"{side}{step}": {f"a{step + 1}", f"b{step + 1}"} for step in range(40) for side in "ab"}
+    assert _elementary_cycles(ladder) == []
+
+
+def test_dependency_index_lookup_maps_match_edges(monkeypatch):
+    client, Session = _client(monkeypatch, r_ui_dependencies)
+    _seed(Session)
+    session = Session()
+    index = build_dependency_index(session)
+    session.close()
+    assert outgoing_edges(index, "quests:quest-1", {"sets"}) == [
+        edge for edge in index["edges"] if edge["source"] == "quests:quest-1" and edge["relation"] == "sets"
+    ]
+    assert incoming_edges(index, "flag:flag-1") == [edge for edge in index["edges"] if edge["target"] == "flag:flag-1"]
+    assert index.lookup["nodes"]["flag:flag-1"] == 0
+    assert set(client.get("/api/ui/dependencies").get_json()) == {"nodes", "edges", "health"}
+
+
+def test_dependency_index_is_cached_and_follows_committed_changes(monkeypatch, count_queries):
+    client, Session = _client(monkeypatch, r_ui_dependencies)
+    _seed(Session)
+    engine = Session.kw["bind"]
+    session = Session()
+    session.add(Requirement(id="req-1", slug="req", tags=[]))
+    session.commit()
+    assert client.get("/api/ui/dependencies").status_code == 200
+
+    with count_queries(engine) as statements:
+        assert build_dependency_index(session) is build_dependency_index(session)
+    assert statements == []
+
+    session.add(RequirementRequiredFlag(id="req-flag-1", requirement_id="req-1", flag_id="flag-1"))
+    session.get(Quest, "quest-1").flags_set_on_completion = []
+    session.commit()
+    index = build_dependency_index(session)
+    assert any(edge["relation"] == "required_by" and edge["target"] == "requirement:req-1" for edge in index["edges"])
+    assert not any(edge["relation"] == "sets" and edge["source"] == "quests:quest-1" for edge in index["edges"])
+
+    session.delete(session.get(Requirement, "req-1"))
+    session.commit()
+    cached = build_dependency_index(session)
+    assert not any(node["id"] == "requirement:req-1" for node in cached["nodes"])
+
+    session.get(Quest, "quest-1").flags_set_on_completion = ["flag-1"]
+    session.flush()
+    uncommitted = build_dependency_index(session)
+    assert uncommitted is not cached
+    assert any(edge["relation"] == "sets" and edge["source"] == "quests:quest-1" for edge in uncommitted["edges"])
+    session.rollback()
+    assert build_dependency_index(session) is cached
+
+    db_runtime.notify_database_change()
+    with count_queries(engine) as statements:
+        build_dependency_index(session)
+    assert statements
+    session.close()
+
+
+def test_item_ecosystem_packet_can_reference_its_catalog_by_version(monkeypatch):
+    client, Session = _client(monkeypatch, r_ui_item_ecosystem)
+    _seed(Session)
+    full = client.get("/api/ui/items/ecosystem/item-1").get_json()
+    referenced = client.get("/api/ui/items/ecosystem/item-1?catalogs=ref").get_json()
+    assert "catalogs" not in referenced
+    assert referenced["catalogs_version"] == full["catalogs_version"]
+    assert referenced["catalogs_url"] == f"/api/ui/catalogs/item_ecosystem?v={full['catalogs_version']}"
+    assert referenced["item"] == full["item"]
@@ -1,3 +1,5 @@
+import csv
+import io
 import json
 
 from backend.app.models.m_abilities_links import AbilityEffectLink
@@ -448,3 +450,97 @@ def test_timeline_csv_coercion_accepts_dragon_era_years():
 
     assert row["start_year"] == -50000
     assert row["end_year"] == 10000
+
+
+def test_batch_csv_coercion_matches_row_coercion_and_reports_row_errors():
+    source = io.StringIO(
+        "Name,id,slug,name,type,base_price,effects,tags,\n"
+        'sword,01A,sword,Sword,Weapon,12,"[""01EFF""]",,extra\n'
+        'bad,01B,bad,Bad,Weapon,1,("01EFF"),,\n'
+        'plain,01C,plain,Plain,Weapon,oops,[],"[""a""]",\n'
+    )
+    results = list(csv_tools.coerce_csv_rows("items", csv.DictReader(source), strict_json=True))
+
+    assert [row_number for row_number, _row, _error in results] == [2, 3, 4]
+    assert results[0][1] == csv_tools.coerce_row_from_schema("items", {
+        "Name": "sword", "id": "01A", "slug": "sword", "name": "Sword", "type": "Weapon",
+        "base_price": "12", "effects": '["01EFF"]', "tags": "",
+    }, strict_json=True)
+    assert results[0][1]["effects"] == ["01EFF"]
+    assert results[0][1]["base_price"] == 12.0
+    assert results[0][1]["tags"] is None
+    assert "" not in results[0][1]
+    assert results[1][1] is None and "effects" in str(results[1][2])
+    assert results[2][1]["base_price"] == "oops"
+    assert results[2][1]["tags"] == ["a"]
+
+
+def test_bulk_zip_export_streams_batches_with_the_same_bytes_as_whole_table_export(monkeypatch):
+    import zipfile
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from backend.app.models.base import Base
+    from backend.app.models.m_flags import Flag
+    from backend.app.routes import r_bulk_export, r_flags  # noqa: F401 - registers the flag serializer
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    for index, slug in enumerate(["ember", "Ember", "ember ", "frost", "frost gate"]):
+        session.add(Flag(id=f"flag-{index}", slug=slug, name=f"Flag {index}", description="d", tags=["a"]))
+    session.commit()
+    session.close()
+    monkeypatch.setattr(r_bulk_export, "get_db_session", lambda: Session())
+    monkeypatch.setattr(
+        r_bulk_export, "iter_model_batches",
+        lambda db_session, model_class: csv_tools.iter_model_batches(db_session, model_class, batch_size=2),
+    )
+    app = Flask(__name__)
+    app.register_blueprint(r_bulk_export.bp)
+
+    for url, mode, first_table in (("/api/export/ue/all-csv-zip", "ue", "flags"), ("/api/source/export/all-csv-zip", "source", "flags")):
+        response = app.test_client().get(url)
+        assert response.status_code == 200
+        assert response.headers.get("Content-Length") is None
+        archive = zipfile.ZipFile(BytesIO(response.get_data()))
+        expected_session = Session()
+        columns, data_rows = csv_tools.build_csv_rows(first_table, Flag, expected_session.query(Flag).all(), mode=mode)
+        expected_session.close()
+        assert archive.read(f"{first_table}.csv").decode("utf-8") == csv_tools.write_csv_string(columns, data_rows)
+        assert ("character_story_beats.csv" in archive.namelist()) == (mode == "source")
+
+    rows = list(csv.reader(io.StringIO(archive.read("flags.csv").decode("utf-8"))))
+    assert len(rows) == 6
+
+
+def test_batched_export_header_includes_keys_first_seen_in_later_batches():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from backend.app.models.base import Base
+    from backend.app.models.m_events import Event, EventType
+    from backend.app.models.m_location_pois import PoiType
+    from backend.app.routes import r_location_pois  # noqa: F401 - registers the POI serializer
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Location(id="loc-1", slug="harbor", name="Harbor"))
+    session.add(Event(id="event-1", slug="storm", title="Storm", type=EventType.Encounter))
+    session.add(LocationPoi(id="poi-1", slug="gate", location_id="loc-1", name="Gate", poi_type=PoiType.Door))
+    session.add(LocationPoi(id="poi-2", slug="shrine", location_id="loc-1", name="Shrine", poi_type=PoiType.Shrine, event_id="event-1"))
+    session.commit()
+
+    for mode in ("ue", "source"):
+        whole = csv_tools.build_csv_rows("location_pois", LocationPoi, session.query(LocationPoi).all(), mode=mode)
+        batched = list(csv_tools.iter_csv_rows(
+            "location_pois", LocationPoi, lambda: csv_tools.iter_model_batches(session, LocationPoi, batch_size=1), mode=mode,
+        ))
+        assert "event" in batched[0]
+        assert (batched[0], batched[1:]) == whole
+    session.close()
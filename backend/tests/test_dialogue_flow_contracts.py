@@ -17,6 +17,8 @@ from backend.app.models.m_encounters import Encounter, EncounterType
 from backend.app.models.m_location_pois import LocationPoi, PoiType
 from backend.app.models.m_requirements import Requirement, RequirementRequiredFlag
 from backend.app.routes import base_route, r_dialogue_nodes, r_ui_dialogues
+from backend.app.services.dialogue_choice_actions import find_dialogue_choice
+from backend.app.services.dialogue_choice_index import action_positions, choice_positions
 
 
 def _client(monkeypatch):
@@ -281,6 +283,83 @@ def test_crud_uses_canonical_choice_requirements_id(monkeypatch):
     assert "Invalid requirements_id" in invalid.get_json()["message"]
 
 
+
+def test_choice_and_action_ids_are_indexed_across_node_writes(monkeypatch):
+    client, Session = _client(monkeypatch)
+    session = Session()
+    session.add_all([
+        Dialogue(**_dialogue()),
+        Character(id="companion-1", slug="companion-1", name="Mara", tags=[]),
+    ])
+    session.commit()
+    session.close()
+    join = {
+        "id": "action-join", "action_type": "join_companion", "target_character_id": "companion-1",
+        "continuation_policy": "continue_dialogue", "sort_order": 0, "runtime_support": "runtime_unverified",
+    }
+    assert client.post("/api/dialogue-nodes", json=_node("node-2")).status_code == 200
+    assert client.post("/api/dialogue-nodes", json=_node("node-1", choices=[
+        {"id": "choice-a", "next_node_id": "node-2"},
+        {"id": "choice-b", "actions": [join]},
+    ])).status_code == 200
+
+    session = Session()
+    node, index, choice = find_dialogue_choice(session, "choice-b")
+    assert (node.id, index, choice["actions"][0]["id"]) == ("node-1", 1, "action-join")
+    assert action_positions(session, "action-join") == [("node-1", 1)]
+    session.close()
+
+    taken_choice = client.post("/api/dialogue-nodes", json=_node("node-3", choices=[{"id": "choice-a", "next_node_id": "node-2"}]))
+    taken_action = client.post("/api/dialogue-nodes", json=_node("node-3", choices=[{"id": "choice-c", "actions": [join]}]))
+    assert "choice id already belongs to another node: choice-a" in taken_choice.get_json()["message"]
+    assert "action id already belongs to another node: action-join" in taken_action.get_json()["message"]
+
+    assert client.post("/api/dialogue-nodes", json=_node("node-1", choices=[{"id": "choice-renamed", "next_node_id": "node-2"}])).status_code == 200
+    session = Session()
+    assert choice_positions(session, "choice-a") == []
+    assert action_positions(session, "action-join") == []
+    assert find_dialogue_choice(session, "choice-renamed")[1] == 0
+
+    session.get(DialogueNode, "node-2").choices = [{"id": "choice-pending", "next_node_id": "node-1"}]
+    assert choice_positions(session, "choice-pending") == [("node-2", 0)]
+    session.rollback()
+    assert choice_positions(session, "choice-pending") == []
+    session.query(DialogueNode).filter(DialogueNode.id == "node-1").delete(synchronize_session=False)
+    session.commit()
+    assert find_dialogue_choice(session, "choice-renamed") is None
+    session.close()
+
+
+def test_table_wide_pending_node_changes_index_the_session_once_per_flush(monkeypatch, count_queries):
+    _, Session = _client(monkeypatch)
+    engine = Session.kw["bind"]
+    session = Session()
+    session.add(Dialogue(**_dialogue()))
+    session.add_all([
+        DialogueNode(**_node(f"node-{number}", choices=[{"id": f"choice-{number}", "actions": [{"id": f"action-{number}"}]}]))
+        for number in range(3)
+    ])
+    session.commit()
+
+    session.query(DialogueNode).update({DialogueNode.speaker: "Narrator"}, synchronize_session=False)
+    assert action_positions(session, "action-1") == [("node-1", 0)]
+    moved = session.get(DialogueNode, "node-0")
+    with count_queries(engine) as statements:
+        assert [action_positions(session, f"action-{number}") for number in range(3)] == [
+            [("node-0", 0)], [("node-1", 0)], [("node-2", 0)],
+        ]
+        moved.choices = [{"id": "choice-0", "actions": [{"id": "action-moved"}]}]
+        assert action_positions(session, "action-moved") == [("node-0", 0)]
+        assert action_positions(session, "action-0") == []
+    assert statements == []
+
+    session.add(DialogueNode(**_node("node-new", choices=[{"id": "choice-new", "actions": [{"id": "action-new"}]}])))
+    session.flush()
+    assert action_positions(session, "action-new") == [("node-new", 0)]
+    session.rollback()
+    assert action_positions(session, "action-new") == []
+    session.close()
+
 def test_bundle_rejects_cross_dialogue_target_and_rolls_back(monkeypatch):
     client, Session = _client(monkeypatch)
     session = Session()
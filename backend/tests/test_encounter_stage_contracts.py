@@ -14,6 +14,7 @@ from backend.app.models.m_items import Item, ItemType
 from backend.app.models.m_location_encounter_tables import LocationEncounterTable
 from backend.app.models.m_locations import Location
 from backend.app.models.m_requirements import Requirement
+from backend.app.models.m_stats import Stat, StatCategory, ValueType
 from backend.app.routes import r_ui_encounters
 
 
@@ -261,3 +262,57 @@ def test_bundle_rejects_duplicate_participants_and_placement_tables(monkeypatch)
         ],
     })
     assert duplicate_tables.status_code == 400
+
+
+def test_catalogs_are_shared_per_table_version_and_served_as_cacheable_resources(monkeypatch, count_queries):
+    from backend.app.routes import r_ui_catalogs
+
+    client, Session = _client(monkeypatch)
+    monkeypatch.setattr(r_ui_catalogs, "get_db_session", lambda: Session())
+    client.application.register_blueprint(r_ui_catalogs.bp)
+    _seed(Session)
+    session = Session()
+    session.add(Encounter(id="enc-gated", slug="gated", name="Gated", encounter_type=EncounterType.Combat,
+                          requirements_id="req-shared", participants=[], rewards={}, tags=[]))
+    session.commit()
+    session.close()
+
+    first = client.get("/api/ui/encounters").get_json()
+    version = first["catalogs_version"]
+    assert version
+    with count_queries(Session.kw["bind"]) as statements:
+        second = client.get("/api/ui/encounters").get_json()
+    assert statements == []
+    assert second == first
+
+    packet = client.get("/api/ui/encounters/enc-gated").get_json()
+    assert packet["catalogs_version"] == version
+    assert "enc-gated" not in {usage["entry_id"] for usage in packet["requirement_usages_by_id"]["req-shared"]}
+    shared_usages = client.get("/api/ui/encounters").get_json()["requirement_usages_by_id"]["req-shared"]
+    assert "enc-gated" in {usage["entry_id"] for usage in shared_usages}
+
+    resource = client.get(f"/api/ui/catalogs/encounters?v={version}")
+    assert resource.status_code == 200
+    assert resource.headers["Cache-Control"] == r_ui_catalogs.IMMUTABLE_CACHE_CONTROL
+    assert resource.get_json()["catalog"]["encounters"] == first["encounters"]
+    assert client.get("/api/ui/catalogs/encounters", headers={"If-None-Match": f'"{version}"'}).status_code == 304
+    listing = client.get("/api/ui/catalogs").get_json()["catalogs"]
+    assert listing["encounters"]["version"] == version
+    assert client.get("/api/ui/catalogs/unknown").status_code == 404
+
+    session = Session()
+    session.add(Item(id="item-2", slug="elixir", name="Elixir", type=ItemType.Consumable, base_price=20))
+    session.commit()
+    session.close()
+    refreshed = client.get("/api/ui/encounters").get_json()
+    assert refreshed["catalogs_version"] != version
+    assert "item-2" in {item["id"] for item in refreshed["items"]}
+    stale = client.get(f"/api/ui/catalogs/encounters?v={version}")
+    assert stale.headers["Cache-Control"] == "no-cache"
+
+    session = Session()
+    session.add(Stat(id="stat-1", slug="might", name="Might", category=StatCategory.Combat, value_type=ValueType.Int))
+    session.commit()
+    session.close()
+    # Stats are not part of the encounter catalog, so the cached build is still current.
+    assert client.get("/api/ui/encounters").get_json()["catalogs_version"] == refreshed["catalogs_version"]
@@ -1,4 +1,6 @@
+import gzip
 import json
+import os
 from pathlib import Path
 
 from flask import Flask, jsonify
@@ -7,13 +9,23 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 import backend.app.models
+from backend.app import schemas
 from backend.app.models.base import Base
+from backend.app.models.m_attribute_stat_link import AttributeStatLink, ScaleType
+from backend.app.models.m_attributes import Attribute, AttrValueType
 from backend.app.models.m_flags import Flag
+from backend.app.models.m_stats import Stat, StatCategory, ValueType
+from backend.app.db import change_tracking
+from backend.app.db import init_db as db_runtime
 from backend.app.db.init_db import _upgrade_sqlite_schema
-from backend.app.routes import base_route, r_flags
+from backend.app.db import search_index, tag_index
+from backend.app.db.references import reference_resolver
+from backend.app.routes import base_route, r_attributes, r_change_events, r_changes, r_flags, r_requirements, r_search, r_tags
 from backend.app.routes.r_content_packs import ContentPackRoute
 from backend.app.routes.r_currencies import CurrencyRoute
 from backend.app.routes.r_shop_inventory import ShopInventoryRoute
+from backend.app.services import change_events
+from backend.app.services.query_plans import query_plan_report
 
 
 SCHEMAS_DIR = Path(__file__).parents[1] / "app" / "schemas"
@@ -108,6 +120,24 @@ def test_sqlite_upgrade_adds_canonical_dialogue_graph_columns():
         assert choices[0]["actions"] == []
 
 
+def test_sqlite_upgrade_adds_declared_indexes_that_hot_queries_use():
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_shops_inventory_item_id")
+        connection.exec_driver_sql("DROP INDEX ix_dialogue_nodes_dialogue_id")
+
+    scanning = query_plan_report(engine)["scanning"]
+    assert {"item_ecosystem.shop_inventory_by_item", "dialogues.node_graph", "foreign_key.shops_inventory.item_id"} <= set(scanning)
+
+    _upgrade_sqlite_schema(engine)
+
+    assert "ix_shops_inventory_item_id" in {index["name"] for index in inspect(engine).get_indexes("shops_inventory")}
+    report = query_plan_report(engine)
+    assert report["scanning"] == []
+    assert any(query["name"] == "foreign_key.events.requirements_id" for query in report["queries"])
+
+
 def _flags_client(monkeypatch):
     engine = create_engine(
         "sqlite://",
@@ -118,6 +148,7 @@ def _flags_client(monkeypatch):
     Base.metadata.create_all(engine)
     Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
     monkeypatch.setattr(base_route, "get_db_session", lambda: Session())
+    monkeypatch.setattr(r_flags, "get_db_session", lambda: Session())
     app = Flask(__name__)
 
     @app.errorhandler(Exception)
@@ -159,3 +190,502 @@ def test_common_persistence_rejects_wrong_json_shape(monkeypatch):
 
     assert response.status_code == 400
     assert "tags must be an array" in response.get_json()["message"]
+
+
+def test_schema_registry_indexes_once_and_reloads_on_mtime_change(monkeypatch, tmp_path):
+    monkeypatch.setattr(schemas, "SCHEMA_DIR", str(tmp_path))
+    schemas.clear_schema_registry()
+    path = tmp_path / "widgets.json"
+    path.write_text(json.dumps({
+        "required": ["id"],
+        "properties": {"id": {"type": "string"}, "year": {"type": "integer", "ui": {"number_format": "dragon_era_year"}}},
+    }), encoding="utf-8")
+
+    entry = schemas.get_schema_entry("widgets")
+    assert entry["required"] == ["id"]
+    assert entry["types"] == {"id": "string", "year": "integer"}
+    assert entry["number_formats"] == {"year": "dragon_era_year"}
+    assert schemas.get_schema_entry("widgets") is entry
+
+    path.write_text(json.dumps({"properties": {"id": {"type": "string"}}}), encoding="utf-8")
+    os.utime(path, (entry["mtime"] + 5, entry["mtime"] + 5))
+    reloaded = schemas.get_schema_entry("widgets")
+    assert reloaded is not entry
+    assert reloaded["columns"] == ["id"]
+    assert schemas.get_schema_entry("missing") is None
+    schemas.clear_schema_registry()
+
+
+def _pragmas(engine, names):
+    with engine.connect() as connection:
+        return {name: connection.exec_driver_sql(f"PRAGMA {name}").scalar_one() for name in names}
+
+
+def test_sqlite_pragma_profiles_apply_per_engine(tmp_path):
+    names = ["foreign_keys", "journal_mode", "synchronous"]
+    live = db_runtime._build_engine(f"sqlite:///{tmp_path / 'live.sqlite'}", "live")
+    bulk = db_runtime._build_engine(f"sqlite:///{tmp_path / 'bulk.sqlite'}", "bulk")
+    unknown = db_runtime._build_engine(f"sqlite:///{tmp_path / 'other.sqlite'}", "turbo")
+
+    assert _pragmas(live, names) == {"foreign_keys": 1, "journal_mode": "wal", "synchronous": 1}
+    assert _pragmas(bulk, names) == {"foreign_keys": 0, "journal_mode": "memory", "synchronous": 0}
+    assert _pragmas(unknown, names) == {"foreign_keys": 1, "journal_mode": "delete", "synchronous": 2}
+    for engine in (live, bulk, unknown):
+        engine.dispose()
+
+
+def test_replace_active_database_drops_stale_wal_sidecars(monkeypatch, tmp_path):
+    monkeypatch.setattr(db_runtime, "DATA_DIR", tmp_path)
+    for name in ("engine", "SessionLocal", "_active_db_uri"):
+        monkeypatch.setattr(db_runtime, name, getattr(db_runtime, name))
+    (tmp_path / "target.sqlite").touch()
+    try:
+        db_runtime.switch_active_database("target")
+        with db_runtime.engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE marker (value TEXT)")
+            connection.exec_driver_sql("INSERT INTO marker VALUES ('old')")
+        staging = tmp_path / "target.staging.sqlite"
+        staging_engine = db_runtime._build_engine(f"sqlite:///{staging}", "bulk")
+        with staging_engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE marker (value TEXT)")
+            connection.exec_driver_sql("INSERT INTO marker VALUES ('new')")
+        staging_engine.dispose()
+        (tmp_path / "target.sqlite-wal").write_bytes(b"stale")
+
+        db_runtime.replace_active_database_file(staging, "target")
+
+        assert not (tmp_path / "target.sqlite-wal").exists()
+        with db_runtime.engine.connect() as connection:
+            assert connection.exec_driver_sql("SELECT value FROM marker").scalar_one() == "new"
+    finally:
+        db_runtime.SessionLocal.remove()
+        db_runtime.engine.dispose()
+
+
+def _seed_flags(client, count):
+    for index in range(count):
+        response = client.post("/api/flags", json={
+            "id": f"flag-{index}",
+            "slug": f"flag-{index}",
+            "name": f"Flag {index}",
+            "description": "Description",
+        })
+        assert response.status_code == 200
+
+
+def test_list_endpoints_page_by_primary_key_and_project_fields(monkeypatch):
+    client, _ = _flags_client(monkeypatch)
+    _seed_flags(client, 5)
+
+    assert len(client.get("/api/flags").get_json()) == 5
+
+    first = client.get("/api/flags?limit=2&fields=name")
+    assert first.get_json() == [{"id": "flag-0", "name": "Flag 0"}, {"id": "flag-1", "name": "Flag 1"}]
+    assert first.headers[base_route.NEXT_CURSOR_HEADER] == "flag-1"
+
+    last = client.get("/api/flags?limit=3&after=flag-1")
+    assert [row["id"] for row in last.get_json()] == ["flag-2", "flag-3", "flag-4"]
+    assert "description" in last.get_json()[0]
+    assert base_route.NEXT_CURSOR_HEADER not in last.headers
+
+    rejected = client.get("/api/flags?fields=name,not_a_column")
+    assert rejected.status_code == 400
+    assert "not_a_column" in rejected.get_json()["message"]
+
+
+def test_list_endpoints_stream_ndjson(monkeypatch):
+    client, _ = _flags_client(monkeypatch)
+    _seed_flags(client, 3)
+
+    response = client.get("/api/flags?format=ndjson&fields=slug&after=flag-0")
+
+    assert response.mimetype == "application/x-ndjson"
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": "flag-1", "slug": "flag-1"},
+        {"id": "flag-2", "slug": "flag-2"},
+    ]
+
+
+def test_ndjson_streams_eager_loaded_relationships_in_keyset_pages(monkeypatch):
+    from backend.app.models.m_requirements import Requirement, RequirementRequiredFlag
+
+    engine = create_engine("sqlite://", future=True, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    monkeypatch.setattr(base_route, "get_db_session", lambda: Session())
+    monkeypatch.setattr(r_requirements, "get_db_session", lambda: Session())
+    monkeypatch.setattr(base_route, "LIST_STREAM_BATCH_SIZE", 2)
+    session = Session()
+    session.add(Flag(id="flag-1", slug="flag-1", name="Flag 1", description="Description"))
+    for index in range(5):
+        session.add(Requirement(
+            id=f"req-{index}",
+            slug=f"req-{index}",
+            required_flags=[RequirementRequiredFlag(id=f"required-{index}", flag_id="flag-1")],
+        ))
+    session.commit()
+    session.close()
+    app = Flask(__name__)
+    app.register_blueprint(r_requirements.bp)
+    client = app.test_client()
+
+    streamed = client.get("/api/requirements?format=ndjson")
+    assert streamed.status_code == 200
+    rows = [json.loads(line) for line in streamed.get_data(as_text=True).splitlines()]
+    assert rows == client.get("/api/requirements").get_json()
+    assert [row["required_flags"] for row in rows] == [["flag-1"]] * 5
+
+    limited = client.get("/api/requirements?format=ndjson&limit=3&after=req-0")
+    assert [json.loads(line)["id"] for line in limited.get_data(as_text=True).splitlines()] == ["req-1", "req-2", "req-3"]
+
+
+def test_engine_states_accumulate_committed_rows_until_refreshed(monkeypatch):
+    client, Session = _flags_client(monkeypatch)
+    engine = Session.kw["bind"]
+    states = change_tracking.EngineStates(dict, change_tracking.stale_entries_for(["flags"]))
+    _seed_flags(client, 1)
+    assert states.get(engine) is None and states.stale(engine) == ({}, set())
+
+    refreshed = []
+    state = states.refreshed(engine, lambda state, rows, tables: refreshed.append((dict(rows), set(tables))))
+    assert refreshed == [({}, set())]
+    _seed_flags(client, 2)
+    session = Session()
+    session.add(Stat(id="stat-1", slug="might", name="Might", category=StatCategory.Attribute, value_type=ValueType.Int))
+    session.commit()
+    session.close()
+    assert states.stale(engine) == ({"flags": {"flag-0", "flag-1"}}, set())
+
+    def failing(state, rows, tables):
+        raise RuntimeError("refresh failed")
+
+    try:
+        states.refreshed(engine, failing)
+    except RuntimeError:
+        pass
+    assert states.stale(engine)[0] == {"flags": {"flag-0", "flag-1"}}
+    assert states.refreshed(engine, lambda state, rows, tables: refreshed.append((dict(rows), set(tables)))) is state
+    assert refreshed[-1] == ({"flags": {"flag-0", "flag-1"}}, set()) and states.stale(engine) == ({}, set())
+
+    db_runtime.notify_database_change()
+    assert states.get(engine) is None
+
+
+def _attributes_client(monkeypatch, attribute_count):
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    session.add(Stat(id="stat-1", slug="strength", name="Strength", category=StatCategory.Attribute, value_type=ValueType.Int))
+    for index in range(attribute_count):
+        attribute = Attribute(id=f"attr-{index}", slug=f"attr-{index}", name=f"Attr {index}", value_type=AttrValueType.Int)
+        attribute.scaling_links = [AttributeStatLink(id=f"link-{index}", stat_id="stat-1", scale=ScaleType.Linear, multiplier=1.0)]
+        session.add(attribute)
+    session.commit()
+    session.close()
+    monkeypatch.setattr(base_route, "get_db_session", lambda: Session())
+    monkeypatch.setattr(r_attributes, "get_db_session", lambda: Session())
+    app = Flask(__name__)
+    app.register_blueprint(r_attributes.bp)
+    return app.test_client(), engine
+
+
+def test_list_and_detail_queries_do_not_grow_with_related_rows(monkeypatch, count_queries):
+    query_counts = []
+    for attribute_count in (2, 20):
+        client, engine = _attributes_client(monkeypatch, attribute_count)
+        with count_queries(engine) as statements:
+            response = client.get("/api/attributes")
+        assert response.status_code == 200
+        assert len(response.get_json()) == attribute_count
+        assert response.get_json()[0]["results_in"] == [{"stat_id": "stat-1", "scale": "Linear", "multiplier": 1.0}]
+        query_counts.append(len(statements))
+
+    assert query_counts[0] == query_counts[1]
+    with count_queries(engine) as statements:
+        assert client.get("/api/attributes/attr-3").status_code == 200
+    assert len(statements) <= len(base_route.ROUTE_REGISTRY["attributes"].eager_load_options()) + 1
+
+
+def test_reference_checks_batch_per_table_and_track_session_deletes(monkeypatch, count_queries):
+    client, Session = _flags_client(monkeypatch)
+    client.application.register_blueprint(r_requirements.bp)
+    session = Session()
+    for index in range(20):
+        session.add(Flag(id=f"flag-{index}", slug=f"flag-{index}", name=f"Flag {index}", description="Flag"))
+    session.commit()
+    session.close()
+    engine = session.get_bind()
+
+    with count_queries(engine) as statements:
+        response = client.post("/api/requirements", json={
+            "id": "req-1",
+            "slug": "req-1",
+            "required_flags": [f"flag-{index}" for index in range(0, 20, 2)],
+            "forbidden_flags": [f"flag-{index}" for index in range(1, 20, 2)],
+        })
+    assert response.status_code == 200
+    assert sum(1 for statement in statements if "FROM flags" in statement) == 1
+
+    response = client.post("/api/requirements", json={
+        "id": "req-2", "slug": "req-2", "required_flags": ["flag-1", "missing-flag"],
+    })
+    assert response.status_code == 400
+    assert "Invalid flag_id: missing-flag" in response.get_json()["message"]
+
+    session = Session()
+    references = reference_resolver(session)
+    assert references.missing(Flag, ["flag-1", "flag-2", "", None, "nope"]) == ["", None, "nope"]
+    session.delete(session.get(Flag, "flag-2"))
+    assert not references.exists(Flag, "flag-2")
+    session.flush()
+    assert references.missing(Flag, ["flag-1", "flag-2"]) == ["flag-2"]
+    session.rollback()
+    assert reference_resolver(session) is not references
+    assert reference_resolver(session).exists(Flag, "flag-2")
+    session.close()
+
+
+def test_full_text_search_index_follows_writes_and_ranks_labels_first(monkeypatch):
+    client, Session = _flags_client(monkeypatch)
+    monkeypatch.setattr(r_search, "get_db_session", lambda: Session())
+    client.application.register_blueprint(r_search.bp)
+    engine = Session().get_bind()
+    flags = [
+        ("flag-ember", "Ember Oath", "Sworn at the forge."),
+        ("flag-ash", "Ash Road", "Opened once the embers of the old watchtower cool."),
+        ("flag-frost", "Frost Gate", "Sealed."),
+    ]
+    for flag_id, name, description in flags:
+        assert client.post("/api/flags", json={"id": flag_id, "slug": flag_id, "name": name, "description": description}).status_code == 200
+
+    # Without an index the list filter keeps its substring match on name/id only.
+    assert [row["id"] for row in client.get("/api/flags?search=mber").get_json()] == ["flag-ember"]
+    assert client.get("/api/search?q=ember").status_code == 503
+
+    assert "flags" in search_index.ensure_search_index(engine)
+    assert [row["id"] for row in client.get("/api/flags?search=emb").get_json()] == ["flag-ember", "flag-ash"]
+    # Id fragments still match by substring alongside the word-prefix index.
+    assert [row["id"] for row in client.get("/api/flags?search=lag-em").get_json()] == ["flag-ember"]
+
+    results = client.get("/api/search?q=emb&tables=flags").get_json()["results"]
+    assert [(hit["table"], hit["id"], hit["label"]) for hit in results] == [
+        ("flags", "flag-ember", "Ember Oath"),
+        ("flags", "flag-ash", "Ash Road"),
+    ]
+    assert "[embers]" in results[1]["snippet"]
+    assert client.get("/api/search?q=emb&tables=nope").status_code == 400
+
+    client.post("/api/flags", json={"id": "flag-ash", "slug": "flag-ash", "name": "Ash Road", "description": "Opened at dawn."})
+    assert client.delete("/api/flags/flag-ember").status_code == 200
+    assert client.get("/api/search?q=emb").get_json()["results"] == []
+    assert [hit["id"] for hit in client.get("/api/search?q=ash dawn").get_json()["results"]] == ["flag-ash"]
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TRIGGER search_flags_ai")
+        connection.exec_driver_sql("INSERT INTO flags (id, slug, name, description) VALUES ('flag-raw', 'flag-raw', 'Frostbite', 'Raw')")
+    search_index.ensure_search_index(engine)
+    assert [hit["id"] for hit in client.get("/api/search?q=fros").get_json()["results"]] == ["flag-frost", "flag-raw"]
+
+
+def test_tag_filters_use_entity_tag_index_and_report_facets(monkeypatch, count_queries):
+    client, Session = _flags_client(monkeypatch)
+    monkeypatch.setattr(r_tags, "get_db_session", lambda: Session())
+    client.application.register_blueprint(r_tags.bp)
+    engine = Session().get_bind()
+    for flag_id, tags in (("flag-a", ["Fire", "quest-main"]), ("flag-b", ["fire", "frost"]), ("flag-c", ["frozen"]), ("flag-d", [])):
+        assert client.post("/api/flags", json={"id": flag_id, "slug": flag_id, "name": flag_id, "description": "d", "tags": tags}).status_code == 200
+
+    cases = {
+        "tags=ire": ["flag-a", "flag-b"],
+        "tags=fr&tag_match=prefix": ["flag-b", "flag-c"],
+        "tags=fire&tag_match=exact": ["flag-a", "flag-b"],
+        "tags=fire,frost&tag_match=exact": ["flag-b"],
+        "tags=quest-main,frozen&tag_match=exact&tag_mode=any": ["flag-a", "flag-c"],
+    }
+
+    def listed(query):
+        return sorted(row["id"] for row in client.get(f"/api/flags?{query}").get_json())
+
+    assert {query: listed(query) for query in cases} == cases
+    assert client.get("/api/flags?tags=fire&tag_match=fuzzy").status_code == 400
+    assert client.get("/api/tags").status_code == 503
+
+    assert "flags" in tag_index.ensure_tag_index(engine)
+    with count_queries(engine) as statements:
+        assert {query: listed(query) for query in cases} == cases
+    assert all("entity_tags" in statement and "json_each" not in statement for statement in statements)
+
+    facets = client.get("/api/tags?tables=flags").get_json()["tags"]
+    assert facets[0] == {"tag": "fire", "count": 2, "tables": {"flags": 2}}
+    assert [facet["tag"] for facet in client.get("/api/tags?prefix=FR").get_json()["tags"]] == ["frost", "frozen"]
+
+    client.post("/api/flags", json={"id": "flag-a", "slug": "flag-a", "name": "flag-a", "description": "d", "tags": ["frost"]})
+    assert client.delete("/api/flags/flag-b").status_code == 200
+    assert client.get("/api/tags?tables=flags").get_json()["tags"] == [
+        {"tag": "frost", "count": 1, "tables": {"flags": 1}},
+        {"tag": "frozen", "count": 1, "tables": {"flags": 1}},
+    ]
+
+
+def _seeded_engine(monkeypatch):
+    """In-memory database loaded with the shipped source CSVs."""
+    from backend.app.config import DATA_DIR
+    from backend.app.services import recovery
+
+    engine = create_engine("sqlite://", future=True, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    parsed_rows = {}
+    assert recovery.preflight_source_csvs(DATA_DIR, parsed_rows)["status"] != "error"
+    monkeypatch.setattr(recovery.db_runtime, "get_engine", lambda: engine)
+    assert recovery.bulk_import_source_rows(parsed_rows, DATA_DIR)["status"] == "success"
+    return engine
+
+
+def _tables_read(statements):
+    import re
+
+    table_names = set(Base.metadata.tables)
+    return {
+        match.group(1)
+        for statement in statements
+        for match in re.finditer(r'\b(?:FROM|JOIN)\s+"?(\w+)"?', statement)
+        if match.group(1) in table_names
+    }
+
+
+def test_workspace_catalogs_declare_every_table_their_builders_read(monkeypatch, count_queries):
+    import backend.app  # noqa: F401 - imports every workspace route, registering its catalog
+    from backend.app.services.catalog_cache import CATALOGS
+
+    engine = _seeded_engine(monkeypatch)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    for name, definition in CATALOGS.items():
+        if definition.tables is None:
+            continue
+        session = Session()
+        with count_queries(engine) as statements:
+            definition.build(session)
+        session.close()
+        read = _tables_read(statements)
+        assert read <= set(definition.tables), (name, sorted(read - set(definition.tables)))
+
+
+def test_list_routes_key_their_etags_on_every_table_they_read(monkeypatch, count_queries):
+    import sys
+
+    import backend.app  # noqa: F401 - imports every resource route
+
+    engine = _seeded_engine(monkeypatch)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    monkeypatch.setattr(base_route, "get_db_session", lambda: Session())
+    app = Flask(__name__)
+
+    routes = {id(route): route for route in base_route.ROUTE_REGISTRY.values()}.values()
+    for route in routes:
+        module = sys.modules[type(route).__module__]
+        if hasattr(module, "get_db_session"):
+            monkeypatch.setattr(module, "get_db_session", lambda: Session())
+        with app.test_request_context(route.route_prefix), count_queries(engine) as statements:
+            assert route.get_all().status_code == 200
+        read = _tables_read(statements)
+        assert read <= set(route.content_tables()), (route.bp.name, sorted(read - set(route.content_tables())))
+
+
+def test_get_endpoints_answer_unchanged_content_with_304_before_querying(monkeypatch, count_queries):
+    from backend.app.routes.http_caching import compress_response
+
+    client, Session = _flags_client(monkeypatch)
+    engine = Session.kw["bind"]
+    monkeypatch.setattr(db_runtime, "get_engine", lambda: engine)
+    client.application.after_request(compress_response)
+    _seed_flags(client, 40)
+
+    first = client.get("/api/flags")
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"') and first.headers["Cache-Control"] == "no-cache"
+    assert "Content-Encoding" not in first.headers
+    with count_queries(engine) as statements:
+        unchanged = client.get("/api/flags", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304 and statements == [] and unchanged.headers["ETag"] == etag
+    assert client.get("/api/flags?limit=2", headers={"If-None-Match": etag}).status_code == 200
+
+    session = Session()
+    session.add(Stat(id="stat-1", slug="might", name="Might", category=StatCategory.Attribute, value_type=ValueType.Int))
+    session.commit()
+    assert client.get("/api/flags", headers={"If-None-Match": etag}).status_code == 304
+    session.get(Flag, "flag-0").name = "Renamed"
+    session.commit()
+    session.close()
+    changed = client.get("/api/flags", headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+    assert changed.headers["Content-Encoding"] == "gzip" and "Accept-Encoding" in changed.headers["Vary"]
+    assert json.loads(gzip.decompress(changed.get_data()))[0]["name"] == "Renamed"
+
+
+def test_change_feed_reports_net_row_deltas_since_a_version(monkeypatch):
+    client, Session = _flags_client(monkeypatch)
+    monkeypatch.setattr(db_runtime, "get_engine", lambda: Session.kw["bind"])
+    client.application.register_blueprint(r_changes.bp)
+
+    start = client.get("/api/changes").get_json()
+    assert start["reset"] is False and start["changes"] == []
+    _seed_flags(client, 2)
+    assert client.post("/api/flags", json={"id": "flag-1", "slug": "flag-1", "name": "Renamed", "description": "D"}).status_code == 200
+    middle = client.get("/api/changes").get_json()["version"]
+    assert client.delete("/api/flags/flag-0").status_code == 200
+
+    feed = client.get(f"/api/changes?since={start['version']}&tables=flags").get_json()
+    assert feed["reset"] is False and feed["version"] > middle
+    assert [(change["id"], change["op"]) for change in feed["changes"]] == [("flag-1", "insert"), ("flag-0", "delete")]
+    assert feed["tables"] == {"flags": feed["version"]}
+    recent = client.get(f"/api/changes?since={middle}").get_json()["changes"]
+    assert [(change["table"], change["id"], change["op"]) for change in recent] == [("flags", "flag-0", "delete")]
+    assert client.get(f"/api/changes?since={feed['version']}").get_json()["changes"] == []
+
+    assert client.get("/api/changes?since=0").get_json()["reset"] is True
+    assert client.get("/api/changes?since=abc").status_code == 400
+    db_runtime.notify_database_change()
+    assert client.get(f"/api/changes?since={feed['version']}").get_json()["reset"] is True
+
+
+def test_event_stream_coalesces_commits_into_one_invalidation_per_table(monkeypatch):
+    client, Session = _flags_client(monkeypatch)
+    monkeypatch.setattr(db_runtime, "get_engine", lambda: Session.kw["bind"])
+    monkeypatch.setattr(change_events, "COALESCE_SECONDS", 0)
+    client.application.register_blueprint(r_change_events.bp)
+
+    response = client.get("/api/events/stream?tables=flags")
+    assert response.mimetype == "text/event-stream"
+    chunks = iter(response.response)
+    assert next(chunks).startswith(b"retry:")
+    start = change_tracking.current_version()
+    _seed_flags(client, 3)
+    session = Session()
+    session.add(Stat(id="stat-1", slug="might", name="Might", category=StatCategory.Attribute, value_type=ValueType.Int))
+    session.commit()
+    session.close()
+
+    message = next(chunks).decode("utf-8").splitlines()
+    assert message[1] == "event: invalidate"
+    data = json.loads(message[2][len("data: "):])
+    assert data["table"] == "flags" and data["rows"] == {"flag-0": "insert", "flag-1": "insert", "flag-2": "insert"}
+    assert message[0] == f"id: {data['version']}"
+    resumed = client.get("/api/events/stream", headers={"Last-Event-ID": str(start)})
+    replay = iter(resumed.response)
+    next(replay)
+    replayed = [json.loads(line[len("data: "):]) for line in next(replay).decode("utf-8").splitlines() if line.startswith("data: ")]
+    assert replayed == [data]
+    resumed.close()
+
+    db_runtime.notify_database_change()
+    assert next(chunks).decode("utf-8").splitlines()[0] == "event: reset"
+    response.close()
+    assert not change_events._subscribers
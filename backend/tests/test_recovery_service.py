@@ -1,9 +1,14 @@
 from pathlib import Path
 
 from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from backend.app.services import recovery
+from backend.app.models.base import Base
+from backend.app.models.m_effects import Effect
 from backend.app.models.m_factions import Faction
+from backend.app.models.m_items import Item
 from backend.app.models.m_requirements import Requirement, RequirementMinFactionReputation
 
 
@@ -194,6 +199,9 @@ def test_export_source_csvs_writes_reported_files(monkeypatch, tmp_path: Path):
         def query(self, _model_class):
             return DummyQuery()
 
+        def get_bind(self):
+            return self
+
         def close(self):
             pass
 
@@ -315,6 +323,23 @@ def test_source_preflight_rejects_disagreeing_reputation_representations(monkeyp
     assert any("missing from requirement_min_faction_reputation CSV" in error["message"] for error in report["errors"])
 
 
+def test_source_preflight_reports_missing_ids_inside_json_arrays(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(recovery, "_model_by_table", lambda: {"items": Item, "effects": Effect})
+    _write_source_csv(tmp_path / "effects_seed.csv", "Name,id,slug,name,type", [])
+    _write_source_csv(
+        tmp_path / "items_seed.csv",
+        "Name,id,slug,name,type,base_price,effects",
+        ['sword,item-1,sword,Sword,Weapon,0,"[""DOES_NOT_EXIST""]"'],
+    )
+
+    report = recovery.preflight_source_csvs(tmp_path)
+
+    assert report["status"] == "error"
+    assert {
+        (error["table"], error["field"], error.get("referenced_id")) for error in report["errors"]
+    } == {("items", "effects[0]", "DOES_NOT_EXIST")}
+
+
 def test_restore_preflight_failure_does_not_reset_database(monkeypatch, tmp_path: Path):
     _limit_preflight_to_reputation_tables(monkeypatch)
     _write_source_csv(
@@ -356,6 +381,7 @@ def test_source_preflight_rejects_incomplete_rebuild_directory(monkeypatch, tmp_
 
 def test_reset_rebuild_reports_post_import_foreign_key_failures(monkeypatch, tmp_path: Path):
     _write_source_csv(tmp_path / "stats_seed.csv", "Name,id,slug,name,category,value_type", [])
+    monkeypatch.setattr(recovery, "is_database_empty", lambda: True)
     monkeypatch.setattr(recovery, "preflight_source_csvs", lambda source_dir=None: {
         "status": "ok",
         "source_dir": str(tmp_path),
@@ -394,10 +420,10 @@ def test_staged_rebuild_replaces_only_after_success(monkeypatch, tmp_path: Path)
     replaced = []
     monkeypatch.setattr(recovery.db_runtime, "get_active_db_name", lambda: active["name"])
     monkeypatch.setattr(recovery.db_runtime, "get_db_path", lambda name: tmp_path / f"{name}.sqlite")
-    monkeypatch.setattr(recovery.db_runtime, "switch_active_database", lambda name: active.update(name=name) or (name, str(tmp_path / f"{name}.sqlite")))
+    monkeypatch.setattr(recovery.db_runtime, "switch_active_database", lambda name, pragma_profile=None: active.update(name=name) or (name, str(tmp_path / f"{name}.sqlite")))
     monkeypatch.setattr(recovery.db_runtime, "init_db", lambda: None)
-    monkeypatch.setattr(recovery, "preflight_source_csvs", lambda source_dir=None: {"status": "ok", "errors": []})
-    monkeypatch.setattr(recovery, "import_source_csvs", lambda app, source_dir=None, reset_first=False: {
+    monkeypatch.setattr(recovery, "preflight_source_csvs", lambda source_dir=None, parsed_rows=None: {"status": "ok", "errors": []})
+    monkeypatch.setattr(recovery, "bulk_import_source_rows", lambda parsed_rows, source_dir=None: {
         "status": "success", "message": "ok", "tables": [], "warnings": [], "errors": [],
     })
     monkeypatch.setattr(recovery, "foreign_key_integrity_errors", lambda: [])
@@ -421,10 +447,10 @@ def test_staged_rebuild_failure_restores_runtime_and_cleans_staging(monkeypatch,
     original.write_text("original", encoding="utf-8")
     monkeypatch.setattr(recovery.db_runtime, "get_active_db_name", lambda: active["name"])
     monkeypatch.setattr(recovery.db_runtime, "get_db_path", lambda name: tmp_path / f"{name}.sqlite")
-    monkeypatch.setattr(recovery.db_runtime, "switch_active_database", lambda name: active.update(name=name) or (name, str(tmp_path / f"{name}.sqlite")))
+    monkeypatch.setattr(recovery.db_runtime, "switch_active_database", lambda name, pragma_profile=None: active.update(name=name) or (name, str(tmp_path / f"{name}.sqlite")))
     monkeypatch.setattr(recovery.db_runtime, "init_db", lambda: None)
-    monkeypatch.setattr(recovery, "preflight_source_csvs", lambda source_dir=None: {"status": "ok", "errors": []})
-    monkeypatch.setattr(recovery, "import_source_csvs", lambda app, source_dir=None, reset_first=False: {
+    monkeypatch.setattr(recovery, "preflight_source_csvs", lambda source_dir=None, parsed_rows=None: {"status": "ok", "errors": []})
+    monkeypatch.setattr(recovery, "bulk_import_source_rows", lambda parsed_rows, source_dir=None: {
         "status": "error", "message": "bad import", "tables": [], "warnings": [], "errors": [{"message": "bad"}],
     })
     report = recovery.staged_rebuild_database_from_source(Flask(__name__), tmp_path)
@@ -433,3 +459,203 @@ def test_staged_rebuild_failure_restores_runtime_and_cleans_staging(monkeypatch,
     assert active["name"] == "active"
     assert not Path(report["staging_path"]).exists()
     assert original.read_text(encoding="utf-8") == "original"
+
+
+def _bulk_engine(monkeypatch):
+    engine = create_engine("sqlite://", future=True, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(recovery.db_runtime, "get_engine", lambda: engine)
+    return engine
+
+
+def test_bulk_import_writes_preflighted_rows_without_reparsing(monkeypatch, tmp_path: Path):
+    _limit_preflight_to_reputation_tables(monkeypatch)
+    _write_source_csv(tmp_path / "factions_seed.csv", "Name,id,slug,name,alignment,tags", ["Guild,faction-1,,Guild,friendly,\"[\"\"Trade\"\"]\""])
+    _write_source_csv(
+        tmp_path / "requirements_seed.csv",
+        "Name,id,slug,required_flags,forbidden_flags,min_faction_reputation,tags",
+        ['gate,req-1,gate,[],[],\"[{\"\"faction_id\"\":\"\"faction-1\"\",\"\"min\"\":5}]\",[]'],
+    )
+    _write_source_csv(
+        tmp_path / "requirement_min_faction_reputation_seed.csv",
+        "Name,id,requirement_id,faction_id,min_value",
+        ["gate-guild,rep-1,req-1,faction-1,5"],
+    )
+    engine = _bulk_engine(monkeypatch)
+    parsed_rows = {}
+    assert recovery.preflight_source_csvs(tmp_path, parsed_rows)["status"] == "ok"
+    for path in tmp_path.glob("*.csv"):
+        path.unlink()
+
+    report = recovery.bulk_import_source_rows(parsed_rows, tmp_path)
+
+    assert report["status"] == "success"
+    assert [table["table"] for table in report["tables"]] == ["factions", "requirements", "requirement_min_faction_reputation"]
+    with engine.connect() as connection:
+        faction = connection.exec_driver_sql("SELECT slug, alignment, tags, reputation_ranks FROM factions").one()
+        assert faction == ("guild", "Friendly", '["trade"]', None)
+        assert connection.exec_driver_sql("SELECT min_value FROM requirement_min_faction_reputation").scalar_one() == 5
+
+
+def test_bulk_import_validates_every_table_before_writing(monkeypatch, tmp_path: Path):
+    engine = _bulk_engine(monkeypatch)
+    parsed_rows = {
+        "factions": [(2, {"id": "faction-1", "slug": "guild", "name": "Guild", "alignment": "Friendly"})],
+        "requirements": [(2, {"id": "req-1", "slug": "gate", "tags": {"wrong": "shape"}})],
+        "requirement_min_faction_reputation": [(2, {"id": "rep-1", "requirement_id": "req-1", "faction_id": None, "min_value": 5.0})],
+    }
+    monkeypatch.setattr(recovery, "_model_by_table", lambda: {
+        "factions": Faction,
+        "requirements": Requirement,
+        "requirement_min_faction_reputation": RequirementMinFactionReputation,
+    })
+
+    report = recovery.bulk_import_source_rows(parsed_rows, tmp_path)
+
+    assert report["status"] == "error"
+    assert {(error["table"], error["field"]) for error in report["errors"]} == {
+        ("requirements", "tags"),
+        ("requirement_min_faction_reputation", "faction_id"),
+    }
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT COUNT(*) FROM factions").scalar_one() == 0
+
+
+def test_parallel_export_writes_the_same_bytes_as_sequential_export(monkeypatch, tmp_path: Path):
+    import zipfile
+    from io import BytesIO
+
+    from sqlalchemy.orm import sessionmaker
+
+    from backend.app.models.m_flags import Flag
+    from backend.app.routes import r_bulk_export
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    session.add(Faction(id="faction-1", slug="wardens", name="Wardens", description="Keep the gate", alignment="Friendly"))
+    for index, slug in enumerate(["ember", "Ember", "frost gate"]):
+        session.add(Flag(id=f"flag-{index}", slug=slug, name=f"Flag {index}", description="d", tags=["a", "b"]))
+    session.add(Requirement(id="req-1", slug="trusted", tags=["gate"]))
+    session.add(RequirementMinFactionReputation(requirement_id="req-1", faction_id="faction-1", min_value=10))
+    session.commit()
+    session.close()
+    monkeypatch.setattr(recovery.db_runtime, "get_db_session", lambda: Session())
+    monkeypatch.setattr(r_bulk_export, "get_db_session", lambda: Session())
+    monkeypatch.setattr(recovery, "_write_recovery_state", lambda *args: None)
+
+    sequential = recovery.export_source_csvs(tmp_path / "sequential", workers=1)
+    parallel = recovery.export_source_csvs(tmp_path / "parallel", workers=2)
+
+    assert sequential["status"] == parallel["status"] == "success"
+    assert (sequential["workers"], parallel["workers"]) == (1, 2)
+    assert [table["table"] for table in parallel["tables"]] == [table["table"] for table in sequential["tables"]]
+    assert [table["rows"] for table in parallel["tables"]] == [table["rows"] for table in sequential["tables"]]
+    for table in sequential["tables"]:
+        file_name = f"{table['table']}_seed.csv"
+        assert (tmp_path / "parallel" / file_name).read_bytes() == (tmp_path / "sequential" / file_name).read_bytes()
+    assert (tmp_path / "parallel" / "flags_seed.csv").read_text(encoding="utf-8").count("\n") == 4
+
+    app = Flask(__name__)
+    app.register_blueprint(r_bulk_export.bp)
+    archives = [
+        zipfile.ZipFile(BytesIO(app.test_client().get(f"/api/export/ue/all-csv-zip?workers={workers}").get_data()))
+        for workers in (1, 2)
+    ]
+    names = archives[0].namelist()
+    assert archives[1].namelist() == names
+    assert names.index("factions.csv") < names.index("flags.csv") < names.index("requirements.csv")
+    assert all(archives[1].read(name) == archives[0].read(name) for name in names)
+    assert app.test_client().get("/api/export/ue/all-csv-zip?workers=many").status_code == 400
+
+
+def test_export_rewrites_only_changed_tables_and_reports_per_table_sync(monkeypatch, tmp_path: Path):
+    from sqlalchemy.orm import sessionmaker
+
+    from backend.app.models.m_flags import Flag
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    session.add(Faction(id="faction-1", slug="wardens", name="Wardens", description="Keep the gate", alignment="Friendly"))
+    session.add(Flag(id="flag-1", slug="ember", name="Ember", description="d", tags=["a"]))
+    session.commit()
+    session.close()
+    monkeypatch.setattr(recovery.db_runtime, "get_db_session", lambda: Session())
+    monkeypatch.setattr(recovery, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(recovery, "RECOVERY_STATE_PATH", tmp_path / ".recovery_state.json")
+    monkeypatch.setattr(recovery, "active_db_path", lambda: tmp_path / "db.sqlite")
+    serialized = []
+    build_csv_rows = recovery.build_csv_rows
+    monkeypatch.setattr(
+        recovery, "build_csv_rows",
+        lambda table_name, *args, **kwargs: serialized.append(table_name) or build_csv_rows(table_name, *args, **kwargs),
+    )
+
+    first = recovery.export_source_csvs(workers=1)
+    assert first["status"] == "success"
+    assert first["unchanged"] == []
+    assert set(first["rewritten"]) == set(recovery._model_by_table())
+    assert recovery._read_recovery_state()["tables"]["flags"]["sha256"]
+    assert recovery.get_sync_status(tmp_path, include_tables=True)["dirty_tables"] == []
+    untouched = (tmp_path / "factions_seed.csv").stat().st_mtime_ns
+
+    session = Session()
+    session.get(Flag, "flag-1").name = "Ember Renamed"
+    session.commit()
+    session.close()
+    statuses = {entry["table"]: entry for entry in recovery.table_sync_status(tmp_path)}
+    assert statuses["flags"]["status"] == "dirty"
+    assert statuses["factions"]["status"] == "clean"
+
+    serialized.clear()
+    second = recovery.export_source_csvs(workers=1)
+    assert second["rewritten"] == ["flags"]
+    assert serialized == ["flags"]
+    assert "Ember Renamed" in (tmp_path / "flags_seed.csv").read_text(encoding="utf-8")
+    assert (tmp_path / "factions_seed.csv").stat().st_mtime_ns == untouched
+    assert not list(tmp_path.glob(".*.tmp"))
+
+    with (tmp_path / "factions_seed.csv").open("a", encoding="utf-8", newline="") as handle:
+        handle.write("\r\n")
+    status = recovery.get_sync_status(tmp_path, include_tables=True)
+    assert status["dirty_tables"] == ["factions"]
+    assert {entry["table"]: entry for entry in status["tables"]}["factions"]["source_edited"] is True
+    assert recovery.export_source_csvs(workers=1)["rewritten"] == ["factions"]
+    assert recovery.get_sync_status(tmp_path, include_tables=True)["dirty_tables"] == []
+
+
+def test_export_status_follows_rows_embedded_from_related_tables(monkeypatch, tmp_path: Path):
+    from sqlalchemy.orm import sessionmaker
+
+    from backend.app.models.m_location_pois import LocationPoi, PoiType
+    from backend.app.models.m_locations import Location
+    from backend.app.routes import r_location_pois, r_locations  # noqa: F401 - registers the serializers
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    session = Session()
+    session.add(Location(id="loc-1", slug="harbor", name="Harbor"))
+    session.add(LocationPoi(id="poi-1", slug="gate", location_id="loc-1", name="Gate", poi_type=PoiType.Door))
+    session.commit()
+    session.close()
+    monkeypatch.setattr(recovery.db_runtime, "get_db_session", lambda: Session())
+    monkeypatch.setattr(recovery, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(recovery, "RECOVERY_STATE_PATH", tmp_path / ".recovery_state.json")
+    monkeypatch.setattr(recovery, "active_db_path", lambda: tmp_path / "db.sqlite")
+    assert recovery.export_source_csvs(workers=1)["status"] == "success"
+    assert "Harbor" in (tmp_path / "location_pois_seed.csv").read_text(encoding="utf-8")
+
+    session = Session()
+    session.get(Location, "loc-1").name = "Old Harbor"
+    session.commit()
+    session.close()
+    statuses = {entry["table"]: entry["status"] for entry in recovery.table_sync_status(tmp_path)}
+    assert statuses["locations"] == "dirty"
+    assert statuses["location_pois"] == "dirty"
+
+    assert {"locations", "location_pois"} <= set(recovery.export_source_csvs(workers=1)["rewritten"])
+    assert "Old Harbor" in (tmp_path / "location_pois_seed.csv").read_text(encoding="utf-8")
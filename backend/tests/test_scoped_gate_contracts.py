@@ -4,11 +4,15 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from backend.app.models.base import Base
+from backend.app.models.m_dialogue_nodes import DialogueNode
+from backend.app.models.m_dialogues import Dialogue
 from backend.app.models.m_encounters import Encounter, EncounterType
 from backend.app.models.m_events import Event, EventType
 from backend.app.models.m_flags import Flag, FlagType
+from backend.app.models.m_quests import Quest
 from backend.app.models.m_requirements import Requirement
 from backend.app.routes import r_ui_scoped_gates
+from backend.app.services.requirement_usage import requirement_usages
 
 
 def _client(monkeypatch):
@@ -163,3 +167,42 @@ def test_bundle_rejects_unsupported_target_and_malformed_arrays(monkeypatch):
 
     assert response.status_code == 400
     assert "schema_name is not supported" in response.get_json()["message"]
+
+
+def test_requirement_usage_index_covers_columns_objectives_and_choices_and_follows_commits(monkeypatch, count_queries):
+    client, Session = _client(monkeypatch)
+    _seed(Session)
+    session = Session()
+    session.add_all([
+        Quest(id="quest-1", slug="quest-1", title="Hunt", description="Hunt.", requirements_id="req-old",
+              objectives=[{"objective_id": "o1"}, {"objective_id": "o2", "requirements_id": "req-old"}]),
+        Dialogue(id="dialogue-1", slug="dialogue-1", title="Talk"),
+        DialogueNode(id="node-1", slug="node-1", dialogue_id="dialogue-1", speaker="npc", text="Hi",
+                     choices=[{"id": "c1", "requirements_id": "req-old"}, "not-a-choice"]),
+    ])
+    session.commit()
+
+    usages = requirement_usages(session)
+    assert [(usage["schema_name"], usage["entry_id"], usage["path"]) for usage in usages["req-old"]] == [
+        ("dialogue_nodes", "node-1", "choices[0].requirements_id"),
+        ("quests", "quest-1", "requirements_id"),
+        ("quests", "quest-1", "objectives[1].requirements_id"),
+    ]
+    assert usages["req-old"][0]["entry_label"] == "node-1"
+    with count_queries(Session.kw["bind"]) as statements:
+        assert requirement_usages(session) is usages
+    assert statements == []
+
+    session.get(Event, "event-1").requirements_id = "req-old"
+    session.flush()
+    uncommitted = requirement_usages(session)
+    assert ("events", "event-1") in {(usage["schema_name"], usage["entry_id"]) for usage in uncommitted["req-old"]}
+    assert requirement_usages(Session()) is usages
+    session.commit()
+
+    with count_queries(Session.kw["bind"]) as statements:
+        committed = requirement_usages(session)
+    assert len(statements) == 1
+    assert committed["req-old"] == uncommitted["req-old"]
+    packet = client.get("/api/ui/scoped-gates").get_json()
+    assert packet["requirement_usages_by_id"]["req-old"] == committed["req-old"]
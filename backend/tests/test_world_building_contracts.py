@@ -16,11 +16,15 @@ from backend.app.models.m_events import Event, EventType
 from backend.app.models.m_location_creative_briefs import LocationCreativeBrief
 from backend.app.models.m_location_encounter_tables import LocationEncounterTable
 from backend.app.models.m_location_pois import LocationPoi, PoiType
+from backend.app.models.m_flags import Flag
 from backend.app.models.m_location_routes import LocationRoute, LocationRouteType
 from backend.app.models.m_locations import Biome, BiomeInheritance, Location, LocationType, PlaceKind
+from backend.app.models.m_requirements import Requirement, RequirementRequiredFlag
 from backend.app.models.m_route_event_bindings import RouteEventBinding
 from backend.app.models.m_travel_tuning import TravelTuning
 from backend.app.routes import base_route
+from backend.app.services.location_hierarchy import location_hierarchy
+from backend.app.services.route_planning import route_graph
 from backend.app.routes import (
     r_location_creative_briefs,
     r_location_encounter_tables,
@@ -31,6 +35,7 @@ from backend.app.routes import (
     r_export,
     r_route_event_bindings,
     r_travel_tuning,
+    r_ui_location_graph,
     r_ui_world_builder,
 )
 from backend.app.utils import csv_tools
@@ -59,6 +64,7 @@ def _app_with_session(monkeypatch):
         r_location_creative_briefs,
         r_encounters,
         r_ui_world_builder,
+        r_ui_location_graph,
         base_route,
     ]:
         monkeypatch.setattr(module, "get_db_session", get_session, raising=False)
@@ -74,6 +80,7 @@ def _app_with_session(monkeypatch):
         r_location_creative_briefs.bp,
         r_encounters.bp,
         r_ui_world_builder.bp,
+        r_ui_location_graph.bp,
     ]:
         app.register_blueprint(bp)
     return app.test_client(), Session
@@ -319,6 +326,132 @@ def test_world_builder_endpoint_returns_world_packets(monkeypatch):
     assert payload["pois"][0]["poi_type"] == "Shrine"
 
 
+def test_location_hierarchy_is_shared_and_rebuilt_on_location_writes(monkeypatch):
+    client, Session = _app_with_session(monkeypatch)
+    _seed_world(Session)
+    session = Session()
+    session.add_all([
+        Location(id="hall", slug="hall", name="Hall", parent_location_id="zone", location_type=LocationType.Interior),
+        Location(id="cellar", slug="cellar", name="Cellar", parent_location_id="hall", location_type=LocationType.Room),
+        Location(id="loop-a", slug="loop-a", name="Loop A", parent_location_id="loop-b", location_type=LocationType.Room),
+        Location(id="loop-b", slug="loop-b", name="Loop B", parent_location_id="loop-a", location_type=LocationType.Room),
+        Location(id="under-loop", slug="under-loop", name="Under Loop", parent_location_id="loop-a", location_type=LocationType.Room),
+    ])
+    session.commit()
+
+    hierarchy = location_hierarchy(session)
+    assert location_hierarchy(session) is hierarchy
+    assert hierarchy.ancestors("cellar") == ("hall", "zone", "world")
+    assert hierarchy.depth("cellar") == 3
+    assert set(hierarchy.descendants("zone")) == {"hall", "cellar"}
+    assert hierarchy.effective_biome("cellar") == "Forest"
+    assert hierarchy.effective_biome("world") is None
+    assert hierarchy.cyclic_ids() == {"loop-a", "loop-b", "under-loop"}
+    assert hierarchy.effective_biome("under-loop") is None
+
+    session.get(Location, "zone").biome = Biome.Swamp
+    assert location_hierarchy(session).effective_biome("cellar") == "Swamp"
+    assert location_hierarchy(Session()) is hierarchy
+    session.commit()
+    assert location_hierarchy(session) is not hierarchy
+    assert location_hierarchy(session).effective_biome("cellar") == "Swamp"
+    session.close()
+
+    payload = client.get("/api/ui/world_builder").get_json()
+    cellar = next(row for row in payload["locations"] if row["id"] == "cellar")
+    assert cellar["effective_biome"] == "Swamp"
+    assert cellar["resolved_biome_inheritance"] == "InheritFromParent"
+    cycle_warnings = {row["entry_id"] for row in payload["warnings"] if "cycle" in row["message"]}
+    assert cycle_warnings == {"loop-a", "loop-b", "under-loop"}
+
+
+def test_location_graph_paths_apply_tuning_visibility_and_requirements(monkeypatch):
+    client, Session = _app_with_session(monkeypatch)
+    _seed_world(Session)
+    session = Session()
+    town = {"location_type": LocationType.Zone, "parent_location_id": "zone", "biome_inheritance": BiomeInheritance.InheritFromParent}
+    session.add_all([
+        Location(id="a", slug="a", name="A", **town),
+        Location(id="b", slug="b", name="B", **town),
+        Location(id="c", slug="c", name="C", **town),
+        Location(id="d", slug="d", name="D", **town),
+        Flag(id="gate-open", slug="gate-open", name="Gate Open", description="Gate"),
+        Requirement(id="req-gate", slug="req-gate", tags=[]),
+        RequirementRequiredFlag(id="req-gate-flag", requirement_id="req-gate", flag_id="gate-open"),
+        LocationRoute(id="a-b", slug="a-b", from_location_id="a", to_location_id="b", route_type=LocationRouteType.Road, travel_time=10),
+        LocationRoute(id="b-d", slug="b-d", from_location_id="b", to_location_id="d", route_type=LocationRouteType.Road, travel_time=10),
+        LocationRoute(id="a-c", slug="a-c", from_location_id="a", to_location_id="c", route_type=LocationRouteType.Trail, travel_time=5),
+        LocationRoute(
+            id="c-d", slug="c-d", from_location_id="c", to_location_id="d", route_type=LocationRouteType.Trail,
+            travel_time=5, requirements_id="req-gate",
+        ),
+        LocationRoute(
+            id="a-d", slug="a-d", from_location_id="a", to_location_id="d", route_type=LocationRouteType.SecretPath,
+            travel_time=1, is_hidden=True,
+        ),
+        TravelTuning(id="forest-trails", slug="forest-trails", name="Forest Trails", route_type=LocationRouteType.Trail, biome=Biome.Forest, travel_time_multiplier=1.5),
+        TravelTuning(id="any-trail", slug="any-trail", name="Any Trail", route_type=LocationRouteType.Trail, travel_time_multiplier=3),
+    ])
+    session.commit()
+    assert route_graph(session) is route_graph(session)
+    session.close()
+
+    def paths(query):
+        response = client.get(f"/api/ui/location_graph/paths?{query}")
+        assert response.status_code == 200, response.get_json()
+        return response.get_json()
+
+    assert paths("from=a&to=d")["paths"][0]["route_ids"] == ["a-d"]
+    visible = paths("from=a&to=d&include_hidden=false&k=3")
+    assert [path["route_ids"] for path in visible["paths"]] == [["a-c", "c-d"], ["a-b", "b-d"]]
+    assert [path["travel_time"] for path in visible["paths"]] == [15, 20]
+    assert visible["paths"][0]["legs"][0]["tuning_id"] == "forest-trails"
+
+    gated = "from=a&to=d&include_hidden=false&requirements=evaluate"
+    assert paths(gated)["paths"][0]["route_ids"] == ["a-b", "b-d"]
+    assert paths(f"{gated}&flags=gate-open")["paths"][0]["route_ids"] == ["a-c", "c-d"]
+    assert paths("from=a&to=d&metric=hops")["paths"][0]["hops"] == 1
+
+    reachable = paths("mode=reachable&from=a&budget=12&include_hidden=false")
+    assert [row["location_id"] for row in reachable["reachable"]] == ["a", "c", "b"]
+    assert "d" in reachable["unreachable_ids"]
+
+    matrix = paths("mode=matrix&ids=a,d&include_hidden=false&requirements=exclude&budget=15")
+    assert matrix["matrix"] == [[0, 20], [20, 0]]
+    assert matrix["over_budget_pairs"] == 2
+
+    assert client.get("/api/ui/location_graph/paths?from=a&to=missing").status_code == 400
+    assert client.get("/api/ui/location_graph/paths?from=a&to=d&metric=speed").status_code == 400
+
+
+
+def test_location_graph_clamps_negative_weights_and_skips_non_finite_routes(monkeypatch):
+    client, Session = _app_with_session(monkeypatch)
+    _seed_world(Session)
+    session = Session()
+    town = {"location_type": LocationType.Zone, "parent_location_id": "zone", "biome_inheritance": BiomeInheritance.InheritFromParent}
+    session.add_all([
+        Location(id="a", slug="a", name="A", **town),
+        Location(id="b", slug="b", name="B", **town),
+        Location(id="c", slug="c", name="C", **town),
+        LocationRoute(id="a-b", slug="a-b", from_location_id="a", to_location_id="b", route_type=LocationRouteType.Road, travel_time=-50),
+        LocationRoute(id="b-c", slug="b-c", from_location_id="b", to_location_id="c", route_type=LocationRouteType.Trail, travel_time=4),
+        LocationRoute(id="a-c", slug="a-c", from_location_id="a", to_location_id="c", route_type=LocationRouteType.Road, travel_time=float("inf")),
+        TravelTuning(id="bad-trail", slug="bad-trail", name="Bad Trail", route_type=LocationRouteType.Trail, travel_time_multiplier=-2),
+    ])
+    session.commit()
+    graph = route_graph(session)
+    session.close()
+    assert graph.skipped_route_ids == ["a-c"]
+    assert min(graph.weights["time"]) == 0
+
+    response = client.get("/api/ui/location_graph/paths?from=a&to=c")
+    assert response.status_code == 200, response.get_json()
+    payload = response.get_json()
+    assert payload["skipped_route_ids"] == ["a-c"]
+    assert payload["paths"][0]["route_ids"] == ["a-b", "b-c"]
+    assert payload["paths"][0]["travel_time"] == 0
+
 def test_world_builder_bundle_saves_linked_world_records_atomically(monkeypatch):
     client, Session = _app_with_session(monkeypatch)
     _seed_world(Session)
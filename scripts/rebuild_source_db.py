@@ -1,7 +1,8 @@
 """Rebuild the active SQLite database from source CSV files.
 
-This script uses the Flask import routes in-process so rebuild validation stays
-identical to the application import path.
+The rebuild preflights the complete source set once, bulk-inserts the parsed
+rows into a sibling staging database, runs `PRAGMA foreign_key_check`, and only
+then replaces the active database file.
 """
 
 from __future__ import annotations
@@ -25,6 +25,11 @@ interface EntryListPanelProps {
   onToggleEditor: () => void;
   recentEntries: RecentEntry[];
   onOpenRecentEntry: (id: string) => void;
+  hasMoreEntries?: boolean;
+  loadingMoreEntries?: boolean;
+  onLoadMoreEntries?: () => void;
+  searchIsPartial?: boolean;
+  onLoadAllEntries?: () => void;
 }
 
 const getEntryId = (entry: EntryRecord, idField: string): string => {
@@ -78,6 +83,11 @@ const EntryListPanel = ({
   onToggleEditor,
   recentEntries,
   onOpenRecentEntry,
+  hasMoreEntries,
+  loadingMoreEntries,
+  onLoadMoreEntries,
+  searchIsPartial,
+  onLoadAllEntries,
 }: EntryListPanelProps) => (
   <EntryListPanelInternal
     schemaName={schemaName}
@@ -101,6 +111,11 @@ const EntryListPanel = ({
     onToggleEditor={onToggleEditor}
     recentEntries={recentEntries}
     onOpenRecentEntry={onOpenRecentEntry}
+    hasMoreEntries={hasMoreEntries}
+    loadingMoreEntries={loadingMoreEntries}
+    onLoadMoreEntries={onLoadMoreEntries}
+    searchIsPartial={searchIsPartial}
+    onLoadAllEntries={onLoadAllEntries}
   />
 );
 
@@ -126,6 +141,11 @@ const EntryListPanelInternal = ({
   onToggleEditor,
   recentEntries,
   onOpenRecentEntry,
+  hasMoreEntries = false,
+  loadingMoreEntries = false,
+  onLoadMoreEntries,
+  searchIsPartial = false,
+  onLoadAllEntries,
 }: EntryListPanelProps) => {
   const [selectedIds, setSelectedIds] = useState<string[]>([]);
   const [showBulkEdit, setShowBulkEdit] = useState(false);
@@ -207,7 +227,7 @@ const EntryListPanelInternal = ({
         <div className="flex flex-wrap gap-2 items-center justify-between">
           <div>
             <div className="text-xs font-medium uppercase text-slate-500 dark:text-slate-400">{schemaName.replace(/_/g, " ")}</div>
-            <div className="text-lg font-semibold text-slate-950 dark:text-slate-100">{entries.length} entries</div>
+            <div className="text-lg font-semibold text-slate-950 dark:text-slate-100">{entries.length}{hasMoreEntries ? "+" : ""} entries</div>
           </div>
           <div className="flex flex-wrap gap-2 items-center">
           <button className={`${BUTTON_CLASSES.success} ${BUTTON_SIZES.sm}`} onClick={onAddNew}>+ New</button>
@@ -296,6 +316,23 @@ const EntryListPanelInternal = ({
             onChange={e => setSearch(e.target.value)}
           />
         </div>
+        {searchIsPartial && (
+          <div className="flex flex-wrap items-center justify-between gap-2 rounded border border-amber-200 bg-amber-50 px-2 py-2 text-xs text-amber-800 dark:border-amber-900 dark:bg-amber-950 dark:text-amber-300">
+            <span>
+              Results may be incomplete: they cover the loaded pages plus the server's search of names and ids. Load every entry to search all fields.
+            </span>
+            {onLoadAllEntries && (
+              <button
+                className={`${BUTTON_CLASSES.neutral} ${BUTTON_SIZES.xs}`}
+                onClick={onLoadAllEntries}
+                disabled={loadingMoreEntries}
+                type="button"
+              >
+                {loadingMoreEntries ? "Loading..." : "Load all entries"}
+              </button>
+            )}
+          </div>
+        )}
         <div className={`text-[11px] ${TEXT_CLASSES.subtle}`}>
           Shortcuts: <span className="font-medium">Ctrl/Cmd+S</span> save, <span className="font-medium">Ctrl/Cmd+N</span> new, <span className="font-medium">Ctrl/Cmd+D</span> duplicate
         </div>
@@ -434,6 +471,18 @@ const EntryListPanelInternal = ({
             </tbody>
           </table>
         )}
+        {hasMoreEntries && onLoadMoreEntries && (
+          <div className="mt-3 flex justify-center">
+            <button
+              className={`${BUTTON_CLASSES.neutral} ${BUTTON_SIZES.sm}`}
+              onClick={onLoadMoreEntries}
+              disabled={loadingMoreEntries}
+              type="button"
+            >
+              {loadingMoreEntries ? "Loading..." : "Load more entries"}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
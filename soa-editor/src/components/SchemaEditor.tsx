@@ -90,6 +90,8 @@ function errorMessage(error: unknown, fallback: string): string {
   return fallback;
 }
 
+const ENTRY_PAGE_SIZE = 500;
+
 async function readJsonSafe(response: Response): Promise<unknown> {
   try {
     return await response.json();
@@ -147,6 +149,9 @@ export default function SchemaEditor({
   const [entries, setEntries] = useState<EntryRecord[]>([]);
   const [entriesLoaded, setEntriesLoaded] = useState(false);
   const [entriesError, setEntriesError] = useState<string | null>(null);
+  const [entriesCursor, setEntriesCursor] = useState<string | null>(null);
+  const [loadingMoreEntries, setLoadingMoreEntries] = useState(false);
+  const [serverSearch, setServerSearch] = useState<{ term: string; entries: EntryRecord[] } | null>(null);
   const [search, setSearch] = useState("");
   const [searchField, setSearchField] = useState<string>("__all__");
   const [formValid, setFormValid] = useState(true);
@@ -235,27 +240,87 @@ export default function SchemaEditor({
     });
   }, [getEntryId, getEntryLabel, recentStorageKey]);
 
+  // The list is loaded one primary-key page at a time; later pages are fetched on demand.
+  const fetchEntryPage = useCallback(async (after: string | null) => {
+    const params = new URLSearchParams({ limit: String(ENTRY_PAGE_SIZE) });
+    if (after) params.set("after", after);
+    const res = await apiFetch(`/api/${apiPath}?${params.toString()}`);
+    const payload = await readJsonSafe(res);
+    if (!Array.isArray(payload)) {
+      throw new Error(asMessage(payload) || "API did not return a list.");
+    }
+    return { page: toEntryArray(payload), cursor: res.headers.get("X-Next-Cursor") };
+  }, [apiPath]);
+
   const loadEntries = useCallback(async () => {
     setEntriesLoaded(false);
     try {
-      const res = await apiFetch(`/api/${apiPath}`);
-      const payload = await readJsonSafe(res);
-      if (!Array.isArray(payload)) {
-        setEntries([]);
-        const msg = asMessage(payload) || "API did not return a list.";
-        setEntriesError(`Entries load failed: ${msg}`);
-        setEntriesLoaded(true);
-        return;
-      }
-      setEntries(toEntryArray(payload));
+      const { page, cursor } = await fetchEntryPage(null);
+      setEntries(page);
+      setEntriesCursor(cursor);
       setEntriesError(null);
     } catch (err) {
       setEntries([]);
+      setEntriesCursor(null);
       setEntriesError(`Entries load failed: ${errorMessage(err, "Unknown error")}`);
     } finally {
       setEntriesLoaded(true);
     }
-  }, [apiPath]);
+  }, [fetchEntryPage]);
+
+  const loadMoreEntries = useCallback(async () => {
+    if (!entriesCursor || loadingMoreEntries) return;
+    setLoadingMoreEntries(true);
+    try {
+      const { page, cursor } = await fetchEntryPage(entriesCursor);
+      setEntries((prev) => {
+        const seen = new Set(prev.map((entry) => getEntryId(entry)));
+        return [...prev, ...page.filter((entry) => !seen.has(getEntryId(entry)))];
+      });
+      setEntriesCursor(cursor);
+    } catch (err) {
+      setEntriesError(`Entries load failed: ${errorMessage(err, "Unknown error")}`);
+    } finally {
+      setLoadingMoreEntries(false);
+    }
+  }, [entriesCursor, fetchEntryPage, getEntryId, loadingMoreEntries]);
+
+  const loadAllEntries = useCallback(async () => {
+    if (!entriesCursor || loadingMoreEntries) return;
+    setLoadingMoreEntries(true);
+    try {
+      const loaded: EntryRecord[] = [];
+      let cursor: string | null = entriesCursor;
+      while (cursor) {
+        const next = await fetchEntryPage(cursor);
+        loaded.push(...next.page);
+        cursor = next.cursor;
+      }
+      setEntries((prev) => {
+        const seen = new Set(prev.map((entry) => getEntryId(entry)));
+        return [...prev, ...loaded.filter((entry) => !seen.has(getEntryId(entry)))];
+      });
+      setEntriesCursor(null);
+    } catch (err) {
+      setEntriesError(`Entries load failed: ${errorMessage(err, "Unknown error")}`);
+    } finally {
+      setLoadingMoreEntries(false);
+    }
+  }, [entriesCursor, fetchEntryPage, getEntryId, loadingMoreEntries]);
+
+  // Entries past the loaded pages are fetched by id rather than by paging through the table.
+  const resolveEntry = useCallback(async (entryId: string): Promise<EntryRecord | null> => {
+    const localMatch = entries.find((entry) => getEntryId(entry) === entryId);
+    if (localMatch) return localMatch;
+    try {
+      const res = await apiFetch(`/api/${apiPath}/${encodeURIComponent(entryId)}`);
+      if (!res.ok) return null;
+      const payload = await readJsonSafe(res);
+      return isRecord(payload) ? payload : null;
+    } catch {
+      return null;
+    }
+  }, [apiPath, entries, getEntryId]);
 
   useEffect(() => {
     let isCancelled = false;
@@ -543,51 +608,47 @@ export default function SchemaEditor({
   );
 
   useEffect(() => {
+    const restoreDraft = (entryId: string) => {
+      const draftKey = `soa.draft.${schemaName}.${entryId}`;
+      const draft = parseDraftData(localStorage.getItem(draftKey));
+      if (!draft) return false;
+      setData(draft);
+      setOriginalData(draft);
+      originalSerializedRef.current = stringifyStable(draft);
+      setIsDirty(false);
+      setDraftRestored(true);
+      setShowEditor(true);
+      return true;
+    };
+
     const pendingQuerySelectionId = pendingQuerySelectionRef.current;
     if (pendingQuerySelectionId) {
       if (!entriesLoaded) return;
-      const matchingEntry = entries.find((entry) => getEntryId(entry) === pendingQuerySelectionId);
       pendingQuerySelectionRef.current = null;
-      if (matchingEntry) {
-        handleEdit(matchingEntry);
-        return;
-      }
-      const draftKey = `soa.draft.${schemaName}.${pendingQuerySelectionId}`;
-      const draft = parseDraftData(localStorage.getItem(draftKey));
-      if (draft) {
-        setData(draft);
-        setOriginalData(draft);
-        originalSerializedRef.current = stringifyStable(draft);
-        setIsDirty(false);
-        setDraftRestored(true);
-        setShowEditor(true);
-        return;
-      }
-      setToast({ type: "error", message: `Entry '${pendingQuerySelectionId}' was not found in ${title}.` });
-      if (toastTimeout.current) clearTimeout(toastTimeout.current);
-      toastTimeout.current = setTimeout(() => setToast(null), 3000);
+      void resolveEntry(pendingQuerySelectionId).then((matchingEntry) => {
+        if (matchingEntry) {
+          handleEdit(matchingEntry);
+          return;
+        }
+        if (restoreDraft(pendingQuerySelectionId)) return;
+        setToast({ type: "error", message: `Entry '${pendingQuerySelectionId}' was not found in ${title}.` });
+        if (toastTimeout.current) clearTimeout(toastTimeout.current);
+        toastTimeout.current = setTimeout(() => setToast(null), 3000);
+      });
       return;
     }
 
     const pendingSelectionId = pendingWorkspaceSelectionRef.current;
-    if (!pendingSelectionId) return;
-    const matchingEntry = entries.find((entry) => getEntryId(entry) === pendingSelectionId);
+    if (!pendingSelectionId || !entriesLoaded) return;
     pendingWorkspaceSelectionRef.current = null;
-    if (matchingEntry) {
-      handleEdit(matchingEntry);
-      return;
-    }
-    const draftKey = `soa.draft.${schemaName}.${pendingSelectionId}`;
-    const draft = parseDraftData(localStorage.getItem(draftKey));
-    if (draft) {
-      setData(draft);
-      setOriginalData(draft);
-      originalSerializedRef.current = stringifyStable(draft);
-      setIsDirty(false);
-      setDraftRestored(true);
-      setShowEditor(true);
-    }
-  }, [entries, entriesLoaded, getEntryId, handleEdit, querySelectedId, schemaName, title]);
+    void resolveEntry(pendingSelectionId).then((matchingEntry) => {
+      if (matchingEntry) {
+        handleEdit(matchingEntry);
+        return;
+      }
+      restoreDraft(pendingSelectionId);
+    });
+  }, [entriesLoaded, handleEdit, querySelectedId, resolveEntry, schemaName, title]);
 
   // Delete entry handler.
   const handleDelete = useCallback((entry: EntryRecord) => {
@@ -801,17 +862,19 @@ export default function SchemaEditor({
 
   const handleOpenRecentEntry = useCallback(
     (entryId: string) => {
-      const match = entries.find((entry) => getEntryId(entry) === entryId);
-      if (match) handleEdit(match);
+      void resolveEntry(entryId).then((match) => {
+        if (match) handleEdit(match);
+      });
     },
-    [entries, getEntryId, handleEdit]
+    [handleEdit, resolveEntry]
   );
 
   const handleOpenRelationshipEntry = useCallback(
     (targetSchemaName: string, routePath: string, entryId: string) => {
       if (targetSchemaName === schemaName) {
-        const localMatch = entries.find((entry) => getEntryId(entry) === entryId);
-        if (localMatch) handleEdit(localMatch);
+        void resolveEntry(entryId).then((match) => {
+          if (match) handleEdit(match);
+        });
         return;
       }
 
@@ -837,7 +900,7 @@ export default function SchemaEditor({
       localStorage.setItem(targetWorkspaceKey, JSON.stringify(nextWorkspace));
       window.location.assign(`/${routePath}`);
     },
-    [entries, getEntryId, handleEdit, schemaName]
+    [handleEdit, resolveEntry, schemaName]
   );
 
   const handleCreateBundleDrafts = useCallback((bundle: StudioBundle, selectedIds: Set<string>) => {
@@ -878,10 +941,40 @@ export default function SchemaEditor({
     void runReferenceScan(targetId, true);
   }, [data, getEntryId, runReferenceScan]);
 
+  // While pages remain unloaded, a search also asks the server (`?search=`) so matches past the loaded pages show up.
+  useEffect(() => {
+    const term = debouncedSearch.trim();
+    if (!term || entriesCursor === null) {
+      setServerSearch(null);
+      return;
+    }
+    let isCancelled = false;
+    void (async () => {
+      try {
+        const res = await apiFetch(`/api/${apiPath}?${new URLSearchParams({ search: term }).toString()}`);
+        const payload = await readJsonSafe(res);
+        if (!isCancelled && Array.isArray(payload)) {
+          setServerSearch({ term, entries: toEntryArray(payload) });
+        }
+      } catch {
+        if (!isCancelled) setServerSearch(null);
+      }
+    })();
+    return () => {
+      isCancelled = true;
+    };
+  }, [apiPath, debouncedSearch, entriesCursor]);
+
+  const searchableEntries = useMemo(() => {
+    if (!serverSearch || serverSearch.term !== debouncedSearch.trim()) return entries;
+    const seen = new Set(entries.map((entry) => getEntryId(entry)));
+    return [...entries, ...serverSearch.entries.filter((entry) => !seen.has(getEntryId(entry)))];
+  }, [debouncedSearch, entries, getEntryId, serverSearch]);
+
   // Filtered and sorted entries.
   const filteredEntries = useMemo(
     () =>
-      entries.filter((entry) => {
+      searchableEntries.filter((entry) => {
         if (!debouncedSearch.trim()) return true;
         const searchLower = debouncedSearch.toLowerCase();
         if (searchField === "__all__") {
@@ -899,7 +992,7 @@ export default function SchemaEditor({
         }
         return toSearchText(val).includes(searchLower);
       }),
-    [entries, debouncedSearch, searchField, fieldKeys]
+    [searchableEntries, debouncedSearch, searchField, fieldKeys]
   );
 
   // Sort alphabetically by name, fallback to id.
@@ -1215,6 +1308,11 @@ export default function SchemaEditor({
           onToggleEditor={handleToggleEditor}
           recentEntries={recentEntries}
           onOpenRecentEntry={handleOpenRecentEntry}
+          hasMoreEntries={entriesCursor !== null}
+          loadingMoreEntries={loadingMoreEntries}
+          onLoadMoreEntries={loadMoreEntries}
+          searchIsPartial={entriesCursor !== null && debouncedSearch.trim().length > 0}
+          onLoadAllEntries={loadAllEntries}
         />
         {showEditor && (
           <div className="flex min-w-0 flex-1 flex-col gap-3">